@@ -164,7 +164,7 @@ INSTALL_REQUIRES = [
     'blosc>=1.8',
     'click',
     'grpcio',
-    'protobuf',
+    'protobuf>=3.20',
     'h5py>=2.9',
     'hdf5plugin>=2.0',
     'lmdb>=0.94',
@@ -130,9 +130,16 @@ BACKEND_IS_LOCAL_MAP: Dict[str, bool] = {
     k: bool(k[0] in _local_prefixes) for k in BACKEND_ACCESSOR_MAP.keys()
 }
 
+# backends whose files can only be opened once per process (lmdb environments).
+# Rather than opening one accessor per thread, a single read-only accessor is
+# shared by every reader thread.
+BACKEND_SHARES_READER_MAP: Dict[str, bool] = {
+    k: k in ('30', '31') for k in BACKEND_ACCESSOR_MAP.keys()
+}
+
 __all__ = [
     'backend_decoder', 'HDF5_00_DataHashSpec', 'HDF5_01_DataHashSpec',
     'NUMPY_10_DataHashSpec', 'LMDB_30_DataHashSpec', 'REMOTE_50_DataHashSpec',
     'LMDB_31_DataHashSpec', 'BACKEND_OPTIONS_MAP', 'BACKEND_ACCESSOR_MAP',
-    'BACKEND_IS_LOCAL_MAP',
+    'BACKEND_IS_LOCAL_MAP', 'BACKEND_SHARES_READER_MAP',
 ]
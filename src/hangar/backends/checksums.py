@@ -0,0 +1,178 @@
+"""Policies controlling when local backends verify data checksums on read.
+
+Every local backend records an ``xxhash64_hexdigest`` checksum of each piece of
+data as it is written. By default, the checksum is recomputed and compared
+against the recorded value every time the data is read. For large arrays the
+hash can be a measurable share of read latency, so read-only checkouts can
+select one of the following policies instead:
+
+*  ``'always'``: verify every read (default).
+*  ``'first-read-per-file-per-process'``: verify only the first read of any
+   piece of data stored in some backend file, per process. Once a read from a
+   file has been verified, further reads from that file are not checked.
+*  ``'sampled(p)'``: verify each read with probability ``p``, where ``p`` is a
+   float between 0 and 1 (ie. ``'sampled(0.05)'``).
+*  ``'off'``: never verify checksums on read.
+
+Each policy object counts the number of reads which were ``verified``,
+``skipped``, or ``failed`` verification so that relaxed policies can still be
+audited. Counters are updated under a lock, as a policy is shared by every
+thread reading from a checkout.
+"""
+import os
+import random
+import re
+from threading import Lock
+from typing import Dict, Set, Tuple
+
+_SampledRE = re.compile(r'sampled\((?P<p>[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)\)\Z')
+
+_POLICY_NAMES = ('always', 'first-read-per-file-per-process', 'off')
+
+# (backend format code, file uid) of every file with a verified read in this process.
+_VERIFIED_FILES: Set[Tuple[str, str]] = set()
+_VERIFIED_FILES_PID: int = os.getpid()
+
+
+def _verified_files() -> Set[Tuple[str, str]]:
+    """Get the set of verified files, resetting it in forked child processes.
+    """
+    global _VERIFIED_FILES_PID
+    pid = os.getpid()
+    if pid != _VERIFIED_FILES_PID:
+        _VERIFIED_FILES.clear()
+        _VERIFIED_FILES_PID = pid
+    return _VERIFIED_FILES
+
+
+class ChecksumPolicy(object):
+    """Decide if a backend read should verify the data checksum.
+
+    Parameters
+    ----------
+    policy : str, optional
+        one of ``'always'``, ``'first-read-per-file-per-process'``,
+        ``'sampled(p)'``, or ``'off'``. By default, ``'always'``.
+
+    Raises
+    ------
+    TypeError
+        If ``policy`` is not a string.
+    ValueError
+        If ``policy`` is not a valid policy specification.
+    """
+
+    def __init__(self, policy: str = 'always'):
+        if not isinstance(policy, str):
+            raise TypeError(f'checksum policy must be str, not {type(policy)}')
+
+        self._policy = policy
+        self._p = None
+        self._rng = None
+        if policy in _POLICY_NAMES:
+            self._mode = policy
+        else:
+            match = _SampledRE.match(policy)
+            if match is None:
+                raise ValueError(
+                    f'checksum policy `{policy}` is invalid. Must be one of '
+                    f'{[*_POLICY_NAMES, "sampled(p)"]}')
+            p = float(match.group('p'))
+            if not (0 <= p <= 1):
+                raise ValueError(
+                    f'checksum policy `{policy}` sample probability must be in [0, 1]')
+            self._mode = 'sampled'
+            self._p = p
+            self._rng = random.Random()
+
+        self._lock = Lock()
+        self.verified: int = 0
+        self.skipped: int = 0
+        self.failed: int = 0
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(policy={self._policy!r})'
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    @property
+    def policy(self) -> str:
+        """The policy specification string. Read-only attribute.
+        """
+        return self._policy
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        """Number of reads which were ``verified``, ``skipped``, or ``failed``.
+        """
+        with self._lock:
+            return {'verified': self.verified, 'skipped': self.skipped, 'failed': self.failed}
+
+    def reset_counters(self):
+        """Set all counters back to zero.
+        """
+        with self._lock:
+            self.verified = 0
+            self.skipped = 0
+            self.failed = 0
+
+    def should_verify(self, backend: str, uid: str) -> bool:
+        """Determine if the checksum of a read from some backend file is checked.
+
+        If False is returned, the read is counted as ``skipped``. Otherwise
+        the caller is expected to report the outcome with :meth:`record`.
+
+        Parameters
+        ----------
+        backend : str
+            format code of the backend performing the read.
+        uid : str
+            uid of the backend file the data is read from.
+
+        Returns
+        -------
+        bool
+            True if the checksum should be verified, otherwise False.
+        """
+        mode = self._mode
+        if mode == 'always':
+            return True
+        elif mode == 'off':
+            res = False
+        elif mode == 'sampled':
+            res = self._rng.random() < self._p
+        else:
+            res = (backend, uid) not in _verified_files()
+
+        if not res:
+            with self._lock:
+                self.skipped += 1
+        return res
+
+    def record(self, backend: str, uid: str, valid: bool):
+        """Record the outcome of a checksum verification.
+
+        Parameters
+        ----------
+        backend : str
+            format code of the backend which performed the read.
+        uid : str
+            uid of the backend file the data was read from.
+        valid : bool
+            True if the checksum matched the recorded value, otherwise False.
+        """
+        with self._lock:
+            if valid:
+                self.verified += 1
+            else:
+                self.failed += 1
+        if valid and self._mode == 'first-read-per-file-per-process':
+            _verified_files().add((backend, uid))
+
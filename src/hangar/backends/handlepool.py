@@ -0,0 +1,190 @@
+"""Process wide pool of read-only backend file handles.
+
+Every column accessor opens its own backend accessor instances, which would
+otherwise each lazily open a private handle (``h5py.File``, ``np.memmap``) for
+every backend file they read from. In long running processes holding many
+checkouts (or serving many clients) the same files end up opened many times
+over, exhausting file descriptors and duplicating the HDF5 chunk cache.
+
+Backend accessors opened in read-only mode instead acquire handles from the
+:data:`FILE_HANDLE_POOL`, keyed by ``(backend format code, file path)``. Each
+handle is reference counted; releasing the last reference does not close it,
+but marks it idle. Once more than ``maxsize`` handles are open, idle handles
+are closed in least recently used order. Handles which are still referenced
+are never closed, so the pool can temporarily hold more than ``maxsize``.
+
+A forked child process starts with an empty pool; references acquired before
+the fork belong to the parent. Each reference is tagged with the pool
+:attr:`~FileHandlePool.generation` it was acquired in, and releasing a
+reference from an earlier generation is a no-op.
+"""
+import os
+from collections import Counter, OrderedDict
+from contextlib import suppress
+from threading import RLock
+from typing import Any, Callable, Hashable, Optional
+
+from ..constants import FILE_HANDLE_POOL_MAXSIZE
+
+
+class FileHandlePool(object):
+    """Reference counted, LRU bounded cache of read-only file handles.
+
+    Parameters
+    ----------
+    maxsize : int
+        number of open handles above which idle handles are closed.
+    """
+
+    def __init__(self, maxsize: int = FILE_HANDLE_POOL_MAXSIZE):
+        self._lock = RLock()
+        self._handles: OrderedDict = OrderedDict()
+        self._refs = Counter()
+        self._pid = os.getpid()
+        self._generation = 0
+        self._maxsize = maxsize
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}(maxsize={self._maxsize}, '
+                f'open={len(self._handles)}, in_use={len(self._refs)})')
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._check_pid()
+            return len(self._handles)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            self._check_pid()
+            return key in self._handles
+
+    @property
+    def maxsize(self) -> int:
+        """Number of open handles above which idle handles are closed.
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int):
+        if not isinstance(value, int) or value < 0:
+            raise ValueError(f'maxsize must be a non-negative int, not {value}')
+        with self._lock:
+            self._maxsize = value
+            self._evict()
+
+    @property
+    def generation(self) -> int:
+        """Counter incremented whenever the pool is reset after a ``fork``.
+
+        Recorded alongside the key of every acquired handle so that references
+        inherited from a parent process can be told apart from those acquired
+        in the current process.
+        """
+        with self._lock:
+            self._check_pid()
+            return self._generation
+
+    def refcount(self, key: Hashable) -> int:
+        """Number of references currently held to the handle of some key.
+        """
+        with self._lock:
+            self._check_pid()
+            return self._refs[key]
+
+    def _check_pid(self):
+        """Forget handles inherited from a parent process (after ``fork``).
+
+        The handles are dropped without being closed, as they are still in use
+        by the parent.
+        """
+        pid = os.getpid()
+        if pid != self._pid:
+            self._handles = OrderedDict()
+            self._refs = Counter()
+            self._pid = pid
+            self._generation += 1
+
+    def _evict(self):
+        """Close idle handles in least recently used order while over ``maxsize``.
+        """
+        num_open = len(self._handles)
+        for key in list(self._handles.keys()):
+            if num_open <= self._maxsize:
+                break
+            if self._refs[key] == 0:
+                handle = self._handles.pop(key)
+                with suppress(AttributeError):
+                    handle.close()
+                num_open -= 1
+
+    def acquire(self, key: Hashable, opener: Callable[[], Any]) -> Any:
+        """Get a reference to the handle of some key, opening it if needed.
+
+        Parameters
+        ----------
+        key : Hashable
+            ``(backend format code, file path)`` identifying the handle.
+        opener : Callable[[], Any]
+            called without arguments to open the handle if it is not pooled.
+
+        Returns
+        -------
+        Any
+            the pooled handle. Must be returned with :meth:`release`.
+        """
+        with self._lock:
+            self._check_pid()
+            try:
+                handle = self._handles[key]
+                self._handles.move_to_end(key)
+            except KeyError:
+                handle = opener()
+                self._handles[key] = handle
+            self._refs[key] += 1
+            self._evict()
+            return handle
+
+    def release(self, key: Hashable, generation: Optional[int] = None):
+        """Return a reference to the handle of some key acquired from the pool.
+
+        Parameters
+        ----------
+        key : Hashable
+            key the handle was acquired with.
+        generation : Optional[int]
+            :attr:`generation` of the pool when the handle was acquired. If it
+            is from an earlier generation (the reference was acquired in a
+            parent process before a ``fork``), the call is a no-op. If None
+            (default), the reference is assumed to be from the current
+            generation.
+
+        Raises
+        ------
+        RuntimeError
+            If no reference to the handle is held.
+        """
+        with self._lock:
+            self._check_pid()
+            if generation is not None and generation != self._generation:
+                return
+            if self._refs[key] <= 0:
+                del self._refs[key]
+                raise RuntimeError(f'release called on {key} with no references held')
+            self._refs[key] -= 1
+            if self._refs[key] == 0:
+                del self._refs[key]
+                self._evict()
+
+    def clear(self):
+        """Close every idle handle in the pool.
+        """
+        with self._lock:
+            self._check_pid()
+            for key in list(self._handles.keys()):
+                if self._refs[key] == 0:
+                    handle = self._handles.pop(key)
+                    with suppress(AttributeError):
+                        handle.close()
+
+
+FILE_HANDLE_POOL = FileHandlePool()
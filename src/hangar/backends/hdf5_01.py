@@ -200,11 +200,11 @@ Technical Notes
 import logging
 import math
 import os
-from collections import ChainMap
+from collections import ChainMap, defaultdict
 from contextlib import suppress
 from functools import partial
 from pathlib import Path
-from typing import MutableMapping, Tuple, Optional, Union, Callable
+from typing import MutableMapping, Tuple, Optional, Union, Callable, List, Sequence
 
 import h5py
 import numpy as np
@@ -223,12 +223,14 @@ from xxhash import xxh64_hexdigest
 
 
 from .chunk import calc_chunkshape
+from .checksums import ChecksumPolicy
+from .handlepool import FILE_HANDLE_POOL
 from .specs import HDF5_01_DataHashSpec
 from .. import __version__
 from ..optimized_utils import SizedDict
 from ..constants import DIR_DATA_REMOTE, DIR_DATA_STAGE, DIR_DATA_STORE, DIR_DATA
 from ..op_state import writer_checkout_only, reader_checkout_only
-from ..utils import find_next_prime, random_string, set_blosc_nthreads
+from ..utils import consecutive_runs, find_next_prime, random_string, set_blosc_nthreads
 from ..typesystem import Descriptor, OneOf, DictItems, SizedIntegerTuple, checkedmeta
 
 set_blosc_nthreads()
@@ -386,11 +388,13 @@ class HDF5_01_FileHandles(object):
         self.schema_shape: tuple = schema_shape
         self.schema_dtype: np.dtype = schema_dtype
         self._dflt_backend_opts: Optional[dict] = None
+        self.checksum_policy: ChecksumPolicy = ChecksumPolicy()
 
         self.rFp: HDF5_01_MapTypes = {}
         self.wFp: HDF5_01_MapTypes = {}
         self.Fp: HDF5_01_MapTypes = ChainMap(self.rFp, self.wFp)
         self.rDatasets = SizedDict(maxsize=100)
+        self._pooled: MutableMapping[str, Tuple[Tuple[str, str], int]] = {}
         self.wdset: h5py.Dataset = None
 
         self.mode: Optional[str] = None
@@ -426,6 +430,7 @@ class HDF5_01_FileHandles(object):
         del state['Fp']
         del state['rDatasets']
         del state['wdset']
+        del state['_pooled']
         return state
 
     def __setstate__(self, state: dict) -> None:  # pragma: no cover
@@ -437,6 +442,7 @@ class HDF5_01_FileHandles(object):
         self.Fp = ChainMap(self.rFp, self.wFp)
         self.rDatasets = {}
         self.wdset = None
+        self._pooled = {}
         self.open(mode=self.mode)
 
     @property
@@ -488,7 +494,7 @@ class HDF5_01_FileHandles(object):
                 if uidpth.suffix == '.hdf5':
                     file_pth = self.DATADIR.joinpath(uidpth.name)
                     self.rFp[uidpth.stem] = partial(
-                        h5py.File, file_pth, 'r', swmr=True, libver='latest')
+                        self._open_read_handle, uidpth.stem, file_pth)
 
         if not remote_operation:
             if not self.STOREDIR.is_dir():
@@ -497,7 +503,7 @@ class HDF5_01_FileHandles(object):
                 if uidpth.suffix == '.hdf5':
                     file_pth = self.DATADIR.joinpath(uidpth.name)
                     self.rFp[uidpth.stem] = partial(
-                        h5py.File, file_pth, 'r', swmr=True, libver='latest')
+                        self._open_read_handle, uidpth.stem, file_pth)
 
     def close(self):
         """Close a file handle after writes have been completed
@@ -526,11 +532,41 @@ class HDF5_01_FileHandles(object):
             self.w_uid = None
 
         for uid in list(self.rFp.keys()):
-            with suppress(AttributeError):
-                self.rFp[uid].close()
+            if uid in self._pooled:
+                FILE_HANDLE_POOL.release(*self._pooled.pop(uid))
+            else:
+                with suppress(AttributeError):
+                    self.rFp[uid].close()
             del self.rFp[uid]
         self.rDatasets = {}
 
+    def _open_read_handle(self, uid: str, file_pth: Path) -> h5py.File:
+        """Open a SWMR read-only handle to some hdf5 file.
+
+        In read-only mode the handle is acquired from the process wide
+        ``FILE_HANDLE_POOL`` (and returned to it on :meth:`close`) rather than
+        being opened privately.
+
+        Parameters
+        ----------
+        uid : str
+            file name prefix of the hdf5 file.
+        file_pth : Path
+            path to the hdf5 file on disk.
+
+        Returns
+        -------
+        h5py.File
+            read-only handle to the file.
+        """
+        opener = partial(h5py.File, file_pth, 'r', swmr=True, libver='latest')
+        if self.mode != 'r':
+            return opener()
+        key = (_FmtCode, str(file_pth))
+        handle = FILE_HANDLE_POOL.acquire(key, opener)
+        self._pooled[uid] = (key, FILE_HANDLE_POOL.generation)
+        return handle
+
     @staticmethod
     def delete_in_process_data(repo_path: Path, *, remote_operation=False) -> None:
         """Removes some set of files entirely from the stage/remote directory.
@@ -739,6 +775,40 @@ class HDF5_01_FileHandles(object):
             assert self.wFp[self.w_uid].swmr_mode is True
         self.wdset = self.wFp[self.w_uid][f'/{self.hNextPath}']
 
+    def _dataset_handle(self, uid: str, dsetCol: str) -> h5py.Dataset:
+        """Get the hdf5 dataset of some collection, opening the file if needed.
+
+        Parameters
+        ----------
+        uid : str
+            file name prefix which the collection is stored in.
+        dsetCol : str
+            name of the collection (hdf5 dataset), ie. ``'/0'``.
+
+        Returns
+        -------
+        h5py.Dataset
+            handle to the collection dataset.
+        """
+        rdictkey = f'{uid}{dsetCol}'
+        if rdictkey in self.rDatasets:
+            return self.rDatasets[rdictkey]
+        try:
+            dset = self.Fp[uid][dsetCol]
+        except TypeError:
+            self.Fp[uid] = self.Fp[uid]()
+            dset = self.Fp[uid][dsetCol]
+        except KeyError:
+            process_dir = self.STAGEDIR if self.mode == 'a' else self.STOREDIR
+            if Path(process_dir, f'{uid}.hdf5').is_file():
+                file_pth = self.DATADIR.joinpath(f'{uid}.hdf5')
+                self.rFp[uid] = self._open_read_handle(uid, file_pth)
+                dset = self.Fp[uid][dsetCol]
+            else:
+                raise
+        self.rDatasets[rdictkey] = dset
+        return dset
+
     def read_data(self, hashVal: HDF5_01_DataHashSpec) -> np.ndarray:
         """Read data from an hdf5 file handle at the specified locations
 
@@ -772,7 +842,7 @@ class HDF5_01_FileHandles(object):
                     process_dir = self.STAGEDIR if self.mode == 'a' else self.STOREDIR
                     if Path(process_dir, f'{hashVal.uid}.hdf5').is_file():
                         file_pth = self.DATADIR.joinpath(f'{hashVal.uid}.hdf5')
-                        self.rFp[hashVal.uid] = h5py.File(file_pth, 'r', swmr=True, libver='latest')
+                        self.rFp[hashVal.uid] = self._open_read_handle(hashVal.uid, file_pth)
                         self.rDatasets[rdictkey] = self.Fp[hashVal.uid][dsetCol]
                         self.rDatasets[rdictkey].read_direct(destArr, srcSlc, None)
                     else:
@@ -792,40 +862,125 @@ class HDF5_01_FileHandles(object):
                     process_dir = self.STAGEDIR if self.mode == 'a' else self.STOREDIR
                     if Path(process_dir, f'{hashVal.uid}.hdf5').is_file():
                         file_pth = self.DATADIR.joinpath(f'{hashVal.uid}.hdf5')
-                        self.rFp[hashVal.uid] = h5py.File(file_pth, 'r', swmr=True, libver='latest')
+                        self.rFp[hashVal.uid] = self._open_read_handle(hashVal.uid, file_pth)
                         destArr = self.Fp[hashVal.uid][dsetCol][srcSlc]
                         self.rDatasets[rdictkey] = self.Fp[hashVal.uid][dsetCol]
                     else:
                         raise
 
-        if xxh64_hexdigest(destArr) != hashVal.checksum:
+        if self.checksum_policy.should_verify(_FmtCode, hashVal.uid):
+            destArr = self._verify_checksum(destArr, hashVal)
+        return destArr
+
+    def _verify_checksum(self, arr: np.ndarray, hashVal: HDF5_01_DataHashSpec) -> np.ndarray:
+        """Verify the checksum of data read from disk, recording the outcome.
+
+        Returns
+        -------
+        np.ndarray
+            ``arr``, or a copy of ``arr`` cast to the schema dtype if that is
+            required for the checksum to match.
+
+        Raises
+        ------
+        RuntimeError
+            If the recorded checksum does not match the checksum of the data.
+        """
+        if xxh64_hexdigest(arr) != hashVal.checksum:
             # try casting to check if dtype does not match for all zeros case
-            destArr = destArr.astype(np.typeDict[self.Fp[hashVal.uid]['/'].attrs['schema_dtype_num']])
-            if xxh64_hexdigest(destArr) != hashVal.checksum:
+            arr = arr.astype(np.typeDict[self.Fp[hashVal.uid]['/'].attrs['schema_dtype_num']])
+            if xxh64_hexdigest(arr) != hashVal.checksum:
+                self.checksum_policy.record(_FmtCode, hashVal.uid, False)
                 raise RuntimeError(
-                    f'DATA CORRUPTION Checksum {xxh64_hexdigest(destArr)} != recorded {hashVal}')
-        return destArr
+                    f'DATA CORRUPTION Checksum {xxh64_hexdigest(arr)} != recorded {hashVal}')
+        self.checksum_policy.record(_FmtCode, hashVal.uid, True)
+        return arr
 
-    def write_data(self, array: np.ndarray, *, remote_operation: bool = False) -> bytes:
-        """verifies correctness of array data and performs write operation.
+    def read_data_batch(self, hashVals: Sequence[HDF5_01_DataHashSpec],
+                        out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Read many samples of the same shape into a single stacked array.
+
+        Specs are grouped by file ``uid`` and collection ``dataset``, then sorted
+        by ``dataset_idx`` so that each run of consecutively stored samples is
+        retrieved with a single ``read_direct`` call. When a run also maps to
+        consecutive output positions the data is read directly into ``out``
+        with no intermediate buffer. Checksums are verified according to the
+        ``checksum_policy``.
 
         Parameters
         ----------
-        array : np.ndarray
-            tensor to write to group.
-        remote_operation : optional, kwarg only, bool
-            If this is a remote process which is adding data, any necessary
-            hdf5 dataset files will be created in the remote data dir instead
-            of the stage directory. (default is False, which is for a regular
-            access process)
+        hashVals : Sequence[HDF5_01_DataHashSpec]
+            record specifications of the samples to read. All must share the
+            same shape.
+        out : Optional[np.ndarray]
+            C-contiguous array of shape ``(len(hashVals), *shape)`` and schema
+            dtype to read data into. If None (default), a new array is allocated.
 
         Returns
         -------
-        bytes
-            string identifying the collection dataset and collection dim-0 index
-            which the array can be accessed at.
+        np.ndarray
+            stacked data, with ``hashVals[i]`` stored at index ``i``.
+
+        Raises
+        ------
+        ValueError
+            If the samples do not share a shape, or if ``out`` is not compatible.
+        RuntimeError
+            If the recorded checksum does not match the data of some sample.
+        """
+        num = len(hashVals)
+        shape = hashVals[0].shape if num else self.schema_shape
+        if any(spec.shape != shape for spec in hashVals):
+            raise ValueError('All samples read in a batch must have the same shape.')
+        expected_shape = (num, *shape)
+        if out is None:
+            out = np.empty(expected_shape, dtype=self.schema_dtype)
+        elif (out.shape != expected_shape) or (out.dtype != np.dtype(self.schema_dtype)) \
+                or (not out.flags.c_contiguous):
+            raise ValueError(
+                f'`out` must be a C-contiguous array of shape {expected_shape} and '
+                f'dtype {np.dtype(self.schema_dtype)}, not {out.shape} {out.dtype}')
+
+        groups = defaultdict(list)
+        for pos, spec in enumerate(hashVals):
+            groups[(spec.uid, spec.dataset)].append((spec.dataset_idx, pos))
+
+        # scalar samples are stored with a trailing dimension of size 1
+        slcs = [slice(0, dim) for dim in shape] if shape else [0]
+        for (uid, dataset), locations in groups.items():
+            dset = self._dataset_handle(uid, f'/{dataset}')
+            locations.sort()
+            for start, positions in consecutive_runs(locations):
+                nrun, p0 = len(positions), positions[0]
+                srcSlc = (slice(start, start + nrun), *slcs)
+                if positions == list(range(p0, p0 + nrun)):
+                    dset.read_direct(out, srcSlc, np.s_[p0:p0 + nrun])
+                else:
+                    buf = np.empty((nrun, *shape), dtype=out.dtype)
+                    dset.read_direct(buf, srcSlc, None)
+                    out[positions] = buf
+
+        for pos, spec in enumerate(hashVals):
+            if self.checksum_policy.should_verify(_FmtCode, spec.uid):
+                sample = out[pos, ...]
+                verified = self._verify_checksum(sample, spec)
+                if verified is not sample:
+                    out[pos, ...] = verified
+        return out
+
+    def _advance_write_location(self, *, remote_operation: bool = False):
+        """Move the write pointer (``hNextPath``, ``hIdx``) to the next free slot.
+
+        If the current collection is full, it is flushed and the next one is
+        selected; if the file has run out of collections, a new file is created.
+
+        Parameters
+        ----------
+        remote_operation : optional, kwarg only, bool
+            If this is a remote process which is adding data, any necessary
+            hdf5 dataset files will be created in the remote data dir instead
+            of the stage directory.
         """
-        checksum = xxh64_hexdigest(array)
         if self.w_uid in self.wFp:
             self.hIdx += 1
             if self.hIdx >= self.hMaxSize:
@@ -842,8 +997,85 @@ class HDF5_01_FileHandles(object):
         else:
             self._create_schema(remote_operation=remote_operation)
 
+    def write_data(self, array: np.ndarray, *, remote_operation: bool = False) -> bytes:
+        """verifies correctness of array data and performs write operation.
+
+        Parameters
+        ----------
+        array : np.ndarray
+            tensor to write to group.
+        remote_operation : optional, kwarg only, bool
+            If this is a remote process which is adding data, any necessary
+            hdf5 dataset files will be created in the remote data dir instead
+            of the stage directory. (default is False, which is for a regular
+            access process)
+
+        Returns
+        -------
+        bytes
+            string identifying the collection dataset and collection dim-0 index
+            which the array can be accessed at.
+        """
+        checksum = xxh64_hexdigest(array)
+        self._advance_write_location(remote_operation=remote_operation)
+
         destSlc = (self.hIdx, *[slice(0, dim) for dim in array.shape])
         self.wdset.write_direct(array, None, destSlc)
         self.wdset.flush()
         res = hdf5_01_encode(self.w_uid, checksum, self.hNextPath, self.hIdx, array.shape)
         return res
+
+    def write_data_batch(self, arrays: Sequence[np.ndarray], *,
+                         remote_operation: bool = False) -> List[bytes]:
+        """write many arrays to consecutive collection indexes, flushing once.
+
+        Runs of same shaped arrays which fit in the remaining slots of the
+        current collection are stacked and written with a single hyperslab
+        selection, rather than issuing one ``write_direct`` (and ``flush``)
+        call per array as :meth:`write_data` does.
+
+        Parameters
+        ----------
+        arrays : Sequence[np.ndarray]
+            tensors to write to group, in order.
+        remote_operation : optional, kwarg only, bool
+            If this is a remote process which is adding data, any necessary
+            hdf5 dataset files will be created in the remote data dir instead
+            of the stage directory. (default is False, which is for a regular
+            access process)
+
+        Returns
+        -------
+        List[bytes]
+            db hash record values specifying location information of each
+            input array (in the same order as ``arrays``).
+        """
+        res = []
+        start, total = 0, len(arrays)
+        while start < total:
+            self._advance_write_location(remote_operation=remote_operation)
+            shape = arrays[start].shape
+            stop = min(start + self.hMaxSize - self.hIdx, total)
+            for end in range(start + 1, stop):
+                if arrays[end].shape != shape:
+                    stop = end
+                    break
+
+            run = arrays[start:stop]
+            nrun = len(run)
+            block = run[0][None, ...] if nrun == 1 else np.stack(run)
+            # scalar samples are stored with a trailing dimension of size 1
+            slcs = [slice(0, dim) for dim in shape] if shape else [0]
+            destSlc = (slice(self.hIdx, self.hIdx + nrun), *slcs)
+            self.wdset.write_direct(block, None, destSlc)
+            for offset, array in enumerate(run):
+                checksum = xxh64_hexdigest(array)
+                res.append(hdf5_01_encode(
+                    self.w_uid, checksum, self.hNextPath, self.hIdx + offset, shape))
+
+            self.hIdx += nrun - 1
+            start = stop
+
+        if self.wdset is not None:
+            self.wdset.flush()
+        return res
@@ -87,13 +87,15 @@ import string
 from collections import ChainMap
 from contextlib import suppress
 from functools import partial
-from itertools import permutations
+from itertools import islice, permutations
 from pathlib import Path
-from typing import Optional
+from threading import Lock
+from typing import Optional, List, Sequence
 
 import lmdb
 from xxhash import xxh64_hexdigest
 
+from .checksums import ChecksumPolicy
 from .specs import LMDB_31_DataHashSpec
 from ..constants import DIR_DATA_REMOTE, DIR_DATA_STAGE, DIR_DATA_STORE, DIR_DATA
 from ..op_state import reader_checkout_only, writer_checkout_only
@@ -170,11 +172,13 @@ class LMDB_31_FileHandles:
         self.rFp = {}
         self.wFp = {}
         self.Fp = ChainMap(self.rFp, self.wFp)
+        self._open_lock = Lock()
 
         self.mode: Optional[str] = None
         self.w_uid: Optional[str] = None
         self.row_idx: Optional[str] = None
         self._dflt_backend_opts: Optional[dict] = None
+        self.checksum_policy: ChecksumPolicy = ChecksumPolicy()
 
         self.STAGEDIR: Path = Path(self.path, DIR_DATA_STAGE, _FmtCode)
         self.REMOTEDIR: Path = Path(self.path, DIR_DATA_REMOTE, _FmtCode)
@@ -198,6 +202,7 @@ class LMDB_31_FileHandles:
         del state['rFp']
         del state['wFp']
         del state['Fp']
+        del state['_open_lock']
         return state
 
     def __setstate__(self, state: dict) -> None:  # pragma: no cover
@@ -207,6 +212,7 @@ class LMDB_31_FileHandles:
         self.rFp = {}
         self.wFp = {}
         self.Fp = ChainMap(self.rFp, self.wFp)
+        self._open_lock = Lock()
 
     @property
     def backend_opts(self):
@@ -350,20 +356,30 @@ class LMDB_31_FileHandles:
                 if res is False:
                     raise RuntimeError(hashVal)
         except AttributeError:
-            self.Fp[hashVal.uid] = self.Fp[hashVal.uid]()
+            # environments can only be opened once per process; the accessor
+            # may be shared by many reader threads.
+            with self._open_lock:
+                if isinstance(self.Fp[hashVal.uid], partial):
+                    self.Fp[hashVal.uid] = self.Fp[hashVal.uid]()
             return self.read_data(hashVal)
         except KeyError:
             process_dir = self.STAGEDIR if self.mode == 'a' else self.STOREDIR
             if Path(process_dir, f'{hashVal.uid}.lmdbdir').is_file():
                 file_pth = self.DATADIR.joinpath(hashVal.uid)
-                self.rFp[hashVal.uid] = lmdb.open(str(file_pth), readonly=True, **LMDB_SETTINGS)
+                with self._open_lock:
+                    if hashVal.uid not in self.Fp:
+                        self.rFp[hashVal.uid] = lmdb.open(
+                            str(file_pth), readonly=True, **LMDB_SETTINGS)
                 return self.read_data(hashVal)
             else:
                 raise
 
-        if xxh64_hexdigest(res) != hashVal.checksum:
-            raise RuntimeError(
-                f'DATA CORRUPTION Checksum {xxh64_hexdigest(res)} != recorded {hashVal}')
+        if self.checksum_policy.should_verify(_FmtCode, hashVal.uid):
+            cksum = xxh64_hexdigest(res)
+            valid = cksum == hashVal.checksum
+            self.checksum_policy.record(_FmtCode, hashVal.uid, valid)
+            if not valid:
+                raise RuntimeError(f'DATA CORRUPTION Checksum {cksum} != recorded {hashVal}')
         return res
 
     def write_data(self, data: bytes, *, remote_operation: bool = False) -> bytes:
@@ -405,3 +421,62 @@ class LMDB_31_FileHandles:
             return self.write_data(data, remote_operation=remote_operation)
 
         return lmdb_31_encode(self.w_uid, row_idx, checksum)
+
+    def write_data_batch(self, data: Sequence[bytes], *,
+                         remote_operation: bool = False) -> List[bytes]:
+        """write many values in a single write transaction per lmdb database.
+
+        Rather than opening (and committing) a write transaction for every value
+        as :meth:`write_data` does, all values are appended in one ``putmulti``
+        call. Should the database fill up, the batch is retried in a new database
+        with the number of values placed in each transaction halved.
+
+        Parameters
+        ----------
+        data: Sequence[bytes]
+            data values to write, in order.
+        remote_operation : optional, kwarg only, bool
+            If this is a remote process which is adding data, any necessary
+            lmdb databases will be created in the remote data dir instead of
+            the stage directory. (default is False, which is for a regular
+            access process)
+
+        Returns
+        -------
+        List[bytes]
+            db hash record values specifying location information of each
+            input value (in the same order as ``data``).
+        """
+        res = []
+        pending = list(data)
+        limit, fresh_db = len(pending), False
+        while pending:
+            if self.w_uid not in self.wFp:
+                self._create_schema(remote_operation=remote_operation)
+                fresh_db = True
+            row_idxs = list(islice(self.row_idx, min(limit, len(pending))))
+            if not row_idxs:
+                self._create_schema(remote_operation=remote_operation)
+                fresh_db = True
+                continue
+
+            batch = pending[:len(row_idxs)]
+            encoded_row_idxs = [row_idx.encode() for row_idx in row_idxs]
+            try:
+                with self.wFp[self.w_uid].begin(write=True) as txn:
+                    with txn.cursor() as cur:
+                        cur.putmulti(zip(encoded_row_idxs, batch), append=True)
+            except lmdb.MapFullError:
+                if fresh_db and len(batch) == 1:
+                    raise
+                self._create_schema(remote_operation=remote_operation)
+                fresh_db = True
+                limit = max(len(batch) // 2, 1)
+                continue
+
+            for row_idx, encoded_data in zip(row_idxs, batch):
+                checksum = xxh64_hexdigest(encoded_data)
+                res.append(lmdb_31_encode(self.w_uid, row_idx, checksum))
+            pending = pending[len(batch):]
+            fresh_db = False
+        return res
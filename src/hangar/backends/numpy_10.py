@@ -75,21 +75,31 @@ Technical Notes
    format itself to serve as a quick way to verify no disk corruption occurred.
    This is required since numpy has no built in data integrity validation
    methods when reading from disk.
+
+*  Read-only checkouts can opt into ``zero_copy`` reads, where a read-only
+   view of the memmap subarray is returned instead of a copy. In this mode the
+   checksum of each sample is only verified (subject to the checkout's checksum
+   policy) the first time the sample is read after the file handles are
+   opened; subsequent reads of the same sample skip the checksum entirely.
+   Verified samples are tracked with one boolean flag per row of each file, so
+   the bookkeeping is bounded by the size of the files read.
 """
 import os
-from collections import ChainMap
+from collections import ChainMap, defaultdict
 from functools import partial
 from pathlib import Path
-from typing import MutableMapping, Optional
+from typing import Dict, MutableMapping, Optional, List, Sequence, Tuple
 
 import numpy as np
 from numpy.lib.format import open_memmap
 from xxhash import xxh64_hexdigest
 
+from .checksums import ChecksumPolicy
+from .handlepool import FILE_HANDLE_POOL
 from .specs import NUMPY_10_DataHashSpec
 from ..constants import DIR_DATA_REMOTE, DIR_DATA_STAGE, DIR_DATA_STORE, DIR_DATA
 from ..op_state import reader_checkout_only, writer_checkout_only
-from ..utils import random_string
+from ..utils import consecutive_runs, random_string
 from ..typesystem import Descriptor, OneOf, EmptyDict, checkedmeta
 
 
@@ -175,11 +185,16 @@ class NUMPY_10_FileHandles(object):
         self.rFp: MutableMapping[str, np.memmap] = {}
         self.wFp: MutableMapping[str, np.memmap] = {}
         self.Fp = ChainMap(self.rFp, self.wFp)
+        self._pooled: MutableMapping[str, Tuple[Tuple[str, str], int]] = {}
 
         self.mode: str = None
         self.w_uid: str = None
         self.hIdx: int = None
 
+        self.checksum_policy: ChecksumPolicy = ChecksumPolicy()
+        self.zero_copy: bool = False
+        self._zero_copy_verified: Dict[str, np.ndarray] = {}
+
         self.STAGEDIR: Path = Path(self.repo_path, DIR_DATA_STAGE, _FmtCode)
         self.REMOTEDIR: Path = Path(self.repo_path, DIR_DATA_REMOTE, _FmtCode)
         self.DATADIR: Path = Path(self.repo_path, DIR_DATA, _FmtCode)
@@ -195,6 +210,8 @@ class NUMPY_10_FileHandles(object):
         del state['rFp']
         del state['wFp']
         del state['Fp']
+        del state['_zero_copy_verified']
+        del state['_pooled']
         return state
 
     def __setstate__(self, state: dict) -> None:  # pragma: no cover
@@ -204,6 +221,8 @@ class NUMPY_10_FileHandles(object):
         self.rFp = {}
         self.wFp = {}
         self.Fp = ChainMap(self.rFp, self.wFp)
+        self._zero_copy_verified = {}
+        self._pooled = {}
         self.open(mode=self.mode)
 
     def __enter__(self):
@@ -240,6 +259,20 @@ class NUMPY_10_FileHandles(object):
         """
         return self._backend_opts_set(value)
 
+    @reader_checkout_only
+    def set_zero_copy(self, value: bool):
+        """Enable or disable zero-copy reads in a read-only checkout.
+
+        Parameters
+        ----------
+        value : bool
+            If True, :meth:`read_data` returns read-only views of the memmap
+            subarrays rather than copies, and verifies the checksum of each
+            sample only on the first read. If False (default), every read
+            returns a verified copy.
+        """
+        self.zero_copy = value
+
     def open(self, mode: str, *, remote_operation: bool = False):
         """open numpy file handle coded directories
 
@@ -258,7 +291,7 @@ class NUMPY_10_FileHandles(object):
             for uidpth in process_dir.iterdir():
                 if uidpth.suffix == '.npy':
                     file_pth = self.DATADIR.joinpath(uidpth.name)
-                    self.rFp[uidpth.stem] = partial(open_memmap, file_pth, 'r')
+                    self.rFp[uidpth.stem] = partial(self._open_read_handle, uidpth.stem, file_pth)
 
         if not remote_operation:
             if not self.STOREDIR.is_dir():
@@ -266,7 +299,7 @@ class NUMPY_10_FileHandles(object):
             for uidpth in self.STOREDIR.iterdir():
                 if uidpth.suffix == '.npy':
                     file_pth = self.DATADIR.joinpath(uidpth.name)
-                    self.rFp[uidpth.stem] = partial(open_memmap, file_pth, 'r')
+                    self.rFp[uidpth.stem] = partial(self._open_read_handle, uidpth.stem, file_pth)
 
     def close(self, *args, **kwargs):
         """Close any open file handles.
@@ -280,7 +313,37 @@ class NUMPY_10_FileHandles(object):
                 del self.wFp[k]
 
         for k in list(self.rFp.keys()):
+            if k in self._pooled:
+                FILE_HANDLE_POOL.release(*self._pooled.pop(k))
             del self.rFp[k]
+        self._zero_copy_verified.clear()
+
+    def _open_read_handle(self, uid: str, file_pth: Path) -> np.memmap:
+        """Open a read-only memmap of some np file.
+
+        In read-only mode the memmap is acquired from the process wide
+        ``FILE_HANDLE_POOL`` (and returned to it on :meth:`close`) rather than
+        being opened privately.
+
+        Parameters
+        ----------
+        uid : str
+            file name (schema uid) of the np file.
+        file_pth : Path
+            path to the np file on disk.
+
+        Returns
+        -------
+        np.memmap
+            read-only memory mapped array backed by the file.
+        """
+        opener = partial(open_memmap, file_pth, 'r')
+        if self.mode != 'r':
+            return opener()
+        key = (_FmtCode, str(file_pth))
+        handle = FILE_HANDLE_POOL.acquire(key, opener)
+        self._pooled[uid] = (key, FILE_HANDLE_POOL.generation)
+        return handle
 
     @staticmethod
     def delete_in_process_data(repo_path: Path, *, remote_operation: bool = False):
@@ -344,7 +407,9 @@ class NUMPY_10_FileHandles(object):
         Returns
         -------
         np.ndarray
-            tensor data stored at the provided hashVal specification.
+            tensor data stored at the provided hashVal specification. If
+            ``zero_copy`` reads are enabled, this is a read-only view of the
+            memmap subarray.
 
         Raises
         ------
@@ -380,17 +445,168 @@ class NUMPY_10_FileHandles(object):
             process_dir = self.STAGEDIR if self.mode == 'a' else self.STOREDIR
             if Path(process_dir, f'{hashVal.uid}.npy').is_file():
                 file_pth = self.DATADIR.joinpath(f'{hashVal.uid}.npy')
-                self.rFp[hashVal.uid] = open_memmap(file_pth, 'r')
+                self.rFp[hashVal.uid] = self._open_read_handle(hashVal.uid, file_pth)
                 res = self.Fp[hashVal.uid][srcSlc]
             else:
                 raise
 
+        if self.zero_copy:
+            return self._read_data_view(res, hashVal, num_rows=len(self.Fp[hashVal.uid]))
+
         out = np.array(res, dtype=res.dtype, order='C')
-        if xxh64_hexdigest(out) != hashVal.checksum:
-            raise RuntimeError(
-                f'DATA CORRUPTION Checksum {xxh64_hexdigest(out)} != recorded {hashVal}')
+        if self.checksum_policy.should_verify(_FmtCode, hashVal.uid):
+            self._verify_checksum(out, hashVal)
+        return out
+
+    def _verify_checksum(self, arr: np.ndarray, hashVal: NUMPY_10_DataHashSpec):
+        """Verify the checksum of data read from disk, recording the outcome.
+
+        Raises
+        ------
+        RuntimeError
+            If the recorded checksum does not match the checksum of ``arr``.
+        """
+        cksum = xxh64_hexdigest(arr)
+        valid = cksum == hashVal.checksum
+        self.checksum_policy.record(_FmtCode, hashVal.uid, valid)
+        if not valid:
+            raise RuntimeError(f'DATA CORRUPTION Checksum {cksum} != recorded {hashVal}')
+
+    def _read_data_view(self, res: np.memmap, hashVal: NUMPY_10_DataHashSpec,
+                        num_rows: int) -> np.ndarray:
+        """Return a read-only view of a memmap subarray for zero-copy reads.
+
+        The checksum is verified only on the first read of each sample
+        location; the result of a successful verification is recorded in a
+        per file bitmap (one flag per row of the file) until the file handles
+        are closed.
+        """
+        out = res.view(np.ndarray)
+        out.flags.writeable = False
+        try:
+            verified = self._zero_copy_verified[hashVal.uid]
+        except KeyError:
+            verified = np.zeros(num_rows, dtype=bool)
+            self._zero_copy_verified[hashVal.uid] = verified
+        if not verified[hashVal.collection_idx]:
+            if self.checksum_policy.should_verify(_FmtCode, hashVal.uid):
+                self._verify_checksum(np.ascontiguousarray(out), hashVal)
+                verified[hashVal.collection_idx] = True
+        return out
+
+    def _memmap_handle(self, uid: str) -> np.memmap:
+        """Get the memmap of some file uid, opening the file if needed.
+
+        Parameters
+        ----------
+        uid : str
+            file name (schema uid) of the np file.
+
+        Returns
+        -------
+        np.memmap
+            memory mapped array backed by the file.
+        """
+        try:
+            fp = self.Fp[uid]
+        except KeyError:
+            process_dir = self.STAGEDIR if self.mode == 'a' else self.STOREDIR
+            if Path(process_dir, f'{uid}.npy').is_file():
+                file_pth = self.DATADIR.joinpath(f'{uid}.npy')
+                self.rFp[uid] = self._open_read_handle(uid, file_pth)
+                return self.rFp[uid]
+            else:
+                raise
+        if isinstance(fp, partial):
+            fp = fp()
+            self.Fp[uid] = fp
+        return fp
+
+    def read_data_batch(self, hashVals: Sequence[NUMPY_10_DataHashSpec],
+                        out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Read many samples of the same shape into a single stacked array.
+
+        Specs are grouped by file ``uid`` and sorted by ``collection_idx`` so
+        that each run of consecutively stored samples is copied out of the
+        memmap with a single slice assignment. When a run also maps to
+        consecutive output positions the data is copied directly into ``out``.
+        Checksums are verified according to the ``checksum_policy``.
+
+        Parameters
+        ----------
+        hashVals : Sequence[NUMPY_10_DataHashSpec]
+            record specifications of the samples to read. All must share the
+            same shape.
+        out : Optional[np.ndarray]
+            C-contiguous array of shape ``(len(hashVals), *shape)`` and schema
+            dtype to read data into. If None (default), a new array is allocated.
+
+        Returns
+        -------
+        np.ndarray
+            stacked data, with ``hashVals[i]`` stored at index ``i``.
+
+        Raises
+        ------
+        ValueError
+            If the samples do not share a shape, or if ``out`` is not compatible.
+        RuntimeError
+            If the recorded checksum does not match the data of some sample.
+        """
+        num = len(hashVals)
+        shape = hashVals[0].shape if num else self.schema_shape
+        if any(spec.shape != shape for spec in hashVals):
+            raise ValueError('All samples read in a batch must have the same shape.')
+        expected_shape = (num, *shape)
+        if out is None:
+            out = np.empty(expected_shape, dtype=self.schema_dtype)
+        elif (out.shape != expected_shape) or (out.dtype != np.dtype(self.schema_dtype)) \
+                or (not out.flags.c_contiguous):
+            raise ValueError(
+                f'`out` must be a C-contiguous array of shape {expected_shape} and '
+                f'dtype {np.dtype(self.schema_dtype)}, not {out.shape} {out.dtype}')
+
+        groups = defaultdict(list)
+        for pos, spec in enumerate(hashVals):
+            groups[spec.uid].append((spec.collection_idx, pos))
+
+        slcs = [slice(0, x) for x in shape]
+        for uid, locations in groups.items():
+            mm = self._memmap_handle(uid)
+            locations.sort()
+            for start, positions in consecutive_runs(locations):
+                nrun, p0 = len(positions), positions[0]
+                srcSlc = (slice(start, start + nrun), *slcs)
+                if positions == list(range(p0, p0 + nrun)):
+                    out[p0:p0 + nrun] = mm[srcSlc]
+                else:
+                    out[positions] = mm[srcSlc]
+
+        for pos, spec in enumerate(hashVals):
+            if self.checksum_policy.should_verify(_FmtCode, spec.uid):
+                self._verify_checksum(out[pos, ...], spec)
         return out
 
+    def _advance_write_location(self, *, remote_operation: bool = False):
+        """Move the write pointer (``hIdx``) to the next free collection index.
+
+        If the current memmap file is full, it is flushed and a new file is
+        created.
+
+        Parameters
+        ----------
+        remote_operation : bool, optional, kwarg only
+            True if writing in a remote operation, otherwise False. Default is
+            False
+        """
+        if self.w_uid in self.wFp:
+            self.hIdx += 1
+            if self.hIdx >= COLLECTION_SIZE:
+                self.wFp[self.w_uid].flush()
+                self._create_schema(remote_operation=remote_operation)
+        else:
+            self._create_schema(remote_operation=remote_operation)
+
     def write_data(self, array: np.ndarray, *, remote_operation: bool = False) -> bytes:
         """writes array data to disk in the numpy_00 fmtBackend
 
@@ -408,15 +624,58 @@ class NUMPY_10_FileHandles(object):
             db hash record value specifying location information
         """
         checksum = xxh64_hexdigest(array)
-        if self.w_uid in self.wFp:
-            self.hIdx += 1
-            if self.hIdx >= COLLECTION_SIZE:
-                self.wFp[self.w_uid].flush()
-                self._create_schema(remote_operation=remote_operation)
-        else:
-            self._create_schema(remote_operation=remote_operation)
+        self._advance_write_location(remote_operation=remote_operation)
 
         destSlc = (self.hIdx, *[slice(0, x) for x in array.shape])
         self.wFp[self.w_uid][destSlc] = array
         self.wFp[self.w_uid].flush()
         return numpy_10_encode(self.w_uid, checksum, self.hIdx, array.shape)
+
+    def write_data_batch(self, arrays: Sequence[np.ndarray], *,
+                         remote_operation: bool = False) -> List[bytes]:
+        """writes many arrays to consecutive collection indexes, flushing once.
+
+        Runs of same shaped arrays which fit in the remaining slots of the
+        current memmap file are stacked directly into the memmap subarray in a
+        single operation (no intermediate buffer is allocated), and the memmap
+        is flushed once at the end instead of after every array.
+
+        Parameters
+        ----------
+        arrays : Sequence[np.ndarray]
+            tensors to write to disk, in order.
+        remote_operation : bool, optional, kwarg only
+            True if writing in a remote operation, otherwise False. Default is
+            False
+
+        Returns
+        -------
+        List[bytes]
+            db hash record values specifying location information of each
+            input array (in the same order as ``arrays``).
+        """
+        res = []
+        start, total = 0, len(arrays)
+        while start < total:
+            self._advance_write_location(remote_operation=remote_operation)
+            shape = arrays[start].shape
+            stop = min(start + COLLECTION_SIZE - self.hIdx, total)
+            for end in range(start + 1, stop):
+                if arrays[end].shape != shape:
+                    stop = end
+                    break
+
+            run = arrays[start:stop]
+            nrun = len(run)
+            destSlc = (slice(self.hIdx, self.hIdx + nrun), *[slice(0, x) for x in shape])
+            np.stack(run, out=self.wFp[self.w_uid][destSlc])
+            for offset, array in enumerate(run):
+                checksum = xxh64_hexdigest(array)
+                res.append(numpy_10_encode(self.w_uid, checksum, self.hIdx + offset, shape))
+
+            self.hIdx += nrun - 1
+            start = stop
+
+        if self.w_uid in self.wFp:
+            self.wFp[self.w_uid].flush()
+        return res
@@ -55,7 +55,7 @@ Technical Notes
    operation
 """
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
 from .specs import REMOTE_50_DataHashSpec
 from ..op_state import writer_checkout_only, reader_checkout_only
@@ -174,6 +174,11 @@ class REMOTE_50_Handler(object):
             f'data hash spec: {REMOTE_50_DataHashSpec} does not exist on this machine. '
             f'Perform a `data-fetch` operation to retrieve it from the remote server.')
 
+    def read_data_batch(self, hashVals: Sequence[REMOTE_50_DataHashSpec], *args, **kwargs) -> None:
+        raise FileNotFoundError(
+            f'data hash spec: {REMOTE_50_DataHashSpec} does not exist on this machine. '
+            f'Perform a `data-fetch` operation to retrieve it from the remote server.')
+
     def write_data(self, schema_hash: str, *args, **kwargs) -> bytes:
         """Provide a formatted byte representation for storage as a remote reference
 
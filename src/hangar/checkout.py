@@ -15,6 +15,7 @@ from .columns import (
     generate_nested_column,
     generate_flat_column,
 )
+from .backends.checksums import ChecksumPolicy
 from .diff import ReaderUserDiff, WriterUserDiff
 from .merger import select_merge_algorithm
 from .records import commiting, hashs, heads, summarize
@@ -83,7 +84,10 @@ class ReaderCheckout(GetMixin, CheckoutDictIteration):
                  hashenv: lmdb.Environment,
                  branchenv: lmdb.Environment,
                  refenv: lmdb.Environment,
-                 commit: str):
+                 commit: str,
+                 checksum_policy: Optional[ChecksumPolicy] = None,
+                 lazy_specs: bool = False,
+                 compact_specs: bool = False):
         """Developer documentation of init method.
 
         Parameters
@@ -100,6 +104,15 @@ class ReaderCheckout(GetMixin, CheckoutDictIteration):
             db where the commit references are stored.
         commit : str
             specific commit hash to checkout
+        checksum_policy : Optional[ChecksumPolicy]
+            policy deciding when data checksums are verified on read. If None
+            (default), an ``'always'`` policy is used.
+        lazy_specs : bool
+            if True, the backend location of flat column samples is resolved
+            on first read instead of when the column is first accessed.
+        compact_specs : bool
+            if True, flat columns store the backend location of their samples
+            in a compact array backed table.
         """
         self._commit_hash = commit
         self._repo_path = base_path
@@ -110,10 +123,15 @@ class ReaderCheckout(GetMixin, CheckoutDictIteration):
         self._enter_count = 0
         self._stack: Optional[ExitStack] = None
 
+        self._checksum_policy = checksum_policy if checksum_policy is not None else ChecksumPolicy()
+
         self._columns = Columns._from_commit(
             repo_pth=self._repo_path,
             hashenv=self._hashenv,
-            cmtrefenv=self._dataenv)
+            cmtrefenv=self._dataenv,
+            checksum_policy=self._checksum_policy,
+            lazy_specs=lazy_specs,
+            compact_specs=compact_specs)
         self._differ = ReaderUserDiff(
             commit_hash=self._commit_hash,
             branchenv=self._branchenv,
@@ -245,6 +263,30 @@ class ReaderCheckout(GetMixin, CheckoutDictIteration):
         self._verify_alive()
         return self._commit_hash
 
+    @property
+    def checksum_policy(self) -> ChecksumPolicy:
+        """Policy deciding when data checksums are verified on read.
+
+        Set when the checkout is created (see the ``checksum_policy`` argument
+        of :meth:`~hangar.repository.Repository.checkout`). The returned object
+        also counts how many reads were verified, skipped, or failed
+        verification.
+
+            >>> co = repo.checkout(checksum_policy='off')
+            >>> co.checksum_policy.policy
+            'off'
+            >>> data = [co['foo', i] for i in range(100)]
+            >>> co.checksum_policy.counters
+            {'verified': 0, 'skipped': 100, 'failed': 0}
+
+        Returns
+        -------
+        ChecksumPolicy
+            policy (and verification counters) of the checkout.
+        """
+        self._verify_alive()
+        return self._checksum_policy
+
     def log(self,
             branch: str = None,
             commit: str = None,
@@ -364,6 +406,7 @@ class WriterCheckout(GetMixin, CheckoutDictIteration):
                  stageenv: lmdb.Environment,
                  branchenv: lmdb.Environment,
                  stagehashenv: lmdb.Environment,
+                 stagedigestenv: lmdb.Environment,
                  mode: str = 'a'):
         """Developer documentation of init method.
 
@@ -384,6 +427,8 @@ class WriterCheckout(GetMixin, CheckoutDictIteration):
             db where the head record data is unpacked and stored.
         stagehashenv: lmdb.Environment
             db where the staged hash record data is stored.
+        stagedigestenv: lmdb.Environment
+            db where the staged record digests and dirty record keys are stored.
         mode : str, optional
             open in write or read only mode, default is 'a' which is write-enabled.
         """
@@ -398,6 +443,7 @@ class WriterCheckout(GetMixin, CheckoutDictIteration):
         self._stageenv = stageenv
         self._branchenv = branchenv
         self._stagehashenv = stagehashenv
+        self._stagedigestenv = stagedigestenv
 
         self._columns: Optional[Columns] = None
         self._differ: Optional[WriterUserDiff] = None
@@ -491,11 +537,14 @@ class WriterCheckout(GetMixin, CheckoutDictIteration):
             be used for the base of this checkout.
         """
         self._verify_alive()
+        if self._stagedigestenv is not None:
+            commiting.verify_staged_digests_base(self._refenv, self._stagedigestenv)
         current_head = heads.get_staging_branch_head(self._branchenv)
         currentDiff = WriterUserDiff(stageenv=self._stageenv,
                                      refenv=self._refenv,
                                      branchenv=self._branchenv,
-                                     branch_name=current_head)
+                                     branch_name=current_head,
+                                     stagedigestenv=self._stagedigestenv)
         if currentDiff.status() == 'DIRTY':
             if current_head != self._branch_name:
                 e = ValueError(
@@ -513,8 +562,13 @@ class WriterCheckout(GetMixin, CheckoutDictIteration):
                 except ValueError as e:
                     self.close()
                     raise e
+                # staging area is clean, so it holds exactly the current head commit.
+                base_cmt = heads.get_branch_head_commit(
+                    branchenv=self._branchenv, branch_name=current_head)
                 commiting.replace_staging_area_with_commit(
-                    refenv=self._refenv, stageenv=self._stageenv, commit_hash=cmt)
+                    refenv=self._refenv, stageenv=self._stageenv,
+                    commit_hash=cmt, base_commit=base_cmt,
+                    stagedigestenv=self._stagedigestenv)
                 heads.set_staging_branch_head(
                     branchenv=self._branchenv, branch_name=self._branch_name)
 
@@ -522,12 +576,14 @@ class WriterCheckout(GetMixin, CheckoutDictIteration):
             repo_pth=self._repo_path,
             hashenv=self._hashenv,
             stageenv=self._stageenv,
-            stagehashenv=self._stagehashenv)
+            stagehashenv=self._stagehashenv,
+            stagedigestenv=self._stagedigestenv)
         self._differ = WriterUserDiff(
             stageenv=self._stageenv,
             refenv=self._refenv,
             branchenv=self._branchenv,
-            branch_name=self._branch_name)
+            branch_name=self._branch_name,
+            stagedigestenv=self._stagedigestenv)
 
     @property
     def columns(self) -> Columns:
@@ -987,9 +1043,11 @@ class WriterCheckout(GetMixin, CheckoutDictIteration):
         hashSchemaKey = schema_hash_db_key_from_digest(schema_digest)
         hashSchemaVal = schema_hash_record_db_val_from_spec(schema.schema)
 
-        txnctx = ColumnTxn(self._stageenv, self._hashenv, self._stagehashenv)
+        txnctx = ColumnTxn(
+            self._stageenv, self._hashenv, self._stagehashenv, self._stagedigestenv)
         with txnctx.write() as ctx:
             ctx.dataTxn.put(columnSchemaKey, columnSchemaVal)
+            ctx.mark_dirty(columnSchemaKey)
             ctx.hashTxn.put(hashSchemaKey, hashSchemaVal, overwrite=False)
 
         # ------------- create column instance and return to user -------------
@@ -1036,9 +1094,10 @@ class WriterCheckout(GetMixin, CheckoutDictIteration):
             master_branch=self._branch_name,
             dev_branch=dev_branch,
             repo_path=self._repo_path,
-            writer_uuid=self._writer_lock)
+            writer_uuid=self._writer_lock,
+            stagedigestenv=self._stagedigestenv)
 
-        for asetHandle in self._columns.values():
+        for asetHandle in self._columns._loaded_columns():
             with suppress(KeyError):
                 asetHandle._close()
 
@@ -1046,12 +1105,14 @@ class WriterCheckout(GetMixin, CheckoutDictIteration):
             repo_pth=self._repo_path,
             hashenv=self._hashenv,
             stageenv=self._stageenv,
-            stagehashenv=self._stagehashenv)
+            stagehashenv=self._stagehashenv,
+            stagedigestenv=self._stagedigestenv)
         self._differ = WriterUserDiff(
             stageenv=self._stageenv,
             refenv=self._refenv,
             branchenv=self._branchenv,
-            branch_name=self._branch_name)
+            branch_name=self._branch_name,
+            stagedigestenv=self._stagedigestenv)
 
         return commit_hash
 
@@ -1078,7 +1139,7 @@ class WriterCheckout(GetMixin, CheckoutDictIteration):
         self._verify_alive()
 
         open_columns = []
-        for column in self._columns.values():
+        for column in self._columns._loaded_columns():
             if column._is_conman:
                 open_columns.append(column.column)
 
@@ -1095,7 +1156,8 @@ class WriterCheckout(GetMixin, CheckoutDictIteration):
                                                    branchenv=self._branchenv,
                                                    stageenv=self._stageenv,
                                                    refenv=self._refenv,
-                                                   repo_path=self._repo_path)
+                                                   repo_path=self._repo_path,
+                                                   stagedigestenv=self._stagedigestenv)
             # purge recs then reopen file handles so that we don't have to invalidate
             # previous weakproxy references like if we just called :meth:``_setup```
             hashs.clear_stage_hash_records(self._stagehashenv)
@@ -1163,12 +1225,14 @@ class WriterCheckout(GetMixin, CheckoutDictIteration):
             repo_pth=self._repo_path,
             hashenv=self._hashenv,
             stageenv=self._stageenv,
-            stagehashenv=self._stagehashenv)
+            stagehashenv=self._stagehashenv,
+            stagedigestenv=self._stagedigestenv)
         self._differ = WriterUserDiff(
             stageenv=self._stageenv,
             refenv=self._refenv,
             branchenv=self._branchenv,
-            branch_name=self._branch_name)
+            branch_name=self._branch_name,
+            stagedigestenv=self._stagedigestenv)
         return head_commit
 
     def close(self) -> None:
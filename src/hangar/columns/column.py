@@ -1,8 +1,13 @@
 """Constructor and Interaction Class for Columns
 """
 from contextlib import ExitStack
+from functools import partial
 from pathlib import Path
-from typing import Iterable, List, Mapping, Optional, Tuple, Union, Dict
+from threading import Lock
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Mapping, MutableMapping,
+    Optional, Tuple, Union
+)
 
 import lmdb
 
@@ -17,6 +22,7 @@ from ..records import (
     schema_spec_from_db_val,
     dynamic_layout_data_record_db_start_range_key,
 )
+from ..records.parsing import stage_dirty_db_key_from_raw_key
 from ..records.queries import RecordQuery
 from ..op_state import writer_checkout_only
 from ..txnctx import TxnRegister
@@ -25,6 +31,84 @@ KeyType = Union[str, int]
 ModifierTypes = Union['NestedSampleReader', 'FlatSubsampleReader']
 
 
+class LazyColumnMap(MutableMapping):
+    """Mapping of column names to column accessors constructed on first access.
+
+    Initializing a column accessor requires reading every data record in the
+    column and opening backend file handles. Rather than paying that cost for
+    every column when a checkout is created, a zero argument constructor can be
+    registered with :meth:`add_constructor`; the accessor is only built (and
+    cached) the first time the column name is looked up. Membership tests,
+    iteration over names, and ``len`` never construct an accessor.
+    """
+
+    __slots__ = ('_data', '_pending', '_lock', '_on_load')
+
+    def __init__(self, columns: Optional[Mapping[str, ModifierTypes]] = None):
+        self._data: Dict[str, Any] = dict(columns) if columns else {}
+        self._pending: set = set()
+        self._lock = Lock()
+        self._on_load: Optional[Callable[[ModifierTypes], None]] = None
+
+    def add_constructor(self, key: str, constructor: Callable[[], ModifierTypes]):
+        """Register a zero argument callable which constructs the column accessor.
+        """
+        self._data[key] = constructor
+        self._pending.add(key)
+
+    def __getitem__(self, key: str) -> ModifierTypes:
+        if key in self._pending:
+            with self._lock:
+                if key in self._pending:
+                    column = self._data[key]()
+                    self._data[key] = column
+                    self._pending.discard(key)
+                    if self._on_load is not None:
+                        self._on_load(column)
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: ModifierTypes):
+        self._data[key] = value
+        self._pending.discard(key)
+
+    def __delitem__(self, key: str):
+        del self._data[key]
+        self._pending.discard(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({list(self._data.keys())})'
+
+    def loaded_values(self) -> List[ModifierTypes]:
+        """List of the column accessors which have already been constructed.
+        """
+        return [v for k, v in self._data.items() if k not in self._pending]
+
+
+def _generate_column(column_record, schema, mode, repo_pth, dataenv, hashenv,
+                     stagehashenv=None, stagedigestenv=None, checksum_policy=None,
+                     lazy_specs=False, compact_specs=False) -> ModifierTypes:
+    """Construct the flat or nested column accessor of some column record.
+    """
+    txnctx = ColumnTxn(dataenv, hashenv, stagehashenv, stagedigestenv)
+    if column_record.layout == 'nested':
+        return generate_nested_column(
+            txnctx=txnctx, column_name=column_record.column, path=repo_pth,
+            schema=schema, mode=mode, checksum_policy=checksum_policy)
+    return generate_flat_column(
+        txnctx=txnctx, column_name=column_record.column, path=repo_pth,
+        schema=schema, mode=mode, checksum_policy=checksum_policy,
+        lazy_specs=lazy_specs, compact_specs=compact_specs)
+
+
 class Columns:
     """Common access patterns and initialization/removal of columns in a checkout.
 
@@ -38,10 +122,11 @@ class Columns:
     def __init__(self,
                  mode: str,
                  repo_pth: Path,
-                 columns: Dict[str, ModifierTypes],
+                 columns: Union[LazyColumnMap, Dict[str, ModifierTypes]],
                  hashenv: Optional[lmdb.Environment] = None,
                  dataenv: Optional[lmdb.Environment] = None,
                  stagehashenv: Optional[lmdb.Environment] = None,
+                 stagedigestenv: Optional[lmdb.Environment] = None,
                  txnctx: Optional[ColumnTxn] = None):
         """Developer documentation for init method.
 
@@ -58,8 +143,9 @@ class Columns:
             one of 'r' or 'a' to indicate read or write mode
         repo_pth : Path
             path to the repository on disk
-        columns : Mapping[str, Union[ArraysetDataReader, ArraysetDataWriter]]
-            dictionary of ArraysetData objects
+        columns : Union[LazyColumnMap, Dict[str, ModifierTypes]]
+            mapping of column names to column accessors (or to constructors of
+            the column accessors which are called on first access).
         hashenv : Optional[lmdb.Environment]
             environment handle for hash records
         dataenv : Optional[lmdb.Environment]
@@ -68,6 +154,8 @@ class Columns:
             cmtrefenv for read-only checkouts.
         stagehashenv : Optional[lmdb.Environment]
             environment handle for newly added staged data hash records.
+        stagedigestenv : Optional[lmdb.Environment]
+            environment handle for staged record digests and dirty keys.
         txnctx: Optional[ColumnTxn]
             class implementing context managers to handle lmdb transactions
         """
@@ -75,26 +163,41 @@ class Columns:
         self._is_conman_counter = 0
         self._mode = mode
         self._repo_pth = repo_pth
+        if not isinstance(columns, LazyColumnMap):
+            columns = LazyColumnMap(columns)
         self._columns = columns
+        self._columns._on_load = self._column_loaded
 
         self._hashenv = hashenv
         self._dataenv = dataenv
         self._stagehashenv = stagehashenv
+        self._stagedigestenv = stagedigestenv
         self._txnctx = txnctx
 
+    def _loaded_columns(self) -> List[ModifierTypes]:
+        """Column accessors which have been constructed (accessed) so far.
+        """
+        return self._columns.loaded_values()
+
+    def _column_loaded(self, column: ModifierTypes):
+        """Enter a newly constructed column if this object is a context manager.
+        """
+        if self._is_conman and isinstance(self._stack, ExitStack):
+            self._stack.enter_context(column)
+
     def _open(self):
-        for v in self._columns.values():
+        for v in self._loaded_columns():
             v._open()
 
     def _close(self):
-        for v in self._columns.values():
+        for v in self._loaded_columns():
             v._close()
 
     def _destruct(self):
         if isinstance(self._stack, ExitStack):
             self._stack.close()
         self._close()
-        for column in self._columns.values():
+        for column in self._loaded_columns():
             column._destruct()
         for attr in list(self.__dict__.keys()):
             delattr(self, attr)
@@ -202,13 +305,13 @@ class Columns:
         bool
             [description]
         """
-        res = any([self._is_conman, *[x._is_conman for x in self._columns.values()]])
+        res = any([self._is_conman, *[x._is_conman for x in self._loaded_columns()]])
         return res
 
     def __enter__(self):
         with ExitStack() as stack:
-            for asetN in list(self._columns.keys()):
-                stack.enter_context(self._columns[asetN])
+            for column in self._loaded_columns():
+                stack.enter_context(column)
             self._is_conman_counter += 1
             self._stack = stack.pop_all()
         return self
@@ -363,6 +466,8 @@ class Columns:
         with ExitStack() as stack:
             datatxn = TxnRegister().begin_writer_txn(self._dataenv)
             stack.callback(TxnRegister().commit_writer_txn, self._dataenv)
+            digesttxn = TxnRegister().begin_writer_txn(self._stagedigestenv)
+            stack.callback(TxnRegister().commit_writer_txn, self._stagedigestenv)
 
             if column not in self._columns:
                 e = KeyError(f'Cannot remove: {column}. Key does not exist.')
@@ -381,21 +486,25 @@ class Columns:
                 while recordsExist:
                     k = cursor.key()
                     if k.startswith(startRangeKey):
+                        digesttxn.put(stage_dirty_db_key_from_raw_key(k), b'')
                         recordsExist = cursor.delete()
                     else:
                         recordsExist = False
             datatxn.delete(columnSchemaKey)
+            digesttxn.put(stage_dirty_db_key_from_raw_key(columnSchemaKey), b'')
 
         return column
 
     @classmethod
-    def _from_staging_area(cls, repo_pth, hashenv, stageenv, stagehashenv):
+    def _from_staging_area(cls, repo_pth, hashenv, stageenv, stagehashenv, stagedigestenv):
         """INTERNAL USE ONLY
 
         Class method factory to checkout :class:`Columns` in write mode
 
         Once you get here, we assume the write lock verification has
-        passed, and that write operations are safe to perform.
+        passed, and that write operations are safe to perform. Only the column
+        schemas are read up front; each column accessor is constructed the
+        first time it is accessed.
 
         Parameters
         ----------
@@ -407,6 +516,9 @@ class Columns:
             environment where staging records (dataenv) are opened in write mode.
         stagehashenv : lmdb.Environment
             environment where the staged hash records are stored in write mode
+        stagedigestenv : lmdb.Environment
+            environment where staged record digests and dirty keys are stored
+            in write mode
 
         Returns
         -------
@@ -414,8 +526,8 @@ class Columns:
             Interface class with write-enabled attributes activate which contains
             live column data accessors in `write` mode.
         """
-        columns = {}
-        txnctx = ColumnTxn(stageenv, hashenv, stagehashenv)
+        columns = LazyColumnMap()
+        txnctx = ColumnTxn(stageenv, hashenv, stagehashenv, stagedigestenv)
         query = RecordQuery(stageenv)
         stagedSchemaSpecs = query.schema_specs()
 
@@ -431,15 +543,10 @@ class Columns:
                 staged_col_schemas[column_record] = schema
 
         for column_record, schema in staged_col_schemas.items():
-            if column_record.layout == 'nested':
-                column = generate_nested_column(
-                    txnctx=txnctx, column_name=column_record.column,
-                    path=repo_pth, schema=schema, mode='a')
-            else:
-                column = generate_flat_column(
-                    txnctx=txnctx, column_name=column_record.column,
-                    path=repo_pth, schema=schema, mode='a')
-            columns[column_record.column] = column
+            columns.add_constructor(column_record.column, partial(
+                _generate_column, column_record=column_record, schema=schema,
+                mode='a', repo_pth=repo_pth, dataenv=stageenv, hashenv=hashenv,
+                stagehashenv=stagehashenv, stagedigestenv=stagedigestenv))
 
         return cls(mode='a',
                    repo_pth=repo_pth,
@@ -447,16 +554,20 @@ class Columns:
                    hashenv=hashenv,
                    dataenv=stageenv,
                    stagehashenv=stagehashenv,
+                   stagedigestenv=stagedigestenv,
                    txnctx=txnctx)
 
     @classmethod
-    def _from_commit(cls, repo_pth, hashenv, cmtrefenv):
+    def _from_commit(cls, repo_pth, hashenv, cmtrefenv, checksum_policy=None,
+                     lazy_specs=False, compact_specs=False):
         """INTERNAL USE ONLY
 
         Class method factory to checkout :class:`.Columns` in read-only mode
 
         For read mode, no locks need to be verified, but construction should
-        occur through this interface only.
+        occur through this interface only. Only the column schemas are read up
+        front; each column accessor is constructed the first time it is
+        accessed.
 
         Parameters
         ----------
@@ -466,14 +577,33 @@ class Columns:
             environment where tensor data hash records are open in read-only mode.
         cmtrefenv : lmdb.Environment
             environment where staging checkout records are opened in read-only mode.
+        checksum_policy : Optional[ChecksumPolicy]
+            policy deciding when backends verify data checksums on read. If
+            None (default) checksums are verified on every read.
+        lazy_specs : bool
+            if True, flat columns resolve the backend location spec of a
+            sample the first time it is read, rather than when the column is
+            constructed. Default is False.
+        compact_specs : bool
+            if True, flat columns store the backend location specs of their
+            samples in a compact array backed table. Cannot be combined with
+            ``lazy_specs``. Default is False.
 
         Returns
         -------
         :class:`~column.Columns`
             Interface class with write-enabled attributes deactivated which
             contains live column data accessors in `read-only` mode.
+
+        Raises
+        ------
+        ValueError
+            If both ``lazy_specs`` and ``compact_specs`` are True.
         """
-        columns = {}
+        if lazy_specs and compact_specs:
+            raise ValueError('`lazy_specs` and `compact_specs` cannot both be True.')
+
+        columns = LazyColumnMap()
         txnctx = ColumnTxn(cmtrefenv, hashenv, None)
         query = RecordQuery(cmtrefenv)
         cmtSchemaSpecs = query.schema_specs()
@@ -490,15 +620,11 @@ class Columns:
                 cmt_col_schemas[column_record] = schema
 
         for column_record, schema in cmt_col_schemas.items():
-            if column_record.layout == 'nested':
-                column = generate_nested_column(
-                    txnctx=txnctx, column_name=column_record.column,
-                    path=repo_pth, schema=schema, mode='r')
-            else:
-                column = generate_flat_column(
-                    txnctx=txnctx, column_name=column_record.column,
-                    path=repo_pth, schema=schema, mode='r')
-            columns[column_record.column] = column
+            columns.add_constructor(column_record.column, partial(
+                _generate_column, column_record=column_record, schema=schema,
+                mode='r', repo_pth=repo_pth, dataenv=cmtrefenv, hashenv=hashenv,
+                checksum_policy=checksum_policy, lazy_specs=lazy_specs,
+                compact_specs=compact_specs))
 
         return cls(mode='r',
                    repo_pth=repo_pth,
@@ -1,11 +1,49 @@
+import warnings
+from array import array
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Optional
+from threading import Lock, local
+from typing import Iterable, Iterator, Mapping, Optional, Set, Tuple, Union
 
 import lmdb
+import numpy as np
+from xxhash import xxh64_intdigest
 
+from ..backends import (
+    BACKEND_IS_LOCAL_MAP,
+    BACKEND_SHARES_READER_MAP,
+    backend_decoder,
+    HDF5_00_DataHashSpec,
+    HDF5_01_DataHashSpec,
+    NUMPY_10_DataHashSpec,
+    LMDB_30_DataHashSpec,
+    LMDB_31_DataHashSpec,
+    REMOTE_50_DataHashSpec,
+)
+from ..records import hash_data_db_key_from_raw_key
+from ..records.parsing import stage_dirty_db_key_from_raw_key
 from ..txnctx import TxnRegister
 
 
+KeyType = Union[str, int]
+DataHashSpecType = Union[HDF5_00_DataHashSpec,
+                         HDF5_01_DataHashSpec,
+                         NUMPY_10_DataHashSpec,
+                         LMDB_30_DataHashSpec,
+                         LMDB_31_DataHashSpec,
+                         REMOTE_50_DataHashSpec]
+
+LAZY_SPEC_CACHE_SIZE = 100_000
+
+
+def _warn_remote(aset_name):
+    warnings.warn(
+        f'Column: {aset_name} contains `reference-only` samples, with '
+        f'actual data residing on a remote server. A `fetch-data` '
+        f'operation is required to access these samples.', UserWarning)
+
+
 class ColumnTxn(object):
     """Provides context manager ready methods to handle lmdb transactions.
 
@@ -17,19 +55,22 @@ class ColumnTxn(object):
     caller.
     """
 
-    __slots__ = ('stagehashenv', 'dataenv', 'hashenv', 'hashTxn',
-                 'dataTxn', 'stageHashTxn', '_TxnRegister', '__weakref__')
+    __slots__ = ('stagehashenv', 'stagedigestenv', 'dataenv', 'hashenv', 'hashTxn',
+                 'dataTxn', 'stageHashTxn', 'stageDigestTxn', '_TxnRegister',
+                 '__weakref__')
 
-    def __init__(self, dataenv, hashenv, stagehashenv):
+    def __init__(self, dataenv, hashenv, stagehashenv, stagedigestenv=None):
 
         self._TxnRegister = TxnRegister()
         self.stagehashenv = stagehashenv
+        self.stagedigestenv = stagedigestenv
         self.dataenv = dataenv
         self.hashenv = hashenv
 
         self.hashTxn: Optional[lmdb.Transaction] = None
         self.dataTxn: Optional[lmdb.Transaction] = None
         self.stageHashTxn: Optional[lmdb.Transaction] = None
+        self.stageDigestTxn: Optional[lmdb.Transaction] = None
 
     @property
     def _debug_(self):  # pragma: no cover
@@ -62,15 +103,32 @@ class ColumnTxn(object):
         self.hashTxn = self._TxnRegister.begin_writer_txn(self.hashenv)
         self.dataTxn = self._TxnRegister.begin_writer_txn(self.dataenv)
         self.stageHashTxn = self._TxnRegister.begin_writer_txn(self.stagehashenv)
+        self.stageDigestTxn = self._TxnRegister.begin_writer_txn(self.stagedigestenv)
         return self
 
     def close_write(self):
         """Manually close write-enabled transactions, must be called after manual open.
+
+        The dirty markers are committed before the staged records: if a later
+        commit fails, the markers may name records which were not modified
+        (they are rehashed needlessly), but a modified record is never missing
+        a marker.
         """
+        self.stageDigestTxn = self._TxnRegister.commit_writer_txn(self.stagedigestenv)
         self.hashTxn = self._TxnRegister.commit_writer_txn(self.hashenv)
         self.dataTxn = self._TxnRegister.commit_writer_txn(self.dataenv)
         self.stageHashTxn = self._TxnRegister.commit_writer_txn(self.stagehashenv)
 
+    def mark_dirty(self, db_key: bytes):
+        """Record that a staged record was put or deleted, requires open write txn.
+
+        Parameters
+        ----------
+        db_key : bytes
+            db key of the staged (data or schema) record which was modified.
+        """
+        self.stageDigestTxn.put(stage_dirty_db_key_from_raw_key(db_key), b'')
+
     @contextmanager
     def read(self):
         """Use ``with`` style context manager to open read-only transaction.
@@ -96,7 +154,8 @@ class ColumnTxn(object):
             self.close_write()
 
 
-def open_file_handles(backends, path, mode, schema, *, remote_operation=False):
+def open_file_handles(backends, path, mode, schema, *,
+                      remote_operation=False, checksum_policy=None):
     """Open backend accessor file handles for reading
 
     Parameters
@@ -112,6 +171,11 @@ def open_file_handles(backends, path, mode, schema, *, remote_operation=False):
         one of ['r', 'a'] indicating read or write mode to open backends in.
     schema : ColumnDefinitionTypes
         schema spec so required values can be filled in to backend openers.
+    remote_operation : bool, optional, kwarg only
+        True if remote operations call this method, by default False.
+    checksum_policy : Optional[ChecksumPolicy], kwarg only
+        policy deciding when local backends verify data checksums on read.
+        If None (default), every backend uses a new ``'always'`` policy.
 
     Returns
     -------
@@ -139,9 +203,507 @@ def open_file_handles(backends, path, mode, schema, *, remote_operation=False):
                     kwargs[arg] = schema.dtype
 
             fhandles[be] = accessor(**kwargs)
+            if checksum_policy is not None and hasattr(fhandles[be], 'checksum_policy'):
+                fhandles[be].checksum_policy = checksum_policy
             fhandles[be].open(mode=mode, remote_operation=remote_operation)
 
     if mode == 'a':
         if schema.backend in fhandles:
             fhandles[schema.backend].backend_opts = schema.backend_options
     return fhandles
+
+
+class LazySampleSpecs(Mapping):
+    """Read-only mapping of sample keys to backend specs resolved on first read.
+
+    Only the data digest of each sample is held in memory. The backend
+    location spec of a digest is read from the hash db (and decoded) the first
+    time it is requested, and is kept in an LRU cache holding at most
+    ``cache_size`` specs. The cache lock is only held while the cache is read
+    or updated, never while the hash db is read or a spec is decoded.
+
+    Pickling an instance resolves every spec and produces a plain ``dict``,
+    since the lmdb environment cannot be shared with another process.
+    """
+
+    __slots__ = ('_digests', '_hashenv', '_cache', '_cache_size', '_lock')
+
+    def __init__(self, digests: dict, hashenv: lmdb.Environment,
+                 cache_size: int = LAZY_SPEC_CACHE_SIZE):
+        self._digests = digests
+        self._hashenv = hashenv
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = Lock()
+
+    def __getitem__(self, key):
+        return self._resolve(self._digests[key])
+
+    def __contains__(self, key) -> bool:
+        return key in self._digests
+
+    def __iter__(self) -> Iterator:
+        return iter(self._digests)
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+    def __reduce__(self):
+        return (dict, (self._resolve_all(),))
+
+    def _resolve(self, digest: str):
+        with self._lock:
+            try:
+                self._cache.move_to_end(digest)
+                return self._cache[digest]
+            except KeyError:
+                pass
+
+        hashTxn = TxnRegister().begin_reader_txn(self._hashenv)
+        try:
+            hash_ref = hashTxn.get(hash_data_db_key_from_raw_key(digest))
+        finally:
+            TxnRegister().abort_reader_txn(self._hashenv)
+        spec = self._decode(digest, hash_ref)
+
+        with self._lock:
+            self._cache[digest] = spec
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return spec
+
+    @staticmethod
+    def _decode(digest: str, hash_ref: Optional[bytes]):
+        if hash_ref is None:
+            raise KeyError(f'data digest {digest} has no record in the hash db')
+        return backend_decoder(hash_ref)
+
+    def _iter_resolved(self) -> Iterator[Tuple[KeyType, DataHashSpecType]]:
+        """Resolve the spec of every sample (bypassing the cache) in one transaction.
+        """
+        hashTxn = TxnRegister().begin_reader_txn(self._hashenv)
+        try:
+            for key, digest in self._digests.items():
+                hash_ref = hashTxn.get(hash_data_db_key_from_raw_key(digest))
+                yield key, self._decode(digest, hash_ref)
+        finally:
+            TxnRegister().abort_reader_txn(self._hashenv)
+
+    def _resolve_all(self) -> dict:
+        return dict(self._iter_resolved())
+
+    def contains_remote(self) -> bool:
+        """True if any sample references data stored on a remote server.
+        """
+        return any(not spec.islocal for _, spec in self._iter_resolved())
+
+    def remote_keys(self) -> Tuple[KeyType]:
+        """Keys of samples referencing data stored on a remote server.
+        """
+        return tuple(key for key, spec in self._iter_resolved() if not spec.islocal)
+
+    def local_keys(self) -> Tuple[KeyType]:
+        """Keys of samples whose data is stored on the local disk.
+        """
+        return tuple(key for key, spec in self._iter_resolved() if spec.islocal)
+
+
+class CompactSampleSpecs(Mapping):
+    """Read-only mapping of sample keys to backend specs stored as arrays.
+
+    Rather than holding one spec object per sample, the fields of every spec
+    are packed into numpy arrays with one row per sample: the backend code,
+    the xxh64 ``checksum`` as ``uint64``, the ``dataset_idx`` /
+    ``collection_idx`` integer, and indices into interned tables of strings
+    (``uid``, ``dataset``, ``row_idx``, ``schema_hash``) and of shapes. Spec
+    objects are rebuilt when a key is read.
+
+    Rows are kept in insertion order. ``int`` sample keys are stored in an
+    ``int64`` array, while ``str`` keys are encoded into one bytes blob sliced
+    by an offsets array. Keys are located through an open addressing hash
+    table (linear probing) mapping the ``uint64`` xxh64 hash of a key to its
+    row, so a lookup does not depend on the number of samples.
+    """
+
+    __slots__ = ('_keys', '_key_is_str', '_key_blob', '_key_offsets', '_table_hash',
+                 '_table_row', '_backend', '_uid', '_dataset', '_idx', '_checksum',
+                 '_shape', '_strings', '_shapes')
+
+    _backend_codes = ('00', '01', '10', '30', '31', '50')
+    _remote_code = _backend_codes.index('50')
+    _int64_info = np.iinfo(np.int64)
+
+    def __init__(self, keys, key_is_str, key_blob, key_offsets, backend, uid,
+                 dataset, idx, checksum, shape, strings, shapes):
+        self._keys = keys
+        self._key_is_str = key_is_str
+        self._key_blob = key_blob
+        self._key_offsets = key_offsets
+        self._backend = backend
+        self._uid = uid
+        self._dataset = dataset
+        self._idx = idx
+        self._checksum = checksum
+        self._shape = shape
+        self._strings = strings
+        self._shapes = shapes
+        self._table_hash, self._table_row = self._build_index()
+
+    @classmethod
+    def from_specs(cls, specs: Iterable[Tuple[KeyType, DataHashSpecType]]):
+        """Pack an iterable of (sample key, backend spec) pairs into a table.
+        """
+        keys, key_is_str = array('q'), array('B')
+        key_blob, key_offsets = bytearray(), array('q', [0])
+        backend, checksum = array('B'), array('Q')
+        uid, dataset, idx, shape = array('i'), array('i'), array('i'), array('i')
+        string_ids, shape_ids = {}, {}
+
+        for key, spec in specs:
+            if isinstance(key, str):
+                keys.append(len(key_offsets) - 1)
+                key_is_str.append(True)
+                key_blob += key.encode()
+                key_offsets.append(len(key_blob))
+            else:
+                keys.append(key)
+                key_is_str.append(False)
+            be = spec.backend
+            backend.append(cls._backend_codes.index(be))
+            if be == '50':
+                uid.append(string_ids.setdefault(spec.schema_hash, len(string_ids)))
+                dataset.append(-1)
+                idx.append(-1)
+                checksum.append(0)
+                shape.append(-1)
+                continue
+
+            uid.append(string_ids.setdefault(spec.uid, len(string_ids)))
+            checksum.append(int(spec.checksum, 16))
+            if be in ('30', '31'):
+                dataset.append(string_ids.setdefault(spec.row_idx, len(string_ids)))
+                idx.append(-1)
+                shape.append(-1)
+                continue
+
+            if be == '10':
+                dataset.append(-1)
+                idx.append(spec.collection_idx)
+            else:
+                dataset.append(string_ids.setdefault(spec.dataset, len(string_ids)))
+                idx.append(spec.dataset_idx)
+            shape.append(shape_ids.setdefault(spec.shape, len(shape_ids)))
+
+        return cls(keys=np.frombuffer(keys, dtype=np.int64),
+                   key_is_str=np.frombuffer(key_is_str, dtype=np.bool_),
+                   key_blob=bytes(key_blob),
+                   key_offsets=np.frombuffer(key_offsets, dtype=np.int64),
+                   backend=np.frombuffer(backend, dtype=np.uint8),
+                   uid=np.frombuffer(uid, dtype=np.int32),
+                   dataset=np.frombuffer(dataset, dtype=np.int32),
+                   idx=np.frombuffer(idx, dtype=np.int32),
+                   checksum=np.frombuffer(checksum, dtype=np.uint64),
+                   shape=np.frombuffer(shape, dtype=np.int32),
+                   strings=tuple(string_ids),
+                   shapes=tuple(shape_ids))
+
+    @classmethod
+    def _hash_key(cls, key) -> Optional[Tuple[int, KeyType, Optional[bytes]]]:
+        """Hash a sample key for the index.
+
+        Returns
+        -------
+        Optional[Tuple[int, KeyType, Optional[bytes]]]
+            xxh64 hash of the key, the key (``np.integer`` converted to ``int``),
+            and the utf-8 encoded key if it is a ``str``. None if the key cannot
+            be stored in the table.
+        """
+        if isinstance(key, str):
+            raw = key.encode()
+            return xxh64_intdigest(raw), key, raw
+        elif isinstance(key, (int, np.integer)):
+            key = int(key)
+            if cls._int64_info.min <= key <= cls._int64_info.max:
+                return xxh64_intdigest(key.to_bytes(8, 'little', signed=True)), key, None
+        return None
+
+    def _build_index(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Build the hash table over every row, sized to stay at most 3/4 full.
+
+        Raises
+        ------
+        ValueError
+            If a sample key is stored in more than one row.
+        """
+        nslots = 8
+        while nslots * 3 < len(self) * 4:
+            nslots *= 2
+        mask = nslots - 1
+        table_hash = array('Q', bytes(8 * nslots))
+        table_row = array('i', [-1]) * nslots
+
+        for row in range(len(self)):
+            keyhash, key, raw = self._hash_key(self._key(row))
+            slot = keyhash & mask
+            while table_row[slot] >= 0:
+                if table_hash[slot] == keyhash and self._key_equals(table_row[slot], key, raw):
+                    raise ValueError(f'duplicate sample key {key}')
+                slot = (slot + 1) & mask
+            table_hash[slot] = keyhash
+            table_row[slot] = row
+        return (np.frombuffer(table_hash, dtype=np.uint64),
+                np.frombuffer(table_row, dtype=np.int32))
+
+    def _key_equals(self, row: int, key: KeyType, raw: Optional[bytes]) -> bool:
+        """True if the sample key stored at some row of the table is ``key``.
+        """
+        if raw is None:
+            return (not self._key_is_str[row]) and int(self._keys[row]) == key
+        if not self._key_is_str[row]:
+            return False
+        pos = int(self._keys[row])
+        return self._key_blob[self._key_offsets[pos]:self._key_offsets[pos + 1]] == raw
+
+    def _row(self, key) -> int:
+        """Row of the table holding some sample key, or -1 if it does not exist.
+        """
+        hashed = self._hash_key(key)
+        if hashed is None:
+            return -1
+        keyhash, key, raw = hashed
+        mask = len(self._table_row) - 1
+        slot = keyhash & mask
+        while True:
+            row = int(self._table_row[slot])
+            if row < 0:
+                return -1
+            if int(self._table_hash[slot]) == keyhash and self._key_equals(row, key, raw):
+                return row
+            slot = (slot + 1) & mask
+
+    def _key(self, row: int) -> KeyType:
+        """Sample key stored at some row of the table.
+        """
+        if self._key_is_str[row]:
+            pos = int(self._keys[row])
+            return self._key_blob[self._key_offsets[pos]:self._key_offsets[pos + 1]].decode()
+        return int(self._keys[row])
+
+    def __getitem__(self, key):
+        row = self._row(key)
+        if row < 0:
+            raise KeyError(key)
+        return self._spec(row)
+
+    def __contains__(self, key) -> bool:
+        return self._row(key) >= 0
+
+    def __iter__(self) -> Iterator:
+        offsets = self._key_offsets.tolist()
+        for key, is_str in zip(self._keys.tolist(), self._key_is_str.tolist()):
+            if is_str:
+                yield self._key_blob[offsets[key]:offsets[key + 1]].decode()
+            else:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _spec(self, row: int):
+        """Rebuild the backend spec object stored in some row of the table.
+        """
+        be = self._backend_codes[self._backend[row]]
+        if be == '50':
+            return REMOTE_50_DataHashSpec(be, self._strings[self._uid[row]])
+
+        uid = self._strings[self._uid[row]]
+        checksum = f'{int(self._checksum[row]):016x}'
+        if be == '30':
+            return LMDB_30_DataHashSpec(be, uid, self._strings[self._dataset[row]], checksum)
+        elif be == '31':
+            return LMDB_31_DataHashSpec(be, uid, self._strings[self._dataset[row]], checksum)
+
+        shape = self._shapes[self._shape[row]]
+        if be == '10':
+            return NUMPY_10_DataHashSpec(be, uid, checksum, int(self._idx[row]), shape)
+        spec_type = HDF5_00_DataHashSpec if be == '00' else HDF5_01_DataHashSpec
+        return spec_type(be, uid, checksum, self._strings[self._dataset[row]],
+                         int(self._idx[row]), shape)
+
+    def backends(self) -> Set[str]:
+        """Set of backend codes referenced by any sample in the table.
+        """
+        return {self._backend_codes[code] for code in np.unique(self._backend)}
+
+    def contains_remote(self) -> bool:
+        """True if any sample references data stored on a remote server.
+        """
+        return bool(np.any(self._backend == self._remote_code))
+
+    def remote_keys(self) -> Tuple[KeyType]:
+        """Keys of samples referencing data stored on a remote server.
+        """
+        rows = np.flatnonzero(self._backend == self._remote_code)
+        return tuple(self._key(int(row)) for row in rows)
+
+    def local_keys(self) -> Tuple[KeyType]:
+        """Keys of samples whose data is stored on the local disk.
+        """
+        rows = np.flatnonzero(self._backend != self._remote_code)
+        return tuple(self._key(int(row)) for row in rows)
+
+
+class LazyBackendHandles(dict):
+    """dict of read-only backend accessors which opens missing backends on access.
+
+    Used alongside :class:`LazySampleSpecs`, where the backends referenced by
+    the samples of a column are not known until their specs are resolved.
+    Opening a backend which is not local (ie. the first time a sample
+    referencing remote data is read) emits the same ``reference-only``
+    samples warning other checkouts emit when the column is constructed.
+    """
+
+    def __init__(self, handles: dict, path, schema, checksum_policy=None, column_name=None):
+        super().__init__(handles)
+        self._path = path
+        self._schema = schema
+        self._checksum_policy = checksum_policy
+        self._column_name = column_name
+
+    def __missing__(self, backend: str):
+        if not BACKEND_IS_LOCAL_MAP[backend]:
+            _warn_remote(self._column_name)
+        fhand = open_file_handles(backends=(backend,), path=self._path, mode='r',
+                                  schema=self._schema,
+                                  checksum_policy=self._checksum_policy)
+        self[backend] = fhand[backend]
+        return self[backend]
+
+
+def read_fixed_shape_batch(specs, be_fs, schema, out=None):
+    """Read the data of many fixed shape ndarray samples into one stacked array.
+
+    Specs are grouped by backend and each backend's ``read_data_batch`` method
+    fills its portion of the output buffer directly whenever those samples
+    occupy a contiguous block of output positions.
+
+    Parameters
+    ----------
+    specs : Sequence[DataHashSpecType]
+        backend location specs of samples to read, in output order.
+    be_fs : AccessorMapType
+        dict mapping backend format codes to initialized backend accessors.
+    schema : ColumnDefinitionTypes
+        schema spec of the column the samples are contained in.
+    out : Optional[np.ndarray]
+        C-contiguous array of shape ``(len(specs), *schema.shape)`` and schema
+        dtype to read data into. If None (default), a new array is allocated.
+
+    Returns
+    -------
+    np.ndarray
+        stacked sample data, with the data of ``specs[i]`` at index ``i``.
+
+    Raises
+    ------
+    ValueError
+        If the column is not a fixed shape ndarray column or if ``out`` does not
+        have the expected shape, dtype, and memory layout.
+    """
+    if (schema.column_type != 'ndarray') or (schema.schema_type != 'fixed_shape'):
+        raise ValueError(
+            f'Batched reads are only supported for `fixed_shape` `ndarray` columns, '
+            f'not {schema.schema_type} {schema.column_type} columns.')
+
+    expected_shape = (len(specs), *schema.shape)
+    if out is None:
+        out = np.empty(expected_shape, dtype=schema.dtype)
+    elif (out.shape != expected_shape) or (out.dtype != np.dtype(schema.dtype)) \
+            or (not out.flags.c_contiguous):
+        raise ValueError(
+            f'`out` must be a C-contiguous array of shape {expected_shape} and '
+            f'dtype {np.dtype(schema.dtype)}, not {out.shape} {out.dtype}')
+
+    groups = defaultdict(list)
+    for pos, spec in enumerate(specs):
+        groups[spec.backend].append(pos)
+
+    for backend, positions in groups.items():
+        be_specs = [specs[pos] for pos in positions]
+        p0, nread = positions[0], len(positions)
+        if positions[-1] - p0 == nread - 1:
+            be_fs[backend].read_data_batch(be_specs, out=out[p0:p0 + nread])
+        else:
+            out[positions] = be_fs[backend].read_data_batch(be_specs)
+    return out
+
+
+def read_specs_threaded(specs, be_fs, path, schema, workers=None):
+    """Read the data of many samples across a pool of threads.
+
+    Every worker thread opens its own read-only backend accessors the first
+    time it reads a sample. The accessors use the same checksum policy (and
+    ``zero_copy`` setting) as those in ``be_fs``, and are closed once every
+    sample has been read. Backends which can only be opened once per process
+    (see ``BACKEND_SHARES_READER_MAP``) instead share their accessor in
+    ``be_fs``.
+
+    File handles are still shared between threads: read-only ``HDF5_00``,
+    ``HDF5_01`` and ``NUMPY_10`` accessors acquire their files from the
+    process wide :data:`~hangar.backends.handlepool.FILE_HANDLE_POOL`, so every
+    thread reads through the same ``h5py.File`` or memmap. ``NUMPY_10`` reads
+    copy out of the memmap with the GIL released and so run in parallel, while
+    h5py serializes every call on its global lock, so reads of HDF5 backed
+    samples get no parallelism from the threads.
+
+    Parameters
+    ----------
+    specs : Sequence[DataHashSpecType]
+        backend location specs of samples to read, in output order.
+    be_fs : AccessorMapType
+        dict mapping backend format codes to the initialized backend accessors
+        of the column. Used directly if the data is read in a single thread.
+    path : Path
+        path to the hangar repository on disk
+    schema : ColumnDefinitionTypes
+        schema spec of the column the samples are contained in.
+    workers : Optional[int]
+        maximum number of threads to read with. If None (default), the
+        :class:`~concurrent.futures.ThreadPoolExecutor` default is used.
+
+    Returns
+    -------
+    List[Any]
+        sample data, with the data of ``specs[i]`` at index ``i``.
+    """
+    if (workers == 1) or (len(specs) <= 1):
+        return [be_fs[spec.backend].read_data(spec) for spec in specs]
+
+    checksum_policy = next((fh.checksum_policy for fh in be_fs.values()
+                            if hasattr(fh, 'checksum_policy')), None)
+    backends = {spec.backend for spec in specs}
+    shared = {be: be_fs[be] for be in backends if BACKEND_SHARES_READER_MAP.get(be)}
+    thread_fs = local()
+    opened, opened_lock = [], Lock()
+
+    def _read(spec):
+        try:
+            fhands = thread_fs.fhands
+        except AttributeError:
+            fhands = open_file_handles(backends=backends.difference(shared), path=path,
+                                       mode='r', schema=schema, checksum_policy=checksum_policy)
+            for be, fh in fhands.items():
+                if hasattr(be_fs.get(be), 'zero_copy'):
+                    fh.zero_copy = be_fs[be].zero_copy
+            with opened_lock:
+                opened.append(fhands)
+            fhands = thread_fs.fhands = {**fhands, **shared}
+        return fhands[spec.backend].read_data(spec)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_read, specs))
+    finally:
+        for fhands in opened:
+            for fh in fhands.values():
+                fh.close()
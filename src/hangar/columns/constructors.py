@@ -1,13 +1,14 @@
 """Constructors for initializing FlatSampleReader and NestedSampleReader columns
 """
-import warnings
 from _weakref import proxy
 from collections import defaultdict
 from typing import Union
 
 from wrapt import ObjectProxy
 
-from .common import open_file_handles
+from .common import (
+    CompactSampleSpecs, LazyBackendHandles, LazySampleSpecs, _warn_remote, open_file_handles
+)
 from .layout_flat import FlatSampleReader, FlatSampleWriter
 from .layout_nested import (
     FlatSubsampleReader, FlatSubsampleWriter,
@@ -48,13 +49,6 @@ def column_type_object_from_schema(schema: dict):
         raise ValueError(f'Could not instantiate column schema object for {schema}')
 
 
-def _warn_remote(aset_name):
-    warnings.warn(
-        f'Column: {aset_name} contains `reference-only` samples, with '
-        f'actual data residing on a remote server. A `fetch-data` '
-        f'operation is required to access these samples.', UserWarning)
-
-
 # --------- FlatSampleReader constructor metaclass / setup methods ------------------
 
 
@@ -89,7 +83,61 @@ def _flat_load_sample_keys_and_specs(column_name, txnctx):
     return (sspecs, seen_bes)
 
 
-def generate_flat_column(txnctx, column_name, path, schema, mode):
+def _flat_load_sample_keys_and_compact_specs(column_name, txnctx):
+    """Load flat sample key / backend location mapping into a compact table.
+
+    Parameters
+    ----------
+    column_name: str
+        name of the column to load.
+    txnctx: ColumnTxn
+        transaction context object used to access commit ref info on disk
+
+    Returns
+    -------
+    Tuple[CompactSampleSpecs, Set[str]]
+        First element is a table mapping sample key to backend location.
+        Second element is set of all unique backends encountered for every
+        data pice in the column.
+    """
+    with txnctx.read() as ctx:
+        hashTxn = ctx.hashTxn
+        asetNamesSpec = RecordQuery(ctx.dataenv).column_data_records(column_name)
+        sspecs = CompactSampleSpecs.from_specs(
+            (asetNames.sample,
+             backend_decoder(hashTxn.get(hash_data_db_key_from_raw_key(dataSpec.digest))))
+            for asetNames, dataSpec in asetNamesSpec)
+    return (sspecs, sspecs.backends())
+
+
+def _flat_load_sample_keys_and_digests(column_name, txnctx):
+    """Load flat sample key / data digest mapping into memory.
+
+    Unlike :func:`_flat_load_sample_keys_and_specs`, the hash db is not read;
+    backend location specs are resolved from the digests on first access.
+
+    Parameters
+    ----------
+    column_name: str
+        name of the column to load.
+    txnctx: ColumnTxn
+        transaction context object used to access commit ref info on disk
+
+    Returns
+    -------
+    LazySampleSpecs
+        mapping of sample key to backend location, resolved on first access.
+    """
+    digests = {}
+    with txnctx.read() as ctx:
+        asetNamesSpec = RecordQuery(ctx.dataenv).column_data_records(column_name)
+        for asetNames, dataSpec in asetNamesSpec:
+            digests[asetNames.sample] = dataSpec.digest
+    return LazySampleSpecs(digests, txnctx.hashenv)
+
+
+def generate_flat_column(txnctx, column_name, path, schema, mode,
+                         checksum_policy=None, lazy_specs=False, compact_specs=False):
     """Generate instance ready structures for read-only checkouts
 
     Parameters
@@ -105,6 +153,20 @@ def generate_flat_column(txnctx, column_name, path, schema, mode):
         schema definition of the column.
     mode: str
         read-only or write-enabled mode. one of ['a', 'r'].
+    checksum_policy : Optional[ChecksumPolicy]
+        policy deciding when backends verify data checksums on read. If None
+        (default) checksums are verified on every read.
+    lazy_specs : bool
+        only used if ``mode == 'r'``. If True, only the data digest of each
+        sample is loaded; backend location specs are resolved (and backends
+        opened) on first read. The warning for samples referencing remote
+        data is emitted the first time such a sample is read, rather than
+        when the column is constructed. Default is False.
+    compact_specs : bool
+        only used if ``mode == 'r'``. If True, backend location specs of every
+        sample are packed into a :class:`~.common.CompactSampleSpecs` table
+        rather than held as one spec object per sample. Cannot be combined
+        with ``lazy_specs``. Default is False.
 
     Returns
     -------
@@ -112,13 +174,33 @@ def generate_flat_column(txnctx, column_name, path, schema, mode):
         Top level column accessor classes fully initialized for requested
         state. initailized structures defining and initializing access to
         the sample data on disk.
+
+    Raises
+    ------
+    ValueError
+        If both ``lazy_specs`` and ``compact_specs`` are True.
     """
-    sspecs, bes = _flat_load_sample_keys_and_specs(column_name, txnctx)
-    if not all([BACKEND_IS_LOCAL_MAP[be] for be in bes]):
-        _warn_remote(column_name)
-    if mode == 'a':
-        bes.add(schema.backend)
-    file_handles = open_file_handles(backends=bes, path=path, mode=mode, schema=schema)
+    if lazy_specs and compact_specs:
+        raise ValueError('`lazy_specs` and `compact_specs` cannot both be True.')
+
+    if lazy_specs and mode == 'r':
+        sspecs = _flat_load_sample_keys_and_digests(column_name, txnctx)
+        file_handles = LazyBackendHandles(
+            open_file_handles(backends={schema.backend}, path=path, mode=mode,
+                              schema=schema, checksum_policy=checksum_policy),
+            path=path, schema=schema, checksum_policy=checksum_policy,
+            column_name=column_name)
+    else:
+        if compact_specs and mode == 'r':
+            sspecs, bes = _flat_load_sample_keys_and_compact_specs(column_name, txnctx)
+        else:
+            sspecs, bes = _flat_load_sample_keys_and_specs(column_name, txnctx)
+        if not all([BACKEND_IS_LOCAL_MAP[be] for be in bes]):
+            _warn_remote(column_name)
+        if mode == 'a':
+            bes.add(schema.backend)
+        file_handles = open_file_handles(backends=bes, path=path, mode=mode, schema=schema,
+                                         checksum_policy=checksum_policy)
 
     if mode == 'r':
         res = FlatSampleReader(columnname=column_name,
@@ -176,7 +258,7 @@ def _nested_load_sample_keys_and_specs(column_name, txnctx):
     return (sspecs, seen_bes)
 
 
-def generate_nested_column(txnctx, column_name, path, schema, mode):
+def generate_nested_column(txnctx, column_name, path, schema, mode, checksum_policy=None):
     """Generate instance ready structures for read-only checkouts
 
     Parameters
@@ -192,6 +274,9 @@ def generate_nested_column(txnctx, column_name, path, schema, mode):
         schema definition of the column.
     mode: str
     read-only or write-enabled mode. one of ['a', 'r'].
+    checksum_policy : Optional[ChecksumPolicy]
+        policy deciding when backends verify data checksums on read. If None
+        (default) checksums are verified on every read.
 
     Returns
     -------
@@ -205,7 +290,8 @@ def generate_nested_column(txnctx, column_name, path, schema, mode):
         _warn_remote(column_name)
     if mode == 'a':
         bes.add(schema.backend)
-    fhand = open_file_handles(backends=bes, path=path, mode=mode, schema=schema)
+    fhand = open_file_handles(backends=bes, path=path, mode=mode, schema=schema,
+                              checksum_policy=checksum_policy)
     samples = {}
     schema_proxy = proxy(schema)
     fhand['enter_count'] = 0
@@ -3,11 +3,13 @@
 from contextlib import ExitStack
 from pathlib import Path
 from typing import (
-    Tuple, Union, Dict, Iterable, Any, Optional
+    Tuple, Union, Dict, Iterable, Any, Optional, Sequence, List
 )
 from weakref import proxy
 
-from .common import open_file_handles
+import numpy as np
+
+from .common import open_file_handles, read_fixed_shape_batch, read_specs_threaded
 from ..records import (
     data_record_db_val_from_digest,
     data_record_digest_val_from_db_val,
@@ -463,6 +465,7 @@ class FlatSubsampleWriter(FlatSubsampleReader):
         # add the record to the db
         dataRecVal = data_record_db_val_from_digest(full_hash)
         self._txnctx.dataTxn.put(dataRecKey, dataRecVal)
+        self._txnctx.mark_dirty(dataRecKey)
         self._subsamples[key] = hash_spec
 
     def __setitem__(self, key, value):
@@ -583,6 +586,7 @@ class FlatSubsampleWriter(FlatSubsampleReader):
 
             dbKey = nested_data_db_key_from_names(self._column_name, self._samplen, key)
             isRecordDeleted = self._txnctx.dataTxn.delete(dbKey)
+            self._txnctx.mark_dirty(dbKey)
             if isRecordDeleted is False:
                 raise RuntimeError(
                     f'Internal error. Not able to delete key {key} from staging '
@@ -840,6 +844,40 @@ class NestedSampleReader:
         """
         return self._schema.backend_options
 
+    @property
+    def zero_copy(self) -> bool:
+        """Bool indicating if reads return read-only views instead of copies.
+
+        Only applies to data stored in the ``NUMPY_10`` backend, where reads
+        can return a read-only view (``WRITEABLE=False``) directly onto the
+        memory mapped file rather than copying the data. In this mode the
+        checksum of each sample is verified only the first time it is read.
+        Columns without any ``NUMPY_10`` data always report False.
+
+        Can only be set in a read-only checkout. Default is False.
+        """
+        fh = self._be_fs.get('10')
+        return fh.zero_copy if fh is not None else False
+
+    @reader_checkout_only
+    def _zero_copy_set(self, value: bool):
+        """Nonstandard descriptor method. See notes in ``zero_copy.setter``.
+        """
+        if not isinstance(value, bool):
+            raise TypeError(f'zero_copy value must be bool, not {type(value)}')
+        fh = self._be_fs.get('10')
+        if fh is not None:
+            fh.set_zero_copy(value)
+
+    @zero_copy.setter
+    def zero_copy(self, value: bool):
+        """Using separate setter method (with ``@reader_checkout_only``
+        decorator applied) due to bug in python <3.8.
+
+        From: https://bugs.python.org/issue19072
+        """
+        return self._zero_copy_set(value)
+
     @property
     def iswriteable(self) -> bool:
         """Bool indicating if this column object is write-enabled.
@@ -989,6 +1027,75 @@ class NestedSampleReader:
         except KeyError:
             return default
 
+    def get_batch(self,
+                  keys: Sequence[Tuple[KeyType, KeyType]],
+                  out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Retrieve data for many (sample, subsample) keys stacked into a single array.
+
+        Only supported for ``fixed_shape`` ``ndarray`` columns. Rather than
+        reading every subsample individually and stacking the results, data
+        is read (grouped by backend) directly into a single buffer.
+
+        Parameters
+        ----------
+        keys : Sequence[Tuple[KeyType, KeyType]]
+            Sequence of ``(sample, subsample)`` key pairs to retrieve.
+        out : Optional[np.ndarray]
+            C-contiguous array of shape ``(len(keys), *column.shape)`` and
+            column dtype which the data should be written into. If None
+            (default), a new array is allocated.
+
+        Returns
+        -------
+        np.ndarray
+            Array where index ``i`` holds the data stored under ``keys[i]``.
+
+        Raises
+        ------
+        KeyError
+            if no sample / subsample with some requested key exists.
+        ValueError
+            if the column is not a fixed shape ndarray column, or if ``out``
+            is not of the expected shape / dtype.
+        """
+        specs = [self._samples[sample]._subsamples[subsample] for sample, subsample in keys]
+        return read_fixed_shape_batch(specs, self._be_fs, self._schema, out=out)
+
+    def get_many(self,
+                 keys: Sequence[Tuple[KeyType, KeyType]],
+                 *, workers: Optional[int] = None) -> List[Any]:
+        """Retrieve data for many (sample, subsample) keys, reading across a pool of threads.
+
+        Each worker thread reads with its own backend accessors, though the
+        underlying files are shared through the process wide file handle
+        pool. ``NUMPY_10`` reads copy data with the GIL released, so reads of
+        many subsamples can make use of multiple cores in a single process; h5py
+        serializes every call on its global lock, so ``HDF5_00`` / ``HDF5_01``
+        reads gain no parallelism from more threads. In write-enabled
+        checkouts data is always read in the calling thread.
+
+        Parameters
+        ----------
+        keys : Sequence[Tuple[KeyType, KeyType]]
+            Sequence of ``(sample, subsample)`` key pairs to retrieve.
+        workers : Optional[int], kwarg-only
+            maximum number of threads to read with. If None (default), the
+            :class:`~concurrent.futures.ThreadPoolExecutor` default is used.
+
+        Returns
+        -------
+        List[Any]
+            List where index ``i`` holds the data stored under ``keys[i]``.
+
+        Raises
+        ------
+        KeyError
+            if no sample / subsample with some requested key exists.
+        """
+        specs = [self._samples[sample]._subsamples[subsample] for sample, subsample in keys]
+        workers = workers if self._mode == 'r' else 1
+        return read_specs_threaded(specs, self._be_fs, self._path, self._schema, workers=workers)
+
 
 # ---------------- writer methods only after this point -------------------
 
@@ -1184,6 +1291,7 @@ class NestedSampleWriter(NestedSampleReader):
 
         with self._txnctx.write() as ctx:
             ctx.dataTxn.put(columnSchemaKey, columnSchemaVal)
+            ctx.mark_dirty(columnSchemaKey)
             ctx.hashTxn.put(hashSchemaKey, hashSchemaVal, overwrite=False)
 
         new_backend = self._schema.backend
@@ -11,6 +11,9 @@ SEP_HSH = '$'
 CMT_KV_JOIN_KEY = SEP_LST.encode()
 CMT_DIGEST_JOIN_KEY = ''
 CMT_REC_JOIN_KEY = SEP_HSH.encode()
+CMT_REF_DELTA_MAGIC = b'\x00delta'  # can never begin a blosc compressed ref
+CMT_REF_KEYFRAME_INTERVAL = 16  # max length of a chain of delta encoded refs
+CMT_REF_RANGE_SIZE = 1024  # average number of records covered by a ref range digest
 
 K_INT = f'#'  # must be length 1 value
 K_BRANCH = f'branch{SEP_KEY}'
@@ -22,6 +25,13 @@ K_SCHEMA = f's{SEP_KEY}'
 K_HASH = f'h{SEP_KEY}'
 K_WLOCK = f'writerlock{SEP_KEY}'
 K_VERSION = 'software_version'
+K_STGDIGEST = f'd{SEP_KEY}'
+K_STGDIRTY = f'x{SEP_KEY}'
+K_STGBASE = 'base'
+K_STGBASEREFS = 'baserefs'
+K_CMTIDX = '#'  # prefix of derived per-commit index records in the refs db
+K_CMTRANGES = f'{K_CMTIDX}ranges{SEP_KEY}'
+K_CMTGRAPH = f'{K_CMTIDX}graph{SEP_KEY}'
 
 WLOCK_SENTINAL = 'LOCK_AVAILABLE'
 
@@ -33,6 +43,7 @@ DIR_DATA = 'data'
 DIR_DATA_STORE = 'store_data'
 DIR_DATA_STAGE = 'stage_data'
 DIR_DATA_REMOTE = 'remote_data'
+DIR_CMT_CACHE = 'cmt_cache'
 
 # configuration file names:
 
@@ -51,11 +62,28 @@ LMDB_SETTINGS = {
     'max_spare_txns': 4,
 }
 
+# minimum number of records in the envs of a three way diff before the cursor
+# walks are run concurrently in worker threads.
+DIFF_PARALLEL_MIN_RECORDS = 500_000
+
+# max number of changes a parallel diff worker thread hands to the merge-join
+# in a single batch.
+DIFF_PARALLEL_BATCH_SIZE = 10_000
+
+# number of open read-only backend file handles above which idle handles in the
+# process wide file handle pool are closed.
+FILE_HANDLE_POOL_MAXSIZE = 256
+
 LMDB_REF_NAME = 'ref.lmdb'
 LMDB_HASH_NAME = 'hash.lmdb'
 LMDB_BRANCH_NAME = 'branch.lmdb'
 LMDB_STAGE_REF_NAME = 'stage_ref.lmdb'
 LMDB_STAGE_HASH_NAME = 'stage_hash.lmdb'
+LMDB_STAGE_DIGEST_NAME = 'stage_digest.lmdb'
+
+# max total size (bytes) of unpacked commit ref environments cached on disk.
+
+CMT_CACHE_MAX_BYTES = 4_000_000_000
 
 
 # readme file
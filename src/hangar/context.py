@@ -1,9 +1,6 @@
 import configparser
-import os
 from pathlib import Path
-import platform
 import shutil
-import tempfile
 import warnings
 from typing import MutableMapping, Optional
 
@@ -20,11 +17,12 @@ from .constants import (
     LMDB_HASH_NAME,
     LMDB_REF_NAME,
     LMDB_SETTINGS,
+    LMDB_STAGE_DIGEST_NAME,
     LMDB_STAGE_HASH_NAME,
     LMDB_STAGE_REF_NAME,
     README_FILE_NAME,
 )
-from .records.commiting import unpack_commit_ref
+from .records.commiting import CommitEnvCache
 from .records.heads import (
     create_branch,
     get_branch_head_commit,
@@ -50,7 +48,9 @@ class Environments(object):
         self.stageenv: Optional[lmdb.Environment] = None
         self.branchenv: Optional[lmdb.Environment] = None
         self.stagehashenv: Optional[lmdb.Environment] = None
+        self.stagedigestenv: Optional[lmdb.Environment] = None
         self.cmtenv: MutableMapping[str, lmdb.Environment] = {}
+        self.cmtcache = CommitEnvCache(pth)
         self._startup()
 
     @property
@@ -189,25 +189,10 @@ class Environments(object):
                   f'\n * Checking out writing HEAD BRANCH: {head_branch}'
         print(txt)
 
-        # On UNIX-like system, an open process still retains ability to
-        # interact with disk space allocated to a file when it is removed from
-        # disk. Windows does not, and will not allow file to be removed if a
-        # process is interacting with it. While the CM form is cleaner, this
-        # hack allows similar usage on Windows platforms.
-
-        if platform.system() != 'Windows':
-            with tempfile.TemporaryDirectory() as tempD:
-                tmpDF = os.path.join(tempD, f'{commit_hash}.lmdb')
-                tmpDB = lmdb.open(path=tmpDF, **LMDB_SETTINGS)
-                unpack_commit_ref(self.refenv, tmpDB, commit_hash)
-                self.cmtenv[commit_hash] = tmpDB
-        else:
-            tempD = tempfile.mkdtemp()
-            tmpDF = os.path.join(tempD, f'{commit_hash}.lmdb')
-            tmpDB = lmdb.open(path=tmpDF, **LMDB_SETTINGS)
-            unpack_commit_ref(self.refenv, tmpDB, commit_hash)
-            self.cmtenv[commit_hash] = tmpDB
-
+        # Unpacked commit envs are read-only and shared by every reader
+        # checkout of the same commit (in this and other processes).
+        if commit_hash not in self.cmtenv:
+            self.cmtenv[commit_hash] = self.cmtcache.open(self.refenv, commit_hash)
         return commit_hash
 
     def _open_environments(self):
@@ -221,12 +206,14 @@ class Environments(object):
         stage_pth = str(self.repo_path.joinpath(LMDB_STAGE_REF_NAME))
         branch_pth = str(self.repo_path.joinpath(LMDB_BRANCH_NAME))
         stagehash_pth = str(self.repo_path.joinpath(LMDB_STAGE_HASH_NAME))
+        stagedigest_pth = str(self.repo_path.joinpath(LMDB_STAGE_DIGEST_NAME))
 
         self.refenv = lmdb.open(path=ref_pth, **LMDB_SETTINGS)
         self.hashenv = lmdb.open(path=hash_pth, **LMDB_SETTINGS)
         self.stageenv = lmdb.open(path=stage_pth, **LMDB_SETTINGS)
         self.branchenv = lmdb.open(path=branch_pth, **LMDB_SETTINGS)
         self.stagehashenv = lmdb.open(path=stagehash_pth, **LMDB_SETTINGS)
+        self.stagedigestenv = lmdb.open(path=stagedigest_pth, **LMDB_SETTINGS)
 
     def _close_environments(self):
 
@@ -235,10 +222,7 @@ class Environments(object):
         self.stageenv.close()
         self.branchenv.close()
         self.stagehashenv.close()
+        self.stagedigestenv.close()
         for env in self.cmtenv.values():
-            if platform.system() == 'Windows':
-                envpth = env.path()
-                env.close()
-                os.remove(envpth)
-            else:
-                env.close()
+            self.cmtcache.release(env)
+        self.cmtenv.clear()
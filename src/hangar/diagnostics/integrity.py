@@ -112,7 +112,7 @@ def _verify_commit_ref_digests_exist(hashenv: lmdb.Environment, refenv: lmdb.Env
     try:
         with datatxn.cursor() as cur:
             for cmt in tqdm(all_commits, desc='verifying commit ref digests'):
-                with commiting.tmp_cmt_env(refenv, cmt) as tmpDB:
+                with commiting.tmp_cmt_env(refenv, cmt, use_cache=False) as tmpDB:
                     rq = queries.RecordQuery(tmpDB)
                     array_data_digests = set(rq.data_hashes())
                     schema_digests = set(rq.schema_hashes())
@@ -1,11 +1,19 @@
-from itertools import starmap
-from typing import Iterable, List, NamedTuple, Set, Tuple, Union
+import queue
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, closing
+from itertools import islice, starmap
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
 
 import lmdb
 
 from .records import (
     dynamic_layout_data_record_from_db_key,
+    flat_data_column_record_start_range_key,
+    nested_data_column_record_start_range_key,
     schema_column_record_from_db_key,
+    schema_db_range_key_from_column_unknown_layout,
     data_record_digest_val_from_db_val,
     ColumnSchemaKey,
     FlatColumnDataKey,
@@ -13,11 +21,13 @@ from .records import (
 )
 from .records.commiting import (
     check_commit_hash_in_history,
-    get_commit_ancestors_graph,
+    find_merge_base,
     get_commit_ref,
-    get_commit_spec,
+    get_commit_ref_ranges,
+    staging_area_status,
     tmp_cmt_env,
 )
+from .constants import DIFF_PARALLEL_BATCH_SIZE, DIFF_PARALLEL_MIN_RECORDS, LMDB_SETTINGS
 from .records.heads import get_branch_head_commit, get_branch_names
 from .records.queries import RecordQuery
 from .txnctx import TxnRegister
@@ -75,6 +85,26 @@ class Conflicts(NamedTuple):
     conflict: bool
 
 
+class DiffRecord(NamedTuple):
+    """Single change yielded by the streaming diff methods.
+
+    Attributes
+    ----------
+    kind
+        One of ``'added'``, ``'deleted'``, or ``'mutated'``.
+    record
+        Key of the changed column sample / subsample or column schema.
+    """
+    kind: str
+    record: ConflictKeys
+
+
+class DiffCounts(NamedTuple):
+    added: int
+    deleted: int
+    mutated: int
+
+
 class DiffAndConflictsDB(NamedTuple):
     diff: DiffOutDB
     conflict: Conflicts
@@ -88,8 +118,94 @@ class DiffAndConflicts(NamedTuple):
 # ------------------------------- Differ Methods ------------------------------
 
 
-def diff_envs(base_env: lmdb.Environment, head_env: lmdb.Environment, ) -> DiffOutDB:
-    """Main diff algorithm to determine changes between unpacked lmdb environments.
+RangeDigests = Tuple[Tuple[bytes, str], ...]
+
+
+def _range_index(ranges: Optional[RangeDigests]) -> Dict[bytes, Tuple[str, Optional[bytes]]]:
+    """Map range start keys to the range digest and start key of the following range.
+    """
+    if not ranges:
+        return {}
+    nextStarts = [k for k, _ in ranges[1:]]
+    nextStarts.append(None)
+    return {k: (d, nxt) for (k, d), nxt in zip(ranges, nextStarts)}
+
+
+def _column_db_prefixes(column: Optional[str]) -> Tuple[bytes, ...]:
+    """Sorted db key prefixes of every record belonging to a column.
+    """
+    if column is None:
+        return (b'',)
+    return tuple(sorted((
+        flat_data_column_record_start_range_key(column),
+        nested_data_column_record_start_range_key(column),
+        schema_db_range_key_from_column_unknown_layout(column),
+    )))
+
+
+def _iter_diff_cursors(baseCur: lmdb.Cursor,
+                       headCur: lmdb.Cursor,
+                       baseRanges: Dict[bytes, Tuple[str, Optional[bytes]]],
+                       headRanges: Dict[bytes, Tuple[str, Optional[bytes]]],
+                       prefix: bytes = b'') -> Iterator[Tuple[str, Tuple[bytes, bytes]]]:
+    """Merge-join two sorted cursors over records starting with ``prefix``.
+    """
+    moreBase = baseCur.set_range(prefix)
+    moreHead = headCur.set_range(prefix)
+    while True:
+        if moreBase:
+            bKey, bVal = baseCur.item()
+            moreBase = bKey.startswith(prefix)
+        if moreHead:
+            hKey, hVal = headCur.item()
+            moreHead = hKey.startswith(prefix)
+
+        if (not moreBase) and (not moreHead):
+            break
+        # inserted (no base records remain)
+        elif not moreBase:
+            yield ('added', (hKey, hVal))
+            moreHead = headCur.next()
+        # deleted (no head records remain)
+        elif not moreHead:
+            yield ('deleted', (bKey, bVal))
+            moreBase = baseCur.next()
+        # identical range of records
+        elif (bKey == hKey) and (bKey in baseRanges) and (hKey in headRanges) \
+                and (baseRanges[bKey][0] == headRanges[hKey][0]):
+            bNext, hNext = baseRanges[bKey][1], headRanges[hKey][1]
+            moreBase = baseCur.set_range(bNext) if bNext is not None else False
+            moreHead = headCur.set_range(hNext) if hNext is not None else False
+        # inserted
+        elif bKey > hKey:
+            yield ('added', (hKey, hVal))
+            moreHead = headCur.next()
+        # deleted
+        elif bKey < hKey:
+            yield ('deleted', (bKey, bVal))
+            moreBase = baseCur.next()
+        # no change
+        elif bVal == hVal:
+            moreBase = baseCur.next()
+            moreHead = headCur.next()
+        # mutated
+        else:  # (bKey == hKey) and (bVal != hVal)
+            yield ('mutated', (hKey, hVal))
+            moreBase = baseCur.next()
+            moreHead = headCur.next()
+
+
+def iter_diff_envs(base_env: lmdb.Environment,
+                   head_env: lmdb.Environment,
+                   base_ranges: Optional[RangeDigests] = None,
+                   head_ranges: Optional[RangeDigests] = None,
+                   *,
+                   column: Optional[str] = None) -> Iterator[Tuple[str, Tuple[bytes, bytes]]]:
+    """Stream the changes between unpacked lmdb environments in key order.
+
+    Only the record currently being compared is held in memory. Reader
+    transactions on both environments remain open until the generator is
+    exhausted or closed.
 
     Parameters
     ----------
@@ -97,68 +213,98 @@ def diff_envs(base_env: lmdb.Environment, head_env: lmdb.Environment, ) -> DiffO
         starting point to calculate changes from
     head_env : lmdb.Environment
         some commit which should be compared to BASE
-
-    Returns
-    -------
-    DiffOutDB
-        iterable of db formatted key/value pairs for `added`, `deleted`,
-        `mutated` fields
+    base_ranges : Optional[RangeDigests]
+        range digests of the records in ``base_env`` (see
+        :func:`~.records.commiting.get_commit_ref_ranges`), by default None.
+    head_ranges : Optional[RangeDigests]
+        range digests of the records in ``head_env``, by default None.
+    column : Optional[str]
+        if provided, only records (data & schema) of this column are compared,
+        by default None.
+
+    Yields
+    ------
+    Tuple[str, Tuple[bytes, bytes]]
+        change kind (one of `added`, `deleted`, `mutated`) and the db formatted
+        key/value pair. the head value is provided for mutated records.
     """
-    added, deleted, mutated = [], [], []
+    if (base_ranges is not None) and (head_ranges is not None):
+        baseRanges, headRanges = _range_index(base_ranges), _range_index(head_ranges)
+    else:
+        baseRanges, headRanges = {}, {}
 
     baseTxn = TxnRegister().begin_reader_txn(base_env)
     headTxn = TxnRegister().begin_reader_txn(head_env)
     baseCur = baseTxn.cursor()
     headCur = headTxn.cursor()
     try:
-        moreBase = baseCur.first()
-        moreHead = headCur.first()
-
-        while True:
-            if moreBase and moreHead:
-                bKey, bVal = baseCur.item()
-                hKey, hVal = headCur.item()
-            elif (not moreBase) and (not moreHead):
-                break
-            # necessary to avoid deadlock at last items
-            elif not moreBase:
-                bKey = b'x'
-                bVal = b''
-                hKey, hVal = headCur.item()
-            else:  # (not moreHead)
-                hKey = b'x'
-                hVal = b''
-                bKey, bVal = baseCur.item()
-
-            # inserted
-            if bKey > hKey:
-                added.append((hKey, hVal))
-                moreHead = headCur.next()
-                continue
-            # deleted
-            elif bKey < hKey:
-                deleted.append((bKey, bVal))
-                moreBase = baseCur.next()
-                continue
-            # no change
-            elif (bKey == hKey) and (bVal == hVal):
-                moreBase = baseCur.next()
-                moreHead = headCur.next()
-                continue
-            # mutated
-            else:  # (bKey == hKey) and (bVal != hVal)
-                mutated.append((hKey, hVal))
-                moreBase = baseCur.next()
-                moreHead = headCur.next()
-                continue
-
+        for prefix in _column_db_prefixes(column):
+            yield from _iter_diff_cursors(baseCur, headCur, baseRanges, headRanges, prefix)
     finally:
         baseCur.close()
         headCur.close()
         TxnRegister().abort_reader_txn(base_env)
         TxnRegister().abort_reader_txn(head_env)
 
-    return DiffOutDB(set(added), set(deleted), set(mutated))
+
+def diff_envs(base_env: lmdb.Environment,
+              head_env: lmdb.Environment,
+              base_ranges: Optional[RangeDigests] = None,
+              head_ranges: Optional[RangeDigests] = None) -> DiffOutDB:
+    """Main diff algorithm to determine changes between unpacked lmdb environments.
+
+    If the range digests of both environments are provided, ranges of records
+    which start at the same key and have the same digest in both environments
+    are skipped over rather than compared record by record.
+
+    Parameters
+    ----------
+    base_env : lmdb.Environment
+        starting point to calculate changes from
+    head_env : lmdb.Environment
+        some commit which should be compared to BASE
+    base_ranges : Optional[RangeDigests]
+        range digests of the records in ``base_env`` (see
+        :func:`~.records.commiting.get_commit_ref_ranges`), by default None.
+    head_ranges : Optional[RangeDigests]
+        range digests of the records in ``head_env``, by default None.
+
+    Returns
+    -------
+    DiffOutDB
+        iterable of db formatted key/value pairs for `added`, `deleted`,
+        `mutated` fields
+    """
+    changes = {'added': set(), 'deleted': set(), 'mutated': set()}
+    for kind, kv in iter_diff_envs(base_env, head_env, base_ranges, head_ranges):
+        changes[kind].add(kv)
+    return DiffOutDB(**changes)
+
+
+def _raw_from_db_record(kind: str, kv: Tuple[bytes, bytes]) -> DiffRecord:
+    """Convert a single streamed change from db -> raw
+    """
+    k = kv[0]
+    if k[:2] in (b'f:', b'n:'):
+        return DiffRecord(kind, dynamic_layout_data_record_from_db_key(k))
+    elif k[:2] == b's:':
+        return DiffRecord(kind, schema_column_record_from_db_key(k))
+    raise RuntimeError(f'Unknown record type prefix encountered: '
+                       f'{k[:2]}. full record => k: {k} & v: {kv[1]}')
+
+
+def _iter_raw_from_db_changes(changes: Iterable[Tuple[str, Tuple[bytes, bytes]]]
+                              ) -> Iterator[DiffRecord]:
+    """Lazily convert streamed changes from db -> raw
+    """
+    return starmap(_raw_from_db_record, changes)
+
+
+def _count_db_changes(changes: Iterable[Tuple[str, Tuple[bytes, bytes]]]) -> DiffCounts:
+    """Count streamed changes of each kind without converting them.
+    """
+    counts = Counter(kind for kind, _ in changes)
+    return DiffCounts(added=counts['added'], deleted=counts['deleted'], mutated=counts['mutated'])
 
 
 def _raw_from_db_change(changes: Set[Tuple[bytes, bytes]]) -> Changes:
@@ -225,35 +371,57 @@ def _all_raw_from_db_changes(outDb: DiffAndConflictsDB) -> DiffAndConflicts:
 # ------------------------- Commit Differ -------------------------------------
 
 
-def _symmetric_difference_keys(pair1: Set[Tuple[bytes, bytes]],
-                               pair2: Set[Tuple[bytes, bytes]]
-                               ) -> List[Tuple[bytes, bytes]]:
-    """Find all keys common to both input pairs AND which have different values.
+_CONFLICT_TYPES = {
+    ('added', 'added'): 't1',
+    ('deleted', 'mutated'): 't21',
+    ('mutated', 'deleted'): 't22',
+    ('mutated', 'mutated'): 't3',
+}
 
-    Essentially a moddified `symmetric_difference` set operation, which keeps
-    track of all seen items. Note: This ignores any `count` tracking values in
-    the input tuples (ie. lmdb keys ending in ":")
+
+def find_conflicts_from_changes(master_changes: Iterable[Tuple[str, Tuple[bytes, bytes]]],
+                                dev_changes: Iterable[Tuple[str, Tuple[bytes, bytes]]]
+                                ) -> Conflicts:
+    """Determine conflicting changes by merge-joining two key-sorted change streams.
 
     Parameters
     ----------
-    pair1 : Set[Tuple[bytes, bytes]]
-        key/value pairs making up the first set
-    pair2 : Set[Tuple[bytes, bytes]]
-        key/value pairs making up the second set
+    master_changes : Iterable[Tuple[str, Tuple[bytes, bytes]]]
+        changes between base and master HEAD, in key order (as yielded by
+        :func:`iter_diff_envs`)
+    dev_changes : Iterable[Tuple[str, Tuple[bytes, bytes]]]
+        changes between base and dev HEAD, in key order.
 
     Returns
     -------
-    List[Tuple[bytes, bytes]]
-        keys which appear in both input pair sets but which have different values.
+    Conflicts
+        Tuple containing fields for `t1`, `t21`, `t22`, `t3`, and (bool)
+        `conflicts` recording output info for if and what type of conflict has
+        occured
     """
-    seen = set()
-    conflict = []
-    for k, v in pair1.symmetric_difference(pair2):
-        if k in seen:
-            conflict.append((k, v))
+    found = {'t1': [], 't21': [], 't22': [], 't3': []}
+    mIt, dIt = iter(master_changes), iter(dev_changes)
+    mChange, dChange = next(mIt, None), next(dIt, None)
+    while (mChange is not None) and (dChange is not None):
+        (mKind, (mKey, mVal)), (dKind, (dKey, dVal)) = mChange, dChange
+        if mKey < dKey:
+            mChange = next(mIt, None)
+        elif mKey > dKey:
+            dChange = next(dIt, None)
         else:
-            seen.add(k)
-    return conflict
+            conflictType = _CONFLICT_TYPES.get((mKind, dKind))
+            if (conflictType is not None) and (mVal != dVal):
+                found[conflictType].append((mKey, dVal if mKind == 'deleted' else mVal))
+            mChange, dChange = next(mIt, None), next(dIt, None)
+
+    isConflict = any(found.values())
+    return Conflicts(**found, conflict=isConflict)
+
+
+def _sorted_changes(diff: DiffOutDB) -> List[Tuple[str, Tuple[bytes, bytes]]]:
+    changes = [(kind, kv) for kind, kvs in diff._asdict().items() for kv in kvs]
+    changes.sort(key=lambda change: change[1][0])
+    return changes
 
 
 def find_conflicts(master_diff: DiffOutDB, dev_diff: DiffOutDB) -> Conflicts:
@@ -276,14 +444,152 @@ def find_conflicts(master_diff: DiffOutDB, dev_diff: DiffOutDB) -> Conflicts:
         `conflicts` recording output info for if and what type of conflict has
         occured
     """
-    t1 = _symmetric_difference_keys(master_diff.added, dev_diff.added)
-    t21 = _symmetric_difference_keys(master_diff.deleted, dev_diff.mutated)
-    t22 = _symmetric_difference_keys(master_diff.mutated, dev_diff.deleted)
-    t3 = _symmetric_difference_keys(master_diff.mutated, dev_diff.mutated)
-    isConflict = bool(any([t1, t21, t22, t3]))
+    return find_conflicts_from_changes(_sorted_changes(master_diff), _sorted_changes(dev_diff))
 
-    res = Conflicts(t1=t1, t21=t21, t22=t22, t3=t3, conflict=isConflict)
-    return res
+
+def _collect_changes(changes: Iterable[Tuple[str, Tuple[bytes, bytes]]],
+                     out: Dict[str, Set[Tuple[bytes, bytes]]]
+                     ) -> Iterator[Tuple[str, Tuple[bytes, bytes]]]:
+    """Pass a change stream through, adding each change to the ``out`` set of its kind.
+    """
+    for kind, kv in changes:
+        out[kind].add(kv)
+        yield kind, kv
+
+
+class _ThreadedWalk(object):
+    """Stream the changes of one cursor walk, read ahead in a worker thread.
+
+    The worker thread runs :func:`iter_diff_envs` (holding its own reader
+    transactions) and hands changes over in batches of at most ``batch_size``
+    through a queue holding at most two batches, so memory use is bounded no
+    matter how far the consumer falls behind. Closing the walk stops the
+    worker and waits for it to exit.
+    """
+
+    def __init__(self, walk: Tuple[lmdb.Environment, lmdb.Environment,
+                                   Optional[RangeDigests], Optional[RangeDigests]],
+                 batch_size: int):
+        self._queue = queue.Queue(maxsize=2)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(walk, batch_size), daemon=True)
+        self._thread.start()
+
+    def _put(self, item) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self, walk, batch_size: int):
+        try:
+            with closing(iter_diff_envs(*walk)) as changes:
+                batch = list(islice(changes, batch_size))
+                while batch:
+                    if not self._put(batch):
+                        return
+                    batch = list(islice(changes, batch_size))
+            self._put(None)
+        except BaseException as e:  # pragma: no cover
+            self._put(e)
+
+    def __iter__(self) -> Iterator[Tuple[str, Tuple[bytes, bytes]]]:
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                return
+            if isinstance(batch, BaseException):
+                raise batch
+            yield from batch
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+
+
+def _use_parallel_diff(*envs: lmdb.Environment) -> bool:
+    return sum(env.stat()['entries'] for env in envs) >= DIFF_PARALLEL_MIN_RECORDS
+
+
+def diff3_envs(a_env: lmdb.Environment,
+               m_env: lmdb.Environment,
+               d_env: lmdb.Environment,
+               a_ranges: Optional[RangeDigests] = None,
+               m_ranges: Optional[RangeDigests] = None,
+               d_ranges: Optional[RangeDigests] = None,
+               *,
+               from_ancestor: bool = False) -> DiffAndConflictsDB:
+    """Three way diff and conflict finder from ancestor, master, and dev envs.
+
+    Conflicts are found by merge-joining the (key ordered) ancestor -> master
+    and ancestor -> dev change streams. When the envs hold at least
+    :data:`~.constants.DIFF_PARALLEL_MIN_RECORDS` records, each cursor walk
+    runs in its own thread: the ancestor -> master and ancestor -> dev walks
+    are read ahead (see :class:`_ThreadedWalk`) while this thread merge-joins
+    them, and the dev -> master walk producing the diff (if needed) is
+    collected in a third thread. No process is ever started; the walks
+    overlap while the lmdb reads release the GIL. Otherwise the walks are
+    streamed in this thread.
+
+    Parameters
+    ----------
+    a_env : lmdb.Environment
+        unpacked lmdb environment for the ancestor commit
+    m_env : lmdb.Environment
+        unpacked lmdb environment for the master commit
+    d_env : lmdb.Environment
+        unpacked lmdb environment for the dev commit
+    a_ranges : Optional[RangeDigests]
+        range digests of the ancestor commit records, if known.
+    m_ranges : Optional[RangeDigests]
+        range digests of the master commit records, if known.
+    d_ranges : Optional[RangeDigests]
+        range digests of the dev commit records, if known.
+    from_ancestor : bool
+        If True, the ``diff`` field holds the changes from ancestor -> dev
+        (ie. what must be applied to master to merge). If False (default), it
+        holds the changes from dev -> master.
+
+    Returns
+    -------
+    DiffAndConflictsDB
+        structure containing (`additions`, `deletions`, `mutations`) for
+        diff, as well as the ConflictRecord struct.
+    """
+    masterWalk = (a_env, m_env, a_ranges, m_ranges)
+    devWalk = (a_env, d_env, a_ranges, d_ranges)
+    walks = [masterWalk, devWalk]
+    if not from_ancestor:
+        walks.append((d_env, m_env, d_ranges, m_ranges))
+
+    parallel = _use_parallel_diff(a_env, m_env, d_env)
+    with ExitStack() as stack:
+        if parallel:
+            mChanges, dChanges = (
+                stack.enter_context(closing(_ThreadedWalk(walk, DIFF_PARALLEL_BATCH_SIZE)))
+                for walk in (masterWalk, devWalk))
+        else:
+            mChanges, dChanges = (
+                stack.enter_context(closing(iter_diff_envs(*walk)))
+                for walk in (masterWalk, devWalk))
+
+        if from_ancestor:
+            diff = {'added': set(), 'deleted': set(), 'mutated': set()}
+            devChanges = stack.enter_context(closing(_collect_changes(dChanges, diff)))
+            conflict = find_conflicts_from_changes(mChanges, devChanges)
+            deque(devChanges, maxlen=0)
+            return DiffAndConflictsDB(diff=DiffOutDB(**diff), conflict=conflict)
+
+        if parallel:
+            pool = stack.enter_context(ThreadPoolExecutor(max_workers=1))
+            diffFuture = pool.submit(diff_envs, *walks[2])
+            conflict = find_conflicts_from_changes(mChanges, dChanges)
+            return DiffAndConflictsDB(diff=diffFuture.result(), conflict=conflict)
+        conflict = find_conflicts_from_changes(mChanges, dChanges)
+    return DiffAndConflictsDB(diff=diff_envs(*walks[2]), conflict=conflict)
 
 
 # ---------------------------- Differ Base  -----------------------------------
@@ -296,12 +602,130 @@ class BaseUserDiff(object):
         self._branchenv: lmdb.Environment = branchenv
         self._refenv: lmdb.Environment = refenv
 
+    def _verify_commit_hash(self, dev_commit_hash: str) -> str:
+        if not check_commit_hash_in_history(self._refenv, dev_commit_hash):
+            msg = f'HANGAR VALUE ERROR: dev_commit_hash: {dev_commit_hash} does not exist'
+            raise ValueError(msg)
+        return dev_commit_hash
+
+    def _branch_head_commit(self, dev_branch: str) -> str:
+        branchNames = get_branch_names(self._branchenv)
+        if dev_branch not in branchNames:
+            msg = f'HANGAR VALUE ERROR: dev_branch: {dev_branch} invalid branch name'
+            raise ValueError(msg)
+        return get_branch_head_commit(self._branchenv, dev_branch)
+
+    def _iter_run_diff(self, dev_commit_hash: str,
+                       column: Optional[str] = None) -> Iterator[Tuple[str, Tuple[bytes, bytes]]]:
+        raise NotImplementedError
+
+    def iter_commit(self, dev_commit_hash: str, *,
+                    column: Optional[str] = None) -> Iterator[DiffRecord]:
+        """Stream changes between HEAD and commit hash without building change sets.
+
+        Records are yielded in key order as they are found, so memory use does
+        not grow with the size of the diff. Unlike :meth:`commit`, merge
+        conflicts are not computed.
+
+        Parameters
+        ----------
+        dev_commit_hash : str
+            hash of the commit to be used as the comparison.
+        column : Optional[str]
+            if provided, only changes to this column are reported.
+
+        Returns
+        -------
+        Iterator[DiffRecord]
+            ``(kind, record)`` tuples, where ``kind`` is one of ``'added'``,
+            ``'deleted'``, or ``'mutated'``.
+
+        Raises
+        ------
+        ValueError
+            if the specified ``dev_commit_hash`` is not a valid commit reference.
+        """
+        dHEAD = self._verify_commit_hash(dev_commit_hash)
+        return _iter_raw_from_db_changes(self._iter_run_diff(dHEAD, column))
+
+    def iter_branch(self, dev_branch: str, *,
+                    column: Optional[str] = None) -> Iterator[DiffRecord]:
+        """Stream changes between HEAD and branch name without building change sets.
+
+        Parameters
+        ----------
+        dev_branch : str
+            name of the branch whose HEAD will be used to calculate the diff of.
+        column : Optional[str]
+            if provided, only changes to this column are reported.
+
+        Returns
+        -------
+        Iterator[DiffRecord]
+            ``(kind, record)`` tuples, where ``kind`` is one of ``'added'``,
+            ``'deleted'``, or ``'mutated'``.
+
+        Raises
+        ------
+        ValueError
+            If the specified ``dev_branch`` does not exist.
+        """
+        dHEAD = self._branch_head_commit(dev_branch)
+        return _iter_raw_from_db_changes(self._iter_run_diff(dHEAD, column))
+
+    def count_commit(self, dev_commit_hash: str, *, column: Optional[str] = None) -> DiffCounts:
+        """Count changes between HEAD and commit hash without materializing them.
+
+        Parameters
+        ----------
+        dev_commit_hash : str
+            hash of the commit to be used as the comparison.
+        column : Optional[str]
+            if provided, only changes to this column are counted.
+
+        Returns
+        -------
+        DiffCounts
+            number of ``added``, ``deleted``, and ``mutated`` records.
+
+        Raises
+        ------
+        ValueError
+            if the specified ``dev_commit_hash`` is not a valid commit reference.
+        """
+        dHEAD = self._verify_commit_hash(dev_commit_hash)
+        return _count_db_changes(self._iter_run_diff(dHEAD, column))
+
+    def count_branch(self, dev_branch: str, *, column: Optional[str] = None) -> DiffCounts:
+        """Count changes between HEAD and branch name without materializing them.
+
+        Parameters
+        ----------
+        dev_branch : str
+            name of the branch whose HEAD will be used to calculate the diff of.
+        column : Optional[str]
+            if provided, only changes to this column are counted.
+
+        Returns
+        -------
+        DiffCounts
+            number of ``added``, ``deleted``, and ``mutated`` records.
+
+        Raises
+        ------
+        ValueError
+            If the specified ``dev_branch`` does not exist.
+        """
+        dHEAD = self._branch_head_commit(dev_branch)
+        return _count_db_changes(self._iter_run_diff(dHEAD, column))
+
     def _determine_ancestors(self, mHEAD: str, dHEAD: str) -> HistoryDiffStruct:
         """Search the commit history to determine the closest common ancestor.
 
         The closest common ancestor is important because it serves as the "merge
-        base" in a 3-way merge strategy. This is a very naive implementation, but it
-        works well enough right now for simple branch histories.
+        base" in a 3-way merge strategy. Generation numbers recorded in the
+        commit graph index bound the search to the commits made since the two
+        histories diverged.
 
         Parameters
         ----------
@@ -316,18 +740,7 @@ class BaseUserDiff(object):
             indicating the masterHEAD, devHEAD, ancestorHEAD, and canFF which
             tells if this is a fast-forward-able commit.
         """
-        mAncestors = get_commit_ancestors_graph(self._refenv, mHEAD)
-        dAncestors = get_commit_ancestors_graph(self._refenv, dHEAD)
-        cAncestors = set(mAncestors.keys()).intersection(set(dAncestors.keys()))
-        canFF = True if mHEAD in cAncestors else False
-
-        ancestorOrder = []
-        for ancestor in cAncestors:
-            timeOfCommit = get_commit_spec(self._refenv, ancestor).commit_time
-            ancestorOrder.append((ancestor, timeOfCommit))
-
-        ancestorOrder.sort(key=lambda t: t[1], reverse=True)
-        commonAncestor = ancestorOrder[0][0]
+        commonAncestor, canFF = find_merge_base(self._refenv, mHEAD, dHEAD)
         res = HistoryDiffStruct(
             masterHEAD=mHEAD, devHEAD=dHEAD, ancestorHEAD=commonAncestor, canFF=canFF)
         return res
@@ -335,7 +748,10 @@ class BaseUserDiff(object):
     @staticmethod
     def _diff3(a_env: lmdb.Environment,
                m_env: lmdb.Environment,
-               d_env: lmdb.Environment) -> DiffAndConflictsDB:
+               d_env: lmdb.Environment,
+               a_ranges: Optional[RangeDigests] = None,
+               m_ranges: Optional[RangeDigests] = None,
+               d_ranges: Optional[RangeDigests] = None) -> DiffAndConflictsDB:
         """Three way diff and conflict finder from ancestor, master, and dev commits.
 
         Parameters
@@ -346,6 +762,12 @@ class BaseUserDiff(object):
             unpacked lmdb environment for the master commit, current HEAD
         d_env : lmdb.Environment
             unpacked lmdb environment for the dev commit, compare to HEAD
+        a_ranges : Optional[RangeDigests]
+            range digests of the ancestor commit records, if known.
+        m_ranges : Optional[RangeDigests]
+            range digests of the master commit records, if known.
+        d_ranges : Optional[RangeDigests]
+            range digests of the dev commit records, if known.
 
         Returns
         -------
@@ -353,13 +775,13 @@ class BaseUserDiff(object):
             structure containing (`additions`, `deletions`, `mutations`) for
             diff, as well as the ConflictRecord struct.
         """
-        it = ((a_env, m_env), (a_env, d_env), (d_env, m_env))
-        diffs = tuple(starmap(diff_envs, it))  # significant perf improvement by map.
-        conflict = find_conflicts(diffs[0], diffs[1])
-        return DiffAndConflictsDB(diff=diffs[2], conflict=conflict)
+        return diff3_envs(a_env, m_env, d_env, a_ranges, m_ranges, d_ranges)
 
     @staticmethod
-    def _diff(a_env: lmdb.Environment, m_env: lmdb.Environment) -> DiffAndConflictsDB:
+    def _diff(a_env: lmdb.Environment,
+              m_env: lmdb.Environment,
+              a_ranges: Optional[RangeDigests] = None,
+              m_ranges: Optional[RangeDigests] = None) -> DiffAndConflictsDB:
         """Fast Forward differ from ancestor to master commit.
 
         Note: this method returns the same MasterDevDiff struct as the three
@@ -372,6 +794,10 @@ class BaseUserDiff(object):
             unpacked lmdb environment for the ancestor commit
         m_env : lmdb.Environment
             unpacked lmdb environment for the master commit
+        a_ranges : Optional[RangeDigests]
+            range digests of the ancestor commit records, if known.
+        m_ranges : Optional[RangeDigests]
+            range digests of the master commit records, if known.
 
         Returns
         -------
@@ -379,7 +805,7 @@ class BaseUserDiff(object):
             structure containing (`additions`, `deletions`, `mutations`) for
             the ancestor -> master (head) env diff
         """
-        m_diff = diff_envs(a_env, m_env)
+        m_diff = diff_envs(a_env, m_env, a_ranges, m_ranges)
         conflict = Conflicts(t1=[], t21=[], t22=[], t3=[], conflict=False)
         return DiffAndConflictsDB(diff=m_diff, conflict=conflict)
 
@@ -443,14 +869,34 @@ class ReaderUserDiff(BaseUserDiff):
         """
         hist = self._determine_ancestors(self._commit_hash, dev_commit_hash)
         mH, dH, aH = hist.masterHEAD, hist.devHEAD, hist.ancestorHEAD
+        mR = get_commit_ref_ranges(self._refenv, mH)
+        dR = get_commit_ref_ranges(self._refenv, dH)
         with tmp_cmt_env(self._refenv, mH) as m_env, tmp_cmt_env(self._refenv, dH) as d_env:
             if hist.canFF is True:
-                outDb = self._diff(m_env, d_env)
+                outDb = self._diff(m_env, d_env, mR, dR)
             else:
+                aR = get_commit_ref_ranges(self._refenv, aH)
                 with tmp_cmt_env(self._refenv, aH) as a_env:
-                    outDb = self._diff3(a_env, m_env, d_env)
+                    outDb = self._diff3(a_env, m_env, d_env, aR, mR, dR)
         return outDb
 
+    def _iter_run_diff(self, dev_commit_hash: str,
+                       column: Optional[str] = None) -> Iterator[Tuple[str, Tuple[bytes, bytes]]]:
+        """Stream changes between head and commit hash, yielding DB formatted results.
+
+        Only the ``diff`` portion of :meth:`_run_diff` is computed, so the
+        ancestor commit is never unpacked.
+        """
+        hist = self._determine_ancestors(self._commit_hash, dev_commit_hash)
+        mH, dH = hist.masterHEAD, hist.devHEAD
+        mR = get_commit_ref_ranges(self._refenv, mH)
+        dR = get_commit_ref_ranges(self._refenv, dH)
+        with tmp_cmt_env(self._refenv, mH) as m_env, tmp_cmt_env(self._refenv, dH) as d_env:
+            if hist.canFF is True:
+                yield from iter_diff_envs(m_env, d_env, mR, dR, column=column)
+            else:
+                yield from iter_diff_envs(d_env, m_env, dR, mR, column=column)
+
     def commit(self, dev_commit_hash: str) -> DiffAndConflicts:
         """Compute diff between HEAD and commit hash, returning user-facing results.
 
@@ -470,10 +916,7 @@ class ReaderUserDiff(BaseUserDiff):
         ValueError
             if the specified ``dev_commit_hash`` is not a valid commit reference.
         """
-        if not check_commit_hash_in_history(self._refenv, dev_commit_hash):
-            msg = f'HANGAR VALUE ERROR: dev_commit_hash: {dev_commit_hash} does not exist'
-            raise ValueError(msg)
-
+        self._verify_commit_hash(dev_commit_hash)
         outDb = self._run_diff(dev_commit_hash=dev_commit_hash)
         outRaw = _all_raw_from_db_changes(outDb)
         return outRaw
@@ -497,13 +940,7 @@ class ReaderUserDiff(BaseUserDiff):
         ValueError
             If the specified `dev_branch` does not exist.
         """
-        branchNames = get_branch_names(self._branchenv)
-        if dev_branch in branchNames:
-            dHEAD = get_branch_head_commit(self._branchenv, dev_branch)
-        else:
-            msg = f'HANGAR VALUE ERROR: dev_branch: {dev_branch} invalid branch name'
-            raise ValueError(msg)
-
+        dHEAD = self._branch_head_commit(dev_branch)
         outDb = self._run_diff(dev_commit_hash=dHEAD)
         outRaw = _all_raw_from_db_changes(outDb)
         return outRaw
@@ -550,10 +987,12 @@ class WriterUserDiff(BaseUserDiff):
                  \\----- ee ----- ff
     """
 
-    def __init__(self, stageenv: lmdb.Environment, branch_name: str, *args, **kwargs):
+    def __init__(self, stageenv: lmdb.Environment, branch_name: str, *args,
+                 stagedigestenv: Optional[lmdb.Environment] = None, **kwargs):
 
         super().__init__(*args, **kwargs)
         self._stageenv: lmdb.Environment = stageenv
+        self._stagedigestenv: Optional[lmdb.Environment] = stagedigestenv
         self._branch_name: str = branch_name
 
     def _run_diff(self, dev_commit_hash: str) -> DiffAndConflictsDB:
@@ -576,10 +1015,33 @@ class WriterUserDiff(BaseUserDiff):
             if hist.canFF is True:
                 res = self._diff(self._stageenv, d_env)
             else:
+                aR = get_commit_ref_ranges(self._refenv, hist.ancestorHEAD)
+                dR = get_commit_ref_ranges(self._refenv, hist.devHEAD)
                 with tmp_cmt_env(self._refenv, hist.ancestorHEAD) as a_env:
-                    res = self._diff3(a_env, self._stageenv, d_env)
+                    res = self._diff3(a_env, self._stageenv, d_env, aR, None, dR)
         return res
 
+    def _iter_run_diff(self, dev_commit_hash: str,
+                       column: Optional[str] = None) -> Iterator[Tuple[str, Tuple[bytes, bytes]]]:
+        """Stream changes between head and commit, yielding DB formatted results.
+
+        Only the ``diff`` portion of :meth:`_run_diff` is computed, so the
+        ancestor commit is never unpacked.
+        """
+        commit_hash = get_branch_head_commit(self._branchenv, self._branch_name)
+        hist = self._determine_ancestors(commit_hash, dev_commit_hash)
+        with tmp_cmt_env(self._refenv, hist.devHEAD) as d_env:
+            if hist.canFF is True:
+                yield from iter_diff_envs(self._stageenv, d_env, column=column)
+            else:
+                yield from iter_diff_envs(d_env, self._stageenv, column=column)
+
+    def _iter_staged_diff(self, column: Optional[str] = None
+                          ) -> Iterator[Tuple[str, Tuple[bytes, bytes]]]:
+        commit_hash = get_branch_head_commit(self._branchenv, self._branch_name)
+        with tmp_cmt_env(self._refenv, commit_hash) as base_env:
+            yield from iter_diff_envs(base_env, self._stageenv, column=column)
+
     def commit(self, dev_commit_hash: str) -> DiffAndConflicts:
         """Compute diff between HEAD and commit, returning user-facing results.
 
@@ -599,10 +1061,7 @@ class WriterUserDiff(BaseUserDiff):
         ValueError
             if the specified ``dev_commit_hash`` is not a valid commit reference.
         """
-        if not check_commit_hash_in_history(self._refenv, dev_commit_hash):
-            msg = f'HANGAR VALUE ERROR: dev_commit_hash: {dev_commit_hash} does not exist'
-            raise ValueError(msg)
-
+        self._verify_commit_hash(dev_commit_hash)
         outDb = self._run_diff(dev_commit_hash=dev_commit_hash)
         outRaw = _all_raw_from_db_changes(outDb)
         return outRaw
@@ -626,13 +1085,7 @@ class WriterUserDiff(BaseUserDiff):
         ValueError
             If the specified ``dev_branch`` does not exist.
         """
-        branchNames = get_branch_names(self._branchenv)
-        if dev_branch in branchNames:
-            dHEAD = get_branch_head_commit(self._branchenv, dev_branch)
-        else:
-            msg = f'HANGAR VALUE ERROR: dev_branch: {dev_branch} invalid branch name'
-            raise ValueError(msg)
-
+        dHEAD = self._branch_head_commit(dev_branch)
         outDb = self._run_diff(dev_commit_hash=dHEAD)
         outRaw = _all_raw_from_db_changes(outDb)
         return outRaw
@@ -652,6 +1105,37 @@ class WriterUserDiff(BaseUserDiff):
         outRaw = _all_raw_from_db_changes(outDb)
         return outRaw
 
+    def iter_staged(self, *, column: Optional[str] = None) -> Iterator[DiffRecord]:
+        """Stream changes of the staging area to base without building change sets.
+
+        Parameters
+        ----------
+        column : Optional[str]
+            if provided, only changes to this column are reported.
+
+        Returns
+        -------
+        Iterator[DiffRecord]
+            ``(kind, record)`` tuples, where ``kind`` is one of ``'added'``,
+            ``'deleted'``, or ``'mutated'``.
+        """
+        return _iter_raw_from_db_changes(self._iter_staged_diff(column))
+
+    def count_staged(self, *, column: Optional[str] = None) -> DiffCounts:
+        """Count changes of the staging area to base without materializing them.
+
+        Parameters
+        ----------
+        column : Optional[str]
+            if provided, only changes to this column are counted.
+
+        Returns
+        -------
+        DiffCounts
+            number of ``added``, ``deleted``, and ``mutated`` records.
+        """
+        return _count_db_changes(self._iter_staged_diff(column))
+
     def status(self) -> str:
         """Determine if changes have been made in the staging area
 
@@ -659,12 +1143,22 @@ class WriterUserDiff(BaseUserDiff):
         same, the status is said to be "CLEAN". If even one column or
         metadata record has changed however, the status is "DIRTY".
 
+        When the staged record digests are synced at the parent commit, only
+        the records modified since are inspected; otherwise the full staging
+        area is compared to the parent commit refs.
+
         Returns
         -------
         str
             "CLEAN" if no changes have been made, otherwise "DIRTY"
         """
         head_commit = get_branch_head_commit(self._branchenv, self._branch_name)
+        if (self._stagedigestenv is not None) and (head_commit != ''):
+            status = staging_area_status(
+                self._stageenv, self._stagedigestenv, head_commit)
+            if status is not None:
+                return status
+
         if head_commit == '':
             base_refs = ()
         else:
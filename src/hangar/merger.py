@@ -12,11 +12,13 @@ funneled through the :function:`select_merge_algorithm` function
     operations can be attempted (if desired.)
 """
 from pathlib import Path
+from typing import Optional
 
 import lmdb
 
-from .diff import WriterUserDiff, diff_envs, find_conflicts
+from .diff import WriterUserDiff, diff3_envs
 from .records.commiting import (
+    get_commit_ref_ranges,
     tmp_cmt_env,
     replace_staging_area_with_commit,
     replace_staging_area_with_refs,
@@ -42,7 +44,8 @@ def select_merge_algorithm(message: str,
                            dev_branch: str,
                            repo_path: Path,
                            *,
-                           writer_uuid: str = 'MERGE_PROCESS') -> str:
+                           writer_uuid: str = 'MERGE_PROCESS',
+                           stagedigestenv: lmdb.Environment = None) -> str:
     """Entry point to perform a merge.
 
     Automatically selects algorithm and does the operation if no conflicts are
@@ -72,6 +75,9 @@ def select_merge_algorithm(message: str,
         lock `MERGE_PROCESS` is used to ensure that a writer is active. If
         called from within a write-enabled checkout, the writer lock is set to
         the writer_uuid of the writer checkout so that the lock can be acquired.
+    stagedigestenv : lmdb.Environment, optional, kwarg only
+        where the staged record digests are stored, if provided these are
+        synced to the merge commit records. defaults to None.
 
     Raises
     ------
@@ -91,7 +97,8 @@ def select_merge_algorithm(message: str,
     wDiffer = WriterUserDiff(stageenv=stageenv,
                              branchenv=branchenv,
                              refenv=refenv,
-                             branch_name=current_head)
+                             branch_name=current_head,
+                             stagedigestenv=stagedigestenv)
     if wDiffer.status() != 'CLEAN':
         e = RuntimeError(
             'Changes are currently pending in the staging area To avoid mangled '
@@ -118,7 +125,9 @@ def select_merge_algorithm(message: str,
                 stagehashenv=stagehashenv,
                 master_branch=master_branch,
                 new_masterHEAD=branchHistory.devHEAD,
-                repo_path=repo_path)
+                repo_path=repo_path,
+                stage_base_commit=get_branch_head_commit(branchenv, current_head),
+                stagedigestenv=stagedigestenv)
         else:
             print('Selected 3-Way Merge Strategy')
             success = _three_way_merge(
@@ -132,7 +141,8 @@ def select_merge_algorithm(message: str,
                 stageenv=stageenv,
                 refenv=refenv,
                 stagehashenv=stagehashenv,
-                repo_path=repo_path)
+                repo_path=repo_path,
+                stagedigestenv=stagedigestenv)
 
     except ValueError as e:
         raise e from None
@@ -153,7 +163,9 @@ def _fast_forward_merge(branchenv: lmdb.Environment,
                         stagehashenv: lmdb.Environment,
                         master_branch: str,
                         new_masterHEAD: str,
-                        repo_path: Path) -> str:
+                        repo_path: Path,
+                        stage_base_commit: Optional[str] = None,
+                        stagedigestenv: Optional[lmdb.Environment] = None) -> str:
     """Update branch head pointer to perform a fast-forward merge.
 
     This method does not check that it is safe to do this operation, all
@@ -175,6 +187,11 @@ def _fast_forward_merge(branchenv: lmdb.Environment,
         commit hash to update the master_branch name to point to.
     repo_path: Path
         path to the repository on disk.
+    stage_base_commit: Optional[str]
+        commit hash the (clean) staging area contents currently match, if
+        known. Only records differing from ``new_masterHEAD`` are rewritten.
+    stagedigestenv: Optional[lmdb.Environment]
+        db where the staged record digests are stored, defaults to None.
 
     Returns
     -------
@@ -184,7 +201,8 @@ def _fast_forward_merge(branchenv: lmdb.Environment,
     """
     try:
         replace_staging_area_with_commit(
-            refenv=refenv, stageenv=stageenv, commit_hash=new_masterHEAD)
+            refenv=refenv, stageenv=stageenv, commit_hash=new_masterHEAD,
+            base_commit=stage_base_commit, stagedigestenv=stagedigestenv)
 
         outBranchName = set_branch_head_commit(
             branchenv=branchenv, branch_name=master_branch, commit_hash=new_masterHEAD)
@@ -212,7 +230,8 @@ def _three_way_merge(message: str,
                      stageenv: lmdb.Environment,
                      refenv: lmdb.Environment,
                      stagehashenv: lmdb.Environment,
-                     repo_path: Path) -> str:
+                     repo_path: Path,
+                     stagedigestenv: lmdb.Environment = None) -> str:
     """Merge strategy with diff/patch computed from changes since last common ancestor.
 
     Parameters
@@ -240,6 +259,8 @@ def _three_way_merge(message: str,
         db where the staged hash records are stored
     repo_path: Path
         path to the repository on disk.
+    stagedigestenv: lmdb.Environment, optional
+        db where the staged record digests are stored, defaults to None.
 
     Returns
     -------
@@ -252,11 +273,14 @@ def _three_way_merge(message: str,
         If a conflict is found, the operation will abort before completing.
     """
     with tmp_cmt_env(refenv, ancestorHEAD) as aEnv, tmp_cmt_env(
-            refenv, masterHEAD) as mEnv, tmp_cmt_env(refenv, devHEAD) as dEnv:
-
-        m_diff = diff_envs(aEnv, mEnv)
-        d_diff = diff_envs(aEnv, dEnv)
-        conflict = find_conflicts(m_diff, d_diff)
+            refenv, masterHEAD, use_cache=False) as mEnv, tmp_cmt_env(
+            refenv, devHEAD) as dEnv:
+
+        d_diff, conflict = diff3_envs(aEnv, mEnv, dEnv,
+                                      get_commit_ref_ranges(refenv, ancestorHEAD),
+                                      get_commit_ref_ranges(refenv, masterHEAD),
+                                      get_commit_ref_ranges(refenv, devHEAD),
+                                      from_ancestor=True)
         if conflict.conflict is True:
             msg = f'HANGAR VALUE ERROR:: Merge ABORTED with conflict: {conflict}'
             raise ValueError(msg) from None
@@ -285,6 +309,7 @@ def _three_way_merge(message: str,
         stageenv=stageenv,
         refenv=refenv,
         repo_path=repo_path,
+        stagedigestenv=stagedigestenv,
         is_merge_commit=True,
         merge_master=master_branch,
         merge_dev=dev_branch)
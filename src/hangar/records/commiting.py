@@ -2,9 +2,14 @@ import configparser
 import os
 import shutil
 import tempfile
+import heapq
 import time
-from contextlib import contextmanager, closing
+from collections import Counter
+from contextlib import contextmanager, closing, suppress
 from pathlib import Path
+from threading import Lock
+from typing import Dict, NamedTuple, Optional, Tuple
+from uuid import uuid4
 
 import lmdb
 
@@ -16,20 +21,46 @@ from .heads import (
 )
 from .parsing import (
     cmt_final_digest,
+    commit_graph_db_key_from_raw_key,
+    commit_graph_db_val_from_raw_val,
+    commit_graph_raw_val_from_db_val,
+    CommitGraphNode,
     commit_parent_db_key_from_raw_key,
     commit_parent_db_val_from_raw_val,
     commit_parent_raw_key_from_db_key,
     commit_parent_raw_val_from_db_val,
     commit_ref_db_key_from_raw_key,
     commit_ref_db_val_from_raw_val,
+    commit_ref_db_val_is_delta,
+    commit_ref_delta_db_val_from_raw_val,
+    commit_ref_delta_raw_val_from_db_val,
+    commit_ref_digest_from_kv_digests,
+    commit_ref_digest_from_raw_val,
+    commit_ref_kv_digest,
+    commit_ref_ranges_from_kv_digests,
     commit_ref_raw_val_from_db_val,
+    commit_index_db_key_prefix,
+    commit_ranges_db_key_from_raw_key,
+    commit_ranges_db_val_from_raw_val,
+    commit_ranges_raw_val_from_db_val,
     commit_spec_db_key_from_raw_key,
     commit_spec_db_val_from_raw_val,
     commit_spec_raw_val_from_db_val,
     DigestAndBytes,
+    DigestAndDbRefs,
+    stage_base_db_key,
+    stage_base_refs_db_key,
+    stage_base_refs_db_val_from_raw_val,
+    stage_digest_db_key_from_raw_key,
+    stage_digest_db_key_prefix,
+    stage_dirty_db_key_prefix,
+    stage_dirty_raw_key_from_db_key,
 )
 from ..constants import (
+    CMT_CACHE_MAX_BYTES,
+    CMT_REF_KEYFRAME_INTERVAL,
     CONFIG_USER_NAME,
+    DIR_CMT_CACHE,
     DIR_DATA_REMOTE,
     DIR_DATA_STAGE,
     DIR_DATA_STORE,
@@ -183,6 +214,131 @@ def get_commit_ancestors(refenv, commit_hash):
     return parentCommitAncestors.ancestor_spec
 
 
+def _compute_commit_graph_nodes(reftxn, commit_hash) -> Dict[str, CommitGraphNode]:
+    """Compute graph nodes of a commit & any ancestors missing from the index.
+
+    Ancestors whose node is already recorded in the commit graph index are not
+    walked any further. Nodes are only persisted by
+    :func:`write_commit_graph_nodes` when the next commit is written; read
+    paths (:func:`find_merge_base`, :func:`commit_is_ancestor`,
+    :func:`get_commit_graph_node`) never write to the refenv, so on a
+    repository written before the index existed every such query walks the
+    full unindexed history again until a commit is made.
+
+    Parameters
+    ----------
+    reftxn : lmdb.Transaction
+        transaction opened on the refenv.
+    commit_hash : str
+        commit hash to compute the graph node of.
+
+    Returns
+    -------
+    Dict[str, CommitGraphNode]
+        graph node of ``commit_hash`` and every ancestor walked to compute it.
+
+    Raises
+    ------
+    ValueError
+        if the commit (or one of it's ancestors) does not exist in the refenv.
+    """
+    computed = {}
+    stack = [commit_hash]
+    while stack:
+        cmt = stack[-1]
+        if cmt in computed:
+            stack.pop()
+            continue
+
+        parentVal = reftxn.get(commit_parent_db_key_from_raw_key(cmt), default=None)
+        specVal = reftxn.get(commit_spec_db_key_from_raw_key(cmt), default=None)
+        if (parentVal is None) or (specVal is None):
+            raise ValueError(f'No commit exists with the hash: {cmt}')
+        ancestors = commit_parent_raw_val_from_db_val(parentVal).ancestor_spec
+        parents = tuple(p for p in (ancestors.master_ancestor, ancestors.dev_ancestor) if p)
+
+        generations, pending = [], []
+        for parent in parents:
+            if parent in computed:
+                generations.append(computed[parent].generation)
+                continue
+            nodeVal = reftxn.get(commit_graph_db_key_from_raw_key(parent), default=None)
+            if nodeVal is None:
+                pending.append(parent)
+            else:
+                generations.append(commit_graph_raw_val_from_db_val(nodeVal).generation)
+        if pending:
+            stack.extend(pending)
+            continue
+
+        stack.pop()
+        commit_time = commit_spec_raw_val_from_db_val(specVal).user_spec.commit_time
+        computed[cmt] = CommitGraphNode(generation=max(generations, default=0) + 1,
+                                        commit_time=commit_time,
+                                        parents=parents)
+    return computed
+
+
+def _get_commit_graph_node(reftxn, commit_hash) -> CommitGraphNode:
+    """Read the commit graph node of a commit, computing it if not indexed.
+    """
+    nodeVal = reftxn.get(commit_graph_db_key_from_raw_key(commit_hash), default=None)
+    if nodeVal is not None:
+        return commit_graph_raw_val_from_db_val(nodeVal)
+    return _compute_commit_graph_nodes(reftxn, commit_hash)[commit_hash]
+
+
+def write_commit_graph_nodes(reftxn, commit_hash):
+    """Record the commit graph node of a commit (and any unindexed ancestors).
+
+    Parameters
+    ----------
+    reftxn : lmdb.Transaction
+        write-enabled transaction opened on the refenv.
+    commit_hash : str
+        commit hash whose parent and spec records have already been written
+        in the same transaction.
+
+    Raises
+    ------
+    ValueError
+        if the commit (or one of it's ancestors) does not exist in the refenv.
+    """
+    if reftxn.get(commit_graph_db_key_from_raw_key(commit_hash), default=None) is not None:
+        return
+    for cmt, node in _compute_commit_graph_nodes(reftxn, commit_hash).items():
+        reftxn.put(commit_graph_db_key_from_raw_key(cmt),
+                   commit_graph_db_val_from_raw_val(node))
+
+
+def get_commit_graph_node(refenv, commit_hash) -> CommitGraphNode:
+    """Get the generation number, commit time, and parents of a commit.
+
+    Parameters
+    ----------
+    refenv : lmdb.Environment
+        lmdb environment where the commit refs are stored
+    commit_hash : str
+        commit hash to query
+
+    Returns
+    -------
+    CommitGraphNode
+        generation number (length of the longest path to a root commit,
+        roots are generation ``1``), commit time, and parent commit hashes.
+
+    Raises
+    ------
+    ValueError
+        if no commit exists with the provided hash
+    """
+    reftxn = TxnRegister().begin_reader_txn(refenv)
+    try:
+        return _get_commit_graph_node(reftxn, commit_hash)
+    finally:
+        TxnRegister().abort_reader_txn(refenv)
+
+
 def get_commit_ancestors_graph(refenv, starting_commit):
     """returns a DAG of all commits starting at some hash pointing to the repo root.
 
@@ -200,43 +356,112 @@ def get_commit_ancestors_graph(refenv, starting_commit):
         and it's value is a list containing either one or two elements which
         identify the child commits of that parent hash.
     """
-    parent_commit = starting_commit
     commit_graph = {}
-    seen = set(starting_commit)
-    more_work = []
-    end_commit = False
-
-    if parent_commit == '':
-        end_commit = True
-
-    while end_commit is not True:
-        childCommit = get_commit_ancestors(refenv, parent_commit)
-
-        if (childCommit.master_ancestor == '') or (childCommit.master_ancestor in seen):
-            end_commit = True
-            commit_graph[parent_commit] = [childCommit.master_ancestor]
-            if len(more_work) != 0:
-                master_commit = more_work.pop(0)
-                end_commit = False
-            else:
+    if starting_commit == '':
+        return commit_graph
+
+    reftxn = TxnRegister().begin_reader_txn(refenv)
+    try:
+        more_work = [starting_commit]
+        while more_work:
+            commit = more_work.pop()
+            if commit in commit_graph:
                 continue
+            node = _get_commit_graph_node(reftxn, commit)
+            commit_graph[commit] = list(node.parents) if node.parents else ['']
+            more_work.extend(reversed(node.parents))
+    finally:
+        TxnRegister().abort_reader_txn(refenv)
+    return commit_graph
 
-        elif childCommit.is_merge_commit is True:
-            master_commit = childCommit.master_ancestor
-            dev_commit = childCommit.dev_ancestor
-            more_work.append(dev_commit)
-            commit_graph[parent_commit] = [master_commit, dev_commit]
-            seen.add(master_commit)
-            seen.add(dev_commit)
 
-        else:
-            master_commit = childCommit.master_ancestor
-            commit_graph[parent_commit] = [master_commit]
-            seen.add(master_commit)
+def find_merge_base(refenv, master_commit, dev_commit) -> Tuple[str, bool]:
+    """Find the most recent common ancestor of two commits.
 
-        parent_commit = master_commit
+    Commits are visited in order of decreasing generation number, so the
+    walk stops as soon as the first commit reachable from both heads is seen
+    rather than constructing the full history of either.
 
-    return commit_graph
+    Parameters
+    ----------
+    refenv : lmdb.Environment
+        lmdb environment where the commit refs are stored
+    master_commit : str
+        head commit of the branch being merged into.
+    dev_commit : str
+        head commit of the branch being merged.
+
+    Returns
+    -------
+    Tuple[str, bool]
+        merge base commit hash, and bool indicating if the ``master_commit``
+        is an ancestor of ``dev_commit`` (ie. a fast-forward is possible).
+
+    Raises
+    ------
+    ValueError
+        if the commits share no common ancestor.
+    """
+    _MASTER, _DEV, _BOTH = 1, 2, 3
+    reftxn = TxnRegister().begin_reader_txn(refenv)
+    try:
+        flags, heap = {}, []
+
+        def _push(commit, flag):
+            if commit not in flags:
+                node = _get_commit_graph_node(reftxn, commit)
+                flags[commit] = 0
+                heapq.heappush(heap, (-node.generation, -node.commit_time, commit, node.parents))
+            flags[commit] |= flag
+
+        _push(master_commit, _MASTER)
+        _push(dev_commit, _DEV)
+        while heap:
+            *_, commit, parents = heapq.heappop(heap)
+            flag = flags[commit]
+            if flag == _BOTH:
+                return (commit, commit == master_commit)
+            for parent in parents:
+                _push(parent, flag)
+    finally:
+        TxnRegister().abort_reader_txn(refenv)
+    raise ValueError(f'No common ancestor exists for commits: {master_commit} & {dev_commit}')
+
+
+def commit_is_ancestor(refenv, ancestor_commit, descendant_commit) -> bool:
+    """Determine if a commit is in the history of (or equal to) another.
+
+    Parameters
+    ----------
+    refenv : lmdb.Environment
+        lmdb environment where the commit refs are stored
+    ancestor_commit : str
+        commit hash which may be an ancestor.
+    descendant_commit : str
+        commit hash whose history is searched.
+
+    Returns
+    -------
+    bool
+        True if ``ancestor_commit`` is reachable from ``descendant_commit``.
+    """
+    reftxn = TxnRegister().begin_reader_txn(refenv)
+    try:
+        target = _get_commit_graph_node(reftxn, ancestor_commit).generation
+        seen, more_work = set(), [descendant_commit]
+        while more_work:
+            commit = more_work.pop()
+            if commit == ancestor_commit:
+                return True
+            if commit in seen:
+                continue
+            seen.add(commit)
+            node = _get_commit_graph_node(reftxn, commit)
+            if node.generation > target:
+                more_work.extend(node.parents)
+    finally:
+        TxnRegister().abort_reader_txn(refenv)
+    return False
 
 
 """
@@ -245,6 +470,107 @@ Methods for reading packed commit data and reconstructing an unpacked format.
 """
 
 
+def _commit_ref_kvs_from_delta(reftxn, cmtRefVal):
+    """Reconstruct the full records of a delta encoded ref from its parent chain.
+
+    Parameters
+    ----------
+    reftxn : lmdb.Transaction
+        read transaction open on the refenv.
+    cmtRefVal : bytes
+        delta encoded commit ref db value.
+
+    Returns
+    -------
+    Tuple[Tuple[bytes, bytes]]
+        sorted db_key/db_value pairs of the commit records.
+    """
+    deltas = []
+    while commit_ref_db_val_is_delta(cmtRefVal):
+        delta = commit_ref_delta_raw_val_from_db_val(cmtRefVal)
+        deltas.append(delta)
+        cmtRefVal = reftxn.get(commit_ref_db_key_from_raw_key(delta.parent), default=False)
+        if cmtRefVal is False:
+            raise ValueError(f'No commit exists with the hash: {delta.parent}')
+
+    records = dict(commit_ref_raw_val_from_db_val(cmtRefVal).db_kvs)
+    for delta in reversed(deltas):
+        for k in delta.deleted:
+            del records[k]
+        records.update(delta.put)
+    return tuple(sorted(records.items()))
+
+
+def _commit_ref_delta_depth(refenv, commit_hash) -> int:
+    """Number of delta encoded refs between a commit and its full snapshot ref.
+    """
+    reftxn = TxnRegister().begin_reader_txn(refenv)
+    try:
+        cmtRefVal = reftxn.get(commit_ref_db_key_from_raw_key(commit_hash), default=False)
+    finally:
+        TxnRegister().abort_reader_txn(refenv)
+
+    if (cmtRefVal is not False) and commit_ref_db_val_is_delta(cmtRefVal):
+        return commit_ref_delta_raw_val_from_db_val(cmtRefVal).depth
+    return 0
+
+
+def get_commit_ref_db_val(refenv, commit_hash) -> bytes:
+    """Read the full snapshot (non delta encoded) commit ref db value of a commit.
+
+    Used where the stored ref value is sent to another repository, which may
+    not contain the refs the delta is encoded against.
+
+    Parameters
+    ----------
+    refenv : lmdb.Environment`
+        lmdb environment where the references are stored
+    commit_hash : string
+        hash of the commit to retrieve.
+
+    Returns
+    -------
+    bytes
+        db formatted full snapshot commit ref value
+    """
+    reftxn = TxnRegister().begin_reader_txn(refenv)
+    try:
+        cmtRefVal = reftxn.get(commit_ref_db_key_from_raw_key(commit_hash), default=False)
+        if (cmtRefVal is not False) and commit_ref_db_val_is_delta(cmtRefVal):
+            db_kvs = _commit_ref_kvs_from_delta(reftxn, cmtRefVal)
+            cmtRefVal = commit_ref_db_val_from_raw_val(db_kvs).raw
+    finally:
+        TxnRegister().abort_reader_txn(refenv)
+    return cmtRefVal
+
+
+def get_commit_ref_ranges(refenv, commit_hash) -> Optional[Tuple[Tuple[bytes, str], ...]]:
+    """Read the range digests of a commit's records, if they were recorded.
+
+    Parameters
+    ----------
+    refenv : lmdb.Environment`
+        lmdb environment where the references are stored
+    commit_hash : string
+        hash of the commit to retrieve.
+
+    Returns
+    -------
+    Optional[Tuple[Tuple[bytes, str], ...]]
+        start db key and digest of each range of the commit records (see
+        :func:`~.parsing.commit_ref_ranges_from_kv_digests`). None if no range
+        digests were recorded for the commit (eg. commits fetched from a remote).
+    """
+    reftxn = TxnRegister().begin_reader_txn(refenv)
+    try:
+        rangesVal = reftxn.get(commit_ranges_db_key_from_raw_key(commit_hash), default=None)
+    finally:
+        TxnRegister().abort_reader_txn(refenv)
+    if rangesVal is None:
+        return None
+    return commit_ranges_raw_val_from_db_val(rangesVal)
+
+
 def get_commit_ref(refenv, commit_hash):
     """Read the commit data record references from a specific commit.
 
@@ -277,6 +603,12 @@ def get_commit_ref(refenv, commit_hash):
         cmtRefVal = reftxn.get(cmtRefKey, default=False)
         cmtSpecVal = reftxn.get(cmtSpecKey, default=False)
         cmtParentVal = reftxn.get(cmtParentKey, default=False)
+        if (cmtRefVal is not False) and commit_ref_db_val_is_delta(cmtRefVal):
+            db_kvs = _commit_ref_kvs_from_delta(reftxn, cmtRefVal)
+            commitRefs = DigestAndDbRefs(
+                digest=commit_ref_digest_from_raw_val(db_kvs), db_kvs=db_kvs)
+        elif cmtRefVal is not False:
+            commitRefs = commit_ref_raw_val_from_db_val(cmtRefVal)
     except lmdb.BadValsizeError:
         raise ValueError(f'No commit exists with the hash: {commit_hash}')
     finally:
@@ -285,7 +617,6 @@ def get_commit_ref(refenv, commit_hash):
     if (cmtRefVal is False) or (cmtSpecVal is False) or (cmtParentVal is False):
         raise ValueError(f'No commit exists with the hash: {commit_hash}')
 
-    commitRefs = commit_ref_raw_val_from_db_val(cmtRefVal)
     commitSpecs = commit_spec_raw_val_from_db_val(cmtSpecVal)
     commitParent = commit_parent_raw_val_from_db_val(cmtParentVal)
 
@@ -339,8 +670,123 @@ def unpack_commit_ref(refenv, cmtrefenv, commit_hash):
     return
 
 
+class CommitEnvCache(object):
+    """On-disk cache of unpacked commit ref environments shared between processes.
+
+    Each commit is unpacked once into ``<repo>/cmt_cache/<commit_hash>.lmdb``
+    and then opened read-only by every process (and checkout) which needs it.
+    Environments are written under a temporary name and atomically renamed
+    into place, so a partially written environment is never opened. A cache
+    hit updates the file modification time; whenever a commit is added, the
+    least recently used environments are removed until the total size of the
+    cache is at most ``max_bytes``. Removing a file does not affect processes
+    which already opened it (on platforms where an open file can be removed).
+
+    As lmdb does not allow an environment to be opened twice in one process,
+    open environments are reference counted per process; every call to
+    :meth:`open` must be paired with a call to :meth:`release`.
+
+    Parameters
+    ----------
+    repo_path : Path
+        path to the hangar repository directory.
+    max_bytes : int, optional
+        size bound of the cache directory, by default CMT_CACHE_MAX_BYTES
+    """
+
+    _open_envs: Dict[str, lmdb.Environment] = {}
+    _open_counts = Counter()
+    _lock = Lock()
+
+    def __init__(self, repo_path: Path, max_bytes: int = CMT_CACHE_MAX_BYTES):
+        self.cache_dir = Path(repo_path, DIR_CMT_CACHE)
+        self.max_bytes = max_bytes
+
+    def cmt_env_path(self, commit_hash: str) -> Path:
+        return self.cache_dir.joinpath(f'{commit_hash}.lmdb')
+
+    def open(self, refenv: lmdb.Environment, commit_hash: str) -> lmdb.Environment:
+        """Open the read-only unpacked env of a commit, unpacking it on a cache miss.
+
+        Parameters
+        ----------
+        refenv : lmdb.Environment
+            lmdb environment where the commit refs are stored
+        commit_hash : str
+            hash of the commit to get the contents of
+
+        Returns
+        -------
+        lmdb.Environment
+            read-only environment with all db contents from ``commit`` unpacked.
+            Must be passed to :meth:`release` once the caller is done with it.
+        """
+        pth = self.cmt_env_path(commit_hash)
+        key = str(pth)
+        with self._lock:
+            if key not in self._open_envs:
+                try:
+                    cmtenv = lmdb.open(key, readonly=True, **LMDB_SETTINGS)
+                except lmdb.Error:
+                    self._unpack(refenv, commit_hash, pth)
+                    self._evict(keep=pth)
+                    cmtenv = lmdb.open(key, readonly=True, **LMDB_SETTINGS)
+                self._open_envs[key] = cmtenv
+            with suppress(OSError):
+                os.utime(pth)
+            self._open_counts[key] += 1
+            return self._open_envs[key]
+
+    def release(self, cmtenv: lmdb.Environment):
+        """Release an environment returned by :meth:`open`, closing it if unused.
+        """
+        key = cmtenv.path()
+        with self._lock:
+            self._open_counts[key] -= 1
+            if self._open_counts[key] <= 0:
+                del self._open_counts[key]
+                self._open_envs.pop(key).close()
+
+    def _unpack(self, refenv: lmdb.Environment, commit_hash: str, pth: Path):
+        """Unpack a commit into a temporary file and atomically move it to ``pth``.
+        """
+        self.cache_dir.mkdir(exist_ok=True)
+        tmp_pth = self.cache_dir.joinpath(f'{commit_hash}.{uuid4().hex}.tmp')
+        try:
+            with closing(lmdb.open(str(tmp_pth), **LMDB_SETTINGS)) as tmpDB:
+                unpack_commit_ref(refenv, tmpDB, commit_hash)
+            try:
+                os.replace(tmp_pth, pth)
+            except OSError:
+                # another process finished first and has it open (Windows).
+                if not pth.is_file():
+                    raise
+        finally:
+            with suppress(OSError):
+                tmp_pth.unlink()
+
+    def _evict(self, keep: Path):
+        """Remove least recently used environments until the cache fits ``max_bytes``.
+        """
+        entries = []
+        for pth in self.cache_dir.glob('*.lmdb'):
+            with suppress(OSError):
+                stat = pth.stat()
+                entries.append((stat.st_mtime, stat.st_size, pth))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, pth in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if pth == keep:
+                continue
+            with suppress(OSError):
+                pth.unlink()
+                total -= size
+
+
 @contextmanager
-def tmp_cmt_env(refenv: lmdb.Environment, commit_hash: str):
+def tmp_cmt_env(refenv: lmdb.Environment, commit_hash: str, *, use_cache: bool = True):
     """create temporary unpacked lmdb environment from compressed structure
 
     Parameters
@@ -349,12 +795,26 @@ def tmp_cmt_env(refenv: lmdb.Environment, commit_hash: str):
         lmdb environment where the commit refs are stored
     commit_hash : str
         hash of the commit to get the contents of
+    use_cache : bool, optional, kwarg only
+        if True, a read-only environment is opened from the
+        :class:`CommitEnvCache` of the repository containing ``refenv``.
+        Otherwise the commit is unpacked (and its integrity verified) into a
+        new temporary, write-enabled environment, by default True.
 
     Returns
     -------
     lmdb.Environment
         environment with all db contents from ``commit`` unpacked
     """
+    if use_cache:
+        cache = CommitEnvCache(Path(refenv.path()).parent)
+        cmtDB = cache.open(refenv, commit_hash)
+        try:
+            yield cmtDB
+        finally:
+            cache.release(cmtDB)
+        return
+
     with tempfile.TemporaryDirectory() as tmpdir:
         tmpDF = os.path.join(tmpdir, 'test.lmdb')
         with closing(
@@ -454,33 +914,358 @@ def _commit_spec(message: str, user: str, email: str) -> DigestAndBytes:
     return spec_db
 
 
-def _commit_ref(stageenv: lmdb.Environment) -> DigestAndBytes:
+class StagedRecordChanges(NamedTuple):
+    digest: str
+    ranges: Tuple[Tuple[bytes, str], ...]
+    put: Tuple[Tuple[bytes, bytes], ...]
+    deleted: Tuple[bytes, ...]
+    kv_digests: Tuple[Tuple[bytes, Optional[bytes]], ...]
+    rebuilt: bool
+
+
+def _staged_changes_from_dirty(stagetxn, digesttxn) -> Optional[StagedRecordChanges]:
+    """Update the stored record digests with only the records marked as dirty.
+
+    Returns None if the stored digests do not agree with the number of records
+    in the staging area, in which case they need to be rebuilt.
+    """
+    dirtyPfx = stage_dirty_db_key_prefix()
+    digestPfx = stage_digest_db_key_prefix()
+    updates, inserted, put, deleted = {}, [], [], []
+    with digesttxn.cursor() as cursor:
+        dirtyExists = cursor.set_range(dirtyPfx)
+        for dirtyKey in (cursor.iternext(keys=True, values=False) if dirtyExists else ()):
+            if not dirtyKey.startswith(dirtyPfx):
+                break
+            dbKey = stage_dirty_raw_key_from_db_key(dirtyKey)
+            oldDigest = digesttxn.get(stage_digest_db_key_from_raw_key(dbKey))
+            dbVal = stagetxn.get(dbKey)
+            newDigest = None if dbVal is None else commit_ref_kv_digest(dbKey, dbVal).encode()
+            if newDigest == oldDigest:
+                continue
+            updates[dbKey] = newDigest
+            if dbVal is None:
+                deleted.append(dbKey)
+            else:
+                put.append((dbKey, dbVal))
+                if oldDigest is None:
+                    inserted.append(dbKey)
+
+    # merge the updates into the (sorted) stored digests of unchanged records.
+    kvDigests, insertIdx = [], 0
+    with digesttxn.cursor() as cursor:
+        digestExists = cursor.set_range(digestPfx)
+        for digestKey, digest in (cursor.iternext() if digestExists else ()):
+            if not digestKey.startswith(digestPfx):
+                break
+            dbKey = digestKey[len(digestPfx):]
+            while (insertIdx < len(inserted)) and (inserted[insertIdx] < dbKey):
+                kvDigests.append((inserted[insertIdx], updates[inserted[insertIdx]].decode()))
+                insertIdx += 1
+            if dbKey in updates:
+                digest = updates[dbKey]
+                if digest is None:
+                    continue
+            kvDigests.append((dbKey, digest.decode()))
+    kvDigests.extend((k, updates[k].decode()) for k in inserted[insertIdx:])
+
+    if len(kvDigests) != stagetxn.stat()['entries']:
+        return None
+    digest = commit_ref_digest_from_kv_digests(d for _, d in kvDigests)
+    ranges = commit_ref_ranges_from_kv_digests(kvDigests)
+    return StagedRecordChanges(digest=digest, ranges=ranges, put=tuple(put),
+                               deleted=tuple(deleted), kv_digests=tuple(updates.items()),
+                               rebuilt=False)
+
+
+def _staged_changes_from_all(stagetxn) -> StagedRecordChanges:
+    """Calculate the digest of every record in the staging area.
+    """
+    kvDigests = []
+    with stagetxn.cursor() as cursor:
+        for dbKey, dbVal in cursor.iternext(keys=True, values=True):
+            kvDigests.append((dbKey, commit_ref_kv_digest(dbKey, dbVal)))
+    digest = commit_ref_digest_from_kv_digests(d for _, d in kvDigests)
+    ranges = commit_ref_ranges_from_kv_digests(kvDigests)
+    return StagedRecordChanges(digest=digest, ranges=ranges, put=(), deleted=(),
+                               kv_digests=tuple((k, d.encode()) for k, d in kvDigests),
+                               rebuilt=True)
+
+
+def _staged_record_changes(stageenv: lmdb.Environment,
+                           stagedigestenv: lmdb.Environment,
+                           parent: str,
+                           rebuild: bool = False) -> StagedRecordChanges:
+    """Determine the staged records digest and changes relative to the parent commit.
+
+    The digest of every staged record is stored in the ``stagedigestenv``
+    along with the keys of all staged records modified since the digests were
+    last synced (at the commit recorded as the base). If the base is the
+    parent of the commit being made, only the digests of the modified records
+    are recalculated and the modified records are exactly the changes relative
+    to the parent. Otherwise (eg. after the staging area is replaced with the
+    contents of another commit) the digest of every staged record is rebuilt.
+
+    Parameters
+    ----------
+    stageenv : lmdb.Environment
+        lmdb environment where the staged record data is stored.
+    stagedigestenv : lmdb.Environment
+        lmdb environment where the staged record digests / dirty keys are stored.
+    parent : str
+        commit hash of the (master) parent of the commit being written.
+    rebuild : bool, optional
+        force the digest of every staged record to be recalculated, by default
+        False.
+
+    Returns
+    -------
+    StagedRecordChanges
+        refs ``digest`` of the staged records, records ``put`` and ``deleted``
+        relative to the parent (only if not ``rebuilt``), and the updated
+        ``kv_digests`` which should be stored after the commit is written.
+    """
+    digesttxn = TxnRegister().begin_reader_txn(stagedigestenv)
+    stagetxn = TxnRegister().begin_reader_txn(stageenv)
+    try:
+        base = digesttxn.get(stage_base_db_key())
+        changes = None
+        if (not rebuild) and (base is not None) and (base.decode() == parent):
+            changes = _staged_changes_from_dirty(stagetxn, digesttxn)
+        if changes is None:
+            changes = _staged_changes_from_all(stagetxn)
+    finally:
+        TxnRegister().abort_reader_txn(stageenv)
+        TxnRegister().abort_reader_txn(stagedigestenv)
+    return changes
+
+
+def _commit_records_fingerprint(refenv: lmdb.Environment, commit_hash: str) -> Optional[bytes]:
+    """Fingerprint the stored parent, spec, and ref records of a commit.
+
+    Returns None if any of the commit records do not exist.
+    """
+    reftxn = TxnRegister().begin_reader_txn(refenv)
+    try:
+        parentVal = reftxn.get(commit_parent_db_key_from_raw_key(commit_hash), default=None)
+        specVal = reftxn.get(commit_spec_db_key_from_raw_key(commit_hash), default=None)
+        refVal = reftxn.get(commit_ref_db_key_from_raw_key(commit_hash), default=None)
+    finally:
+        TxnRegister().abort_reader_txn(refenv)
+    if None in (parentVal, specVal, refVal):
+        return None
+    return stage_base_refs_db_val_from_raw_val(parentVal, specVal, refVal)
+
+
+def _set_staged_digests_base(digesttxn, commit_hash: str, fingerprint: Optional[bytes]):
+    digesttxn.put(stage_base_db_key(), commit_hash.encode())
+    if fingerprint is None:
+        digesttxn.delete(stage_base_refs_db_key())
+    else:
+        digesttxn.put(stage_base_refs_db_key(), fingerprint)
+
+
+def _clear_staged_digests_base(digesttxn):
+    digesttxn.delete(stage_base_db_key())
+    digesttxn.delete(stage_base_refs_db_key())
+
+
+def verify_staged_digests_base(refenv: lmdb.Environment,
+                               stagedigestenv: lmdb.Environment) -> bool:
+    """Check the records of the commit the staged digests were synced at against their fingerprint.
+
+    Called when a write-enabled checkout is opened, so that later status
+    checks can trust the base commit without reading the ref db. If the
+    commit records do not exist, or no longer match the fingerprint taken
+    when the digests were synced, the base is cleared; the staging area
+    status and the next commit then fall back to reading every record.
+
+    Parameters
+    ----------
+    refenv : lmdb.Environment
+        lmdb environment where the commit records are stored.
+    stagedigestenv : lmdb.Environment
+        lmdb environment where the staged record digests / dirty keys are stored.
+
+    Returns
+    -------
+    bool
+        True if the staged digests are synced at a verified base commit.
+    """
+    digesttxn = TxnRegister().begin_writer_txn(stagedigestenv)
+    try:
+        base = digesttxn.get(stage_base_db_key())
+        if base is None:
+            return False
+        fingerprint = _commit_records_fingerprint(refenv, base.decode())
+        if (fingerprint is not None) and (fingerprint == digesttxn.get(stage_base_refs_db_key())):
+            return True
+        _clear_staged_digests_base(digesttxn)
+        return False
+    finally:
+        TxnRegister().commit_writer_txn(stagedigestenv)
+
+
+def _sync_staged_record_digests(stagedigestenv: lmdb.Environment,
+                                changes: StagedRecordChanges,
+                                commit_hash: str,
+                                fingerprint: Optional[bytes] = None):
+    """Store updated staged record digests, clear dirty keys, and set the base commit.
+    """
+    dirtyPfx = stage_dirty_db_key_prefix()
+    digesttxn = TxnRegister().begin_writer_txn(stagedigestenv)
+    try:
+        with digesttxn.cursor() as cursor:
+            if changes.rebuilt:
+                positionExists = cursor.first()
+            else:
+                positionExists = cursor.set_range(dirtyPfx)
+            while positionExists and (changes.rebuilt or cursor.key().startswith(dirtyPfx)):
+                positionExists = cursor.delete()
+        for dbKey, digest in changes.kv_digests:
+            digestKey = stage_digest_db_key_from_raw_key(dbKey)
+            if digest is None:
+                digesttxn.delete(digestKey)
+            else:
+                digesttxn.put(digestKey, digest)
+        _set_staged_digests_base(digesttxn, commit_hash, fingerprint)
+    finally:
+        TxnRegister().commit_writer_txn(stagedigestenv)
+
+
+def staging_area_status(stageenv: lmdb.Environment,
+                        stagedigestenv: lmdb.Environment,
+                        head_commit: str) -> Optional[str]:
+    """Determine if the staging area differs from a commit using the staged record digests.
+
+    Only records marked dirty since the digests were synced are inspected, so
+    the commit records are never read, nor is the full staging area. The base
+    commit records are verified against their fingerprint once, when the
+    write-enabled checkout is opened (see :func:`verify_staged_digests_base`).
+
+    Parameters
+    ----------
+    stageenv : lmdb.Environment
+        lmdb environment where the staged record data is stored.
+    stagedigestenv : lmdb.Environment
+        lmdb environment where the staged record digests / dirty keys are stored.
+    head_commit : str
+        commit hash the staging area contents should be compared to.
+
+    Returns
+    -------
+    Optional[str]
+        "CLEAN" if no changes have been made, "DIRTY" if they have, or None if
+        the staged record digests were not synced at ``head_commit`` (in which
+        case the status must be determined by a full diff).
+    """
+    dirtyPfx = stage_dirty_db_key_prefix()
+    digesttxn = TxnRegister().begin_reader_txn(stagedigestenv)
+    stagetxn = TxnRegister().begin_reader_txn(stageenv)
+    try:
+        base = digesttxn.get(stage_base_db_key())
+        if (base is None) or (base.decode() != head_commit):
+            return None
+        if digesttxn.get(stage_base_refs_db_key()) is None:
+            return None
+
+        numDirty = 0
+        with digesttxn.cursor() as cursor:
+            dirtyExists = cursor.set_range(dirtyPfx)
+            for dirtyKey in (cursor.iternext(keys=True, values=False) if dirtyExists else ()):
+                if not dirtyKey.startswith(dirtyPfx):
+                    break
+                numDirty += 1
+                dbKey = stage_dirty_raw_key_from_db_key(dirtyKey)
+                oldDigest = digesttxn.get(stage_digest_db_key_from_raw_key(dbKey))
+                dbVal = stagetxn.get(dbKey)
+                newDigest = None if dbVal is None else commit_ref_kv_digest(dbKey, dbVal).encode()
+                if newDigest != oldDigest:
+                    return 'DIRTY'
+
+        # digest records hold one entry per base record, plus the dirty & base keys.
+        numBaseRecords = digesttxn.stat()['entries'] - numDirty - 2
+        if numBaseRecords != stagetxn.stat()['entries']:
+            return None
+        return 'CLEAN'
+    finally:
+        TxnRegister().abort_reader_txn(stageenv)
+        TxnRegister().abort_reader_txn(stagedigestenv)
+
+
+def _commit_ref(stageenv: lmdb.Environment,
+                refenv: lmdb.Environment = None,
+                parent: str = '',
+                changes: Optional[StagedRecordChanges] = None) -> DigestAndBytes:
     """Query and format all staged data records, and format it for ref storage.
 
+    If a ``parent`` commit is provided, the records are delta encoded against
+    the records of that commit, unless doing so would extend the parent's
+    chain of delta encoded refs beyond ``CMT_REF_KEYFRAME_INTERVAL``; in that
+    case (or when there is no parent) a full snapshot is stored.
+
     Parameters
     ----------
     stageenv : lmdb.Environment
         lmdb environment where the staged record data is actually stored.
+    refenv : lmdb.Environment, optional
+        lmdb environment where the commit ref records are stored. Required if
+        ``parent`` is set.
+    parent : str, optional
+        commit hash of the (master) parent of the commit being written,
+        defaults to '' (full snapshot is stored).
+    changes : Optional[StagedRecordChanges]
+        staged record changes relative to ``parent``. If provided (and not
+        ``rebuilt``) the delta is formed from these without reading either the
+        full staging area or the parent records.
 
     Returns
     -------
     DigestAndBytes
-        Serialized and compressed version of all staged record data along with
-        digest of commit refs.
+        Serialized and compressed version of all staged record data (or the
+        delta to the parent records) along with digest of commit refs.
     """
     from .queries import RecordQuery  # needed to avoid cyclic import
 
+    depth = _commit_ref_delta_depth(refenv, parent) + 1 if parent else 0
+    if parent and (depth < CMT_REF_KEYFRAME_INTERVAL):
+        if (changes is not None) and (not changes.rebuilt):
+            raw = commit_ref_delta_db_val_from_raw_val(
+                parent=parent, depth=depth, deleted=changes.deleted, put=changes.put)
+            return DigestAndBytes(digest=changes.digest, raw=raw)
+
     querys = RecordQuery(dataenv=stageenv)
     allRecords = tuple(querys._traverse_all_records())
-    res = commit_ref_db_val_from_raw_val(allRecords)
-    return res
+    if (not parent) or (depth >= CMT_REF_KEYFRAME_INTERVAL):
+        return commit_ref_db_val_from_raw_val(allRecords)
+
+    reftxn = TxnRegister().begin_reader_txn(refenv)
+    try:
+        parentRefVal = reftxn.get(commit_ref_db_key_from_raw_key(parent))
+        if commit_ref_db_val_is_delta(parentRefVal):
+            parentRecords = dict(_commit_ref_kvs_from_delta(reftxn, parentRefVal))
+        else:
+            parentRecords = dict(commit_ref_raw_val_from_db_val(parentRefVal).db_kvs)
+    finally:
+        TxnRegister().abort_reader_txn(refenv)
+
+    put = []
+    for k, v in allRecords:
+        if parentRecords.pop(k, None) != v:
+            put.append((k, v))
+    deleted = tuple(parentRecords.keys())
+    raw = commit_ref_delta_db_val_from_raw_val(parent=parent, depth=depth,
+                                               deleted=deleted, put=put)
+    digest = commit_ref_digest_from_raw_val(allRecords)
+    return DigestAndBytes(digest=digest, raw=raw)
 
 
 # -------------------- Format ref k/v pairs and write the commit to disk ----------------
 
 
 def commit_records(message, branchenv, stageenv, refenv, repo_path: Path,
-                   *, is_merge_commit=False, merge_master=None, merge_dev=None):
+                   *, stagedigestenv=None, is_merge_commit=False,
+                   merge_master=None, merge_dev=None):
     """Commit all staged records to the repository, updating branch HEAD as needed.
 
     This method is intended to work for both merge commits as well as regular
@@ -500,6 +1285,10 @@ def commit_records(message, branchenv, stageenv, refenv, repo_path: Path,
         lmdb environment where the commit ref records are stored.
     repo_path : Path
         path to the hangar repository on disk
+    stagedigestenv : lmdb.Environment, optional
+        lmdb environment where staged record digests and dirty record keys are
+        stored. If provided, only records modified since the last commit are
+        hashed. defaults to None (every staged record is hashed).
     is_merge_commit : bool, optional
         Is the commit a merge commit or not? defaults to False
     merge_master : string, optional
@@ -527,7 +1316,16 @@ def commit_records(message, branchenv, stageenv, refenv, repo_path: Path,
         raise RuntimeError(f'Username and Email are required. Please configure.')
 
     cmtSpec = _commit_spec(message=message, user=USER_NAME, email=USER_EMAIL)
-    cmtRefs = _commit_ref(stageenv=stageenv)
+    cmtParentAncestors = commit_parent_raw_val_from_db_val(cmtParent.raw).ancestor_spec
+    stagedChanges = None
+    if stagedigestenv is not None:
+        stagedChanges = _staged_record_changes(stageenv=stageenv,
+                                               stagedigestenv=stagedigestenv,
+                                               parent=cmtParentAncestors.master_ancestor,
+                                               rebuild=is_merge_commit)
+    cmtRefs = _commit_ref(stageenv=stageenv, refenv=refenv,
+                          parent=cmtParentAncestors.master_ancestor,
+                          changes=stagedChanges)
 
     commit_hash = cmt_final_digest(parent_digest=cmtParent.digest,
                                    spec_digest=cmtSpec.digest,
@@ -542,9 +1340,18 @@ def commit_records(message, branchenv, stageenv, refenv, repo_path: Path,
         reftxn.put(commitSpecKey, cmtSpec.raw, overwrite=False)
         reftxn.put(commitParentKey, cmtParent.raw, overwrite=False)
         reftxn.put(commitRefKey, cmtRefs.raw, overwrite=False)
+        if stagedChanges is not None:
+            commitRangesKey = commit_ranges_db_key_from_raw_key(commit_hash)
+            commitRangesVal = commit_ranges_db_val_from_raw_val(stagedChanges.ranges)
+            reftxn.put(commitRangesKey, commitRangesVal, overwrite=False)
+        write_commit_graph_nodes(reftxn, commit_hash)
     finally:
         TxnRegister().commit_writer_txn(refenv)
 
+    if stagedChanges is not None:
+        fingerprint = stage_base_refs_db_val_from_raw_val(cmtParent.raw, cmtSpec.raw, cmtRefs.raw)
+        _sync_staged_record_digests(stagedigestenv, stagedChanges, commit_hash, fingerprint)
+
     # possible separate function
     move_process_data_to_store(repo_path)
     if is_merge_commit is False:
@@ -560,7 +1367,8 @@ def commit_records(message, branchenv, stageenv, refenv, repo_path: Path,
 # --------------------- staging setup, may need to move this elsewhere ------------------
 
 
-def replace_staging_area_with_commit(refenv, stageenv, commit_hash):
+def replace_staging_area_with_commit(refenv, stageenv, commit_hash, base_commit=None,
+                                     stagedigestenv=None):
     """DANGER ZONE: Delete the stage db and replace it with a copy of a commit environment.
 
     .. warning::
@@ -576,7 +1384,50 @@ def replace_staging_area_with_commit(refenv, stageenv, commit_hash):
         lmdb environment opened to the staging area.
     commit_hash : str
         commit hash to read from the refenv and replace the stage contents with.
+    base_commit : Optional[str]
+        commit hash whose contents the staging area currently (exactly) holds,
+        if known. When provided, only the records which differ between
+        ``base_commit`` and ``commit_hash`` are written to the staging area
+        rather than deleting and reloading every record. Default is None.
+    stagedigestenv : Optional[lmdb.Environment]
+        lmdb environment where the staged record digests are stored. If the
+        digests were synced at ``base_commit``, the digests of the changed
+        records are updated so they remain synced (at ``commit_hash``) after
+        the staging area is replaced. The base commit of the digests is
+        cleared before any change is written, and only set to ``commit_hash``
+        once every change has been committed; if the replacement fails midway
+        the digests are not trusted. Default is None.
     """
+    if base_commit:
+        from ..diff import iter_diff_envs
+
+        digestenv = None
+        if stagedigestenv is not None:
+            digesttxn = TxnRegister().begin_writer_txn(stagedigestenv)
+            try:
+                base = digesttxn.get(stage_base_db_key())
+                if (base is not None) and (base.decode() == base_commit):
+                    _clear_staged_digests_base(digesttxn)
+                    digestenv = stagedigestenv
+            finally:
+                TxnRegister().commit_writer_txn(stagedigestenv)
+
+        baseRanges = get_commit_ref_ranges(refenv, base_commit)
+        cmtRanges = get_commit_ref_ranges(refenv, commit_hash)
+        with tmp_cmt_env(refenv, base_commit) as baseEnv, \
+                tmp_cmt_env(refenv, commit_hash) as cmtEnv:
+            changes = iter_diff_envs(baseEnv, cmtEnv, baseRanges, cmtRanges)
+            apply_changes_to_staging_area(stageenv, changes, stagedigestenv=digestenv)
+
+        if digestenv is not None:
+            fingerprint = _commit_records_fingerprint(refenv, commit_hash)
+            digesttxn = TxnRegister().begin_writer_txn(digestenv)
+            try:
+                _set_staged_digests_base(digesttxn, commit_hash, fingerprint)
+            finally:
+                TxnRegister().commit_writer_txn(digestenv)
+        return
+
     stagetxn = TxnRegister().begin_writer_txn(stageenv)
     with stagetxn.cursor() as cursor:
         positionExists = cursor.first()
@@ -589,6 +1440,53 @@ def replace_staging_area_with_commit(refenv, stageenv, commit_hash):
     return
 
 
+def apply_changes_to_staging_area(stageenv, changes, stagedigestenv=None):
+    """DANGER ZONE: Write a stream of record changes to the staging area.
+
+    Parameters
+    ----------
+    stageenv : lmdb.Environment
+        staging area db to apply changes to.
+    changes : Iterable[Tuple[str, Tuple[bytes, bytes]]]
+        change kind (`added`, `deleted`, or `mutated`) and the db formatted
+        key / (new) value pair, as yielded by :func:`~hangar.diff.iter_diff_envs`.
+    stagedigestenv : Optional[lmdb.Environment]
+        if provided, the stored staged record digest of each changed record is
+        updated as well. Default is None.
+
+    Notes
+    -----
+    If ``changes`` raises, every change written so far is discarded (in both
+    environments) before the exception propagates; the staging area is only
+    updated if the full stream of changes is applied.
+    """
+    stagetxn = TxnRegister().begin_writer_txn(stageenv)
+    digesttxn = None
+    if stagedigestenv is not None:
+        digesttxn = TxnRegister().begin_writer_txn(stagedigestenv)
+    try:
+        for kind, (k, v) in changes:
+            if kind == 'deleted':
+                stagetxn.delete(k)
+            else:
+                stagetxn.put(k, v)
+            if digesttxn is not None:
+                digestKey = stage_digest_db_key_from_raw_key(k)
+                if kind == 'deleted':
+                    digesttxn.delete(digestKey)
+                else:
+                    digesttxn.put(digestKey, commit_ref_kv_digest(k, v).encode())
+    except BaseException:
+        if digesttxn is not None:
+            TxnRegister().abort_writer_txn(stagedigestenv)
+        TxnRegister().abort_writer_txn(stageenv)
+        raise
+
+    TxnRegister().commit_writer_txn(stageenv)
+    if digesttxn is not None:
+        TxnRegister().commit_writer_txn(stagedigestenv)
+
+
 def replace_staging_area_with_refs(stageenv, sorted_content):
     """DANGER ZONE: Delete all stage db records and replace it with specified data.
 
@@ -685,9 +1583,12 @@ def list_all_commits(refenv):
     refTxn = TxnRegister().begin_reader_txn(refenv)
     try:
         commits = set()
+        indexPrefix = commit_index_db_key_prefix()
         with refTxn.cursor() as cursor:
             cursor.first()
             for k in cursor.iternext(keys=True, values=False):
+                if k.startswith(indexPrefix):
+                    continue
                 commitKey, *_ = k.decode().split(SEP_KEY)
                 commits.add(commitKey)
             cursor.close()
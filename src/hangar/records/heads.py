@@ -284,7 +284,7 @@ def remove_branch(branchenv: lmdb.Environment,
         If the branch has not been fully merged into other branch histories,
         and ``force_delete`` option is not ``True``.
     """
-    from .commiting import get_commit_ancestors_graph
+    from .commiting import commit_is_ancestor
 
     all_branches = get_branch_names(branchenv)
     alive_branches = [x for x in all_branches if '/' not in x]  # exclude remotes
@@ -313,8 +313,7 @@ def remove_branch(branchenv: lmdb.Environment,
     if not force_delete:
         for branch in alive_branches:
             b_head = get_branch_head_commit(branchenv, branch)
-            b_ancestors = get_commit_ancestors_graph(refenv, starting_commit=b_head)
-            if HEAD in b_ancestors:
+            if commit_is_ancestor(refenv, HEAD, b_head):
                 break
         else:  # N.B. for-else conditional (ie. "no break")
             msg = f'The branch {name} is not fully merged. If you are sure '\
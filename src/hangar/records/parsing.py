@@ -11,13 +11,23 @@ from ..constants import (
     CMT_DIGEST_JOIN_KEY,
     CMT_KV_JOIN_KEY,
     CMT_REC_JOIN_KEY,
+    CMT_REF_DELTA_MAGIC,
+    CMT_REF_RANGE_SIZE,
     K_BRANCH,
+    K_CMTGRAPH,
+    K_CMTIDX,
+    K_CMTRANGES,
     K_HEAD,
     K_REMOTES,
+    K_STGBASE,
+    K_STGBASEREFS,
+    K_STGDIGEST,
+    K_STGDIRTY,
     K_VERSION,
     K_WLOCK,
     SEP_CMT,
     SEP_KEY,
+    SEP_LST,
     WLOCK_SENTINAL,
 )
 from .._version import parse as version_parse
@@ -318,6 +328,19 @@ class DigestAndDbRefs(NamedTuple):
     db_kvs: Union[Tuple, Tuple[Tuple[bytes, bytes]]]
 
 
+class CommitGraphNode(NamedTuple):
+    generation: int
+    commit_time: float
+    parents: Tuple[str, ...]
+
+
+class CommitRefDelta(NamedTuple):
+    parent: str
+    depth: int
+    deleted: Tuple[bytes, ...]
+    put: Tuple[Tuple[bytes, bytes], ...]
+
+
 def _hash_func(recs: bytes) -> str:
     """hash a tuple of db formatted k, v pairs.
 
@@ -367,6 +390,60 @@ def cmt_final_digest(parent_digest: str, spec_digest: str, refs_digest: str,
     return digest
 
 
+"""
+Commit Index Methods
+--------------------
+
+Records derived from the commit refs, stored in the refs db under a prefix
+which can not begin a commit hash.
+"""
+
+
+def commit_index_db_key_prefix() -> bytes:
+    return K_CMTIDX.encode()
+
+
+def commit_ranges_db_key_from_raw_key(commit_hash: str) -> bytes:
+    return f'{K_CMTRANGES}{commit_hash}'.encode()
+
+
+def commit_ranges_db_val_from_raw_val(ranges: Iterable[Tuple[bytes, str]]) -> bytes:
+    """Serialize and compress the range digests of a commit's refs.
+    """
+    pck = CMT_REC_JOIN_KEY.join(CMT_KV_JOIN_KEY.join((k, d.encode())) for k, d in ranges)
+    return blosc.compress(pck, typesize=1, clevel=8, shuffle=blosc.NOSHUFFLE, cname='zstd')
+
+
+def commit_ranges_raw_val_from_db_val(db_val: bytes) -> Tuple[Tuple[bytes, str], ...]:
+    """Load the range start keys and digests of a commit's refs.
+    """
+    pck = blosc.decompress(db_val)
+    if pck == b'':
+        return ()
+    ranges = []
+    for rec in pck.split(CMT_REC_JOIN_KEY):
+        k, d = rec.split(CMT_KV_JOIN_KEY)
+        ranges.append((k, d.decode()))
+    return tuple(ranges)
+
+
+def commit_graph_db_key_from_raw_key(commit_hash: str) -> bytes:
+    return f'{K_CMTGRAPH}{commit_hash}'.encode()
+
+
+def commit_graph_db_val_from_raw_val(node: CommitGraphNode) -> bytes:
+    """Serialize the commit graph node (generation, time, and parents) of a commit.
+    """
+    return SEP_LST.join((str(node.generation), repr(node.commit_time), *node.parents)).encode()
+
+
+def commit_graph_raw_val_from_db_val(db_val: bytes) -> CommitGraphNode:
+    """Load the commit graph node (generation, time, and parents) of a commit.
+    """
+    generation, commit_time, *parents = db_val.decode().split(SEP_LST)
+    return CommitGraphNode(int(generation), float(commit_time), tuple(parents))
+
+
 """
 Commit Parent (ancestor) Lookup methods
 ---------------------------------------
@@ -463,9 +540,43 @@ def _commit_ref_joined_kv_digest(joined_db_kvs: Iterable[bytes]) -> str:
         calculated digest of the commit ref record component
     """
     kv_digests = map(_hash_func, joined_db_kvs)
+    return commit_ref_digest_from_kv_digests(kv_digests)
+
+
+def commit_ref_kv_digest(db_key: bytes, db_val: bytes) -> str:
+    """Calculate the digest of a single db_key/db_value pair of the commit refs.
+
+    Parameters
+    ----------
+    db_key : bytes
+        db formatted record key
+    db_val : bytes
+        db formatted record value
+
+    Returns
+    -------
+    str
+        digest of the joined pair
+    """
+    return _hash_func(CMT_KV_JOIN_KEY.join((db_key, db_val)))
+
+
+def commit_ref_digest_from_kv_digests(kv_digests: Iterable[str]) -> str:
+    """Calculate the commit ref digest from the (sorted) digests of each kv pair.
+
+    Parameters
+    ----------
+    kv_digests : Iterable[str]
+        digest of each db_key/db_value pair (see :func:`commit_ref_kv_digest`)
+        in the sorted order of their db keys.
+
+    Returns
+    -------
+    str
+        calculated digest of the commit ref record component
+    """
     joined_digests = CMT_DIGEST_JOIN_KEY.join(kv_digests).encode()
-    res = _hash_func(joined_digests)
-    return res
+    return _hash_func(joined_digests)
 
 
 def commit_ref_db_val_from_raw_val(db_kvs: Iterable[Tuple[bytes, bytes]]) -> DigestAndBytes:
@@ -489,6 +600,124 @@ def commit_ref_db_val_from_raw_val(db_kvs: Iterable[Tuple[bytes, bytes]]) -> Dig
     return DigestAndBytes(digest=refDigest, raw=raw)
 
 
+def commit_ref_digest_from_raw_val(db_kvs: Iterable[Tuple[bytes, bytes]]) -> str:
+    """Calculate the refs digest of db_key/db_value pairs without serializing them.
+
+    Parameters
+    ----------
+    db_kvs : Iterable[Tuple[bytes, bytes]]
+        Iterable collection binary encoded db_key/db_val pairs.
+
+    Returns
+    -------
+    str
+        digest of the joined db kvs, identical to the digest returned by
+        :func:`commit_ref_db_val_from_raw_val`.
+    """
+    return _commit_ref_joined_kv_digest(map(CMT_KV_JOIN_KEY.join, db_kvs))
+
+
+def commit_ref_ranges_from_kv_digests(kv_digests: Iterable[Tuple[bytes, str]]
+                                      ) -> Tuple[Tuple[bytes, str], ...]:
+    """Split sorted commit ref records into ranges and calculate the digest of each.
+
+    Every column (record type + column name key prefix) starts a new range, and
+    within a column a new range is started at each record whose kv digest
+    satisfies a content-defined boundary condition (on average every
+    ``CMT_REF_RANGE_SIZE`` records). Since boundaries depend only on record
+    contents, ranges holding identical records in two commits begin at the
+    same key and have the same digest.
+
+    Parameters
+    ----------
+    kv_digests : Iterable[Tuple[bytes, str]]
+        db key and digest of each db_key/db_value pair (see
+        :func:`commit_ref_kv_digest`) in the sorted order of their db keys.
+
+    Returns
+    -------
+    Tuple[Tuple[bytes, str], ...]
+        db key the range starts at and digest of all records in the range, for
+        each range in sorted order.
+    """
+    ranges, rangeDigests = [], []
+    startKey, column = None, None
+    for dbKey, kvDigest in kv_digests:
+        keyColumn = dbKey.split(SEP_KEY.encode(), 2)[:2]
+        if (keyColumn != column) or (int(kvDigest[-4:], 16) % CMT_REF_RANGE_SIZE == 0):
+            if startKey is not None:
+                ranges.append((startKey, commit_ref_digest_from_kv_digests(rangeDigests)))
+            startKey, column, rangeDigests = dbKey, keyColumn, []
+        rangeDigests.append(kvDigest)
+    if startKey is not None:
+        ranges.append((startKey, commit_ref_digest_from_kv_digests(rangeDigests)))
+    return tuple(ranges)
+
+
+def commit_ref_db_val_is_delta(commit_db_val: bytes) -> bool:
+    """Determine if a commit ref db_val is delta encoded against its parent.
+    """
+    return commit_db_val.startswith(CMT_REF_DELTA_MAGIC)
+
+
+def commit_ref_delta_db_val_from_raw_val(parent: str,
+                                         depth: int,
+                                         deleted: Iterable[bytes],
+                                         put: Iterable[Tuple[bytes, bytes]]) -> bytes:
+    """Serialize and compress the changes of a commit's records relative to its parent.
+
+    Parameters
+    ----------
+    parent : str
+        commit hash of the (master) parent the delta is calculated against.
+    depth : int
+        number of delta encoded refs between this ref and a full snapshot ref
+        (including this one).
+    deleted : Iterable[bytes]
+        db keys present in the parent which are not in this commit.
+    put : Iterable[Tuple[bytes, bytes]]
+        db_key/db_value pairs which were added or changed relative to parent.
+
+    Returns
+    -------
+    bytes
+        db formatted delta ref value.
+    """
+    recs = [b'-' + k for k in deleted]
+    recs.extend(b'+' + CMT_KV_JOIN_KEY.join(kv) for kv in put)
+    pck = CMT_REC_JOIN_KEY.join(recs)
+    comp = blosc.compress(pck, typesize=1, clevel=8, shuffle=blosc.NOSHUFFLE, cname='zstd')
+    header = f'{depth}{SEP_KEY}{parent}'.encode()
+    return CMT_REF_DELTA_MAGIC + header + CMT_REC_JOIN_KEY + comp
+
+
+def commit_ref_delta_raw_val_from_db_val(commit_db_val: bytes) -> CommitRefDelta:
+    """Load and decompress a delta encoded commit ref db_val.
+
+    Parameters
+    ----------
+    commit_db_val : bytes
+        db formatted delta ref value.
+
+    Returns
+    -------
+    CommitRefDelta
+        `parent` commit hash and `depth` of the delta chain, the `deleted` db
+        keys and the `put` db_key/db_value pairs relative to the parent.
+    """
+    header, comp = commit_db_val[len(CMT_REF_DELTA_MAGIC):].split(CMT_REC_JOIN_KEY, 1)
+    depth, parent = header.decode().split(SEP_KEY, 1)
+    deleted, put = [], []
+    pck = blosc.decompress(comp)
+    if pck != b'':
+        for rec in pck.split(CMT_REC_JOIN_KEY):
+            if rec[:1] == b'-':
+                deleted.append(rec[1:])
+            else:
+                put.append(tuple(rec[1:].split(CMT_KV_JOIN_KEY)))
+    return CommitRefDelta(parent=parent, depth=int(depth), deleted=tuple(deleted), put=tuple(put))
+
+
 def commit_ref_raw_val_from_db_val(commit_db_val: bytes) -> DigestAndDbRefs:
     """Load and decompress a commit ref db_val into python object memory.
 
@@ -571,3 +800,65 @@ def commit_spec_raw_val_from_db_val(db_val: bytes) -> DigestAndUserSpec:
     commit_spec = json.loads(uncompressed_db_val)
     user_spec = CommitUserSpec(**commit_spec)
     return DigestAndUserSpec(digest=digest, user_spec=user_spec)
+
+
+"""
+Stage Digest Parsing Methods
+----------------------------
+
+The parsers defined in this section handle records of the staged record
+digest db, which tracks the digest of every staged record along with the
+keys of staged records which were modified since the digests were computed.
+"""
+
+# ------------------------ db key prefixes are fixed -----------------
+
+
+def stage_base_db_key() -> bytes:
+    """The db formatted key the commit which staged digests were synced at is stored.
+    """
+    return K_STGBASE.encode()
+
+
+def stage_base_refs_db_key() -> bytes:
+    """The db formatted key the fingerprint of the base commit records is stored.
+    """
+    return K_STGBASEREFS.encode()
+
+
+def stage_digest_db_key_prefix() -> bytes:
+    return K_STGDIGEST.encode()
+
+
+def stage_dirty_db_key_prefix() -> bytes:
+    return K_STGDIRTY.encode()
+
+
+# ------------------------ raw -> db --------------------------------
+
+
+def stage_digest_db_key_from_raw_key(db_key: bytes) -> bytes:
+    return K_STGDIGEST.encode() + db_key
+
+
+def stage_dirty_db_key_from_raw_key(db_key: bytes) -> bytes:
+    return K_STGDIRTY.encode() + db_key
+
+
+def stage_base_refs_db_val_from_raw_val(parent_val: bytes,
+                                        spec_val: bytes,
+                                        ref_val: bytes) -> bytes:
+    """Fingerprint of the (db formatted) parent, spec, and ref records of a commit.
+    """
+    return _hash_func(b''.join((parent_val, spec_val, ref_val))).encode()
+
+
+# ------------------------ db -> raw --------------------------------
+
+
+def stage_digest_raw_key_from_db_key(db_key: bytes) -> bytes:
+    return db_key[len(K_STGDIGEST):]
+
+
+def stage_dirty_raw_key_from_db_key(db_key: bytes) -> bytes:
+    return db_key[len(K_STGDIRTY):]
@@ -1,6 +1,6 @@
 import math
 import struct
-from typing import NamedTuple, List, Union, Tuple
+from typing import NamedTuple, List, Sequence, Union, Tuple
 
 import blosc
 import numpy as np
@@ -68,7 +68,7 @@ def clientCommitChunkedIterator(commit: str, parentVal: bytes, specVal: bytes,
         yield request
 
 
-def tensorChunkedIterator(buf, uncomp_nbytes, pb2_request, *, err=None):
+def tensorChunkedIterator(buf, uncomp_nbytes, pb2_request, *, err=None, **fields):
 
     compBytes = blosc.compress(
         buf, clevel=3, cname='blosclz', shuffle=blosc.NOSHUFFLE)
@@ -76,7 +76,8 @@ def tensorChunkedIterator(buf, uncomp_nbytes, pb2_request, *, err=None):
     request = pb2_request(
         comp_nbytes=len(compBytes),
         uncomp_nbytes=uncomp_nbytes,
-        error=err)
+        error=err,
+        **fields)
     chunkIterator = chunk_bytes(compBytes)
     for dchunk in chunkIterator:
         request.raw_data = dchunk
@@ -115,6 +116,9 @@ def missingHashRequestIterator(commit, hash_bytes, pb2_func):
 # ------------------------ serialization formats -------------------------
 
 
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
 class DataIdent(NamedTuple):
     digest: str
     schema: str
@@ -126,21 +130,29 @@ class DataRecord(NamedTuple):
     schema: str
 
 
+def _serialize_arr_buffers(arr: np.ndarray) -> List[Union[bytes, memoryview]]:
+    """
+    dtype_num ndim dim1_size dim2_size ... dimN_size array_bytes
+
+    The array bytes are a ``uint8`` view of the array data, which is only
+    copied if the array is not C-contiguous.
+    """
+    header = struct.pack(f'<bb{len(arr.shape)}i', arr.dtype.num, arr.ndim, *arr.shape)
+    data = np.ascontiguousarray(arr).reshape(-1).view(np.uint8)
+    return [header, memoryview(data)]
+
+
 def _serialize_arr(arr: np.ndarray) -> bytes:
     """
     dtype_num ndim dim1_size dim2_size ... dimN_size array_bytes
     """
-    raw = struct.pack(
-        f'<bb{len(arr.shape)}i{arr.nbytes}s',
-        arr.dtype.num, arr.ndim, *arr.shape, arr.tobytes()
-    )
-    return raw
+    return b''.join(_serialize_arr_buffers(arr))
 
 
-def _deserialize_arr(raw: bytes) -> np.ndarray:
-    dtnum, ndim = struct.unpack('<bb', raw[0:2])
+def _deserialize_arr(raw: BytesLike) -> np.ndarray:
+    dtnum, ndim = struct.unpack_from('<bb', raw, 0)
     end = 2 + (4 * ndim)
-    arrshape = struct.unpack(f'<{ndim}i', raw[2:end])
+    arrshape = struct.unpack_from(f'<{ndim}i', raw, 2)
     arr = np.frombuffer(raw, dtype=np.typeDict[dtnum], offset=end).reshape(arrshape)
     return arr
 
@@ -152,8 +164,8 @@ def _serialize_str(data: str) -> bytes:
     return data.encode()
 
 
-def _deserialize_str(raw: bytes) -> str:
-    return raw.decode()
+def _deserialize_str(raw: BytesLike) -> str:
+    return str(raw, 'utf-8')
 
 
 def _serialize_bytes(data: bytes) -> bytes:
@@ -163,8 +175,8 @@ def _serialize_bytes(data: bytes) -> bytes:
     return data
 
 
-def _deserialize_bytes(data: bytes) -> bytes:
-    return data
+def _deserialize_bytes(data: BytesLike) -> bytes:
+    return bytes(data)
 
 
 def serialize_ident(digest: str, schema: str) -> bytes:
@@ -178,9 +190,9 @@ def serialize_ident(digest: str, schema: str) -> bytes:
     return raw
 
 
-def deserialize_ident(raw: bytes) -> DataIdent:
-    digestLen, schemaLen = struct.unpack('<hh', raw[:4])
-    rawdigest, rawschema = struct.unpack(f'<{digestLen}s{schemaLen}s', raw[4:])
+def deserialize_ident(raw: BytesLike) -> DataIdent:
+    digestLen, schemaLen = struct.unpack_from('<hh', raw, 0)
+    rawdigest, rawschema = struct.unpack_from(f'<{digestLen}s{schemaLen}s', raw, 4)
     digest = rawdigest.decode()
     schema = rawschema.decode()
     return DataIdent(digest, schema)
@@ -197,7 +209,19 @@ def serialize_data(data: Union[np.ndarray, str, bytes]) -> Tuple[int, bytes]:
         raise TypeError(type(data))
 
 
-def deserialize_data(dtype_code: int, raw_data: bytes) -> Union[np.ndarray, str, bytes]:
+def serialize_data_buffers(
+        data: Union[np.ndarray, str, bytes]) -> Tuple[int, List[Union[bytes, memoryview]]]:
+    """Same as :func:`serialize_data`, with the data split into buffers.
+
+    Array data is not copied (if C-contiguous), see :func:`_serialize_arr_buffers`.
+    """
+    if isinstance(data, np.ndarray):
+        return (0, _serialize_arr_buffers(data))
+    dtype_code, raw_data = serialize_data(data)
+    return (dtype_code, [raw_data])
+
+
+def deserialize_data(dtype_code: int, raw_data: BytesLike) -> Union[np.ndarray, str, bytes]:
     if dtype_code == 0:
         return _deserialize_arr(raw_data)
     elif dtype_code == 2:
@@ -208,43 +232,78 @@ def deserialize_data(dtype_code: int, raw_data: bytes) -> Union[np.ndarray, str,
         raise ValueError(f'dtype_code unknown {dtype_code}')
 
 
-def serialize_record(data: Union[np.ndarray, str, bytes], digest: str, schema: str) -> bytes:
+def buffers_nbytes(buffers: Sequence[BytesLike]) -> int:
+    """Total size of some buffers (``bytes`` or ``uint8`` memoryviews).
+    """
+    return sum(len(buf) for buf in buffers)
+
+
+def serialize_record_buffers(data: Union[np.ndarray, str, bytes],
+                             digest: str, schema: str) -> List[Union[bytes, memoryview]]:
     """
     dtype_code len_raw_ident len_raw_data raw_ident, raw_data
+
+    Same as :func:`serialize_record`, but the record is returned as a list of
+    buffers whose concatenation is the serialized record, so array data is not
+    copied until the buffers are packed by :func:`serialize_record_pack`.
     """
-    dtype_code, raw_data = serialize_data(data)
+    dtype_code, data_buffers = serialize_data_buffers(data)
     raw_ident = serialize_ident(digest, schema)
-    raw = struct.pack(
-        f'<b2Q{len(raw_ident)}s{len(raw_data)}s',
-        dtype_code, len(raw_ident), len(raw_data), raw_ident, raw_data
-    )
-    return raw
+    header = struct.pack('<b2Q', dtype_code, len(raw_ident), buffers_nbytes(data_buffers))
+    return [header + raw_ident, *data_buffers]
 
 
-def deserialize_record(raw: bytes) -> DataRecord:
+def serialize_record(data: Union[np.ndarray, str, bytes], digest: str, schema: str) -> bytes:
+    """
+    dtype_code len_raw_ident len_raw_data raw_ident, raw_data
+    """
+    return b''.join(serialize_record_buffers(data, digest, schema))
+
+
+def deserialize_record(raw: BytesLike) -> DataRecord:
+    """Deserialize a record; arrays are read-only views of ``raw`` (not copies).
+    """
     identStart = 17  # 1 + 2 * 8 bytes
-    dtype_code, identLen, dataLen = struct.unpack(f'<b2Q', raw[:identStart])
+    dtype_code, identLen, dataLen = struct.unpack_from(f'<b2Q', raw, 0)
     identEnd = identStart + identLen
     arrEnd = identEnd + dataLen
+    raw = memoryview(raw)
     arr = deserialize_data(dtype_code, raw[identEnd:arrEnd])
     ident = deserialize_ident(raw[identStart:identEnd])
     return DataRecord(arr, ident.digest, ident.schema)
 
 
-def serialize_record_pack(records: List[bytes]) -> bytes:
+def serialize_record_pack(records: Sequence[Union[BytesLike, Sequence[BytesLike]]]) -> bytearray:
     """
     num_records len_rec1 raw_rec1 len_rec2 raw_rec2 ... len_recN raw_recN
+
+    Records may be serialized records or lists of buffers (as returned by
+    :func:`serialize_record_buffers`). The pack is preallocated and every
+    buffer is copied into it exactly once.
     """
-    raw_num_records = struct.pack(f'<i', len(records))
-    raw_records = [b''.join([struct.pack(f'<Q', len(rec)), rec]) for rec in records]
-    return b''.join([raw_num_records, *raw_records])
+    records = [rec if isinstance(rec, (list, tuple)) else (rec,) for rec in records]
+    recLens = [buffers_nbytes(rec) for rec in records]
+    raw = bytearray(4 + (8 * len(records)) + sum(recLens))
+    struct.pack_into(f'<i', raw, 0, len(records))
+    cursorPos = 4
+    with memoryview(raw) as view:
+        for rec, lenRec in zip(records, recLens):
+            struct.pack_into(f'<Q', raw, cursorPos, lenRec)
+            cursorPos += 8
+            for buf in rec:
+                view[cursorPos:cursorPos + len(buf)] = buf
+                cursorPos += len(buf)
+    return raw
 
 
-def deserialize_record_pack(raw: bytes) -> List[bytes]:
-    numRecords = struct.unpack(f'<i', raw[:4])[0]
+def deserialize_record_pack(raw: BytesLike) -> List[memoryview]:
+    """Split a pack into records, which are views of ``raw`` (not copies).
+    """
+    numRecords = struct.unpack_from(f'<i', raw, 0)[0]
+    view = memoryview(raw)
     cursorPos, recs = 4, []
     for i in range(numRecords):
-        lenRec = struct.unpack(f'<Q', raw[cursorPos:cursorPos+8])[0]
-        recs.append(raw[cursorPos+8:cursorPos+8+lenRec])
+        lenRec = struct.unpack_from(f'<Q', raw, cursorPos)[0]
+        recs.append(view[cursorPos+8:cursorPos+8+lenRec])
         cursorPos += (8 + lenRec)
     return recs
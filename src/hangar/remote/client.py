@@ -1,8 +1,13 @@
 import logging
 import os
+import queue
 import tempfile
+import threading
 import time
-from typing import Tuple, Sequence
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Iterable, Iterator, List, Mapping, Tuple, Sequence, Union
 
 import blosc
 import grpc
@@ -17,7 +22,7 @@ from .header_manipulator_client_interceptor import header_adder_interceptor
 from .. import constants as c
 from ..context import Environments
 from ..txnctx import TxnRegister
-from ..backends import BACKEND_ACCESSOR_MAP, backend_decoder
+from ..backends import BACKEND_ACCESSOR_MAP, BACKEND_SHARES_READER_MAP, backend_decoder
 from ..records import commiting
 from ..records import hashs
 from ..records.hashmachine import hash_type_code_from_digest, hash_func_from_tcode
@@ -73,17 +78,22 @@ class HangarClient(object):
         self.header_adder_int = header_adder_interceptor(auth_username, auth_password)
 
         self.cfg: dict = {}
-        self._rFs: BACKEND_ACCESSOR_MAP = {}
+        self._rFs: BACKEND_ACCESSOR_MAP = self._open_reader_accessors()
 
+        self._setup_client_channel_config()
+
+    def _open_reader_accessors(self, backends: Iterable[str] = None) -> BACKEND_ACCESSOR_MAP:
+        """Open read-only accessors of local backends (all if ``backends`` is None).
+        """
+        rFs = {}
         for backend, accessor in BACKEND_ACCESSOR_MAP.items():
-            if accessor is not None:
-                self._rFs[backend] = accessor(
+            if (accessor is not None) and ((backends is None) or (backend in backends)):
+                rFs[backend] = accessor(
                     repo_path=self.env.repo_path,
                     schema_shape=None,
                     schema_dtype=None)
-                self._rFs[backend].open(mode='r')
-
-        self._setup_client_channel_config()
+                rFs[backend].open(mode='r')
+        return rFs
 
     def _setup_client_channel_config(self):
         """get grpc client configuration from server and setup channel and stub for use.
@@ -97,6 +107,7 @@ class HangarClient(object):
                 request = hangar_service_pb2.GetClientConfigRequest()
                 response = tmp_stub.GetClientConfig(request)
                 self.cfg['push_max_nbytes'] = int(response.config['push_max_nbytes'])
+                self.cfg['fetch_frame_nbytes'] = int(response.config.get('fetch_frame_nbytes', '0'))
                 self.cfg['optimization_target'] = response.config['optimization_target']
 
                 enable_compression = response.config['enable_compression']
@@ -302,8 +313,343 @@ class HangarClient(object):
         response = self.stub.PushSchema(request)
         return response
 
+    @staticmethod
+    def _iter_reply_frames(
+            replies: Iterable[hangar_service_pb2.FetchDataReply]
+    ) -> Iterator[Tuple[int, bytes]]:
+        """Reassemble chunked ``FetchData`` replies into decompressed frames.
+
+        Every frame is compressed independently and sent as a run of replies,
+        the first of which reports the compressed / uncompressed size of the
+        frame and the cursor following its last record. Replies with no frame
+        payload (ie. errors) are skipped.
+
+        Parameters
+        ----------
+        replies : Iterable[hangar_service_pb2.FetchDataReply]
+            reply stream of the ``FetchData`` rpc.
+
+        Yields
+        ------
+        Tuple[int, bytes]
+            cursor reported by the frame (0 if the server does not report it)
+            and decompressed contents of the frame (a packed set of records).
+
+        Raises
+        ------
+        RuntimeError
+            if the size of some decompressed frame is not the reported size.
+        """
+        dBytes, offset = None, 0
+        for reply in replies:
+            if dBytes is None:
+                if reply.comp_nbytes == 0:
+                    continue
+                uncomp_nbytes, comp_nbytes = reply.uncomp_nbytes, reply.comp_nbytes
+                cursor = reply.cursor
+                dBytes, offset = bytearray(comp_nbytes), 0
+            size = len(reply.raw_data)
+            dBytes[offset:offset + size] = reply.raw_data
+            offset += size
+            if offset >= comp_nbytes:
+                uncompBytes = blosc.decompress(dBytes)
+                if uncomp_nbytes != len(uncompBytes):
+                    raise RuntimeError(f'uncomp_nbytes: {uncomp_nbytes} != received {comp_nbytes}')
+                dBytes = None
+                yield cursor, uncompBytes
+
+    @staticmethod
+    def _verified_records_from_pack(pack: bytes) -> List[Tuple[str, np.ndarray]]:
+        """Unpack the records of a frame, verifying the digest of every sample.
+
+        Raises
+        ------
+        RuntimeError
+            if the hash of some received data does not match its digest.
+        """
+        received_data = []
+        unpacked_records = chunks.deserialize_record_pack(pack)
+        for record in unpacked_records:
+            data = chunks.deserialize_record(record)
+            expected_hasher_tcode = hash_type_code_from_digest(data.digest)
+            hash_func = hash_func_from_tcode(expected_hasher_tcode)
+            received_hash = hash_func(data.data)
+            if received_hash != data.digest:
+                logger.error(data.data)
+                raise RuntimeError(f'MANGLED! got: {received_hash} != requested: {data.digest}')
+            received_data.append((received_hash, data.data))
+        return received_data
+
+    def iter_fetch_data(
+            self, schema_hash: str, digests: Sequence[str], *, frame_nbytes: int = None
+    ) -> Iterator[List[Tuple[str, np.ndarray]]]:
+        """Fetch data hash digests for a particular schema, one frame at a time.
+
+        The server streams records back in independently compressed frames as
+        they are read, and each frame is decoded and verified as soon as it is
+        received. As in :meth:`fetch_data`, only a portion of the requested
+        digests may be sent; check which digests were actually received.
+
+        Parameters
+        ----------
+        schema_hash : str
+            hash of the schema each of the digests is associated with
+        digests : Sequence[str]
+            iterable of data digests to receive
+        frame_nbytes : int, optional, kwarg-only
+            requested (uncompressed) size of each frame. If None (default),
+            the size set by the server config is used. If 0, the server sends
+            every record in a single pack.
+
+        Yields
+        ------
+        List[Tuple[str, np.ndarray]]
+            2-tuples of the hash digest and data of every record in a frame.
+
+        Raises
+        ------
+        RuntimeError
+            if received digest != requested or what was reported to be sent.
+        """
+        if frame_nbytes is None:
+            frame_nbytes = self.cfg.get('fetch_frame_nbytes', 0)
+        raw_digests = c.SEP_LST.join(digests).encode()
+        cIter = chunks.tensorChunkedIterator(buf=raw_digests, uncomp_nbytes=len(raw_digests),
+                                             pb2_request=hangar_service_pb2.FetchDataRequest,
+                                             frame_nbytes=frame_nbytes)
+        replies = self.stub.FetchData(cIter)
+        try:
+            for _, pack in self._iter_reply_frames(replies):
+                yield self._verified_records_from_pack(pack)
+        except grpc.RpcError as rpc_error:
+            if rpc_error.code() == grpc.StatusCode.RESOURCE_EXHAUSTED:
+                logger.info(rpc_error.details())
+            else:
+                logger.error(rpc_error.details())
+                raise rpc_error
+        finally:
+            replies.cancel()
+
+    def open_fetch_session(self, digests: Sequence[str]) -> Tuple[str, int]:
+        """Open a session on the server holding a list of digests to fetch.
+
+        Parameters
+        ----------
+        digests : Sequence[str]
+            data digests to request in the session.
+
+        Returns
+        -------
+        Tuple[str, int]
+            id of the session and number of digests it holds.
+        """
+        raw_digests = c.SEP_LST.join(digests).encode()
+        cIter = chunks.tensorChunkedIterator(buf=raw_digests, uncomp_nbytes=len(raw_digests),
+                                             pb2_request=hangar_service_pb2.FetchDataSessionRequest)
+        reply = self.stub.FetchDataSession(cIter)
+        return (reply.session_id, reply.num_digests)
+
+    def iter_fetch_session_page(
+            self, session_id: str, cursor: int = 0, *, frame_nbytes: int = None
+    ) -> Iterator[Tuple[int, List[Tuple[str, np.ndarray]]]]:
+        """Fetch one page of the data held by a fetch session, one frame at a time.
+
+        Parameters
+        ----------
+        session_id : str
+            id of a session opened with :meth:`open_fetch_session`.
+        cursor : int, optional
+            index of the first session digest to receive, by default 0
+        frame_nbytes : int, optional, kwarg-only
+            requested (uncompressed) size of each frame. If None (default),
+            the size set by the server config is used. If 0, the page is sent
+            as a single frame.
+
+        Yields
+        ------
+        Tuple[int, List[Tuple[str, np.ndarray]]]
+            cursor following the last record of a frame, and 2-tuples of the
+            hash digest and data of every record in the frame. The page ends
+            when the stream ends; the next page starts at the last cursor.
+
+        Raises
+        ------
+        grpc.RpcError
+            ``FAILED_PRECONDITION`` if the session does not exist (anymore) on
+            the server.
+        """
+        if frame_nbytes is None:
+            frame_nbytes = self.cfg.get('fetch_frame_nbytes', 0)
+        request = hangar_service_pb2.FetchDataRequest(
+            session_id=session_id, cursor=cursor, frame_nbytes=frame_nbytes)
+        replies = self.stub.FetchData(iter([request]))
+        try:
+            for next_cursor, pack in self._iter_reply_frames(replies):
+                yield (next_cursor, self._verified_records_from_pack(pack))
+        finally:
+            replies.cancel()
+
+    def iter_fetch_session_data(
+            self, schema_hash: str, digests: Sequence[str], *,
+            frame_nbytes: int = None, max_retries: int = 5
+    ) -> Iterator[List[Tuple[str, np.ndarray]]]:
+        """Fetch all data of some digests, resuming interrupted transfers.
+
+        The digest list is uploaded once to open a fetch session, whose pages
+        are then requested until every record is received. A frame is
+        acknowledged once the caller asks for the next one; if the connection
+        drops, or the server no longer holds the session, the transfer
+        resumes from the first digest after the last acknowledged frame
+        (reopening a session holding only the remaining digests if needed).
+
+        Servers which do not support fetch sessions (or refuse to open one
+        holding this many digests) are asked for the remaining digests with
+        :meth:`iter_fetch_data` until none are left.
+
+        Parameters
+        ----------
+        schema_hash : str
+            hash of the schema each of the digests is associated with
+        digests : Sequence[str]
+            data digests to receive
+        frame_nbytes : int, optional, kwarg-only
+            requested (uncompressed) size of each frame. If None (default),
+            the size set by the server config is used.
+        max_retries : int, optional, kwarg-only
+            number of times in a row (without receiving a frame) the transfer
+            is resumed after the server becomes ``UNAVAILABLE`` or drops the
+            session (``FAILED_PRECONDITION``) before the error is raised, by
+            default 5
+
+        Yields
+        ------
+        List[Tuple[str, np.ndarray]]
+            2-tuples of the hash digest and data of every record in a frame.
+        """
+        pending = list(digests)
+        try:
+            session_id, num_digests = self.open_fetch_session(pending)
+        except grpc.RpcError as rpc_error:
+            code = rpc_error.code()
+            if code not in (grpc.StatusCode.UNIMPLEMENTED, grpc.StatusCode.RESOURCE_EXHAUSTED):
+                raise rpc_error
+            logger.info(rpc_error.details())
+            remaining = set(pending)
+            while remaining:
+                for frame in self.iter_fetch_data(schema_hash, list(remaining),
+                                                  frame_nbytes=frame_nbytes):
+                    yield frame
+                    remaining.difference_update(digest for digest, _ in frame)
+            return
+
+        cursor, retries = 0, 0
+        while cursor < num_digests:
+            try:
+                if session_id is None:
+                    session_id, num_digests = self.open_fetch_session(pending[cursor:])
+                    pending, cursor = pending[cursor:], 0
+                for next_cursor, frame in self.iter_fetch_session_page(
+                        session_id, cursor, frame_nbytes=frame_nbytes):
+                    yield frame
+                    cursor, retries = next_cursor, 0
+            except grpc.RpcError as rpc_error:
+                code = rpc_error.code()
+                retryable = (grpc.StatusCode.FAILED_PRECONDITION, grpc.StatusCode.UNAVAILABLE)
+                if (code in retryable) and (retries < max_retries):
+                    logger.info(rpc_error.details())
+                    if code == grpc.StatusCode.FAILED_PRECONDITION:
+                        session_id = None
+                    retries += 1
+                    time.sleep(0.1 * 2 ** retries)
+                else:
+                    logger.error(rpc_error.details())
+                    raise rpc_error
+
+    def iter_fetch_data_concurrent(
+            self, schema_digests: Mapping[str, Sequence[str]], *, num_streams: int = 1
+    ) -> Iterator[Tuple[str, List[Tuple[str, np.ndarray]]]]:
+        """Fetch the data of many schemas over concurrent streams.
+
+        The digests of every schema are split into ``num_streams`` shards, each
+        fetched by :meth:`iter_fetch_session_data` in a pool of ``num_streams``
+        threads sharing the client channel. Frames are received, decompressed
+        and verified in those threads, then handed to the caller through a
+        bounded queue, so the caller (ie. whatever writes the data to disk) is
+        the only thread which has to consume them. Closing the generator stops
+        every stream.
+
+        Parameters
+        ----------
+        schema_digests : Mapping[str, Sequence[str]]
+            mapping of schema hash to data digests of that schema to receive.
+        num_streams : int, optional, kwarg-only
+            number of streams fetching data at once, by default 1
+
+        Yields
+        ------
+        Tuple[str, List[Tuple[str, np.ndarray]]]
+            schema hash, and 2-tuples of the hash digest and data of every
+            record in a frame; frames of different shards are interleaved in
+            the order they are received.
+
+        Raises
+        ------
+        ValueError
+            if ``num_streams`` is not a positive int.
+        """
+        if not isinstance(num_streams, int) or num_streams < 1:
+            raise ValueError(f'num_streams must be a positive int, not {num_streams}')
+
+        shards = []
+        for schema, digests in schema_digests.items():
+            digests = list(digests)
+            for idx in range(num_streams):
+                if digests[idx::num_streams]:
+                    shards.append((schema, digests[idx::num_streams]))
+
+        frames = queue.Queue(maxsize=2 * num_streams)
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    frames.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def fetch_shard(schema, digests):
+            # a frame of None marks the end of a shard; an exception its failure.
+            try:
+                if not stop.is_set():
+                    with closing(self.iter_fetch_session_data(schema, digests)) as shard_frames:
+                        for frame in shard_frames:
+                            if not put((schema, frame)):
+                                break
+            except Exception as e:
+                put((schema, e))
+            else:
+                put((schema, None))
+
+        with ThreadPoolExecutor(max_workers=num_streams) as pool:
+            try:
+                for schema, digests in shards:
+                    pool.submit(fetch_shard, schema, digests)
+                num_done = 0
+                while num_done < len(shards):
+                    schema, frame = frames.get()
+                    if frame is None:
+                        num_done += 1
+                    elif isinstance(frame, Exception):
+                        raise frame
+                    else:
+                        yield (schema, frame)
+            finally:
+                stop.set()
+
     def fetch_data(
-            self, schema_hash: str, digests: Sequence[str]
+            self, schema_hash: str, digests: Sequence[str], *, frame_nbytes: int = None
     ) -> Sequence[Tuple[str, np.ndarray]]:
         """Fetch data hash digests for a particular schema.
 
@@ -314,12 +660,17 @@ class HangarClient(object):
         are listed as the return value of this function, be sure to check that
         all requested digests have been received!
 
+        .. seealso:: :meth:`iter_fetch_data`
+
         Parameters
         ----------
         schema_hash : str
             hash of the schema each of the digests is associated with
         digests : Sequence[str]
             iterable of data digests to receive
+        frame_nbytes : int, optional, kwarg-only
+            requested (uncompressed) size of each frame streamed by the server.
+            If None (default), the size set by the server config is used.
 
         Returns
         -------
@@ -331,47 +682,25 @@ class HangarClient(object):
         RuntimeError
             if received digest != requested or what was reported to be sent.
         """
-        try:
-            raw_digests = c.SEP_LST.join(digests).encode()
-            cIter = chunks.tensorChunkedIterator(buf=raw_digests, uncomp_nbytes=len(raw_digests),
-                                                 pb2_request=hangar_service_pb2.FetchDataRequest)
-
-            replies = self.stub.FetchData(cIter)
-            for idx, reply in enumerate(replies):
-                if idx == 0:
-                    uncomp_nbytes, comp_nbytes = reply.uncomp_nbytes, reply.comp_nbytes
-                    dBytes, offset = bytearray(comp_nbytes), 0
-                size = len(reply.raw_data)
-                if size > 0:
-                    dBytes[offset:offset + size] = reply.raw_data
-                    offset += size
-        except grpc.RpcError as rpc_error:
-            if rpc_error.code() == grpc.StatusCode.RESOURCE_EXHAUSTED:
-                logger.info(rpc_error.details())
-            else:
-                logger.error(rpc_error.details())
-                raise rpc_error
-
-        uncompBytes = blosc.decompress(dBytes)
-        if uncomp_nbytes != len(uncompBytes):
-            raise RuntimeError(f'uncomp_nbytes: {uncomp_nbytes} != received {comp_nbytes}')
         received_data = []
-        unpacked_records = chunks.deserialize_record_pack(uncompBytes)
-        for record in unpacked_records:
-            data = chunks.deserialize_record(record)
-            expected_hasher_tcode = hash_type_code_from_digest(data.digest)
-            hash_func = hash_func_from_tcode(expected_hasher_tcode)
-            received_hash = hash_func(data.data)
-            if received_hash != data.digest:
-                logger.error(data.data)
-                raise RuntimeError(f'MANGLED! got: {received_hash} != requested: {data.digest}')
-            received_data.append((received_hash, data.data))
+        for frame in self.iter_fetch_data(schema_hash, digests, frame_nbytes=frame_nbytes):
+            received_data.extend(frame)
         return received_data
 
     def push_data(self, schema_hash: str, digests: Sequence[str],
-                  pbar: tqdm = None) -> hangar_service_pb2.PushDataReply:
+                  pbar: tqdm = None, *, num_readers: int = 4,
+                  num_senders: int = 2) -> hangar_service_pb2.PushDataReply:
         """Given a schema and digest list, read the data and send to the server
 
+        Reading, serialization, compression and sending are pipelined: a pool
+        of ``num_readers`` threads reads and serializes samples (a few ahead
+        of the packer), the calling thread gathers the records into packs of
+        up to ``push_max_nbytes``, and a pool of ``num_senders`` threads
+        compresses and sends every pack in its own ``PushData`` rpc. Besides
+        the packs being sent, only one pack waits for a free sender and one is
+        being gathered; once both are full, reading stops until a pack has been
+        sent, so memory use is bounded by ``num_senders + 2`` packs.
+
         Parameters
         ----------
         schema_hash : str
@@ -380,6 +709,10 @@ class HangarClient(object):
             iterable of digests to be read in and sent to the server
         pbar : tqdm, optional
             progress bar instance to be updated as the operation occurs, by default None
+        num_readers : int, optional, kwarg-only
+            number of threads reading sample data from disk, by default 4
+        num_senders : int, optional, kwarg-only
+            number of packs compressed and sent to the server at once, by default 2
 
         Returns
         -------
@@ -406,41 +739,81 @@ class HangarClient(object):
         finally:
             TxnRegister().abort_reader_txn(self.env.hashenv)
 
-        try:
+        # every reader thread opens its own accessors, except for backends which
+        # can only be opened once per process.
+        backends = {spec.backend for _, spec in specs}
+        shared = {be: self._rFs[be] for be in backends if BACKEND_SHARES_READER_MAP.get(be)}
+        thread_fs = threading.local()
+        opened, opened_lock = [], threading.Lock()
+
+        def read_record(digest, spec) -> List[Union[bytes, memoryview]]:
+            try:
+                rFs = thread_fs.rFs
+            except AttributeError:
+                rFs = self._open_reader_accessors(backends.difference(shared))
+                for accessor in rFs.values():
+                    # data is only copied once, when packed (see ``serialize_record_pack``).
+                    if hasattr(accessor, 'set_zero_copy'):
+                        accessor.set_zero_copy(True)
+                with opened_lock:
+                    opened.append(rFs)
+                rFs = thread_fs.rFs = {**rFs, **shared}
+            data = rFs[spec.backend].read_data(spec)
+            return chunks.serialize_record_buffers(data, digest, schema_hash)
+
+        def send_pack(records) -> hangar_service_pb2.PushDataReply:
+            pack = chunks.serialize_record_pack(records)
+            cIter = chunks.tensorChunkedIterator(buf=pack, uncomp_nbytes=len(pack),
+                                                 pb2_request=hangar_service_pb2.PushDataRequest)
+            response = self.stub.PushData(cIter)
+            if pbar is not None:
+                pbar.update(len(records))
+            return response
+
+        reads, sends = deque(), deque()
+        totalSize, records, last = 0, [], None
+        read_pool = ThreadPoolExecutor(max_workers=num_readers)
+        send_pool = ThreadPoolExecutor(max_workers=num_senders)
+
+        def add_record():
+            nonlocal totalSize
+            record = reads.popleft().result()
+            records.append(record)
+            totalSize += chunks.buffers_nbytes(record)
+            if (totalSize >= self.cfg['push_max_nbytes']) or (len(records) > 2000):
+                # send tensor pack when >= configured max nbytes occupied in memory
+                submit_pack()
+
+        def submit_pack():
+            nonlocal totalSize, records, last
+            while len(sends) > num_senders:
+                last = sends.popleft().result()
+            sends.append(send_pool.submit(send_pack, records))
             totalSize, records = 0, []
-            for k in self._rFs.keys():
-                self._rFs[k].__enter__()
-            responses = []
+
+        try:
             for digest, spec in specs:
-                data = self._rFs[spec.backend].read_data(spec)
-                record = chunks.serialize_record(data, digest, schema_hash)
-                records.append(record)
-                totalSize += len(record)
-                if (totalSize >= self.cfg['push_max_nbytes']) or (len(records) > 2000):
-                    # send tensor pack when >= configured max nbytes occupied in memory
-                    pbar.update(len(records))
-                    pack = chunks.serialize_record_pack(records)
-                    cIter = chunks.tensorChunkedIterator(buf=pack, uncomp_nbytes=len(pack),
-                                                         pb2_request=hangar_service_pb2.PushDataRequest)
-                    response = self.stub.PushData.future(cIter)
-                    responses.append(response)
-                    totalSize = 0
-                    records = []
+                reads.append(read_pool.submit(read_record, digest, spec))
+                if len(reads) >= 2 * num_readers:
+                    add_record()
+            while reads:
+                add_record()
+            if totalSize > 0:
+                # finish sending all remaining tensors if max size has not been hit.
+                submit_pack()
+            while sends:
+                last = sends.popleft().result()
         except grpc.RpcError as rpc_error:
-            logger.error(rpc_error.with_traceback())
+            logger.error(rpc_error.details())
             raise rpc_error
         finally:
-            for k in self._rFs.keys():
-                self._rFs[k].__exit__()
-            if totalSize > 0:
-                # finish sending all remaining tensors if max size has not been hit.
-                pack = chunks.serialize_record_pack(records)
-                cIter = chunks.tensorChunkedIterator(buf=pack, uncomp_nbytes=len(pack),
-                                                     pb2_request=hangar_service_pb2.PushDataRequest)
-                response = self.stub.PushData.future(cIter)
-                responses.append(response)
-        for fut in responses:
-            last = fut.result()
+            for fut in (*reads, *sends):
+                fut.cancel()
+            read_pool.shutdown(wait=True)
+            send_pool.shutdown(wait=True)
+            for rFs in opened:
+                for accessor in rFs.values():
+                    accessor.close()
         return last
 
     def fetch_find_missing_commits(self, branch_name):
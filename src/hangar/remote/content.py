@@ -1,10 +1,14 @@
-from typing import NamedTuple, Union, Sequence, Tuple, List, Optional
+from contextlib import contextmanager, suppress
+from typing import (
+    Callable, Iterator, NamedTuple, Union, Sequence, Tuple, List, Optional
+)
 
 import numpy as np
 
 from ..columns.constructors import open_file_handles, column_type_object_from_schema
 from ..context import Environments
 from ..records import parsing
+from ..records.commiting import get_commit_ref_db_val, write_commit_graph_nodes
 from ..records import (
     schema_spec_from_db_val,
     hash_schema_db_key_from_raw_key,
@@ -62,6 +66,10 @@ class ContentWriter(object):
             cmtParExists = refTxn.put(commitParentKey, parentVal, overwrite=False)
             cmtRefExists = refTxn.put(commitRefKey, refVal, overwrite=False)
             cmtSpcExists = refTxn.put(commitSpecKey, specVal, overwrite=False)
+            # ancestors may not have been received yet; their graph nodes
+            # (and this one) are then computed once the history is complete.
+            with suppress(ValueError):
+                write_commit_graph_nodes(refTxn, commit)
         finally:
             self.txnctx.commit_writer_txn(self.env.refenv)
 
@@ -95,32 +103,34 @@ class ContentWriter(object):
         ret = False if not schemaExists else schema_hash
         return ret
 
-    def data(self,
-             schema_hash: str,
-             received_data: Sequence[Tuple[str, np.ndarray]],
-             backend: Optional[str] = None,
-             backend_options: Optional[dict] = None) -> List[str]:
-        """Write data content to the hash records database
+    @contextmanager
+    def data_writer(self,
+                    schema_hash: str,
+                    backend: Optional[str] = None,
+                    backend_options: Optional[dict] = None
+                    ) -> Iterator[Callable[[Sequence[Tuple[str, np.ndarray]]], List[str]]]:
+        """Keep a backend open to write many batches of data content for a schema.
+
+        Every batch is flushed to disk and its hash records are committed
+        before the write function returns, so batches are written as they
+        arrive without creating a new backend file for each.
 
         Parameters
         ----------
         schema_hash : str
             schema_hash currently being written
-        received_data : Sequence[Tuple[str, np.ndarray]]
-            list of tuples, each specifying (digest, tensor) for data retrieved
-            from the server. However, if a backend is manually specified which
-            requires different input to the ``write_data`` method than a tensor,
-            the second element can be replaced with what is appropriate for that
-            situation.
         backend : str, optional
             Manually specified backend code which will be used to record the
             data records. If not specified (``None``), the default backend
             recorded in the schema spec will be used, by default None
-
-        Returns
-        -------
-        List[str]
-            list of str of all data digests written by this method.
+        backend_options : dict, optional
+            options of the manually specified backend, by default None
+
+        Yields
+        ------
+        Callable[[Sequence[Tuple[str, np.ndarray]]], List[str]]
+            function writing a batch of (digest, data) tuples, returning the
+            digests written. See :meth:`data`.
         """
         schemaKey = hash_schema_db_key_from_raw_key(schema_hash)
         hashTxn = self.txnctx.begin_reader_txn(self.env.hashenv)
@@ -139,22 +149,57 @@ class ContentWriter(object):
                                         mode='a',
                                         schema=schema,
                                         remote_operation=True)[schema.backend]
-        try:
+
+        def write(received_data: Sequence[Tuple[str, np.ndarray]]) -> List[str]:
             saved_digests, hashKVs = [], []
-            for hdigest, tensor in received_data:
-                hashVal = be_accessor.write_data(tensor, remote_operation=True)
-                hashKey = hash_data_db_key_from_raw_key(hdigest)
-                saved_digests.append(hdigest)
-                hashKVs.append((hashKey, hashVal))
-        finally:
-            be_accessor.close()
+            with be_accessor:
+                for hdigest, tensor in received_data:
+                    hashVal = be_accessor.write_data(tensor, remote_operation=True)
+                    hashKey = hash_data_db_key_from_raw_key(hdigest)
+                    saved_digests.append(hdigest)
+                    hashKVs.append((hashKey, hashVal))
+            try:
+                hashTxn = self.txnctx.begin_writer_txn(self.env.hashenv)
+                for k, v in hashKVs:
+                    hashTxn.put(k, v)
+            finally:
+                self.txnctx.commit_writer_txn(self.env.hashenv)
+            return saved_digests
+
         try:
-            hashTxn = self.txnctx.begin_writer_txn(self.env.hashenv)
-            for k, v in hashKVs:
-                hashTxn.put(k, v)
+            yield write
         finally:
-            self.txnctx.commit_writer_txn(self.env.hashenv)
-        return saved_digests
+            be_accessor.close()
+
+    def data(self,
+             schema_hash: str,
+             received_data: Sequence[Tuple[str, np.ndarray]],
+             backend: Optional[str] = None,
+             backend_options: Optional[dict] = None) -> List[str]:
+        """Write data content to the hash records database
+
+        Parameters
+        ----------
+        schema_hash : str
+            schema_hash currently being written
+        received_data : Sequence[Tuple[str, np.ndarray]]
+            list of tuples, each specifying (digest, tensor) for data retrieved
+            from the server. However, if a backend is manually specified which
+            requires different input to the ``write_data`` method than a tensor,
+            the second element can be replaced with what is appropriate for that
+            situation.
+        backend : str, optional
+            Manually specified backend code which will be used to record the
+            data records. If not specified (``None``), the default backend
+            recorded in the schema spec will be used, by default None
+
+        Returns
+        -------
+        List[str]
+            list of str of all data digests written by this method.
+        """
+        with self.data_writer(schema_hash, backend, backend_options) as write:
+            return write(received_data)
 
 
 RawCommitContent = NamedTuple('RawCommitContent', [('commit', str),
@@ -208,6 +253,10 @@ class ContentReader(object):
         finally:
             self.txnctx.abort_reader_txn(self.env.refenv)
 
+        if (cmtRefVal is not False) and parsing.commit_ref_db_val_is_delta(cmtRefVal):
+            # remote may not hold the refs a delta is encoded against.
+            cmtRefVal = get_commit_ref_db_val(self.env.refenv, commit)
+
         ret = RawCommitContent(commit, cmtParentVal, cmtSpecVal, cmtRefVal)
 
         if not all(ret) and not isinstance(ret.cmtParentVal, bytes):
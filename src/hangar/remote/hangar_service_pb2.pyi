@@ -260,6 +260,9 @@ class FetchDataRequest(google___protobuf___message___Message):
     raw_data = ... # type: builtin___bytes
     comp_nbytes = ... # type: builtin___int
     uncomp_nbytes = ... # type: builtin___int
+    frame_nbytes = ... # type: builtin___int
+    session_id = ... # type: typing___Text
+    cursor = ... # type: builtin___int
 
     @property
     def error(self) -> ErrorProto: ...
@@ -270,6 +273,9 @@ class FetchDataRequest(google___protobuf___message___Message):
         comp_nbytes : typing___Optional[builtin___int] = None,
         uncomp_nbytes : typing___Optional[builtin___int] = None,
         error : typing___Optional[ErrorProto] = None,
+        frame_nbytes : typing___Optional[builtin___int] = None,
+        session_id : typing___Optional[typing___Text] = None,
+        cursor : typing___Optional[builtin___int] = None,
         ) -> None: ...
     @classmethod
     def FromString(cls, s: builtin___bytes) -> FetchDataRequest: ...
@@ -277,16 +283,17 @@ class FetchDataRequest(google___protobuf___message___Message):
     def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
     if sys.version_info >= (3,):
         def HasField(self, field_name: typing_extensions___Literal[u"error"]) -> builtin___bool: ...
-        def ClearField(self, field_name: typing_extensions___Literal[u"comp_nbytes",u"error",u"raw_data",u"uncomp_nbytes"]) -> None: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"comp_nbytes",u"cursor",u"error",u"frame_nbytes",u"raw_data",u"session_id",u"uncomp_nbytes"]) -> None: ...
     else:
         def HasField(self, field_name: typing_extensions___Literal[u"error",b"error"]) -> builtin___bool: ...
-        def ClearField(self, field_name: typing_extensions___Literal[u"comp_nbytes",b"comp_nbytes",u"error",b"error",u"raw_data",b"raw_data",u"uncomp_nbytes",b"uncomp_nbytes"]) -> None: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"comp_nbytes",b"comp_nbytes",u"cursor",b"cursor",u"error",b"error",u"frame_nbytes",b"frame_nbytes",u"raw_data",b"raw_data",u"session_id",b"session_id",u"uncomp_nbytes",b"uncomp_nbytes"]) -> None: ...
 
 class FetchDataReply(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
     raw_data = ... # type: builtin___bytes
     comp_nbytes = ... # type: builtin___int
     uncomp_nbytes = ... # type: builtin___int
+    cursor = ... # type: builtin___int
 
     @property
     def error(self) -> ErrorProto: ...
@@ -297,11 +304,39 @@ class FetchDataReply(google___protobuf___message___Message):
         comp_nbytes : typing___Optional[builtin___int] = None,
         uncomp_nbytes : typing___Optional[builtin___int] = None,
         error : typing___Optional[ErrorProto] = None,
+        cursor : typing___Optional[builtin___int] = None,
         ) -> None: ...
     @classmethod
     def FromString(cls, s: builtin___bytes) -> FetchDataReply: ...
     def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
     def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def HasField(self, field_name: typing_extensions___Literal[u"error"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"comp_nbytes",u"cursor",u"error",u"raw_data",u"uncomp_nbytes"]) -> None: ...
+    else:
+        def HasField(self, field_name: typing_extensions___Literal[u"error",b"error"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"comp_nbytes",b"comp_nbytes",u"cursor",b"cursor",u"error",b"error",u"raw_data",b"raw_data",u"uncomp_nbytes",b"uncomp_nbytes"]) -> None: ...
+
+class FetchDataSessionRequest(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    raw_data = ... # type: builtin___bytes
+    comp_nbytes = ... # type: builtin___int
+    uncomp_nbytes = ... # type: builtin___int
+
+    @property
+    def error(self) -> ErrorProto: ...
+
+    def __init__(self,
+        *,
+        raw_data : typing___Optional[builtin___bytes] = None,
+        comp_nbytes : typing___Optional[builtin___int] = None,
+        uncomp_nbytes : typing___Optional[builtin___int] = None,
+        error : typing___Optional[ErrorProto] = None,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> FetchDataSessionRequest: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
     if sys.version_info >= (3,):
         def HasField(self, field_name: typing_extensions___Literal[u"error"]) -> builtin___bool: ...
         def ClearField(self, field_name: typing_extensions___Literal[u"comp_nbytes",u"error",u"raw_data",u"uncomp_nbytes"]) -> None: ...
@@ -309,6 +344,31 @@ class FetchDataReply(google___protobuf___message___Message):
         def HasField(self, field_name: typing_extensions___Literal[u"error",b"error"]) -> builtin___bool: ...
         def ClearField(self, field_name: typing_extensions___Literal[u"comp_nbytes",b"comp_nbytes",u"error",b"error",u"raw_data",b"raw_data",u"uncomp_nbytes",b"uncomp_nbytes"]) -> None: ...
 
+class FetchDataSessionReply(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    session_id = ... # type: typing___Text
+    num_digests = ... # type: builtin___int
+
+    @property
+    def error(self) -> ErrorProto: ...
+
+    def __init__(self,
+        *,
+        session_id : typing___Optional[typing___Text] = None,
+        num_digests : typing___Optional[builtin___int] = None,
+        error : typing___Optional[ErrorProto] = None,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> FetchDataSessionReply: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def HasField(self, field_name: typing_extensions___Literal[u"error"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"error",u"num_digests",u"session_id"]) -> None: ...
+    else:
+        def HasField(self, field_name: typing_extensions___Literal[u"error",b"error"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"error",b"error",u"num_digests",b"num_digests",u"session_id",b"session_id"]) -> None: ...
+
 class FetchCommitRequest(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
     commit = ... # type: typing___Text
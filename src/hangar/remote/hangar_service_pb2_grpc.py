@@ -34,6 +34,11 @@ class HangarServiceStub(object):
         request_serializer=hangar__service__pb2.FetchDataRequest.SerializeToString,
         response_deserializer=hangar__service__pb2.FetchDataReply.FromString,
         )
+    self.FetchDataSession = channel.stream_unary(
+        '/hangar.HangarService/FetchDataSession',
+        request_serializer=hangar__service__pb2.FetchDataSessionRequest.SerializeToString,
+        response_deserializer=hangar__service__pb2.FetchDataSessionReply.FromString,
+        )
     self.FetchCommit = channel.unary_stream(
         '/hangar.HangarService/FetchCommit',
         request_serializer=hangar__service__pb2.FetchCommitRequest.SerializeToString,
@@ -128,6 +133,13 @@ class HangarServiceServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def FetchDataSession(self, request_iterator, context):
+    # missing associated documentation comment in .proto file
+    pass
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
   def FetchCommit(self, request, context):
     # missing associated documentation comment in .proto file
     pass
@@ -235,6 +247,11 @@ def add_HangarServiceServicer_to_server(servicer, server):
           request_deserializer=hangar__service__pb2.FetchDataRequest.FromString,
           response_serializer=hangar__service__pb2.FetchDataReply.SerializeToString,
       ),
+      'FetchDataSession': grpc.stream_unary_rpc_method_handler(
+          servicer.FetchDataSession,
+          request_deserializer=hangar__service__pb2.FetchDataSessionRequest.FromString,
+          response_serializer=hangar__service__pb2.FetchDataSessionReply.SerializeToString,
+      ),
       'FetchCommit': grpc.unary_stream_rpc_method_handler(
           servicer.FetchCommit,
           request_deserializer=hangar__service__pb2.FetchCommitRequest.FromString,
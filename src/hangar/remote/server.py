@@ -1,17 +1,22 @@
 import os
+from collections import OrderedDict
 from pathlib import Path
+from threading import Lock
 from typing import Union
+from uuid import uuid4
 import tempfile
 import warnings
 from concurrent import futures
 from os.path import join as pjoin
 import shutil
 import configparser
+import time
 from pprint import pprint as pp
 
 import blosc
 import grpc
 import lmdb
+import numpy as np
 
 from . import chunks
 from . import hangar_service_pb2
@@ -53,6 +58,44 @@ def server_config(server_dir, *, create: bool = True) -> configparser.ConfigPars
     return CFG
 
 
+class FetchSession(object):
+    """Digest list held by a fetch session, stored compactly.
+
+    Rather than a list of ``str`` objects, the (decompressed) digest list sent
+    by the client is kept as is, along with an array of the offset each digest
+    starts at. Digests are decoded when indexed.
+
+    Parameters
+    ----------
+    raw : bytes
+        ``SEP_LST`` separated digests, as sent by the client.
+    """
+
+    __slots__ = ('_raw', '_starts', 'last_access')
+
+    def __init__(self, raw: bytes):
+        self._raw = bytes(raw)
+        seps = np.flatnonzero(np.frombuffer(self._raw, dtype=np.uint8) == ord(c.SEP_LST))
+        dtype = np.uint32 if len(self._raw) < np.iinfo(np.uint32).max else np.uint64
+        self._starts = np.concatenate(([0], seps + 1, [len(self._raw) + 1])).astype(dtype)
+        self.last_access = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._starts) - 1
+
+    def __getitem__(self, idx: int) -> str:
+        if not (0 <= idx < len(self)):
+            raise IndexError(f'digest index {idx} out of range')
+        start, stop = int(self._starts[idx]), int(self._starts[idx + 1]) - 1
+        return self._raw[start:stop].decode()
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the digest list and offsets of the session.
+        """
+        return len(self._raw) + self._starts.nbytes
+
+
 class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
 
     def __init__(self, repo_path: Union[str, bytes, Path], overwrite=False):
@@ -89,6 +132,9 @@ class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
         self.repo_path = self.env.repo_path
         self.data_dir = pjoin(self.repo_path, c.DIR_DATA)
         self.CW = ContentWriter(self.env)
+        self._fetch_sessions = OrderedDict()
+        self._fetch_sessions_nbytes = 0
+        self._fetch_sessions_lock = Lock()
 
     def close(self):
         for backend_accessor in self._rFs.values():
@@ -108,12 +154,14 @@ class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
         """
         clientCFG = self.CFG['CLIENT_GRPC']
         push_max_nbytes = clientCFG['push_max_nbytes']
+        fetch_frame_nbytes = clientCFG.get('fetch_frame_nbytes', '0')
         enable_compression = clientCFG['enable_compression']
         optimization_target = clientCFG['optimization_target']
 
         err = hangar_service_pb2.ErrorProto(code=0, message='OK')
         reply = hangar_service_pb2.GetClientConfigReply(error=err)
         reply.config['push_max_nbytes'] = push_max_nbytes
+        reply.config['fetch_frame_nbytes'] = fetch_frame_nbytes
         reply.config['enable_compression'] = enable_compression
         reply.config['optimization_target'] = optimization_target
         return reply
@@ -178,6 +226,8 @@ class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
         finally:
             self.txnregister.abort_reader_txn(self.env.refenv)
 
+        if (commitRefVal is not False) and parsing.commit_ref_db_val_is_delta(commitRefVal):
+            commitRefVal = commiting.get_commit_ref_db_val(self.env.refenv, commit)
         if commitRefVal is False:
             msg = f'COMMIT: {commit} DOES NOT EXIST ON SERVER'
             context.set_details(msg)
@@ -293,16 +343,30 @@ class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
         excess of this limit, we just say sorry to the client, send the chunk
         of digests/tensors off to them as is (incomplete), and request that
         the client figure out what it still needs and ask us again.
+
+        If the client sets ``frame_nbytes`` in its request, records are not
+        gathered into a single pack. Instead, they are streamed back in frames
+        (see :meth:`_stream_data_frames`) as soon as they are read.
+
+        If the client sets ``session_id``, no digests are sent with the
+        request. Records are instead sent for the digests held by a session
+        opened with :meth:`FetchDataSession`, starting at index ``cursor``.
         """
         for idx, request in enumerate(request_iterator):
             if idx == 0:
                 uncomp_nbytes = request.uncomp_nbytes
                 comp_nbytes = request.comp_nbytes
+                frame_nbytes = request.frame_nbytes
+                session_id, cursor = request.session_id, request.cursor
                 dBytes, offset = bytearray(comp_nbytes), 0
             size = len(request.raw_data)
             dBytes[offset: offset + size] = request.raw_data
             offset += size
 
+        if session_id:
+            yield from self._stream_session_frames(session_id, cursor, frame_nbytes, context)
+            return
+
         uncompBytes = blosc.decompress(dBytes)
         if uncomp_nbytes != len(uncompBytes):
             msg = f'Expected nbytes data sent: {uncomp_nbytes} != received {comp_nbytes}'
@@ -313,8 +377,12 @@ class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
             yield reply
             raise StopIteration()
 
-        totalSize, records = 0, []
         unpacked_digests = uncompBytes.decode().split(c.SEP_LST)
+        if frame_nbytes > 0:
+            yield from self._stream_data_frames(unpacked_digests, frame_nbytes, context)
+            return
+
+        totalSize, records = 0, []
         hashTxn = self.txnregister.begin_reader_txn(self.env.hashenv)
 
         try:
@@ -334,9 +402,9 @@ class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
                     spec = backend_decoder(hashVal)
                     data = self._rFs[spec.backend].read_data(spec)
 
-                record = chunks.serialize_record(data, digest, '')
+                record = chunks.serialize_record_buffers(data, digest, '')
                 records.append(record)
-                totalSize += len(record)
+                totalSize += chunks.buffers_nbytes(record)
                 if totalSize >= fetch_max_nbytes:
                     pack = chunks.serialize_record_pack(records)
                     err = hangar_service_pb2.ErrorProto(code=0, message='OK')
@@ -363,6 +431,203 @@ class HangarServer(hangar_service_pb2_grpc.HangarServiceServicer):
                 yield from cIter
             self.txnregister.abort_reader_txn(self.env.hashenv)
 
+    def _stream_session_frames(self, session_id, cursor, frame_nbytes, context):
+        """Send the records of a fetch session, starting at some cursor.
+
+        One page of at most ``fetch_max_nbytes`` is sent per call; the client
+        requests the next page with the cursor reported by the last frame it
+        received. Once every record has been sent the session is closed.
+        """
+        with self._fetch_sessions_lock:
+            self._evict_fetch_sessions()
+            digests = self._fetch_sessions.get(session_id)
+            if digests is not None:
+                digests.last_access = time.monotonic()
+                self._fetch_sessions.move_to_end(session_id)
+        if digests is None:
+            msg = f'FETCH SESSION DOES NOT EXIST: {session_id}'
+            context.set_details(msg)
+            context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+            err = hangar_service_pb2.ErrorProto(code=9, message=msg)
+            yield hangar_service_pb2.FetchDataReply(error=err)
+            return
+        if not (0 <= cursor <= len(digests)):
+            msg = f'CURSOR: {cursor} OUT OF RANGE OF SESSION WITH {len(digests)} DIGESTS'
+            context.set_details(msg)
+            context.set_code(grpc.StatusCode.OUT_OF_RANGE)
+            err = hangar_service_pb2.ErrorProto(code=11, message=msg)
+            yield hangar_service_pb2.FetchDataReply(error=err)
+            return
+
+        if frame_nbytes <= 0:
+            frame_nbytes = int(self.CFG['SERVER_GRPC']['fetch_max_nbytes'])
+        yield from self._stream_data_frames(
+            digests, frame_nbytes, context, cursor=cursor, session_id=session_id)
+
+    def _stream_data_frames(self, digests, frame_nbytes, context, *, cursor=0, session_id=None):
+        """Read and send the records of some digests as a stream of frames.
+
+        Records are packed into a frame until it holds at least
+        ``frame_nbytes`` (capped at ``fetch_max_nbytes``). Each frame is then
+        compressed and chunked on its own and sent before more data is read,
+        so no more than about one frame of records is held in memory at a time.
+        Every frame reports the index of the digest following its last record
+        as its ``cursor``. As in the single pack mode, once ``fetch_max_nbytes``
+        have been sent in total the stream ends with a ``RESOURCE_EXHAUSTED``
+        status, unless records are sent for a fetch session; in that case the
+        stream just ends, and the client asks for the next page.
+
+        Parameters
+        ----------
+        digests : Sequence[str]
+            data digests requested by the client.
+        frame_nbytes : int
+            requested (uncompressed) size of each frame.
+        context
+            grpc context of the rpc.
+        cursor : int, optional, kwarg-only
+            index of the first digest to send, by default 0
+        session_id : str, optional, kwarg-only
+            id of the fetch session the digests are held by, if any. The
+            session is closed once its last record is sent.
+
+        Yields
+        ------
+        hangar_service_pb2.FetchDataReply
+            chunks of each compressed frame, in order.
+        """
+        fetch_max_nbytes = int(self.CFG['SERVER_GRPC']['fetch_max_nbytes'])
+        frame_nbytes = min(frame_nbytes, fetch_max_nbytes)
+        ok = hangar_service_pb2.ErrorProto(code=0, message='OK')
+        totalSize, frameSize, records = 0, 0, []
+        hashTxn = self.txnregister.begin_reader_txn(self.env.hashenv)
+        try:
+            for idx in range(cursor, len(digests)):
+                digest = digests[idx]
+                hashKey = hash_data_db_key_from_raw_key(digest)
+                hashVal = hashTxn.get(hashKey, default=False)
+                if hashVal is False:
+                    msg = f'HASH DOES NOT EXIST: {hashKey}'
+                    context.set_details(msg)
+                    context.set_code(grpc.StatusCode.NOT_FOUND)
+                    err = hangar_service_pb2.ErrorProto(code=5, message=msg)
+                    yield hangar_service_pb2.FetchDataReply(error=err)
+                    return
+
+                spec = backend_decoder(hashVal)
+                data = self._rFs[spec.backend].read_data(spec)
+                record = chunks.serialize_record_buffers(data, digest, '')
+                records.append(record)
+                recordSize = chunks.buffers_nbytes(record)
+                frameSize += recordSize
+                totalSize += recordSize
+                cursor = idx + 1
+                if frameSize >= frame_nbytes:
+                    pack = chunks.serialize_record_pack(records)
+                    frameSize, records = 0, []
+                    yield from chunks.tensorChunkedIterator(
+                        buf=pack, uncomp_nbytes=len(pack),
+                        pb2_request=hangar_service_pb2.FetchDataReply, err=ok, cursor=cursor)
+                if totalSize >= fetch_max_nbytes:
+                    break
+            else:  # N.B. for-else loop (ie. "no-break")
+                totalSize = 0
+
+            if records:
+                pack = chunks.serialize_record_pack(records)
+                yield from chunks.tensorChunkedIterator(
+                    buf=pack, uncomp_nbytes=len(pack),
+                    pb2_request=hangar_service_pb2.FetchDataReply, err=ok, cursor=cursor)
+            if session_id is not None:
+                if cursor == len(digests):
+                    with self._fetch_sessions_lock:
+                        self._close_fetch_session(session_id)
+            elif totalSize >= fetch_max_nbytes:
+                msg = 'HANGAR REQUESTED RETRY: developer enforced limit on returned '\
+                      'raw data size to prevent memory overload of user system.'
+                context.set_details(msg)
+                context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+                err = hangar_service_pb2.ErrorProto(code=8, message=msg)
+                yield hangar_service_pb2.FetchDataReply(error=err, raw_data=b'')
+        finally:
+            self.txnregister.abort_reader_txn(self.env.hashenv)
+
+    def FetchDataSession(self, request_iterator, context):
+        """Open a fetch session holding a list of digests requested by a client.
+
+        The digest list is sent only once; the records are then requested page
+        by page through :meth:`FetchData` with the ``session_id`` and a
+        ``cursor`` into the list. As the cursor is chosen by the client, an
+        interrupted transfer resumes from the last record the client received.
+        The digests are held compactly (see :class:`FetchSession`). At most
+        ``fetch_max_sessions`` sessions, holding at most
+        ``fetch_max_session_nbytes`` in total, are kept; least recently used
+        sessions are closed to open another. Sessions which are not used for
+        ``fetch_session_ttl`` seconds are closed as well.
+        """
+        for idx, request in enumerate(request_iterator):
+            if idx == 0:
+                uncomp_nbytes = request.uncomp_nbytes
+                comp_nbytes = request.comp_nbytes
+                dBytes, offset = bytearray(comp_nbytes), 0
+            size = len(request.raw_data)
+            dBytes[offset: offset + size] = request.raw_data
+            offset += size
+
+        uncompBytes = blosc.decompress(dBytes)
+        if uncomp_nbytes != len(uncompBytes):
+            msg = f'Expected nbytes data sent: {uncomp_nbytes} != received {comp_nbytes}'
+            context.set_details(msg)
+            context.set_code(grpc.StatusCode.DATA_LOSS)
+            err = hangar_service_pb2.ErrorProto(code=15, message=msg)
+            return hangar_service_pb2.FetchDataSessionReply(error=err)
+
+        digests = FetchSession(uncompBytes)
+        max_nbytes = int(self.CFG['SERVER_GRPC'].get('fetch_max_session_nbytes', '1_000_000_000'))
+        if digests.nbytes > max_nbytes:
+            msg = f'FETCH SESSION OF {digests.nbytes} BYTES EXCEEDS LIMIT OF {max_nbytes}'
+            context.set_details(msg)
+            context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+            err = hangar_service_pb2.ErrorProto(code=8, message=msg)
+            return hangar_service_pb2.FetchDataSessionReply(error=err)
+
+        session_id = uuid4().hex
+        with self._fetch_sessions_lock:
+            self._fetch_sessions[session_id] = digests
+            self._fetch_sessions_nbytes += digests.nbytes
+            self._evict_fetch_sessions()
+
+        err = hangar_service_pb2.ErrorProto(code=0, message='OK')
+        reply = hangar_service_pb2.FetchDataSessionReply(
+            session_id=session_id, num_digests=len(digests), error=err)
+        return reply
+
+    def _close_fetch_session(self, session_id: str):
+        """Forget a fetch session, must hold ``_fetch_sessions_lock``.
+        """
+        digests = self._fetch_sessions.pop(session_id, None)
+        if digests is not None:
+            self._fetch_sessions_nbytes -= digests.nbytes
+
+    def _evict_fetch_sessions(self):
+        """Close expired sessions, then least recently used ones while over the limits.
+
+        Must hold ``_fetch_sessions_lock``.
+        """
+        cfg = self.CFG['SERVER_GRPC']
+        max_sessions = int(cfg.get('fetch_max_sessions', '64'))
+        max_nbytes = int(cfg.get('fetch_max_session_nbytes', '1_000_000_000'))
+        ttl = float(cfg.get('fetch_session_ttl', '3600'))
+
+        expired = time.monotonic() - ttl
+        for session_id, digests in list(self._fetch_sessions.items()):
+            if digests.last_access < expired:
+                self._close_fetch_session(session_id)
+        while (len(self._fetch_sessions) > max_sessions) \
+                or (self._fetch_sessions_nbytes > max_nbytes):
+            session_id = next(iter(self._fetch_sessions))
+            self._close_fetch_session(session_id)
+
     def PushData(self, request_iterator, context):
         """Receive compressed streams of binary data from the client.
 
@@ -3,7 +3,7 @@ import tempfile
 import time
 import warnings
 from collections import defaultdict
-from contextlib import closing
+from contextlib import closing, ExitStack
 from pathlib import Path
 from typing import List, NamedTuple, Optional, Sequence
 
@@ -281,7 +281,8 @@ class Remotes(object):
                    *,
                    column_names: Optional[Sequence[str]] = None,
                    max_num_bytes: int = None,
-                   retrieve_all_history: bool = False) -> List[str]:
+                   retrieve_all_history: bool = False,
+                   num_streams: int = 1) -> List[str]:
         """Retrieve the data for some commit which exists in a `partial` state.
 
         Parameters
@@ -306,6 +307,11 @@ class Remotes(object):
         retrieve_all_history : Optional[bool]
             if data should be retrieved for all history accessible by the parents
             of this commit HEAD. by default False
+        num_streams : Optional[int]
+            number of streams used to fetch data from the server at once. The
+            digests of every schema are split into shards which are fetched
+            concurrently, while the received data is written to disk by the
+            calling thread. by default 1
 
         Returns
         -------
@@ -397,12 +403,16 @@ class Remotes(object):
         total_data = sum(len(v) for v in m_schema_hash_map.values())
         with closing(self._client) as client, tqdm(total=total_data, desc='fetching data') as pbar:
             client: HangarClient  # type hint
-            stop = False
-            for schema in m_schema_hash_map.keys():
-                hashes = set(m_schema_hash_map[schema])
-                while (len(hashes) > 0) and (not stop):
-                    ret = client.fetch_data(schema, hashes)
+            # frames are received, decompressed and verified by concurrent
+            # streams; only this thread writes them to disk, keeping one backend
+            # writer open per schema.
+            frames = client.iter_fetch_data_concurrent(m_schema_hash_map, num_streams=num_streams)
+            with ExitStack() as stack:
+                stack.enter_context(closing(frames))
+                writers = {}
+                for schema, ret in frames:
                     # max_num_bytes option
+                    stop = False
                     if isinstance(max_num_bytes, int):
                         for idx, r_kv in enumerate(ret):
                             try:
@@ -413,9 +423,12 @@ class Remotes(object):
                                 ret = ret[0:idx]
                                 stop = True
                                 break
-                    saved_digests = CW.data(schema, ret)
+                    if schema not in writers:
+                        writers[schema] = stack.enter_context(CW.data_writer(schema))
+                    saved_digests = writers[schema](ret)
                     pbar.update(len(saved_digests))
-                    hashes = hashes.difference(set(saved_digests))
+                    if stop:
+                        break
 
         move_process_data_to_store(self._repo_path, remote_operation=True)
         return commits
@@ -541,7 +554,6 @@ class Remotes(object):
             with tqdm(total=total_data, desc='pushing data') as p:
                 for dataSchema, dataHashes in m_schema_hashs.items():
                     client.push_data(dataSchema, dataHashes, pbar=p)
-                    p.update(1)
             # commit refs
             for commit in tqdm(m_commits, desc='pushing commit refs'):
                 cmtContent = CR.commit(commit)
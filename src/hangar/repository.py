@@ -3,6 +3,7 @@ import weakref
 import warnings
 from typing import Union, Optional, List
 
+from .backends.checksums import ChecksumPolicy
 from .merger import select_merge_algorithm
 from .constants import DIR_HANGAR
 from .remotes import Remotes
@@ -227,7 +228,10 @@ class Repository(object):
                  write: bool = False,
                  *,
                  branch: str = '',
-                 commit: str = '') -> Union[ReaderCheckout, WriterCheckout]:
+                 commit: str = '',
+                 checksum_policy: str = 'always',
+                 lazy_specs: bool = False,
+                 compact_specs: bool = False) -> Union[ReaderCheckout, WriterCheckout]:
         """Checkout the repo at some point in time in either `read` or `write` mode.
 
         Only one writer instance can exist at a time. Write enabled checkout
@@ -248,6 +252,24 @@ class Repository(object):
             branch ``HEAD`` commit). This argument takes precedent over a branch
             name parameter if it is set. Note: this only will be used in
             non-writeable checkouts, defaults to ''
+        checksum_policy : str, optional
+            when data checksums are verified as data is read. One of
+            ``'always'``, ``'first-read-per-file-per-process'``,
+            ``'sampled(p)'`` (where ``p`` is a probability between 0 and 1), or
+            ``'off'``. Note: only ``'always'`` is allowed in write-enabled
+            checkouts, defaults to 'always'
+        lazy_specs : bool, optional
+            if True, flat columns only load the data digest of each sample when
+            they are first accessed; the location of the data on disk is looked
+            up (and cached) the first time a sample is read. Reduces checkout
+            time and memory use for columns with very many samples. Note: only
+            allowed in non-writeable checkouts, defaults to False
+        compact_specs : bool, optional
+            if True, flat columns store the location on disk of each sample in
+            a compact array backed table rather than as one object per sample.
+            Reduces memory use for columns with very many samples. Cannot be
+            combined with ``lazy_specs``. Note: only allowed in non-writeable
+            checkouts, defaults to False
 
         Raises
         ------
@@ -256,6 +278,12 @@ class Repository(object):
         ValueError
             If ``commit`` argument is set to any value when ``write=True``.
             Only ``branch`` argument is allowed.
+        ValueError
+            If ``checksum_policy`` is not a valid policy, or is set to anything
+            other than ``'always'`` when ``write=True``.
+        ValueError
+            If ``lazy_specs`` or ``compact_specs`` is True when ``write=True``,
+            or if both are True.
 
         Returns
         -------
@@ -270,6 +298,14 @@ class Repository(object):
                     raise ValueError(
                         f'Only `branch` argument can be set if `write=True`. '
                         f'Setting `commit={commit}` not allowed.')
+                if checksum_policy != 'always':
+                    raise ValueError(
+                        f'Setting `checksum_policy={checksum_policy}` is only '
+                        f'allowed if `write=False`.')
+                if lazy_specs or compact_specs:
+                    raise ValueError(
+                        'Setting `lazy_specs=True` or `compact_specs=True` is '
+                        'only allowed if `write=False`.')
                 if branch == '':
                     branch = heads.get_staging_branch_head(self._env.branchenv)
                 co = WriterCheckout(
@@ -279,9 +315,14 @@ class Repository(object):
                     refenv=self._env.refenv,
                     stageenv=self._env.stageenv,
                     branchenv=self._env.branchenv,
-                    stagehashenv=self._env.stagehashenv)
+                    stagehashenv=self._env.stagehashenv,
+                    stagedigestenv=self._env.stagedigestenv)
                 return co
             elif write is False:
+                if lazy_specs and compact_specs:
+                    raise ValueError(
+                        '`lazy_specs` and `compact_specs` cannot both be True.')
+                policy = ChecksumPolicy(checksum_policy)
                 commit_hash = self._env.checkout_commit(
                     branch_name=branch, commit=commit)
                 co = ReaderCheckout(
@@ -290,7 +331,10 @@ class Repository(object):
                     hashenv=self._env.hashenv,
                     branchenv=self._env.branchenv,
                     refenv=self._env.refenv,
-                    commit=commit_hash)
+                    commit=commit_hash,
+                    checksum_policy=policy,
+                    lazy_specs=lazy_specs,
+                    compact_specs=compact_specs)
                 return co
             else:
                 raise ValueError("Argument `write` only takes True or False as value")
@@ -540,7 +584,8 @@ class Repository(object):
             stagehashenv=self._env.stagehashenv,
             master_branch=master_branch,
             dev_branch=dev_branch,
-            repo_path=self._repo_path)
+            repo_path=self._repo_path,
+            stagedigestenv=self._env.stagedigestenv)
 
         return commit_hash
 
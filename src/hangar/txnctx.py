@@ -1,3 +1,4 @@
+import threading
 from collections import Counter
 from typing import MutableMapping
 
@@ -6,24 +7,56 @@ import lmdb
 
 class TxnRegisterSingleton(type):
     _instances = {}
+    _lock = threading.Lock()
+
     def __call__(cls, *args, **kwargs):
         if cls not in cls._instances:
-            cls._instances[cls] = super(TxnRegisterSingleton, cls).__call__(*args, **kwargs)
+            with cls._lock:
+                if cls not in cls._instances:
+                    cls._instances[cls] = super(TxnRegisterSingleton, cls).__call__(*args, **kwargs)
         return cls._instances[cls]
 
 
 class TxnRegister(metaclass=TxnRegisterSingleton):
     """Singleton to manage transaction thread safety in lmdb databases.
 
-    This is essentailly a reference counting transaction register, lots of room
-    for improvement here.
+    This is essentailly a reference counting transaction register. Reader
+    transactions are registered per thread, so each thread which reads from an
+    environment holds its own (reference counted) transaction handle; readers
+    can therefore be used concurrently from a thread pool.
+
+    Writer transactions are registered process wide behind a lock. Only one
+    thread at a time may hold the writer transaction for an environment;
+    requests from other threads block until every reference held by the owning
+    thread has been committed.
     """
 
     def __init__(self):
+        self._local = threading.local()
+        self._writer_cond = threading.Condition(threading.RLock())
         self.WriterAncestors = Counter()
-        self.ReaderAncestors = Counter()
         self.WriterTxn: MutableMapping[lmdb.Environment, lmdb.Transaction] = {}
-        self.ReaderTxn: MutableMapping[lmdb.Environment, lmdb.Transaction] = {}
+        self.WriterThread: MutableMapping[lmdb.Environment, int] = {}
+
+    @property
+    def ReaderAncestors(self) -> Counter:
+        """Reference counts of reader transactions opened by the calling thread.
+        """
+        try:
+            return self._local.ReaderAncestors
+        except AttributeError:
+            self._local.ReaderAncestors = Counter()
+            return self._local.ReaderAncestors
+
+    @property
+    def ReaderTxn(self) -> MutableMapping[lmdb.Environment, lmdb.Transaction]:
+        """Reader transactions opened by the calling thread.
+        """
+        try:
+            return self._local.ReaderTxn
+        except AttributeError:
+            self._local.ReaderTxn = {}
+            return self._local.ReaderTxn
 
     @property
     def _debug_(self):  # pragma: no cover
@@ -32,6 +65,7 @@ class TxnRegister(metaclass=TxnRegisterSingleton):
             'WriterAncestors': self.WriterAncestors,
             'ReaderAncestors': self.ReaderAncestors,
             'WriterTxn': self.WriterTxn,
+            'WriterThread': self.WriterThread,
             'ReaderTxn': self.ReaderTxn,
         }
 
@@ -41,7 +75,9 @@ class TxnRegister(metaclass=TxnRegisterSingleton):
 
         If multiple write transactions are requested for the same handle, only
         one instance of the transaction handle will be returened, and will not
-        close until all operations on that handle have requested to close
+        close until all operations on that handle have requested to close. If
+        the transaction is held by another thread, this blocks until it is
+        committed.
 
         Parameters
         ----------
@@ -56,18 +92,24 @@ class TxnRegister(metaclass=TxnRegisterSingleton):
         lmdb.Transaction
             transaction handle to perform operations on
         """
-        if self.WriterAncestors[lmdbenv] == 0:
-            self.WriterTxn[lmdbenv] = lmdbenv.begin(write=True, buffers=buffer)
-        self.WriterAncestors[lmdbenv] += 1
-        return self.WriterTxn[lmdbenv]
+        thread = threading.get_ident()
+        with self._writer_cond:
+            self._writer_cond.wait_for(
+                lambda: self.WriterThread.get(lmdbenv, thread) == thread)
+            if self.WriterAncestors[lmdbenv] == 0:
+                self.WriterTxn[lmdbenv] = lmdbenv.begin(write=True, buffers=buffer)
+                self.WriterThread[lmdbenv] = thread
+            self.WriterAncestors[lmdbenv] += 1
+            return self.WriterTxn[lmdbenv]
 
     def begin_reader_txn(self, lmdbenv: lmdb.Environment,
                          buffer: bool = False) -> lmdb.Transaction:
         """Start a reader only txn for the given environment
 
         If there a read-only transaction for the same environment already exists
-        then the same reader txn handle will be returned, and will not close
-        until all operations on that handle have said they are finished.
+        (in the calling thread) then the same reader txn handle will be returned,
+        and will not close until all operations on that handle have said they
+        are finished.
 
         Parameters
         ----------
@@ -82,10 +124,11 @@ class TxnRegister(metaclass=TxnRegisterSingleton):
         lmdb.Transaction
             handle to the lmdb transaction.
         """
-        if self.ReaderAncestors[lmdbenv] == 0:
-            self.ReaderTxn[lmdbenv] = lmdbenv.begin(write=False, buffers=buffer)
-        self.ReaderAncestors[lmdbenv] += 1
-        return self.ReaderTxn[lmdbenv]
+        ancestors, txns = self.ReaderAncestors, self.ReaderTxn
+        if ancestors[lmdbenv] == 0:
+            txns[lmdbenv] = lmdbenv.begin(write=False, buffers=buffer)
+        ancestors[lmdbenv] += 1
+        return txns[lmdbenv]
 
     def commit_writer_txn(self, lmdbenv: lmdb.Environment) -> bool:
         """Commit changes made in a write-enable transaction handle
@@ -102,7 +145,8 @@ class TxnRegister(metaclass=TxnRegisterSingleton):
         Raises
         ------
         RuntimeError
-            If the internal reference counting gets out of sync
+            If the internal reference counting gets out of sync, or if the
+            transaction is held by a different thread.
 
         Returns
         -------
@@ -110,25 +154,77 @@ class TxnRegister(metaclass=TxnRegisterSingleton):
             True if this operation actually committed, otherwise false
             if other objects have references to the same (open) handle
         """
-        ancestors = self.WriterAncestors[lmdbenv]
-        if ancestors == 0:
-            msg = f'hash ancestors are zero but commit called on {lmdbenv}'
-            raise RuntimeError(msg)
-        elif ancestors == 1:
-            self.WriterTxn[lmdbenv].commit()
-            self.WriterTxn.__delitem__(lmdbenv)
-            ret = True
-        else:
-            ret = False
-        self.WriterAncestors[lmdbenv] -= 1
-        return ret
+        with self._writer_cond:
+            ancestors = self.WriterAncestors[lmdbenv]
+            if ancestors == 0:
+                msg = f'hash ancestors are zero but commit called on {lmdbenv}'
+                raise RuntimeError(msg)
+            elif self.WriterThread[lmdbenv] != threading.get_ident():
+                msg = f'writer txn on {lmdbenv} is held by a different thread'
+                raise RuntimeError(msg)
+            elif ancestors == 1:
+                try:
+                    self.WriterTxn[lmdbenv].commit()
+                finally:
+                    self.WriterTxn.__delitem__(lmdbenv)
+                    self.WriterThread.__delitem__(lmdbenv)
+                    self.WriterAncestors[lmdbenv] -= 1
+                    self._writer_cond.notify_all()
+                return True
+            self.WriterAncestors[lmdbenv] -= 1
+            return False
+
+    def abort_writer_txn(self, lmdbenv: lmdb.Environment) -> bool:
+        """Discard changes made in a write-enabled transaction handle
+
+        Analogous to :meth:`commit_writer_txn`; the transaction is not actually
+        aborted until all objects holding a reference to the open handle have
+        called either method. Whichever call releases the last reference
+        decides if the changes are kept.
+
+        Parameters
+        ----------
+        lmdbenv : lmdb.Environment
+            the environment handle used to open the transaction
+
+        Raises
+        ------
+        RuntimeError
+            If the internal reference counting gets out of sync, or if the
+            transaction is held by a different thread.
+
+        Returns
+        -------
+        bool
+            True if this operation actually aborted, otherwise false if other
+            objects have references to the same (open) handle
+        """
+        with self._writer_cond:
+            ancestors = self.WriterAncestors[lmdbenv]
+            if ancestors == 0:
+                msg = f'hash ancestors are zero but abort called on {lmdbenv}'
+                raise RuntimeError(msg)
+            elif self.WriterThread[lmdbenv] != threading.get_ident():
+                msg = f'writer txn on {lmdbenv} is held by a different thread'
+                raise RuntimeError(msg)
+            elif ancestors == 1:
+                try:
+                    self.WriterTxn[lmdbenv].abort()
+                finally:
+                    self.WriterTxn.__delitem__(lmdbenv)
+                    self.WriterThread.__delitem__(lmdbenv)
+                    self.WriterAncestors[lmdbenv] -= 1
+                    self._writer_cond.notify_all()
+                return True
+            self.WriterAncestors[lmdbenv] -= 1
+            return False
 
     def abort_reader_txn(self, lmdbenv: lmdb.Environment) -> bool:
         """Request to close a read-only transaction handle
 
         As multiple objects can have references to the same open transaction
         handle, the transaction is not actuall aborted until all open transactions
-        have called the abort method
+        (in the calling thread) have called the abort method
 
 
         Parameters
@@ -148,14 +244,14 @@ class TxnRegister(metaclass=TxnRegisterSingleton):
             otherwise False if other objects have references to the same (open)
             handle.
         """
-        ancestors = self.ReaderAncestors[lmdbenv]
-        if ancestors == 0:
+        ancestors, txns = self.ReaderAncestors, self.ReaderTxn
+        if ancestors[lmdbenv] == 0:
             raise RuntimeError(f'hash ancestors are zero but abort called')
-        elif ancestors == 1:
-            self.ReaderTxn[lmdbenv].abort()
-            self.ReaderTxn.__delitem__(lmdbenv)
+        elif ancestors[lmdbenv] == 1:
+            txns[lmdbenv].abort()
+            txns.__delitem__(lmdbenv)
             ret = True
         else:
             ret = False
-        self.ReaderAncestors[lmdbenv] -= 1
+        ancestors[lmdbenv] -= 1
         return ret
@@ -228,6 +228,27 @@ def ilen(iterable):
     return next(counter)
 
 
+def consecutive_runs(pairs):
+    """Group sorted ``(location, item)`` pairs into runs of consecutive locations.
+
+    Yields the first location of each run along with the list of items in it.
+
+    >>> list(consecutive_runs([(0, 'a'), (1, 'b'), (3, 'c'), (4, 'd'), (4, 'e')]))
+    [(0, ['a', 'b']), (3, ['c', 'd']), (4, ['e'])]
+    """
+    start, prev, items = None, None, []
+    for location, item in pairs:
+        if items and location == prev + 1:
+            items.append(item)
+        else:
+            if items:
+                yield (start, items)
+            start, items = location, [item]
+        prev = location
+    if items:
+        yield (start, items)
+
+
 def find_next_prime(N: int) -> int:
     """Find next prime >= N
 
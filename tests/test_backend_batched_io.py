@@ -0,0 +1,191 @@
+import pytest
+import numpy as np
+
+from hangar.backends import backend_decoder
+
+
+@pytest.mark.parametrize('backend', ['00', '01', '10'])
+@pytest.mark.parametrize('num', [1, 19, 20, 21, 150])
+def test_ndarray_write_data_batch_matches_read(repo, backend, num):
+    wco = repo.checkout(write=True)
+    aset = wco.add_ndarray_column('aset', shape=(5, 7), dtype=np.float32, backend=backend)
+    arrays = [np.random.randn(5, 7).astype(np.float32) for _ in range(num)]
+    with aset:
+        be = aset._be_fs[backend]
+        specs = be.write_data_batch(arrays)
+        assert len(specs) == num
+        decoded = [backend_decoder(spec) for spec in specs]
+        assert len(set(map(tuple, decoded))) == num
+        for spec, arr in zip(decoded, arrays):
+            assert spec.backend == backend
+            assert np.allclose(be.read_data(spec), arr)
+    wco.close()
+
+
+@pytest.mark.parametrize('backend', ['00', '01', '10'])
+def test_ndarray_write_data_batch_continues_after_single_writes(repo, backend):
+    wco = repo.checkout(write=True)
+    aset = wco.add_ndarray_column('aset', shape=(5, 7), dtype=np.float32, backend=backend)
+    with aset:
+        be = aset._be_fs[backend]
+        first = np.ones((5, 7), dtype=np.float32)
+        single_spec = backend_decoder(be.write_data(first))
+        arrays = [np.full((5, 7), i, dtype=np.float32) for i in range(30)]
+        batch_specs = [backend_decoder(spec) for spec in be.write_data_batch(arrays)]
+        last = np.zeros((5, 7), dtype=np.float32) - 1
+        last_spec = backend_decoder(be.write_data(last))
+
+        batch_locations = [tuple(spec) for spec in batch_specs]
+        assert tuple(single_spec) not in batch_locations
+        assert tuple(last_spec) not in batch_locations
+        assert np.allclose(be.read_data(single_spec), first)
+        assert np.allclose(be.read_data(last_spec), last)
+        for spec, arr in zip(batch_specs, arrays):
+            assert np.allclose(be.read_data(spec), arr)
+    wco.close()
+
+
+@pytest.mark.parametrize('backend', ['00', '10'])
+def test_ndarray_write_data_batch_variable_shape(repo, backend):
+    wco = repo.checkout(write=True)
+    aset = wco.add_ndarray_column(
+        'aset', shape=(10, 10), dtype=np.float64, variable_shape=True, backend=backend)
+    arrays = [np.random.randn(np.random.randint(1, 10), 3) for _ in range(45)]
+    with aset:
+        be = aset._be_fs[backend]
+        specs = [backend_decoder(spec) for spec in be.write_data_batch(arrays)]
+        for spec, arr in zip(specs, arrays):
+            assert spec.shape == arr.shape
+            res = be.read_data(spec)
+            assert res.shape == arr.shape
+            assert np.allclose(res, arr)
+    wco.close()
+
+
+def test_write_data_batch_empty_input(repo):
+    wco = repo.checkout(write=True)
+    aset = wco.add_ndarray_column('aset', shape=(5, 7), dtype=np.float32, backend='01')
+    with aset:
+        assert aset._be_fs['01'].write_data_batch([]) == []
+    wco.close()
+
+
+@pytest.mark.parametrize('backend,column_type', [('30', 'str'), ('31', 'bytes')])
+@pytest.mark.parametrize('nbytes', [10, 10_000])
+def test_lmdb_write_data_batch_matches_read(repo, backend, column_type, nbytes):
+    wco = repo.checkout(write=True)
+    if column_type == 'str':
+        aset = wco.add_str_column('aset', backend=backend)
+        data = [f'{i}'.ljust(nbytes, 'a') for i in range(300)]
+    else:
+        aset = wco.add_bytes_column('aset', backend=backend)
+        data = [f'{i}'.ljust(nbytes, 'a').encode() for i in range(300)]
+    with aset:
+        be = aset._be_fs[backend]
+        specs = [backend_decoder(spec) for spec in be.write_data_batch(data)]
+        assert len(set(map(tuple, specs))) == len(data)
+        if nbytes == 10_000:
+            # 3MB of data cannot fit into the 1MB lmdb map size used in tests.
+            assert len({spec.uid for spec in specs}) > 1
+        for spec, val in zip(specs, data):
+            assert be.read_data(spec) == val
+    wco.close()
+
+
+@pytest.fixture(params=['00', '01', '10'])
+def written_ndarray_backend(request, repo):
+    wco = repo.checkout(write=True)
+    aset = wco.add_ndarray_column('aset', shape=(5, 7), dtype=np.float32, backend=request.param)
+    arrays = [np.random.randn(5, 7).astype(np.float32) for _ in range(130)]
+    with aset:
+        be = aset._be_fs[request.param]
+        specs = [backend_decoder(spec) for spec in be.write_data_batch(arrays)]
+        yield (be, specs, arrays)
+    wco.close()
+
+
+@pytest.mark.parametrize('order', ['forward', 'reversed', 'shuffled'])
+def test_read_data_batch_matches_single_reads(written_ndarray_backend, order):
+    be, specs, arrays = written_ndarray_backend
+    idxs = list(range(len(specs)))
+    if order == 'reversed':
+        idxs = idxs[::-1]
+    elif order == 'shuffled':
+        np.random.shuffle(idxs)
+    res = be.read_data_batch([specs[i] for i in idxs])
+    assert res.shape == (len(idxs), 5, 7)
+    assert res.dtype == np.float32
+    for out_idx, sample_idx in enumerate(idxs):
+        assert np.allclose(res[out_idx], arrays[sample_idx])
+        assert np.allclose(res[out_idx], be.read_data(specs[sample_idx]))
+
+
+def test_read_data_batch_duplicate_and_subset_specs(written_ndarray_backend):
+    be, specs, arrays = written_ndarray_backend
+    idxs = [3, 4, 4, 5, 100, 3, 20, 21, 22]
+    res = be.read_data_batch([specs[i] for i in idxs])
+    for out_idx, sample_idx in enumerate(idxs):
+        assert np.allclose(res[out_idx], arrays[sample_idx])
+
+
+def test_read_data_batch_into_out_buffer(written_ndarray_backend):
+    be, specs, arrays = written_ndarray_backend
+    out = np.zeros((10, 5, 7), dtype=np.float32)
+    res = be.read_data_batch(specs[10:20], out=out)
+    assert res is out
+    assert np.allclose(out, np.stack(arrays[10:20]))
+
+
+def test_read_data_batch_empty(written_ndarray_backend):
+    be, specs, arrays = written_ndarray_backend
+    res = be.read_data_batch([])
+    assert res.shape == (0, 5, 7)
+
+
+@pytest.mark.parametrize('out', [
+    np.zeros((9, 5, 7), dtype=np.float32),
+    np.zeros((10, 5, 7), dtype=np.float64),
+    np.zeros((10, 7, 5), dtype=np.float32).transpose((0, 2, 1)),
+])
+def test_read_data_batch_invalid_out_buffer_fails(written_ndarray_backend, out):
+    be, specs, arrays = written_ndarray_backend
+    with pytest.raises(ValueError):
+        be.read_data_batch(specs[10:20], out=out)
+
+
+@pytest.mark.parametrize('backend', ['00', '10'])
+def test_read_data_batch_mixed_shapes_fails(repo, backend):
+    wco = repo.checkout(write=True)
+    aset = wco.add_ndarray_column(
+        'aset', shape=(10, 10), dtype=np.float64, variable_shape=True, backend=backend)
+    with aset:
+        be = aset._be_fs[backend]
+        specs = [backend_decoder(spec) for spec in be.write_data_batch(
+            [np.random.randn(2, 2), np.random.randn(3, 3), np.random.randn(2, 2)])]
+        res = be.read_data_batch([specs[0], specs[2]])
+        assert res.shape == (2, 2, 2)
+        with pytest.raises(ValueError):
+            be.read_data_batch(specs)
+    wco.close()
+
+
+def test_read_data_batch_detects_checksum_mismatch(written_ndarray_backend):
+    be, specs, arrays = written_ndarray_backend
+    bad_spec = type(specs[5])(*[
+        'badbadbadbadbadb' if field == specs[5].checksum else field for field in specs[5]])
+    with pytest.raises(RuntimeError, match='DATA CORRUPTION'):
+        be.read_data_batch([*specs[:5], bad_spec, *specs[6:10]])
+
+
+@pytest.mark.parametrize('backend', ['00', '01', '10'])
+def test_read_data_batch_scalar_shape(repo, backend):
+    wco = repo.checkout(write=True)
+    aset = wco.add_ndarray_column('aset', shape=(), dtype=np.float64, backend=backend)
+    arrays = [np.array(i, dtype=np.float64) for i in range(25)]
+    with aset:
+        be = aset._be_fs[backend]
+        specs = [backend_decoder(spec) for spec in be.write_data_batch(arrays)]
+        res = be.read_data_batch(specs[::-1])
+        assert res.shape == (25,)
+        assert np.allclose(res, np.arange(25)[::-1])
+    wco.close()
@@ -647,3 +647,550 @@ def test_checkout_branch_not_existing_does_not_hold_writer_lock(two_commit_fille
     assert repo.writer_lock_held is False
     with pytest.raises(NameError):
         co.branch_name  # should not even exist
+
+
+class TestLazyColumnConstruction(object):
+
+    @pytest.fixture()
+    def three_column_repo(self, repo):
+        co = repo.checkout(write=True)
+        for name in ['a', 'b', 'c']:
+            col = co.add_ndarray_column(name, prototype=np.zeros((3,), dtype=np.float32))
+            col.update({i: np.full((3,), i, dtype=np.float32) for i in range(5)})
+        nested = co.add_str_column('nested', contains_subsamples=True)
+        nested.update({'s': {'ss': 'foo'}})
+        co.commit('first')
+        co.close()
+        return repo
+
+    @pytest.mark.parametrize('write', [True, False])
+    def test_columns_constructed_on_first_access(self, three_column_repo, write):
+        co = three_column_repo.checkout(write=write)
+        assert co.columns._loaded_columns() == []
+        assert len(co.columns) == 4
+        assert 'a' in co.columns
+        assert sorted(co.columns.keys()) == ['a', 'b', 'c', 'nested']
+        assert co.columns._loaded_columns() == []
+
+        col = co.columns['b']
+        assert co.columns._loaded_columns() == [col]
+        assert co.columns['b'] is col
+        assert np.allclose(co['a', 2], np.full((3,), 2))
+        assert co['nested', 's', 'ss'] == 'foo'
+        assert len(co.columns._loaded_columns()) == 3
+        co.close()
+
+    def test_column_constructed_in_context_manager_is_entered(self, three_column_repo):
+        co = three_column_repo.checkout(write=True)
+        with co:
+            col = co.columns['a']
+            assert col._is_conman is True
+            assert np.allclose(col[1], np.full((3,), 1))
+        assert col._is_conman is False
+        co.close()
+
+    def test_writer_lazy_column_while_other_column_conman(self, three_column_repo):
+        co = three_column_repo.checkout(write=True)
+        with co.columns['a'] as a:
+            a[10] = np.full((3,), 10, dtype=np.float32)
+            b = co.columns['b']
+            b[10] = np.full((3,), 11, dtype=np.float32)
+            assert np.allclose(b[0], np.zeros((3,)))
+        co.commit('second')
+        co.close()
+
+        co = three_column_repo.checkout()
+        assert np.allclose(co['a', 10], np.full((3,), 10))
+        assert np.allclose(co['b', 10], np.full((3,), 11))
+        assert len(co.columns['c']) == 5
+        co.close()
+
+    def test_writer_delete_unaccessed_column(self, three_column_repo):
+        co = three_column_repo.checkout(write=True)
+        del co.columns['c']
+        assert 'c' not in co.columns
+        co.commit('removed c')
+        co.close()
+
+        co = three_column_repo.checkout()
+        assert sorted(co.columns.keys()) == ['a', 'b', 'nested']
+        co.close()
+
+
+def _read_commit_in_other_process(repo_path, commit):
+    from hangar import Repository
+
+    repo = Repository(path=repo_path, exists=True)
+    co = repo.checkout(commit=commit)
+    res = {k: co['writtenaset', k] for k in co.columns['writtenaset'].keys()}
+    co.close()
+    return res
+
+
+class TestCommitEnvCache(object):
+
+    def test_reader_checkouts_share_cached_commit_env(self, two_commit_filled_samples_repo):
+        from multiprocessing import get_context
+        from hangar.records.commiting import CommitEnvCache
+
+        repo = two_commit_filled_samples_repo
+        head = repo.log(return_contents=True)['head']
+        cache = CommitEnvCache(repo._repo_path)
+        assert not cache.cmt_env_path(head).exists()
+
+        co = repo.checkout()
+        pth = cache.cmt_env_path(head)
+        assert pth.is_file()
+        inode = pth.stat().st_ino
+        expected = {k: co['writtenaset', k] for k in co.columns['writtenaset'].keys()}
+        co2 = repo.checkout(commit=head)
+        assert co2._dataenv is co._dataenv
+        co2.close()
+        co.close()
+
+        with get_context('spawn').Pool(2) as P:
+            results = P.starmap(_read_commit_in_other_process, [(repo.path, head)] * 2)
+        assert pth.stat().st_ino == inode
+        for res in results:
+            assert res.keys() == expected.keys()
+            for k, v in expected.items():
+                assert np.allclose(res[k], v)
+
+        # diffs of a checked out commit open the same cached env.
+        co = repo.checkout()
+        assert co.diff.commit(head).diff.added.samples == ()
+        co.close()
+
+    def test_least_recently_used_commit_env_is_evicted(self, two_commit_filled_samples_repo):
+        from hangar.records.commiting import CommitEnvCache
+
+        repo = two_commit_filled_samples_repo
+        first, second = repo.log(return_contents=True)['order'][::-1]
+        cache = CommitEnvCache(repo._repo_path, max_bytes=0)
+        cache.release(cache.open(repo._env.refenv, first))
+        assert cache.cmt_env_path(first).is_file()
+
+        env = cache.open(repo._env.refenv, second)
+        assert not cache.cmt_env_path(first).exists()
+        assert cache.cmt_env_path(second).is_file()
+        with env.begin() as txn:
+            assert txn.stat()['entries'] > 0
+        cache.release(env)
+        assert list(cache.cache_dir.glob('*.tmp')) == []
+
+    def test_cached_commit_env_is_read_only(self, two_commit_filled_samples_repo):
+        import lmdb
+        from hangar.records.commiting import tmp_cmt_env
+
+        repo = two_commit_filled_samples_repo
+        head = repo.log(return_contents=True)['head']
+        with tmp_cmt_env(repo._env.refenv, head) as env:
+            with pytest.raises(lmdb.ReadonlyError):
+                with env.begin(write=True) as txn:
+                    txn.put(b'foo', b'bar')
+        with tmp_cmt_env(repo._env.refenv, head, use_cache=False) as env:
+            with env.begin(write=True) as txn:
+                txn.put(b'foo', b'bar')
+
+
+class TestDeltaCommitRefs(object):
+
+    def test_delta_chain_broken_by_periodic_full_snapshot(self, aset_samples_initialized_repo):
+        from hangar.constants import CMT_REF_KEYFRAME_INTERVAL
+        from hangar.records.commiting import _commit_ref_delta_depth
+
+        repo = aset_samples_initialized_repo
+        expected = {}
+        commits = []
+        for idx in range(CMT_REF_KEYFRAME_INTERVAL + 2):
+            co = repo.checkout(write=True)
+            arr = np.full((5, 7), idx, dtype=np.float64)
+            expected = dict(expected)
+            co['writtenaset'][str(idx)] = arr
+            expected[str(idx)] = arr
+            if idx % 3 == 2:
+                del co['writtenaset'][str(idx - 1)]
+                del expected[str(idx - 1)]
+            digest = co.commit(f'commit {idx}')
+            co.close()
+            commits.append((digest, expected))
+
+        observed = [_commit_ref_delta_depth(repo._env.refenv, d) for d, _ in commits]
+        assert observed[:CMT_REF_KEYFRAME_INTERVAL - 1] == list(range(1, CMT_REF_KEYFRAME_INTERVAL))
+        assert observed[CMT_REF_KEYFRAME_INTERVAL - 1:] == [0, 1, 2]
+
+        for digest, exp in commits:
+            co = repo.checkout(commit=digest)
+            col = co.columns['writtenaset']
+            assert set(col.keys()) == set(exp.keys())
+            for k, v in exp.items():
+                assert np.allclose(col[k], v)
+            co.close()
+
+    def test_full_snapshot_ref_matches_delta_ref(self, two_commit_filled_samples_repo):
+        from hangar.records.commiting import get_commit_ref, get_commit_ref_db_val
+        from hangar.records.parsing import (
+            commit_ref_db_key_from_raw_key,
+            commit_ref_db_val_is_delta,
+            commit_ref_raw_val_from_db_val,
+        )
+
+        repo = two_commit_filled_samples_repo
+        head = repo.log(return_contents=True)['head']
+        with repo._env.refenv.begin() as txn:
+            assert commit_ref_db_val_is_delta(txn.get(commit_ref_db_key_from_raw_key(head)))
+
+        full = commit_ref_raw_val_from_db_val(get_commit_ref_db_val(repo._env.refenv, head))
+        assert full.db_kvs == get_commit_ref(repo._env.refenv, head)
+
+
+class TestIncrementalCommitDigest(object):
+
+    @staticmethod
+    def _dirty_keys(repo):
+        from hangar.records.parsing import stage_dirty_db_key_prefix
+
+        pfx = stage_dirty_db_key_prefix()
+        with repo._env.stagedigestenv.begin() as txn:
+            return [k for k in txn.cursor().iternext(values=False) if k.startswith(pfx)]
+
+    def test_commit_only_hashes_dirty_records(self, aset_samples_initialized_repo, monkeypatch):
+        from hangar.records import commiting
+
+        repo = aset_samples_initialized_repo
+        co = repo.checkout(write=True)
+        for idx in range(10):
+            co['writtenaset'][idx] = np.full((5, 7), idx, dtype=np.float64)
+        co.commit('first')
+        co.close()
+        assert self._dirty_keys(repo) == []
+
+        def _fail(*args, **kwargs):
+            raise AssertionError('all staged records should not be hashed')
+        monkeypatch.setattr(commiting, '_staged_changes_from_all', _fail)
+
+        co = repo.checkout(write=True)
+        co['writtenaset'][0] = np.full((5, 7), 100, dtype=np.float64)
+        del co['writtenaset'][1]
+        co['writtenaset'][10] = np.full((5, 7), 10, dtype=np.float64)
+        co.add_str_column('strcol')
+        co['strcol'][0] = 'foo'
+        assert len(self._dirty_keys(repo)) == 5
+        digest = co.commit('second')
+        co.close()
+        assert self._dirty_keys(repo) == []
+
+        co = repo.checkout(commit=digest)
+        assert set(co['writtenaset'].keys()) == {0, *range(2, 11)}
+        assert np.allclose(co['writtenaset', 0], 100)
+        assert co['strcol', 0] == 'foo'
+        co.close()
+
+    def test_dirty_marker_persisted_if_write_fails_after_data_commit(
+            self, aset_samples_initialized_repo, monkeypatch):
+        from hangar.txnctx import TxnRegister
+
+        repo = aset_samples_initialized_repo
+        co = repo.checkout(write=True)
+        co['writtenaset'][0] = np.zeros((5, 7), dtype=np.float64)
+        co.commit('first')
+        assert self._dirty_keys(repo) == []
+
+        col = co.columns['writtenaset']
+        stageenv = col._txnctx.dataenv
+        commit_writer_txn = TxnRegister.commit_writer_txn
+        committed = []
+
+        def _fail_after_data_commit(self, lmdbenv):
+            if committed and committed[-1] is stageenv:
+                raise OSError('simulated failure after staged data commit')
+            res = commit_writer_txn(self, lmdbenv)
+            if res:
+                committed.append(lmdbenv)
+            return res
+
+        monkeypatch.setattr(TxnRegister, 'commit_writer_txn', _fail_after_data_commit)
+        with pytest.raises(OSError, match='simulated failure'):
+            col[1] = np.ones((5, 7), dtype=np.float64)
+        monkeypatch.undo()
+        assert stageenv in committed
+        assert len(self._dirty_keys(repo)) == 1
+
+        txnreg = TxnRegister()
+        for lmdbenv in list(txnreg.WriterTxn):
+            txnreg.commit_writer_txn(lmdbenv)
+        assert co.diff.status() == 'DIRTY'
+        co.close()
+
+    def test_column_removal_is_tracked(self, aset_samples_initialized_repo, monkeypatch):
+        from hangar.records import commiting
+
+        repo = aset_samples_initialized_repo
+        co = repo.checkout(write=True)
+        co.add_str_column('strcol')
+        co['strcol'][0] = 'foo'
+        co['writtenaset'][0] = np.zeros((5, 7), dtype=np.float64)
+        co.commit('first')
+
+        monkeypatch.setattr(commiting, '_staged_changes_from_all', None)
+        del co.columns['writtenaset']
+        digest = co.commit('second')
+        co.close()
+
+        co = repo.checkout(commit=digest)
+        assert list(co.columns.keys()) == ['strcol']
+        co.close()
+
+    def test_replaced_staging_area_rebuilds_digests(self, aset_samples_initialized_repo):
+        repo = aset_samples_initialized_repo
+        co = repo.checkout(write=True)
+        co['writtenaset'][0] = np.zeros((5, 7), dtype=np.float64)
+        co.commit('master commit')
+        co.close()
+
+        repo.create_branch('dev')
+        co = repo.checkout(write=True, branch='dev')
+        co['writtenaset'][1] = np.ones((5, 7), dtype=np.float64)
+        dev_digest = co.commit('dev commit')
+        co.close()
+
+        co = repo.checkout(write=True, branch='master')
+        co['writtenaset'][2] = np.ones((5, 7), dtype=np.float64)
+        master_digest = co.commit('second master commit')
+        co.close()
+
+        co = repo.checkout(commit=master_digest)
+        assert set(co['writtenaset'].keys()) == {0, 2}
+        co.close()
+        co = repo.checkout(commit=dev_digest)
+        assert set(co['writtenaset'].keys()) == {0, 1}
+        co.close()
+
+
+class TestIncrementalBranchSwitch(object):
+
+    @staticmethod
+    def _stage_records(repo):
+        from hangar.records.queries import RecordQuery
+        return tuple(RecordQuery(repo._env.stageenv)._traverse_all_records())
+
+    def test_switch_applies_only_changed_records(self, aset_samples_initialized_repo, monkeypatch):
+        from hangar.records import commiting
+
+        repo = aset_samples_initialized_repo
+        co = repo.checkout(write=True)
+        for idx in range(20):
+            co['writtenaset'][idx] = np.full((5, 7), idx, dtype=np.float64)
+        master_digest = co.commit('master commit')
+        co.close()
+
+        repo.create_branch('dev')
+        co = repo.checkout(write=True, branch='dev')
+        co['writtenaset'][0] = np.full((5, 7), 100, dtype=np.float64)
+        del co['writtenaset'][1]
+        co['writtenaset'][20] = np.full((5, 7), 20, dtype=np.float64)
+        dev_digest = co.commit('dev commit')
+        co.close()
+
+        applied = []
+        original = commiting.apply_changes_to_staging_area
+
+        def _recording_apply(stageenv, changes, **kwargs):
+            changes = list(changes)
+            applied.append(changes)
+            return original(stageenv, changes, **kwargs)
+        monkeypatch.setattr(commiting, 'apply_changes_to_staging_area', _recording_apply)
+
+        for branch, digest in (('master', master_digest), ('dev', dev_digest)):
+            co = repo.checkout(write=True, branch=branch)
+            assert self._stage_records(repo) == commiting.get_commit_ref(repo._env.refenv, digest)
+            assert co.diff.status() == 'CLEAN'
+            co.close()
+
+        assert len(applied) == 2
+        for changes in applied:
+            assert sorted(kind for kind, _ in changes) == ['added', 'deleted', 'mutated']
+
+        co = repo.checkout(write=True, branch='dev')
+        assert set(co['writtenaset'].keys()) == {0, *range(2, 21)}
+        assert np.allclose(co['writtenaset'][0], 100)
+        co['writtenaset'][21] = np.zeros((5, 7), dtype=np.float64)
+        co.commit('second dev commit')
+        co.close()
+
+    def test_failed_change_stream_leaves_staging_area_untouched(self, aset_samples_initialized_repo):
+        from hangar.records import commiting
+
+        repo = aset_samples_initialized_repo
+        co = repo.checkout(write=True)
+        for idx in range(5):
+            co['writtenaset'][idx] = np.full((5, 7), idx, dtype=np.float64)
+        co.commit('first')
+        co.close()
+        stageRecords = self._stage_records(repo)
+        with repo._env.stagedigestenv.begin() as txn:
+            digests = dict(txn.cursor().iternext())
+
+        def _changes():
+            for k, v in stageRecords:
+                yield 'mutated', (k, b'garbage')
+                yield 'deleted', (k, b'')
+            raise OSError('change stream failed')
+
+        with pytest.raises(OSError, match='change stream failed'):
+            commiting.apply_changes_to_staging_area(
+                repo._env.stageenv, _changes(), stagedigestenv=repo._env.stagedigestenv)
+        assert self._stage_records(repo) == stageRecords
+        with repo._env.stagedigestenv.begin() as txn:
+            assert dict(txn.cursor().iternext()) == digests
+
+        co = repo.checkout(write=True)
+        assert co.diff.status() == 'CLEAN'
+        co['writtenaset'][5] = np.zeros((5, 7), dtype=np.float64)
+        co.commit('second')
+        co.close()
+
+
+class TestStagingStatusFromDigests(object):
+
+    def test_status_does_not_read_head_commit(self, aset_samples_initialized_repo, monkeypatch):
+        from hangar import diff
+
+        repo = aset_samples_initialized_repo
+        co = repo.checkout(write=True)
+        for idx in range(10):
+            co['writtenaset'][idx] = np.full((5, 7), idx, dtype=np.float64)
+        co.commit('first')
+        co.close()
+        repo.create_branch('dev')
+
+        def _fail(*args, **kwargs):
+            raise AssertionError('head commit refs should not be read')
+        monkeypatch.setattr(diff, 'get_commit_ref', _fail)
+
+        co = repo.checkout(write=True)
+        assert co.diff.status() == 'CLEAN'
+        co['writtenaset'][0] = np.full((5, 7), 100, dtype=np.float64)
+        assert co.diff.status() == 'DIRTY'
+        co['writtenaset'][0] = np.full((5, 7), 0, dtype=np.float64)
+        assert co.diff.status() == 'CLEAN'
+        del co['writtenaset'][1]
+        assert co.diff.status() == 'DIRTY'
+        co['writtenaset'][1] = np.full((5, 7), 1, dtype=np.float64)
+        assert co.diff.status() == 'CLEAN'
+        co.add_str_column('strcol')
+        assert co.diff.status() == 'DIRTY'
+        co['strcol'][0] = 'foo'
+        co.commit('second')
+        assert co.diff.status() == 'CLEAN'
+        del co.columns['strcol']
+        assert co.diff.status() == 'DIRTY'
+        co.reset_staging_area()
+        assert co.diff.status() == 'CLEAN'
+        co.close()
+
+        # digests are kept in sync when the writer switches branches.
+        co = repo.checkout(write=True, branch='dev')
+        assert co.diff.status() == 'CLEAN'
+        assert 'strcol' not in co.columns
+        co['writtenaset'][20] = np.zeros((5, 7), dtype=np.float64)
+        assert co.diff.status() == 'DIRTY'
+        co.commit('dev commit')
+        co.close()
+
+    def test_status_falls_back_when_digests_not_synced(self, aset_samples_initialized_repo):
+        from hangar.records.parsing import stage_base_db_key
+
+        repo = aset_samples_initialized_repo
+        co = repo.checkout(write=True)
+        co['writtenaset'][0] = np.zeros((5, 7), dtype=np.float64)
+        co.commit('first')
+        with repo._env.stagedigestenv.begin(write=True) as txn:
+            txn.put(stage_base_db_key(), b'a=notthehead')
+        assert co.diff.status() == 'CLEAN'
+        co['writtenaset'][1] = np.zeros((5, 7), dtype=np.float64)
+        assert co.diff.status() == 'DIRTY'
+        co.close()
+
+    def test_status_does_not_read_commit_records(self, aset_samples_initialized_repo, monkeypatch):
+        from hangar.records import commiting
+
+        repo = aset_samples_initialized_repo
+        co = repo.checkout(write=True)
+        co['writtenaset'][0] = np.zeros((5, 7), dtype=np.float64)
+        co.commit('first')
+        co.close()
+
+        co = repo.checkout(write=True)
+
+        def _fail(*args, **kwargs):
+            raise AssertionError('commit records should not be read')
+        monkeypatch.setattr(commiting, '_commit_records_fingerprint', _fail)
+        assert co.diff.status() == 'CLEAN'
+        co['writtenaset'][1] = np.zeros((5, 7), dtype=np.float64)
+        assert co.diff.status() == 'DIRTY'
+        co.close()
+
+    def test_corrupt_base_fingerprint_detected_on_open(self, aset_samples_initialized_repo):
+        from hangar.records.parsing import stage_base_db_key, stage_base_refs_db_key
+
+        repo = aset_samples_initialized_repo
+        co = repo.checkout(write=True)
+        co['writtenaset'][0] = np.zeros((5, 7), dtype=np.float64)
+        co.commit('first')
+        co.close()
+        with repo._env.stagedigestenv.begin(write=True) as txn:
+            txn.put(stage_base_refs_db_key(), b'0' * 16)
+
+        co = repo.checkout(write=True)
+        with repo._env.stagedigestenv.begin() as txn:
+            assert txn.get(stage_base_db_key()) is None
+            assert txn.get(stage_base_refs_db_key()) is None
+        assert co.diff.status() == 'CLEAN'
+        co['writtenaset'][1] = np.zeros((5, 7), dtype=np.float64)
+        assert co.diff.status() == 'DIRTY'
+        digest = co.commit('second')
+        assert co.diff.status() == 'CLEAN'
+        co.close()
+        with repo._env.stagedigestenv.begin() as txn:
+            assert txn.get(stage_base_db_key()) == digest.encode()
+
+    def test_failed_branch_switch_does_not_report_clean(self, aset_samples_initialized_repo, monkeypatch):
+        from hangar import diff
+        from hangar.records.parsing import stage_base_db_key
+
+        repo = aset_samples_initialized_repo
+        co = repo.checkout(write=True)
+        for idx in range(5):
+            co['writtenaset'][idx] = np.zeros((5, 7), dtype=np.float64)
+        co.commit('first')
+        co.close()
+        repo.create_branch('dev')
+        co = repo.checkout(write=True, branch='dev')
+        co['writtenaset'][10] = np.ones((5, 7), dtype=np.float64)
+        del co['writtenaset'][0]
+        co.commit('dev commit')
+        co.close()
+
+        iter_diff_envs = diff.iter_diff_envs
+
+        def _failing_diff(*args, **kwargs):
+            for idx, change in enumerate(iter_diff_envs(*args, **kwargs)):
+                if idx == 1:
+                    raise OSError('simulated failure while switching branches')
+                yield change
+        monkeypatch.setattr(diff, 'iter_diff_envs', _failing_diff)
+        with pytest.raises(OSError, match='simulated failure'):
+            repo.checkout(write=True, branch='master')
+        monkeypatch.undo()
+        repo.force_release_writer_lock()
+        with repo._env.stagedigestenv.begin() as txn:
+            assert txn.get(stage_base_db_key()) is None
+
+        co = repo.checkout(write=True, branch='dev')
+        assert co.diff.status() == 'CLEAN'
+        co.close()
+        co = repo.checkout(write=True, branch='master')
+        assert co.diff.status() == 'CLEAN'
+        assert set(co['writtenaset'].keys()) == set(range(5))
+        co.close()
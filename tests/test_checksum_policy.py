@@ -0,0 +1,167 @@
+import pytest
+import numpy as np
+
+from hangar.backends.checksums import ChecksumPolicy
+
+
+@pytest.mark.parametrize('policy', [
+    'always', 'off', 'first-read-per-file-per-process', 'sampled(0.5)', 'sampled(0)',
+    'sampled(1)', 'sampled(.25)', 'sampled(1e-3)'])
+def test_valid_policy_specs(policy):
+    res = ChecksumPolicy(policy)
+    assert res.policy == policy
+    assert res.counters == {'verified': 0, 'skipped': 0, 'failed': 0}
+
+
+@pytest.mark.parametrize('policy', [
+    'never', 'sampled', 'sampled()', 'sampled(1.5)', 'sampled(-1)', 'sampled(a)', 'ALWAYS', ''])
+def test_invalid_policy_specs(policy):
+    with pytest.raises(ValueError):
+        ChecksumPolicy(policy)
+
+
+def test_policy_spec_must_be_str():
+    with pytest.raises(TypeError):
+        ChecksumPolicy(0.5)
+
+
+def test_sampled_policy_verifies_fraction_of_reads():
+    policy = ChecksumPolicy('sampled(0.25)')
+    num_verify = sum(policy.should_verify('10', 'foo') for _ in range(10_000))
+    assert 2000 < num_verify < 3000
+    assert policy.skipped == 10_000 - num_verify
+
+
+def test_first_read_policy_marks_files_only_after_valid_read():
+    policy = ChecksumPolicy('first-read-per-file-per-process')
+    assert policy.should_verify('10', 'first_read_test_uid') is True
+    policy.record('10', 'first_read_test_uid', False)
+    assert policy.should_verify('10', 'first_read_test_uid') is True
+    policy.record('10', 'first_read_test_uid', True)
+    assert policy.should_verify('10', 'first_read_test_uid') is False
+    assert policy.should_verify('00', 'first_read_test_uid') is True
+    assert policy.counters == {'verified': 1, 'skipped': 1, 'failed': 1}
+    policy.reset_counters()
+    assert policy.counters == {'verified': 0, 'skipped': 0, 'failed': 0}
+
+
+@pytest.fixture(params=['00', '01', '10', '30', '31'])
+def committed_backend_repo(request, repo):
+    co = repo.checkout(write=True)
+    if request.param in ('30', '31'):
+        if request.param == '30':
+            col = co.add_str_column('col', backend='30')
+            data = {i: str(i) * 10 for i in range(40)}
+        else:
+            col = co.add_bytes_column('col', backend='31')
+            data = {i: str(i).encode() * 10 for i in range(40)}
+    else:
+        col = co.add_ndarray_column('col', prototype=np.zeros((5, 7)), backend=request.param)
+        data = {i: np.full((5, 7), i, dtype=np.float64) for i in range(40)}
+    col.update(data)
+    co.commit('first')
+    co.close()
+    return (repo, data)
+
+
+def _assert_read_all(co, data):
+    col = co.columns['col']
+    for key, value in data.items():
+        if isinstance(value, np.ndarray):
+            assert np.allclose(col[key], value)
+        else:
+            assert col[key] == value
+
+
+@pytest.mark.parametrize('policy,expected', [
+    ('always', {'verified': 40, 'skipped': 0, 'failed': 0}),
+    ('off', {'verified': 0, 'skipped': 40, 'failed': 0}),
+    ('sampled(0)', {'verified': 0, 'skipped': 40, 'failed': 0}),
+    ('sampled(1)', {'verified': 40, 'skipped': 0, 'failed': 0}),
+])
+def test_checkout_checksum_policy_counters(committed_backend_repo, policy, expected):
+    repo, data = committed_backend_repo
+    co = repo.checkout(checksum_policy=policy)
+    assert co.checksum_policy.policy == policy
+    _assert_read_all(co, data)
+    assert co.checksum_policy.counters == expected
+    co.close()
+
+
+def test_checkout_first_read_per_file_policy(committed_backend_repo):
+    repo, data = committed_backend_repo
+    co = repo.checkout(checksum_policy='first-read-per-file-per-process')
+    _assert_read_all(co, data)
+    counters = co.checksum_policy.counters
+    num_files = len({spec.uid for spec in co.columns['col']._samples.values()})
+    assert counters['verified'] == num_files
+    assert counters['skipped'] == len(data) - num_files
+    assert counters['failed'] == 0
+    co.close()
+
+
+def test_checkout_default_policy_is_always(committed_backend_repo):
+    repo, data = committed_backend_repo
+    co = repo.checkout()
+    assert co.checksum_policy.policy == 'always'
+    _assert_read_all(co, data)
+    assert co.checksum_policy.counters['verified'] == len(data)
+    co.close()
+
+
+@pytest.mark.parametrize('policy,raises', [('always', True), ('off', False)])
+def test_checksum_policy_controls_corruption_detection(committed_backend_repo, policy, raises):
+    repo, data = committed_backend_repo
+    co = repo.checkout(checksum_policy=policy)
+    col = co.columns['col']
+    spec = col._samples[0]
+    col._samples[0] = type(spec)(*[
+        'badbadbadbadbadb' if field == spec.checksum else field for field in spec])
+    if raises:
+        with pytest.raises(RuntimeError, match='DATA CORRUPTION'):
+            col[0]
+        assert co.checksum_policy.counters['failed'] == 1
+    else:
+        col[0]
+        assert co.checksum_policy.counters == {'verified': 0, 'skipped': 1, 'failed': 0}
+    co.close()
+
+
+def test_policy_counters_are_thread_safe():
+    from concurrent.futures import ThreadPoolExecutor
+    policy = ChecksumPolicy('off')
+
+    def read(_):
+        for _ in range(2_000):
+            policy.should_verify('10', 'foo')
+            policy.record('10', 'foo', True)
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        list(ex.map(read, range(8)))
+    assert policy.counters == {'verified': 16_000, 'skipped': 16_000, 'failed': 0}
+    policy.reset_counters()
+    assert policy.counters == {'verified': 0, 'skipped': 0, 'failed': 0}
+
+
+def test_policy_pickles_without_lock():
+    import pickle
+    policy = ChecksumPolicy('sampled(0.5)')
+    policy.record('10', 'foo', True)
+    res = pickle.loads(pickle.dumps(policy))
+    assert res.policy == 'sampled(0.5)'
+    assert res.counters == {'verified': 1, 'skipped': 0, 'failed': 0}
+    res.record('10', 'foo', False)
+    assert res.failed == 1
+
+
+def test_checksum_policy_not_allowed_in_write_checkout(repo):
+    with pytest.raises(ValueError):
+        repo.checkout(write=True, checksum_policy='off')
+    co = repo.checkout(write=True, checksum_policy='always')
+    co.close()
+
+
+def test_invalid_checkout_checksum_policy_fails(committed_backend_repo):
+    repo, data = committed_backend_repo
+    with pytest.raises(ValueError):
+        repo.checkout(checksum_policy='sometimes')
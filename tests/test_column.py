@@ -1282,6 +1282,288 @@ class TestVariableSizedColumn(object):
         co.close()
 
 
+class TestGetBatch(object):
+
+    @pytest.mark.parametrize('backend', fixed_shape_backend_params)
+    @pytest.mark.parametrize('write', [True, False])
+    def test_get_batch_matches_getitem(self, repo, backend, write):
+        co = repo.checkout(write=True)
+        aset = co.add_ndarray_column('aset', shape=(5, 7), dtype=np.float32, backend=backend)
+        with aset:
+            for i in range(60):
+                aset[i] = np.random.randn(5, 7).astype(np.float32)
+        co.commit('first')
+        co.close()
+
+        co = repo.checkout(write=write)
+        aset = co.columns['aset']
+        keys = [5, 3, 59, 0, 1, 2, 3, 40]
+        res = aset.get_batch(keys)
+        assert res.shape == (len(keys), 5, 7)
+        assert res.dtype == np.float32
+        for idx, key in enumerate(keys):
+            assert_equal(res[idx], aset[key])
+
+        out = np.empty((len(keys), 5, 7), dtype=np.float32)
+        res = aset.get_batch(keys, out=out)
+        assert res is out
+        for idx, key in enumerate(keys):
+            assert_equal(out[idx], aset[key])
+        co.close()
+
+    def test_get_batch_samples_in_multiple_backends(self, repo):
+        co = repo.checkout(write=True)
+        aset = co.add_ndarray_column('aset', shape=(5, 7), dtype=np.float32, backend='00')
+        aset.update({i: np.full((5, 7), i, dtype=np.float32) for i in range(10)})
+        aset.change_backend('10')
+        aset.update({i: np.full((5, 7), i, dtype=np.float32) for i in range(10, 20)})
+        aset.change_backend('01')
+        aset.update({i: np.full((5, 7), i, dtype=np.float32) for i in range(20, 30)})
+        co.commit('first')
+        co.close()
+
+        co = repo.checkout()
+        keys = [0, 10, 20, 1, 11, 21, 25, 26, 27, 5]
+        res = co.columns['aset'].get_batch(keys)
+        for idx, key in enumerate(keys):
+            assert np.all(res[idx] == key)
+        assert np.all(co.columns['aset'].get_batch(list(range(8, 23))) ==
+                      np.arange(8, 23, dtype=np.float32)[:, None, None])
+        co.close()
+
+    def test_get_batch_missing_key_raises(self, repo):
+        co = repo.checkout(write=True)
+        aset = co.add_ndarray_column('aset', shape=(5, 7), dtype=np.float32)
+        aset[0] = np.zeros((5, 7), dtype=np.float32)
+        with pytest.raises(KeyError):
+            aset.get_batch([0, 1])
+        co.close()
+
+    @pytest.mark.parametrize('out', [
+        np.zeros((3, 5, 7), dtype=np.float32),
+        np.zeros((2, 5, 7), dtype=np.float64),
+        np.zeros((2, 7, 5), dtype=np.float32).transpose((0, 2, 1)),
+    ])
+    def test_get_batch_invalid_out_raises(self, repo, out):
+        co = repo.checkout(write=True)
+        aset = co.add_ndarray_column('aset', shape=(5, 7), dtype=np.float32)
+        aset.update({0: np.zeros((5, 7), dtype=np.float32), 1: np.ones((5, 7), dtype=np.float32)})
+        with pytest.raises(ValueError):
+            aset.get_batch([0, 1], out=out)
+        co.close()
+
+    def test_get_batch_not_supported_for_variable_shape_or_str(self, repo):
+        co = repo.checkout(write=True)
+        aset = co.add_ndarray_column('aset', shape=(5, 7), dtype=np.float32, variable_shape=True)
+        aset[0] = np.zeros((5, 7), dtype=np.float32)
+        saset = co.add_str_column('saset')
+        saset[0] = 'foo'
+        with pytest.raises(ValueError):
+            aset.get_batch([0])
+        with pytest.raises(ValueError):
+            saset.get_batch([0])
+        co.close()
+
+
+class TestGetMany(object):
+
+    @pytest.mark.parametrize('backend', fixed_shape_backend_params)
+    @pytest.mark.parametrize('write', [True, False])
+    @pytest.mark.parametrize('workers', [None, 1, 4])
+    def test_get_many_matches_getitem(self, repo, backend, write, workers):
+        co = repo.checkout(write=True)
+        aset = co.add_ndarray_column('aset', shape=(5, 7), dtype=np.float32, backend=backend)
+        with aset:
+            for i in range(60):
+                aset[i] = np.random.randn(5, 7).astype(np.float32)
+        co.commit('first')
+        co.close()
+
+        co = repo.checkout(write=write)
+        aset = co.columns['aset']
+        keys = [5, 3, 59, 0, 1, 2, 3, 40, *range(10, 50)]
+        res = aset.get_many(keys, workers=workers)
+        assert len(res) == len(keys)
+        for idx, key in enumerate(keys):
+            assert_equal(res[idx], aset[key])
+        co.close()
+
+    def test_get_many_samples_in_multiple_backends_and_types(self, repo):
+        co = repo.checkout(write=True)
+        aset = co.add_ndarray_column('aset', shape=(20,), dtype=np.float32,
+                                     variable_shape=True, backend='00')
+        aset.update({i: np.full((i + 1,), i, dtype=np.float32) for i in range(10)})
+        aset.change_backend('10')
+        aset.update({i: np.full((i + 1,), i, dtype=np.float32) for i in range(10, 20)})
+        saset = co.add_str_column('saset')
+        saset.update({i: str(i) for i in range(20)})
+        co.commit('first')
+        co.close()
+
+        co = repo.checkout()
+        keys = [19, 0, 10, 1, 11, 5, 15, 9]
+        res = co.columns['aset'].get_many(keys, workers=3)
+        for idx, key in enumerate(keys):
+            assert_equal(res[idx], np.full((key + 1,), key, dtype=np.float32))
+        assert co.columns['saset'].get_many(keys, workers=3) == [str(k) for k in keys]
+        assert co.columns['saset'].get_many([], workers=3) == []
+        co.close()
+
+    def test_get_many_closes_thread_handles_and_shares_checksum_policy(self, repo, monkeypatch):
+        from hangar.columns import common
+
+        co = repo.checkout(write=True)
+        aset = co.add_ndarray_column('aset', shape=(5,), dtype=np.int64, backend='00')
+        aset.update({i: np.full((5,), i) for i in range(20)})
+        co.commit('first')
+        co.close()
+
+        opened = []
+
+        def _open_file_handles(*args, **kwargs):
+            res = orig_open(*args, **kwargs)
+            opened.append(res)
+            return res
+
+        orig_open = common.open_file_handles
+        monkeypatch.setattr(common, 'open_file_handles', _open_file_handles)
+
+        co = repo.checkout()
+        aset = co.columns['aset']
+        res = aset.get_many(list(range(20)), workers=4)
+        assert [int(arr[0]) for arr in res] == list(range(20))
+        assert 1 <= len(opened) <= 4
+        policy = aset._be_fs['00'].checksum_policy
+        for fhands in opened:
+            assert fhands['00'].checksum_policy is policy
+            assert fhands['00'].rFp == {}
+        co.close()
+
+    def test_get_many_missing_key_raises(self, repo):
+        co = repo.checkout(write=True)
+        aset = co.add_ndarray_column('aset', shape=(5, 7), dtype=np.float32)
+        aset[0] = np.zeros((5, 7), dtype=np.float32)
+        co.commit('first')
+        co.close()
+
+        co = repo.checkout()
+        with pytest.raises(KeyError):
+            co.columns['aset'].get_many([0, 1], workers=2)
+        co.close()
+
+
+class TestZeroCopyReads(object):
+
+    @pytest.mark.parametrize('variable_shape', [False, True])
+    def test_zero_copy_returns_readonly_view(self, repo, variable_shape):
+        co = repo.checkout(write=True)
+        aset = co.add_ndarray_column('aset', shape=(5, 7), dtype=np.float32,
+                                     variable_shape=variable_shape, backend='10')
+        data = {i: np.random.randn(5, 7 - (i % 3) * variable_shape).astype(np.float32)
+                for i in range(20)}
+        aset.update(data)
+        co.commit('first')
+        co.close()
+
+        co = repo.checkout()
+        aset = co.columns['aset']
+        assert aset.zero_copy is False
+        assert aset[0].flags.owndata is True
+        aset.zero_copy = True
+        assert aset.zero_copy is True
+        for _ in range(2):
+            for key, arr in data.items():
+                res = aset[key]
+                assert res.flags.writeable is False
+                assert res.flags.owndata is False
+                assert_equal(res, arr)
+        with pytest.raises(ValueError):
+            aset[0][0, 0] = 1
+        aset.zero_copy = False
+        res = aset[0]
+        assert res.flags.writeable is True
+        assert_equal(res, data[0])
+        co.close()
+
+    def test_zero_copy_detects_corruption_on_first_read(self, repo):
+        co = repo.checkout(write=True)
+        aset = co.add_ndarray_column('aset', shape=(5, 7), dtype=np.float32, backend='10')
+        aset[0] = np.ones((5, 7), dtype=np.float32)
+        co.commit('first')
+        co.close()
+
+        co = repo.checkout()
+        aset = co.columns['aset']
+        aset.zero_copy = True
+        spec = aset._samples[0]
+        bad_spec = type(spec)(*[
+            'badbadbadbadbadb' if field == spec.checksum else field for field in spec])
+        aset._samples[0] = bad_spec
+        with pytest.raises(RuntimeError, match='DATA CORRUPTION'):
+            aset[0]
+        co.close()
+
+    def test_zero_copy_verification_tracked_per_file(self, repo):
+        co = repo.checkout(write=True)
+        aset = co.add_ndarray_column('aset', shape=(5, 7), dtype=np.float32, backend='10')
+        for i in range(20):
+            aset[i] = np.full((5, 7), i, dtype=np.float32)
+        co.commit('first')
+        co.close()
+
+        co = repo.checkout()
+        aset = co.columns['aset']
+        aset.zero_copy = True
+        for _ in range(2):
+            for i in range(20):
+                assert_equal(aset[i], np.full((5, 7), i, dtype=np.float32))
+        assert co.checksum_policy.counters['verified'] == 20
+        be = aset._be_fs['10']
+        uids = {aset._samples[i].uid for i in range(20)}
+        assert set(be._zero_copy_verified) == uids
+        for uid, verified in be._zero_copy_verified.items():
+            assert verified.dtype == bool
+            assert len(verified) == len(be.Fp[uid])
+        assert sum(int(v.sum()) for v in be._zero_copy_verified.values()) == 20
+        co.close()
+
+    def test_zero_copy_ignored_for_other_backends(self, repo):
+        co = repo.checkout(write=True)
+        aset = co.add_ndarray_column('aset', shape=(5, 7), dtype=np.float32, backend='01')
+        aset[0] = np.ones((5, 7), dtype=np.float32)
+        co.commit('first')
+        co.close()
+
+        co = repo.checkout()
+        aset = co.columns['aset']
+        aset.zero_copy = True
+        assert aset.zero_copy is False
+        assert aset[0].flags.writeable is True
+        co.close()
+
+    def test_zero_copy_not_allowed_in_write_checkout(self, repo):
+        co = repo.checkout(write=True)
+        aset = co.add_ndarray_column('aset', shape=(5, 7), dtype=np.float32, backend='10')
+        aset[0] = np.ones((5, 7), dtype=np.float32)
+        assert aset.zero_copy is False
+        with pytest.raises(PermissionError):
+            aset.zero_copy = True
+        assert aset[0].flags.owndata is True
+        co.close()
+
+    def test_zero_copy_value_must_be_bool(self, repo):
+        co = repo.checkout(write=True)
+        aset = co.add_ndarray_column('aset', shape=(5, 7), dtype=np.float32, backend='10')
+        aset[0] = np.ones((5, 7), dtype=np.float32)
+        co.commit('first')
+        co.close()
+
+        co = repo.checkout()
+        with pytest.raises(TypeError):
+            co.columns['aset'].zero_copy = 1
+        co.close()
+
+
 class TestMultiprocessColumnReads(object):
 
     @pytest.mark.parametrize('backend', fixed_shape_backend_params)
@@ -1460,3 +1742,207 @@ class TestMultiprocessColumnReads(object):
 
         assert '1232' not in aset
         co.close()
+
+
+class TestLazySampleSpecs(object):
+
+    @pytest.fixture()
+    def two_backend_repo(self, repo, array5by7):
+        co = repo.checkout(write=True)
+        aset = co.add_ndarray_column('aset', prototype=array5by7, backend='00')
+        for i in range(10):
+            array5by7[:] = i
+            aset[i] = array5by7
+        aset.change_backend('10')
+        for i in range(10, 20):
+            array5by7[:] = i
+            aset[i] = array5by7
+        co.add_str_column('strcol')['foo'] = 'bar'
+        co.commit('two backends')
+        co.close()
+        return repo
+
+    def test_lazy_specs_read_same_data(self, two_backend_repo):
+        from hangar.columns.common import LazySampleSpecs
+
+        co = two_backend_repo.checkout(lazy_specs=True)
+        aset = co.columns['aset']
+        assert isinstance(aset._samples, LazySampleSpecs)
+        assert list(aset._be_fs.keys()) == ['10']
+        assert len(aset) == 20
+        assert 5 in aset
+        assert sorted(aset.keys()) == list(range(20))
+        for i in range(20):
+            assert_equal(aset[i], np.full((5, 7), i, dtype=np.float64))
+        assert sorted(aset._be_fs.keys()) == ['00', '10']
+        assert_equal(aset.get_batch([3, 15]), np.stack([np.full((5, 7), 3.0),
+                                                         np.full((5, 7), 15.0)]))
+        assert co.columns['strcol']['foo'] == 'bar'
+        assert aset.contains_remote_references is False
+        co.close()
+
+    def test_lazy_spec_cache_is_bounded(self, two_backend_repo):
+        co = two_backend_repo.checkout(lazy_specs=True)
+        aset = co.columns['aset']
+        aset._samples._cache_size = 5
+        for i in range(20):
+            assert_equal(aset[i], np.full((5, 7), i, dtype=np.float64))
+            assert len(aset._samples._cache) == min(i + 1, 5)
+        assert_equal(aset[0], np.full((5, 7), 0, dtype=np.float64))
+        co.close()
+
+    def test_lazy_remote_queries_bypass_spec_cache(self, two_backend_repo):
+        co = two_backend_repo.checkout(lazy_specs=True)
+        aset = co.columns['aset']
+        assert aset.contains_remote_references is False
+        assert aset.remote_reference_keys == ()
+        assert sorted(aset.keys(local=True)) == list(range(20))
+        assert len(aset._samples._cache) == 0
+        co.close()
+
+    def test_lazy_spec_missing_digest_raises_key_error(self, two_backend_repo):
+        co = two_backend_repo.checkout(lazy_specs=True)
+        aset = co.columns['aset']
+        aset._samples._digests[0] = 'ffffffffffffffffffff'
+        with pytest.raises(KeyError, match='no record in the hash db'):
+            aset._samples[0]
+        assert 'ffffffffffffffffffff' not in aset._samples._cache
+        co.close()
+
+    def test_lazy_specs_column_can_be_pickled(self, two_backend_repo):
+        import pickle
+
+        co = two_backend_repo.checkout(lazy_specs=True)
+        aset = co.columns['aset']
+        unpickled = pickle.loads(pickle.dumps(aset))
+        assert isinstance(unpickled._samples, dict)
+        for i in range(20):
+            assert_equal(unpickled[i], aset[i])
+        co.close()
+
+    def test_lazy_specs_not_allowed_in_write_checkout(self, two_backend_repo):
+        with pytest.raises(ValueError):
+            two_backend_repo.checkout(write=True, lazy_specs=True)
+
+
+class TestCompactSampleSpecs(object):
+
+    def test_table_round_trips_every_backend_spec(self):
+        from hangar.backends import (
+            HDF5_00_DataHashSpec, HDF5_01_DataHashSpec, NUMPY_10_DataHashSpec,
+            LMDB_30_DataHashSpec, LMDB_31_DataHashSpec, REMOTE_50_DataHashSpec)
+        from hangar.columns.common import CompactSampleSpecs
+
+        specs = {
+            'a': HDF5_00_DataHashSpec('00', 'uid0', '00ff00ff00ff00ff', '2', 10, (5, 7)),
+            'b': HDF5_01_DataHashSpec('01', 'uid1', 'ffffffffffffffff', '0', 0, (3,)),
+            1: NUMPY_10_DataHashSpec('10', 'uid0', '0000000000000001', 42, (5, 7)),
+            2: LMDB_30_DataHashSpec('30', 'uid3', '0a1b', '123456789abcdef0'),
+            3: LMDB_31_DataHashSpec('31', 'uid3', '0a1c', '0fedcba987654321'),
+            'r': REMOTE_50_DataHashSpec('50', 'schemahash'),
+        }
+        table = CompactSampleSpecs.from_specs(specs.items())
+        assert len(table) == 6
+        assert list(table.keys()) == ['a', 'b', 1, 2, 3, 'r']
+        assert 'a' in table and 'z' not in table
+        assert '1' not in table and 4 not in table and 2 ** 70 not in table
+        for key, spec in specs.items():
+            res = table[key]
+            assert type(res) is type(spec)
+            assert tuple(res) == tuple(spec)
+        with pytest.raises(KeyError):
+            table['z']
+        assert table.backends() == {'00', '01', '10', '30', '31', '50'}
+        assert table.contains_remote() is True
+        assert table.remote_keys() == ('r',)
+        assert table.local_keys() == ('a', 'b', 1, 2, 3)
+        assert len(table._strings) == 8
+        assert len(table._shapes) == 2
+
+    def test_table_finds_keys_by_hash_index(self):
+        from hangar.backends import NUMPY_10_DataHashSpec
+        from hangar.columns.common import CompactSampleSpecs
+
+        keys = [*range(500, 0, -1), *(f'k{i}' for i in range(500)), 2 ** 40, -7, 'ünï']
+        table = CompactSampleSpecs.from_specs(
+            (key, NUMPY_10_DataHashSpec('10', 'uid', f'{i:016x}', i, (2,)))
+            for i, key in enumerate(keys))
+        assert len(table) == len(keys)
+        assert len(table._table_row) * 3 >= len(keys) * 4
+        assert list(table) == keys
+        for i, key in enumerate(keys):
+            assert table[key].collection_idx == i
+            assert table[key].checksum == f'{i:016x}'
+        with pytest.raises(KeyError):
+            table[0]
+        assert 'k500' not in table and 500.5 not in table and None not in table
+
+    def test_table_accepts_numpy_integer_keys(self):
+        from hangar.backends import REMOTE_50_DataHashSpec
+        from hangar.columns.common import CompactSampleSpecs
+
+        table = CompactSampleSpecs.from_specs(
+            (key, REMOTE_50_DataHashSpec('50', f'hash{key}')) for key in [10, 'a', 20])
+        assert np.int64(20) in table
+        assert table[np.int64(20)].schema_hash == 'hash20'
+        assert table[np.uint8(10)].schema_hash == 'hash10'
+        assert np.int64(30) not in table
+
+    @pytest.mark.parametrize('dup', [3, 'c'])
+    def test_table_rejects_duplicate_keys(self, dup):
+        from hangar.backends import REMOTE_50_DataHashSpec
+        from hangar.columns.common import CompactSampleSpecs
+
+        keys = [1, 2, 3, 'a', 'b', 'c', dup]
+        with pytest.raises(ValueError, match='duplicate sample key'):
+            CompactSampleSpecs.from_specs(
+                (key, REMOTE_50_DataHashSpec('50', 'schemahash')) for key in keys)
+
+    def test_compact_specs_read_same_data(self, repo_20_filled_samples):
+        from hangar.columns.common import CompactSampleSpecs
+
+        co = repo_20_filled_samples.checkout(compact_specs=True)
+        aset = co.columns['second_aset']
+        assert isinstance(aset._samples, CompactSampleSpecs)
+        assert len(aset) == 20
+        assert sorted(aset.keys()) == sorted(str(i) for i in range(20))
+        assert sorted(aset.keys(local=True)) == sorted(str(i) for i in range(20))
+        assert aset.contains_remote_references is False
+        assert aset.remote_reference_keys == ()
+        for i in range(20):
+            assert_equal(aset[str(i)], np.full((5, 7), -i, dtype=np.float64))
+        assert_equal(aset.get_batch(['2', '4']), np.stack([np.full((5, 7), -2.0),
+                                                           np.full((5, 7), -4.0)]))
+        co.close()
+
+    def test_compact_specs_iterate_in_same_order_as_dict(self, aset_samples_initialized_repo):
+        wco = aset_samples_initialized_repo.checkout(write=True)
+        wco.add_ndarray_column('mixed', prototype=np.arange(3))
+        keys = ['zz', 5, 'a', 300, 1, 'm', 0]
+        for i, key in enumerate(keys):
+            wco['mixed'][key] = np.arange(3) + i
+        wco.commit('mixed keys')
+        wco.close()
+
+        dco = aset_samples_initialized_repo.checkout()
+        cco = aset_samples_initialized_repo.checkout(compact_specs=True)
+        try:
+            assert list(cco.columns['mixed'].keys()) == list(dco.columns['mixed'].keys())
+            assert list(cco.columns['mixed'].keys()) == list(dco.columns['mixed']._samples)
+        finally:
+            dco.close()
+            cco.close()
+
+    def test_lazy_and_compact_specs_not_allowed_together(self, repo_20_filled_samples):
+        from hangar.columns import Columns
+        from hangar.columns.constructors import generate_flat_column
+
+        with pytest.raises(ValueError):
+            repo_20_filled_samples.checkout(lazy_specs=True, compact_specs=True)
+        with pytest.raises(ValueError, match='cannot both be True'):
+            Columns._from_commit(None, None, None, lazy_specs=True, compact_specs=True)
+        with pytest.raises(ValueError, match='cannot both be True'):
+            generate_flat_column(None, 'col', None, None, 'r',
+                                 lazy_specs=True, compact_specs=True)
+        with pytest.raises(ValueError):
+            repo_20_filled_samples.checkout(write=True, compact_specs=True)
@@ -1515,6 +1515,103 @@ class TestGetDataMethods:
         co.close()
 
 
+class TestGetBatch:
+
+    def test_get_batch_matches_getitem(self, initialized_arrayset, subsample_data_map):
+        aset = initialized_arrayset
+        keys = [('foo', 2), (2, 'bar'), ('foo', 0), ('foo', 1), (2, 'baz'), ('foo', 2)]
+        res = aset.get_batch(keys)
+        assert res.shape == (len(keys), 5, 7)
+        for idx, (sample, subsample) in enumerate(keys):
+            assert_equal(res[idx], subsample_data_map[sample][subsample])
+
+        out = np.zeros((len(keys), 5, 7), dtype=np.uint16)
+        res = aset.get_batch(keys, out=out)
+        assert res is out
+        for idx, (sample, subsample) in enumerate(keys):
+            assert_equal(out[idx], subsample_data_map[sample][subsample])
+
+    def test_get_batch_missing_key_raises(self, initialized_arrayset):
+        aset = initialized_arrayset
+        with pytest.raises(KeyError):
+            aset.get_batch([('foo', 0), ('foo', 'doesnotexist')])
+        with pytest.raises(KeyError):
+            aset.get_batch([('doesnotexist', 0)])
+
+    def test_get_batch_invalid_out_raises(self, initialized_arrayset):
+        aset = initialized_arrayset
+        with pytest.raises(ValueError):
+            aset.get_batch([('foo', 0), ('foo', 1)], out=np.zeros((2, 5, 7), dtype=np.float32))
+
+
+class TestGetMany:
+
+    @pytest.mark.parametrize('workers', [None, 1, 3])
+    def test_get_many_matches_getitem(self, initialized_arrayset, subsample_data_map, workers):
+        aset = initialized_arrayset
+        keys = [('foo', 2), (2, 'bar'), ('foo', 0), ('foo', 1), (2, 'baz'), ('foo', 2)]
+        res = aset.get_many(keys, workers=workers)
+        assert len(res) == len(keys)
+        for idx, (sample, subsample) in enumerate(keys):
+            assert_equal(res[idx], subsample_data_map[sample][subsample])
+
+    def test_get_many_read_checkout(self, repo, subsample_data_map):
+        co = repo.checkout(write=True)
+        aset = co.add_ndarray_column('foo', shape=(5, 7), dtype=np.uint16,
+                                     backend='10', contains_subsamples=True)
+        aset.update(subsample_data_map)
+        co.commit('first')
+        co.close()
+
+        co = repo.checkout()
+        keys = [(sample, subsample)
+                for sample, subsamples in subsample_data_map.items()
+                for subsample in subsamples]
+        res = co.columns['foo'].get_many(keys, workers=4)
+        for idx, (sample, subsample) in enumerate(keys):
+            assert_equal(res[idx], subsample_data_map[sample][subsample])
+        co.close()
+
+    def test_get_many_missing_key_raises(self, initialized_arrayset):
+        aset = initialized_arrayset
+        with pytest.raises(KeyError):
+            aset.get_many([('foo', 0), ('foo', 'doesnotexist')], workers=2)
+        with pytest.raises(KeyError):
+            aset.get_many([('doesnotexist', 0)], workers=2)
+
+
+class TestZeroCopyReads:
+
+    def test_zero_copy_returns_readonly_view(self, repo, subsample_data_map):
+        co = repo.checkout(write=True)
+        aset = co.add_ndarray_column('foo', shape=(5, 7), dtype=np.uint16,
+                                     backend='10', contains_subsamples=True)
+        aset.update(subsample_data_map)
+        co.commit('first')
+        co.close()
+
+        co = repo.checkout()
+        aset = co.columns['foo']
+        assert aset.zero_copy is False
+        aset.zero_copy = True
+        assert aset.zero_copy is True
+        for sample, subsamples in subsample_data_map.items():
+            for subsample, arr in subsamples.items():
+                res = aset[sample][subsample]
+                assert res.flags.writeable is False
+                assert_equal(res, arr)
+        co.close()
+
+    def test_zero_copy_not_allowed_in_write_checkout(self, repo, subsample_data_map):
+        co = repo.checkout(write=True)
+        aset = co.add_ndarray_column('foo', shape=(5, 7), dtype=np.uint16,
+                                     backend='10', contains_subsamples=True)
+        aset.update(subsample_data_map)
+        with pytest.raises(PermissionError):
+            aset.zero_copy = True
+        co.close()
+
+
 class TestWriteThenReadCheckout:
 
     @pytest.mark.parametrize('backend', fixed_shape_backend_params)
@@ -5,14 +5,15 @@ def test_verify_corruption_in_commit_ref_alerts(two_commit_filled_samples_repo):
     from hangar.records.parsing import commit_ref_db_key_from_raw_key
     from hangar.records.parsing import commit_ref_raw_val_from_db_val
     from hangar.records.parsing import commit_ref_db_val_from_raw_val
+    from hangar.records.commiting import get_commit_ref_db_val
 
     repo = two_commit_filled_samples_repo
     history = repo.log(return_contents=True)
     head_commit = history['head']
 
     refKey = commit_ref_db_key_from_raw_key(head_commit)
+    refVal = get_commit_ref_db_val(repo._env.refenv, head_commit)
     with repo._env.refenv.begin(write=True) as txn:
-        refVal = txn.get(refKey)
         ref_unpacked = commit_ref_raw_val_from_db_val(refVal)
 
         modified_ref = list(ref_unpacked.db_kvs)
@@ -32,6 +33,34 @@ def test_verify_corruption_in_commit_ref_alerts(two_commit_filled_samples_repo):
         _ = repo.checkout(write=False, commit=head_commit)
 
 
+def test_verify_corruption_in_delta_commit_ref_alerts(two_commit_filled_samples_repo):
+    from hangar.records.parsing import commit_ref_db_key_from_raw_key
+    from hangar.records.parsing import commit_ref_db_val_is_delta
+    from hangar.records.parsing import commit_ref_delta_raw_val_from_db_val
+    from hangar.records.parsing import commit_ref_delta_db_val_from_raw_val
+
+    repo = two_commit_filled_samples_repo
+    history = repo.log(return_contents=True)
+    head_commit = history['head']
+
+    refKey = commit_ref_db_key_from_raw_key(head_commit)
+    with repo._env.refenv.begin(write=True) as txn:
+        refVal = txn.get(refKey)
+        assert commit_ref_db_val_is_delta(refVal)
+        delta = commit_ref_delta_raw_val_from_db_val(refVal)
+
+        modified_put = list(delta.put)
+        modified_put[0] = (modified_put[0][0], b'corrupt!')
+        modifiedVal = commit_ref_delta_db_val_from_raw_val(
+            parent=delta.parent, depth=delta.depth,
+            deleted=delta.deleted, put=modified_put)
+
+        txn.put(refKey, modifiedVal, overwrite=True)
+
+    with pytest.raises(IOError):
+        _ = repo.checkout(write=False, commit=head_commit)
+
+
 def test_verify_corruption_in_commit_parent_val_alerts(two_commit_filled_samples_repo):
     from hangar.records.parsing import commit_parent_db_key_from_raw_key
     from hangar.records.parsing import commit_parent_raw_val_from_db_val
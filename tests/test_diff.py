@@ -421,3 +421,296 @@ def test_repo_diff_method_one_branch_one_commit_digest(aset_samples_initialized_
 
     repo_diff2 = repo.diff(masterHEAD, 'testbranch')
     assert co_diff == repo_diff2
+
+
+class TestRangeDigestDiff(object):
+
+    @pytest.fixture()
+    def two_commit_repo(self, aset_samples_initialized_repo, monkeypatch):
+        from hangar.records import parsing
+
+        monkeypatch.setattr(parsing, 'CMT_REF_RANGE_SIZE', 4)
+        repo = aset_samples_initialized_repo
+        co = repo.checkout(write=True)
+        co.add_str_column('strcol')
+        for idx in range(60):
+            co['writtenaset'][idx] = np.full((5, 7), idx, dtype=np.float64)
+            co['strcol'][idx] = str(idx)
+        first = co.commit('first')
+        co['writtenaset'][5] = np.zeros((5, 7), dtype=np.float64)
+        del co['writtenaset'][30]
+        co['writtenaset'][100] = np.ones((5, 7), dtype=np.float64)
+        second = co.commit('second')
+        co.close()
+        yield repo, first, second
+
+    def test_commit_ranges_match_commit_records(self, two_commit_repo):
+        from hangar.records.commiting import get_commit_ref, get_commit_ref_ranges
+        from hangar.records.parsing import (
+            commit_ref_kv_digest, commit_ref_ranges_from_kv_digests
+        )
+
+        repo, first, second = two_commit_repo
+        for cmt in (first, second):
+            refs = get_commit_ref(repo._env.refenv, cmt)
+            expected = commit_ref_ranges_from_kv_digests(
+                (k, commit_ref_kv_digest(k, v)) for k, v in refs)
+            ranges = get_commit_ref_ranges(repo._env.refenv, cmt)
+            assert ranges == expected
+            assert len(ranges) > 4
+
+    def test_diff_with_ranges_matches_full_walk(self, two_commit_repo):
+        from hangar.diff import diff_envs
+        from hangar.records.commiting import get_commit_ref_ranges, tmp_cmt_env
+
+        repo, first, second = two_commit_repo
+        fR = get_commit_ref_ranges(repo._env.refenv, first)
+        sR = get_commit_ref_ranges(repo._env.refenv, second)
+        with tmp_cmt_env(repo._env.refenv, first) as fEnv, \
+                tmp_cmt_env(repo._env.refenv, second) as sEnv:
+            expected = diff_envs(fEnv, sEnv)
+            assert diff_envs(fEnv, sEnv, fR, sR) == expected
+            assert len(expected.added) == 1
+            assert len(expected.deleted) == 1
+            assert len(expected.mutated) == 1
+            # identical range digests are never walked record by record.
+            assert diff_envs(fEnv, sEnv, fR, fR) == diff_envs(fEnv, fEnv)
+
+        co = repo.checkout(commit=first)
+        diff = co.diff.commit(second).diff
+        assert len(diff.mutated.samples) == 1
+        co.close()
+
+
+class TestStreamingDiff(object):
+
+    @pytest.fixture()
+    def diverged_repo(self, repo_2_br_no_conf):
+        repo = repo_2_br_no_conf
+        co = repo.checkout(write=True, branch='testbranch')
+        co.add_str_column('strcol')
+        co['strcol']['foo'] = 'bar'
+        co['dummy']['1'] = np.arange(50)
+        del co['dummy']['2']
+        co.commit('mutation, removal, and new column')
+        co.close()
+        return repo
+
+    @staticmethod
+    def _expected(diff_out):
+        expected = set()
+        for kind in ('added', 'deleted', 'mutated'):
+            changes = getattr(diff_out, kind)
+            expected.update((kind, rec) for rec in changes.samples)
+            expected.update((kind, rec) for rec in changes.schema)
+        return expected
+
+    @pytest.mark.parametrize('writer', [False, True])
+    def test_iter_matches_full_diff(self, diverged_repo, writer):
+        from hangar.diff import DiffCounts
+
+        repo = diverged_repo
+        co = repo.checkout(write=writer, branch='master')
+        testHEAD = repo.log(branch='testbranch', return_contents=True)['head']
+        expected = self._expected(co.diff.branch('testbranch').diff)
+        assert len(expected) > 0
+
+        streamed = list(co.diff.iter_branch('testbranch'))
+        assert len(streamed) == len(expected)
+        assert set(streamed) == expected
+        assert set(co.diff.iter_commit(testHEAD)) == expected
+
+        counts = co.diff.count_branch('testbranch')
+        assert isinstance(counts, DiffCounts)
+        assert counts == co.diff.count_commit(testHEAD)
+        assert sum(counts) == len(expected)
+        for kind, num in counts._asdict().items():
+            assert num == len([rec for rec in streamed if rec.kind == kind])
+        co.close()
+
+    @pytest.mark.parametrize('writer', [False, True])
+    def test_iter_column_filter(self, diverged_repo, writer):
+        repo = diverged_repo
+        co = repo.checkout(write=writer, branch='master')
+        streamed = list(co.diff.iter_branch('testbranch'))
+        for column in ('dummy', 'strcol', 'doesnotexist'):
+            filtered = list(co.diff.iter_branch('testbranch', column=column))
+            assert filtered == [rec for rec in streamed if rec.record.column == column]
+            assert sum(co.diff.count_branch('testbranch', column=column)) == len(filtered)
+        assert len(list(co.diff.iter_branch('testbranch', column='strcol'))) == 2
+        co.close()
+
+    @pytest.mark.parametrize('writer', [False, True])
+    def test_iter_invalid_reference(self, diverged_repo, writer):
+        repo = diverged_repo
+        co = repo.checkout(write=writer, branch='master')
+        with pytest.raises(ValueError):
+            co.diff.iter_branch('wrong_branch_name')
+        with pytest.raises(ValueError):
+            co.diff.count_commit('a=wronghash')
+        co.close()
+
+    def test_iter_staged(self, diverged_repo):
+        repo = diverged_repo
+        co = repo.checkout(write=True, branch='testbranch')
+        co['dummy']['new'] = np.arange(50)
+        co['dummy']['3'] = np.zeros(50, dtype=np.int64)
+        del co['strcol']['foo']
+        expected = self._expected(co.diff.staged().diff)
+        assert set(co.diff.iter_staged()) == expected
+        assert co.diff.count_staged() == (1, 1, 1)
+        assert co.diff.count_staged(column='dummy') == (1, 0, 1)
+        assert [rec.kind for rec in co.diff.iter_staged(column='strcol')] == ['deleted']
+        co.close()
+
+
+class TestThreeWayDiff(object):
+
+    @pytest.fixture()
+    def conflicting_repo(self, repo_1_br_no_conf):
+        repo = repo_1_br_no_conf
+        dummyData = np.arange(50)
+        co = repo.checkout(write=True, branch='master')
+        dummyData[:] = 123
+        co.columns['dummy']['55'] = dummyData   # t1
+        co.columns['dummy']['56'] = dummyData   # identical addition
+        del co.columns['dummy']['1']            # t21
+        co.columns['dummy']['2'] = dummyData    # t22
+        co.columns['dummy']['3'] = dummyData    # t3
+        co.columns['dummy']['4'] = dummyData    # identical mutation
+        co.commit('master changes')
+        co.close()
+
+        co = repo.checkout(write=True, branch='testbranch')
+        co.columns['dummy']['56'] = dummyData
+        co.columns['dummy']['4'] = dummyData
+        dummyData[:] = 234
+        co.columns['dummy']['55'] = dummyData
+        co.columns['dummy']['1'] = dummyData
+        del co.columns['dummy']['2']
+        co.columns['dummy']['3'] = dummyData
+        co.commit('testbranch changes')
+        co.close()
+        return repo
+
+    def test_find_conflicts_merge_join(self, conflicting_repo):
+        from hangar.diff import diff_envs, find_conflicts, find_conflicts_from_changes, iter_diff_envs
+        from hangar.records.commiting import find_merge_base, tmp_cmt_env
+        from hangar.records.heads import get_branch_head_commit
+
+        repo = conflicting_repo
+        refenv = repo._env.refenv
+        mHEAD = get_branch_head_commit(repo._env.branchenv, 'master')
+        dHEAD = get_branch_head_commit(repo._env.branchenv, 'testbranch')
+        aHEAD, _ = find_merge_base(refenv, mHEAD, dHEAD)
+        with tmp_cmt_env(refenv, aHEAD) as a_env, tmp_cmt_env(refenv, mHEAD) as m_env, \
+                tmp_cmt_env(refenv, dHEAD) as d_env:
+            conflict = find_conflicts_from_changes(iter_diff_envs(a_env, m_env),
+                                                   iter_diff_envs(a_env, d_env))
+            assert conflict == find_conflicts(diff_envs(a_env, m_env), diff_envs(a_env, d_env))
+
+        assert conflict.conflict is True
+        for field, key in (('t1', b'f:dummy:55'), ('t21', b'f:dummy:1'),
+                           ('t22', b'f:dummy:2'), ('t3', b'f:dummy:3')):
+            assert [k for k, _ in getattr(conflict, field)] == [key]
+
+    def test_diff3_from_ancestor_collects_whole_dev_stream(self, conflicting_repo):
+        from hangar.diff import diff3_envs, diff_envs
+        from hangar.records.commiting import find_merge_base, tmp_cmt_env
+        from hangar.records.heads import get_branch_head_commit
+
+        repo = conflicting_repo
+        refenv = repo._env.refenv
+        mHEAD = get_branch_head_commit(repo._env.branchenv, 'master')
+        dHEAD = get_branch_head_commit(repo._env.branchenv, 'testbranch')
+        aHEAD, _ = find_merge_base(refenv, mHEAD, dHEAD)
+        with tmp_cmt_env(refenv, aHEAD) as a_env, tmp_cmt_env(refenv, mHEAD) as m_env, \
+                tmp_cmt_env(refenv, dHEAD) as d_env:
+            expected = diff_envs(a_env, d_env)
+            # master stream is empty, so the merge-join stops at once
+            res = diff3_envs(a_env, a_env, d_env, from_ancestor=True)
+            assert res.diff == expected
+            assert res.conflict.conflict is False
+            res = diff3_envs(a_env, m_env, d_env, from_ancestor=True)
+            assert res.diff == expected
+            assert res.conflict.conflict is True
+
+    @pytest.mark.parametrize('writer', [False, True])
+    def test_parallel_diff3_matches_sequential(self, conflicting_repo, writer, monkeypatch):
+        from hangar import diff
+
+        repo = conflicting_repo
+        co = repo.checkout(write=writer, branch='master')
+        expected = co.diff.branch('testbranch')
+        monkeypatch.setattr(diff, 'DIFF_PARALLEL_MIN_RECORDS', 0)
+        assert co.diff.branch('testbranch') == expected
+        co.close()
+
+    def test_parallel_diff3_streams_bounded_batches(self, conflicting_repo, monkeypatch):
+        import threading
+        from hangar import diff
+        from hangar.records.commiting import find_merge_base, tmp_cmt_env
+        from hangar.records.heads import get_branch_head_commit
+
+        repo = conflicting_repo
+        co = repo.checkout(branch='master')
+        expected = co.diff.branch('testbranch')
+        monkeypatch.setattr(diff, 'DIFF_PARALLEL_MIN_RECORDS', 0)
+        monkeypatch.setattr(diff, 'DIFF_PARALLEL_BATCH_SIZE', 1)
+        assert co.diff.branch('testbranch') == expected
+        co.close()
+
+        refenv = repo._env.refenv
+        mHEAD = get_branch_head_commit(repo._env.branchenv, 'master')
+        dHEAD = get_branch_head_commit(repo._env.branchenv, 'testbranch')
+        aHEAD, _ = find_merge_base(refenv, mHEAD, dHEAD)
+        with tmp_cmt_env(refenv, aHEAD) as a_env, tmp_cmt_env(refenv, dHEAD) as d_env:
+            walk = diff._ThreadedWalk((a_env, d_env, None, None), batch_size=3)
+            try:
+                assert list(walk) == list(diff.iter_diff_envs(a_env, d_env))
+            finally:
+                walk.close()
+
+            # a walk closed before it is consumed stops its worker thread
+            nthreads = threading.active_count()
+            walk = diff._ThreadedWalk((a_env, d_env, None, None), batch_size=1)
+            assert next(iter(walk)) == next(diff.iter_diff_envs(a_env, d_env))
+            walk.close()
+            assert not walk._thread.is_alive()
+            assert threading.active_count() == nthreads
+
+    def test_parallel_diff3_starts_no_processes(self, conflicting_repo, monkeypatch):
+        import multiprocessing
+        from hangar import diff
+
+        def _no_processes(*args, **kwargs):
+            raise AssertionError('diff started a process')
+
+        monkeypatch.setattr(multiprocessing.process.BaseProcess, 'start', _no_processes)
+        monkeypatch.setattr(diff, 'DIFF_PARALLEL_MIN_RECORDS', 0)
+        co = conflicting_repo.checkout(branch='master')
+        try:
+            assert co.diff.branch('testbranch').conflict.conflict is True
+        finally:
+            co.close()
+
+    def test_parallel_merge_conflict_and_success(self, repo_2_br_no_conf, monkeypatch):
+        from hangar import diff
+
+        monkeypatch.setattr(diff, 'DIFF_PARALLEL_MIN_RECORDS', 0)
+        repo = repo_2_br_no_conf
+        cmt = repo.merge('merge commit', 'master', 'testbranch')
+        co = repo.checkout(commit=cmt)
+        assert len(co.columns['dummy']) == 50
+        co.close()
+
+        co = repo.checkout(write=True, branch='master')
+        co.columns['dummy']['0'] = np.full(50, 7, dtype=np.int64)
+        co.commit('mutate on master')
+        co.close()
+        co = repo.checkout(write=True, branch='testbranch')
+        co.columns['dummy']['0'] = np.ones(50, dtype=np.int64)
+        co.commit('mutate on testbranch')
+        co.close()
+        with pytest.raises(ValueError, match='conflict'):
+            repo.merge('conflicting merge', 'master', 'testbranch')
@@ -0,0 +1,172 @@
+import os
+
+import pytest
+import numpy as np
+
+from hangar.backends.handlepool import FileHandlePool, FILE_HANDLE_POOL
+
+
+class _Handle(object):
+
+    def __init__(self, name):
+        self.name = name
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_acquire_shares_handle_and_counts_references():
+    pool = FileHandlePool(maxsize=4)
+    opened = []
+
+    def opener():
+        opened.append(_Handle('a'))
+        return opened[-1]
+
+    first = pool.acquire(('00', 'a'), opener)
+    second = pool.acquire(('00', 'a'), opener)
+    assert first is second
+    assert len(opened) == 1
+    assert pool.refcount(('00', 'a')) == 2
+
+    pool.release(('00', 'a'))
+    pool.release(('00', 'a'))
+    assert pool.refcount(('00', 'a')) == 0
+    assert ('00', 'a') in pool
+    assert first.closed is False
+    with pytest.raises(RuntimeError):
+        pool.release(('00', 'a'))
+
+
+
+def _run_in_forked_child(func):
+    """Call ``func`` in a forked child process, returning its exit status.
+    """
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        code = 1
+        try:
+            func()
+            code = 0
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    return os.WEXITSTATUS(status)
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='os.fork not available')
+def test_release_of_pre_fork_reference_is_noop_in_child():
+    pool = FileHandlePool(maxsize=4)
+    pool.acquire(('00', 'a'), lambda: _Handle('a'))
+    generation = pool.generation
+
+    def child():
+        pool.release(('00', 'a'), generation)
+        assert ('00', 'a') not in pool
+        assert pool.generation != generation
+        pool.acquire(('00', 'a'), lambda: _Handle('a'))
+        pool.release(('00', 'a'), pool.generation)
+        assert pool.refcount(('00', 'a')) == 0
+
+    assert _run_in_forked_child(child) == 0
+    assert pool.refcount(('00', 'a')) == 1
+    pool.release(('00', 'a'), generation)
+    assert pool.refcount(('00', 'a')) == 0
+
+
+def test_idle_handles_evicted_in_lru_order():
+    pool = FileHandlePool(maxsize=2)
+    handles = {k: pool.acquire(('10', k), lambda k=k: _Handle(k)) for k in 'abc'}
+    # over maxsize, but every handle is in use so none can be closed.
+    assert len(pool) == 3
+
+    pool.release(('10', 'b'))
+    assert handles['b'].closed is True
+    assert ('10', 'b') not in pool
+
+    pool.release(('10', 'a'))
+    assert handles['a'].closed is False
+    pool.acquire(('10', 'd'), lambda: _Handle('d'))
+    assert handles['a'].closed is True
+    assert len(pool) == 2
+
+    pool.release(('10', 'c'))
+    pool.maxsize = 1
+    assert handles['c'].closed is True
+    assert len(pool) == 1
+    with pytest.raises(ValueError):
+        pool.maxsize = -1
+
+
+def test_clear_closes_only_idle_handles():
+    pool = FileHandlePool(maxsize=4)
+    used = pool.acquire(('00', 'used'), lambda: _Handle('used'))
+    idle = pool.acquire(('00', 'idle'), lambda: _Handle('idle'))
+    pool.release(('00', 'idle'))
+    pool.clear()
+    assert idle.closed is True
+    assert used.closed is False
+    assert len(pool) == 1
+
+
+@pytest.mark.parametrize('backend', ['00', '01', '10'])
+def test_reader_checkouts_share_pooled_file_handles(repo, backend):
+    co = repo.checkout(write=True)
+    col = co.add_ndarray_column('col', prototype=np.zeros((5, 7)), backend=backend)
+    col.update({i: np.full((5, 7), i, dtype=np.float64) for i in range(10)})
+    co.commit('first')
+    co.close()
+
+    co1 = repo.checkout()
+    co2 = repo.checkout()
+    col1, col2 = co1.columns['col'], co2.columns['col']
+    assert np.all(col1[3] == 3)
+    assert np.all(col2[4] == 4)
+    uid = col1._samples[3].uid
+    fh1, fh2 = col1._be_fs[backend], col2._be_fs[backend]
+    assert fh1.rFp[uid] is fh2.rFp[uid]
+    key, generation = fh1._pooled[uid]
+    assert generation == FILE_HANDLE_POOL.generation
+    assert FILE_HANDLE_POOL.refcount(key) == 2
+
+    co1.close()
+    assert FILE_HANDLE_POOL.refcount(key) == 1
+    assert np.all(col2[5] == 5)
+    co2.close()
+    assert FILE_HANDLE_POOL.refcount(key) == 0
+
+
+def test_write_checkout_does_not_use_pool(repo):
+    co = repo.checkout(write=True)
+    col = co.add_ndarray_column('col', prototype=np.zeros((5, 7)), backend='00')
+    col[0] = np.zeros((5, 7))
+    co.commit('first')
+    assert np.all(col[0] == 0)
+    assert col._be_fs['00']._pooled == {}
+    co.close()
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='os.fork not available')
+def test_numpy_reader_can_close_after_fork(repo):
+    co = repo.checkout(write=True)
+    col = co.add_ndarray_column('col', prototype=np.zeros((5, 7)), backend='10')
+    col.update({i: np.full((5, 7), i, dtype=np.float64) for i in range(10)})
+    co.commit('first')
+    co.close()
+
+    co = repo.checkout()
+    col = co.columns['col']
+    assert np.all(col[3] == 3)
+    r = col._be_fs['10']
+    key, _ = next(iter(r._pooled.values()))
+    assert FILE_HANDLE_POOL.refcount(key) == 1
+
+    def child():
+        r.close()
+        assert r._pooled == {}
+
+    assert _run_in_forked_child(child) == 0
+    assert FILE_HANDLE_POOL.refcount(key) == 1
+    co.close()
+    assert FILE_HANDLE_POOL.refcount(key) == 0
@@ -336,3 +336,82 @@ class TestArraysetSampleConflicts(object):
         aset = co.columns['dummy']
         assert '0' not in aset
         assert len(aset) == 47
+
+
+class TestCommitGraphIndex(object):
+
+    def test_generation_numbers_recorded_on_commit(self, repo_2_br_no_conf):
+        from hangar.records.commiting import get_commit_graph_node
+
+        repo = repo_2_br_no_conf
+        refenv = repo._env.refenv
+        mergeHash = repo.merge('merge commit', 'master', 'testbranch')
+        history = repo.log(return_contents=True)
+        for cmt, parents in history['ancestors'].items():
+            node = get_commit_graph_node(refenv, cmt)
+            if parents == ['']:
+                assert node.parents == ()
+                assert node.generation == 1
+            else:
+                assert node.parents == tuple(parents)
+                assert node.generation == 1 + max(
+                    get_commit_graph_node(refenv, p).generation for p in parents)
+            assert node.commit_time == history['specs'][cmt]['commit_time']
+        assert get_commit_graph_node(refenv, mergeHash).generation == 3
+
+    def test_merge_base_and_ancestry(self, repo_2_br_no_conf):
+        from hangar.records.commiting import (
+            commit_is_ancestor, find_merge_base, get_commit_ancestors
+        )
+        from hangar.records.heads import get_branch_head_commit
+
+        repo = repo_2_br_no_conf
+        refenv = repo._env.refenv
+        masterHEAD = get_branch_head_commit(repo._env.branchenv, 'master')
+        devHEAD = get_branch_head_commit(repo._env.branchenv, 'testbranch')
+        base = get_commit_ancestors(refenv, devHEAD).master_ancestor
+
+        assert find_merge_base(refenv, masterHEAD, devHEAD) == (base, False)
+        assert find_merge_base(refenv, base, devHEAD) == (base, True)
+        assert find_merge_base(refenv, devHEAD, devHEAD) == (devHEAD, True)
+        assert commit_is_ancestor(refenv, base, masterHEAD) is True
+        assert commit_is_ancestor(refenv, devHEAD, masterHEAD) is False
+
+        mergeHash = repo.merge('merge commit', 'master', 'testbranch')
+        assert commit_is_ancestor(refenv, devHEAD, mergeHash) is True
+        assert find_merge_base(refenv, devHEAD, mergeHash) == (devHEAD, True)
+
+    def test_graph_nodes_computed_when_missing_from_index(self, repo_2_br_no_conf):
+        from hangar.records import parsing
+        from hangar.records.commiting import get_commit_ancestors_graph, get_commit_graph_node
+        from hangar.records.heads import get_branch_head_commit
+        from hangar.txnctx import TxnRegister
+
+        repo = repo_2_br_no_conf
+        refenv = repo._env.refenv
+        masterHEAD = get_branch_head_commit(repo._env.branchenv, 'master')
+        expected_graph = get_commit_ancestors_graph(refenv, masterHEAD)
+        expected = {cmt: get_commit_graph_node(refenv, cmt) for cmt in expected_graph}
+
+        txn = TxnRegister().begin_writer_txn(refenv)
+        try:
+            for cmt in expected:
+                assert txn.delete(parsing.commit_graph_db_key_from_raw_key(cmt))
+        finally:
+            TxnRegister().commit_writer_txn(refenv)
+
+        assert get_commit_ancestors_graph(refenv, masterHEAD) == expected_graph
+        for cmt, node in expected.items():
+            assert get_commit_graph_node(refenv, cmt) == node
+
+        # index of the full history is restored by the next commit.
+        co = repo.checkout(write=True, branch='master')
+        co.columns['dummy']['new'] = np.arange(50)
+        newHash = co.commit('commit after index removed')
+        co.close()
+        txn = TxnRegister().begin_reader_txn(refenv)
+        try:
+            for cmt in (*expected, newHash):
+                assert txn.get(parsing.commit_graph_db_key_from_raw_key(cmt)) is not None
+        finally:
+            TxnRegister().abort_reader_txn(refenv)
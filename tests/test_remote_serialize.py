@@ -277,3 +277,74 @@ def test_serialize_deserialize_ident_only_schema_only_record_pack(ident_testcase
         assert isinstance(resIdent, DataIdent)
         assert resIdent.digest == origIdent[0]
         assert resIdent.schema == origIdent[1]
+
+
+def test_serialize_record_buffers_match_record(array_testcase, ident_testcase):
+    import struct
+    from hangar.remote.chunks import serialize_record
+    from hangar.remote.chunks import serialize_record_buffers
+    from hangar.remote.chunks import buffers_nbytes
+
+    digest, schema = ident_testcase
+    buffers = serialize_record_buffers(array_testcase, digest, schema)
+    raw = serialize_record(array_testcase, digest, schema)
+    assert b''.join(buffers) == raw
+    assert buffers_nbytes(buffers) == len(raw)
+    # array data is referenced, not copied
+    assert np.shares_memory(np.frombuffer(buffers[-1], dtype=np.uint8), array_testcase)
+
+    # wire format is unchanged
+    arr = array_testcase
+    raw_arr = struct.pack(f'<bb{arr.ndim}i{arr.nbytes}s',
+                          arr.dtype.num, arr.ndim, *arr.shape, arr.tobytes())
+    raw_ident = struct.pack(f'<hh{len(digest)}s{len(schema)}s',
+                            len(digest), len(schema), digest.encode(), schema.encode())
+    expected = struct.pack(f'<b2Q{len(raw_ident)}s{len(raw_arr)}s',
+                           0, len(raw_ident), len(raw_arr), raw_ident, raw_arr)
+    assert raw == expected
+
+
+@pytest.mark.parametrize('arr', [
+    np.arange(60, dtype=np.int32).reshape(3, 4, 5).transpose(2, 0, 1),
+    np.arange(60, dtype=np.float64).reshape(6, 10)[::2, 1::3],
+    np.asfortranarray(np.arange(12, dtype=np.uint8).reshape(3, 4)),
+])
+def test_serialize_record_buffers_non_contiguous_array(arr):
+    from hangar.remote.chunks import serialize_record_buffers
+    from hangar.remote.chunks import deserialize_record
+
+    buffers = serialize_record_buffers(arr, 'digest', 'schema')
+    res = deserialize_record(b''.join(buffers))
+    assert_array_equal(res.data, arr)
+
+
+def test_serialize_record_pack_of_buffers(ident_testcase):
+    from hangar.remote.chunks import serialize_record
+    from hangar.remote.chunks import serialize_record_buffers
+    from hangar.remote.chunks import serialize_record_pack
+    from hangar.remote.chunks import deserialize_record_pack
+    from hangar.remote.chunks import deserialize_record
+
+    digest, schema = ident_testcase
+    data = [np.random.random_sample(shape).astype(dtype)
+            for shape in param_shapes for dtype in param_dtypes]
+    data.extend(['i am string', b'i am bytes', np.zeros((0,), dtype=np.float32)])
+
+    buffer_pack = serialize_record_pack(
+        [serialize_record_buffers(d, digest, schema) for d in data])
+    bytes_pack = serialize_record_pack(
+        [serialize_record(d, digest, schema) for d in data])
+    assert buffer_pack == bytes_pack
+
+    for raw, orig in zip(deserialize_record_pack(bytes(buffer_pack)), data):
+        res = deserialize_record(raw)
+        if isinstance(orig, np.ndarray):
+            assert_array_equal(res.data, orig)
+            # arrays are read-only views of the received pack
+            assert res.data.flags.owndata is False
+            assert res.data.flags.writeable is False
+        else:
+            assert type(res.data) is type(orig)
+            assert res.data == orig
+        assert res.digest == digest
+        assert res.schema == schema
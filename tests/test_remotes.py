@@ -111,11 +111,11 @@ def test_push_and_clone_master_linear_history_multiple_commits(
     newRepo.clone('Test User', 'tester@foo.com', server_instance, remove_old=True)
     assert newRepo.list_branches() == ['master', 'origin/master']
     for cmt, sampList in cmtList:
-        with pytest.warns(UserWarning):
-            nco = newRepo.checkout(commit=cmt)
+        nco = newRepo.checkout(commit=cmt)
         assert len(nco.columns) == 1
         assert 'writtenaset' in nco.columns
-        assert len(nco.columns['writtenaset']) == len(sampList)
+        with pytest.warns(UserWarning):
+            assert len(nco.columns['writtenaset']) == len(sampList)
 
         assert nco.columns['writtenaset'].contains_remote_references is True
         remoteKeys = nco.columns['writtenaset'].remote_reference_keys
@@ -239,11 +239,11 @@ def test_server_push_second_branch_with_new_commit_then_clone_partial_fetch(
     newRepo.clone('Test User', 'tester@foo.com', server_instance, remove_old=True)
     assert newRepo.list_branches() == ['master', 'origin/master']
     for cmt, sampList in masterCmtList:
-        with pytest.warns(UserWarning):
-            nco = newRepo.checkout(commit=cmt)
+        nco = newRepo.checkout(commit=cmt)
         assert len(nco.columns) == 1
         assert 'writtenaset' in nco.columns
-        assert len(nco.columns['writtenaset']) == nMasterSamples
+        with pytest.warns(UserWarning):
+            assert len(nco.columns['writtenaset']) == nMasterSamples
 
         assert nco.columns['writtenaset'].contains_remote_references is True
         remoteKeys = nco.columns['writtenaset'].remote_reference_keys
@@ -262,12 +262,11 @@ def test_server_push_second_branch_with_new_commit_then_clone_partial_fetch(
     assert fetch == f'origin/{branch.name}'
     assert newRepo.list_branches() == ['master', 'origin/master', f'origin/{branch.name}']
     for cmt, sampList in devCmtList:
-
-        with pytest.warns(UserWarning):
-            nco = newRepo.checkout(commit=cmt)
+        nco = newRepo.checkout(commit=cmt)
         assert len(nco.columns) == 1
         assert 'writtenaset' in nco.columns
-        assert len(nco.columns['writtenaset']) == nDevSamples
+        with pytest.warns(UserWarning):
+            assert len(nco.columns['writtenaset']) == nDevSamples
 
         assert nco.columns['writtenaset'].contains_remote_references is True
         remoteKeys = nco.columns['writtenaset'].remote_reference_keys
@@ -686,3 +685,435 @@ def test_push_restricted_wrong_user_and_password(server_instance_push_restricted
                                  'master',
                                  username='wrong_username',
                                  password='wrong_password')
+
+
+@pytest.mark.parametrize('frame_nbytes', [0, 1, 500, 16_000_000])
+def test_client_fetch_data_frames(written_two_cmt_server_repo, frame_nbytes):
+    from hangar.records.hashs import HashQuery
+    from hangar.remote.client import HangarClient
+
+    server, repo = written_two_cmt_server_repo
+    digests = HashQuery(repo._env.hashenv).list_all_hash_keys_raw()
+    assert len(digests) == 15
+
+    client = HangarClient(envs=repo._env, address=server)
+    try:
+        frames = list(client.iter_fetch_data('', digests, frame_nbytes=frame_nbytes))
+        received = [digest for frame in frames for digest, _ in frame]
+        assert sorted(received) == sorted(digests)
+        if frame_nbytes in (0, 16_000_000):
+            assert len(frames) == 1
+        elif frame_nbytes == 1:
+            assert len(frames) == len(digests)
+        else:
+            assert 1 < len(frames) < len(digests)
+
+        res = client.fetch_data('', digests, frame_nbytes=frame_nbytes)
+        assert sorted(digest for digest, _ in res) == sorted(digests)
+    finally:
+        client.close()
+
+
+def test_fetch_data_writes_streamed_frames(written_two_cmt_server_repo, managed_tmpdir):
+    from hangar import Repository
+
+    server, repo = written_two_cmt_server_repo
+    new_tmpdir = pjoin(managed_tmpdir, 'new')
+    mkdir(new_tmpdir)
+    newRepo = Repository(path=new_tmpdir, exists=False)
+    newRepo.clone('Test User', 'tester@foo.com', server, remove_old=True)
+    newRepo.remote.fetch_data('origin', branch='master')
+
+    co = repo.checkout()
+    nco = newRepo.checkout()
+    assert nco.columns['writtenaset'].contains_remote_references is False
+    for key, arr in co.columns['writtenaset'].items():
+        assert np.allclose(nco.columns['writtenaset'][key], arr)
+    co.close()
+    nco.close()
+    newRepo._env._close_environments()
+
+
+def test_lazy_specs_warn_on_first_remote_read(written_two_cmt_server_repo, managed_tmpdir):
+    import warnings
+    from hangar import Repository
+
+    server, _ = written_two_cmt_server_repo
+    new_tmpdir = pjoin(managed_tmpdir, 'new')
+    mkdir(new_tmpdir)
+    newRepo = Repository(path=new_tmpdir, exists=False)
+    newRepo.clone('Test User', 'tester@foo.com', server, remove_old=True)
+
+    co = newRepo.checkout(lazy_specs=True)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            col = co.columns['writtenaset']
+            keys = list(col.keys())
+            assert col.contains_remote_references is True
+        with pytest.warns(UserWarning, match='reference-only'):
+            with pytest.raises(FileNotFoundError):
+                col[keys[0]]
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            with pytest.raises(FileNotFoundError):
+                col[keys[1]]
+    finally:
+        co.close()
+        newRepo._env._close_environments()
+
+
+def _configured_server_repo(monkeypatch, managed_tmpdir, worker_id, repo, **server_cfg):
+    from secrets import choice
+    from hangar.remote import server
+    from conftest import mock_server_config
+
+    def configured_server_config(*args, **kwargs):
+        CFG = mock_server_config(*args, **kwargs)
+        for key, val in server_cfg.items():
+            CFG['SERVER_GRPC'][key] = val
+        return CFG
+
+    monkeypatch.setattr(server, 'server_config', configured_server_config)
+    address = f'localhost:{choice(range(50000, 59999))}'
+    base_tmpdir = pjoin(managed_tmpdir, f'{worker_id[-1]}')
+    mkdir(base_tmpdir)
+    grpc_server, hangserver, _ = server.serve(base_tmpdir, overwrite=True, channel_address=address)
+    grpc_server.start()
+    time.sleep(0.1)  # wait for ready
+    repo.remote.add('origin', address)
+    assert repo.remote.push('origin', 'master') == 'master'
+    yield (address, repo, hangserver)
+
+    hangserver.close()
+    grpc_server.stop(0.1)
+    grpc_server.wait_for_termination(timeout=2)
+
+
+@pytest.fixture()
+def paged_server_repo(monkeypatch, managed_tmpdir, worker_id, two_commit_filled_samples_repo):
+    for address, repo, _ in _configured_server_repo(
+            monkeypatch, managed_tmpdir, worker_id, two_commit_filled_samples_repo,
+            fetch_max_nbytes='1000', fetch_max_sessions='2'):
+        yield (address, repo)
+
+
+@pytest.fixture()
+def session_limited_server_repo(monkeypatch, managed_tmpdir, worker_id, two_commit_filled_samples_repo):
+    yield from _configured_server_repo(
+        monkeypatch, managed_tmpdir, worker_id, two_commit_filled_samples_repo,
+        fetch_max_nbytes='1000', fetch_max_session_nbytes='2000', fetch_session_ttl='60')
+
+
+def test_fetch_session_digests_stored_compactly():
+    from hangar.remote.server import FetchSession
+
+    digests = [f'0={i:040x}' for i in range(100)]
+    session = FetchSession(' '.join(digests).encode())
+    assert len(session) == 100
+    assert [session[i] for i in range(100)] == digests
+    assert session.nbytes == len(' '.join(digests)) + 101 * 4
+    with pytest.raises(IndexError):
+        session[100]
+    empty = FetchSession(b'')
+    assert len(empty) == 1 and empty[0] == ''
+
+
+def test_fetch_sessions_bounded_by_nbytes_and_ttl(session_limited_server_repo):
+    import grpc
+    from hangar.records.hashs import HashQuery
+    from hangar.remote.client import HangarClient
+
+    server, repo, hangserver = session_limited_server_repo
+    digests = HashQuery(repo._env.hashenv).list_all_hash_keys_raw()
+    client = HangarClient(envs=repo._env, address=server)
+    try:
+        # a session larger than the byte limit is refused ...
+        with pytest.raises(grpc.RpcError) as exc_info:
+            client.open_fetch_session(digests * 20)
+        assert exc_info.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+        # ... and the data is fetched without a session instead.
+        received = [d for frame in client.iter_fetch_session_data('', digests * 20) for d, _ in frame]
+        assert set(received) == set(digests)
+
+        # least recently used sessions are closed to stay within the byte limit.
+        opened = [client.open_fetch_session(digests)[0] for _ in range(10)]
+        assert 0 < len(hangserver._fetch_sessions) < 10
+        assert hangserver._fetch_sessions_nbytes <= 2000
+        assert list(hangserver._fetch_sessions) == opened[-len(hangserver._fetch_sessions):]
+        assert sum(s.nbytes for s in hangserver._fetch_sessions.values()) == \
+            hangserver._fetch_sessions_nbytes
+        with pytest.raises(grpc.RpcError) as exc_info:
+            list(client.iter_fetch_session_page(opened[0], 0))
+        assert exc_info.value.code() == grpc.StatusCode.FAILED_PRECONDITION
+
+        # sessions idle for longer than the ttl are closed.
+        hangserver._fetch_sessions[opened[-1]].last_access -= 61
+        with pytest.raises(grpc.RpcError) as exc_info:
+            list(client.iter_fetch_session_page(opened[-1], 0))
+        assert exc_info.value.code() == grpc.StatusCode.FAILED_PRECONDITION
+        assert opened[-1] not in hangserver._fetch_sessions
+    finally:
+        client.close()
+
+
+def test_fetch_session_pages_resume_from_cursor(paged_server_repo):
+    import grpc
+    from hangar.records.hashs import HashQuery
+    from hangar.remote.client import HangarClient
+
+    server, repo = paged_server_repo
+    digests = HashQuery(repo._env.hashenv).list_all_hash_keys_raw()
+    client = HangarClient(envs=repo._env, address=server)
+    try:
+        session_id, num_digests = client.open_fetch_session(digests)
+        assert num_digests == len(digests)
+
+        # stop reading part way through the first page, then resume from the
+        # cursor of the last frame received.
+        page = client.iter_fetch_session_page(session_id, 0, frame_nbytes=1)
+        cursor, frame = next(page)
+        page.close()
+        assert cursor == len(frame) == 1
+        received = [digest for digest, _ in frame]
+
+        num_pages = 0
+        while cursor < num_digests:
+            num_pages += 1
+            for cursor, frame in client.iter_fetch_session_page(session_id, cursor):
+                received.extend(digest for digest, _ in frame)
+        assert num_pages > 1
+        assert received == digests
+
+        # session is closed once every record has been sent
+        with pytest.raises(grpc.RpcError) as exc_info:
+            list(client.iter_fetch_session_page(session_id, 0))
+        assert exc_info.value.code() == grpc.StatusCode.FAILED_PRECONDITION
+    finally:
+        client.close()
+
+
+def test_fetch_session_data_reopens_evicted_session(paged_server_repo):
+    from hangar.records.hashs import HashQuery
+    from hangar.remote.client import HangarClient
+
+    server, repo = paged_server_repo
+    digests = HashQuery(repo._env.hashenv).list_all_hash_keys_raw()
+    client = HangarClient(envs=repo._env, address=server)
+    try:
+        frames = client.iter_fetch_session_data('', digests)
+        received = [digest for digest, _ in next(frames)]
+        # opening more sessions than the server holds evicts the first one.
+        client.open_fetch_session(digests)
+        client.open_fetch_session(digests)
+        for frame in frames:
+            received.extend(digest for digest, _ in frame)
+        assert received == digests
+    finally:
+        client.close()
+
+
+def test_fetch_session_data_bounds_session_reopens(paged_server_repo, monkeypatch):
+    import grpc
+    from hangar.records.hashs import HashQuery
+    from hangar.remote import client as client_module
+    from hangar.remote.client import HangarClient
+
+    class SessionClosedError(grpc.RpcError):
+        def code(self):
+            return grpc.StatusCode.FAILED_PRECONDITION
+
+        def details(self):
+            return 'fetch session closed'
+
+    def evicted_page(*args, **kwargs):
+        raise SessionClosedError()
+        yield  # pragma: no cover
+
+    server, repo = paged_server_repo
+    digests = HashQuery(repo._env.hashenv).list_all_hash_keys_raw()
+    client = HangarClient(envs=repo._env, address=server)
+    opened = []
+    open_fetch_session = client.open_fetch_session
+
+    def counted_open_fetch_session(*args, **kwargs):
+        opened.append(True)
+        return open_fetch_session(*args, **kwargs)
+
+    monkeypatch.setattr(client_module.time, 'sleep', lambda *args: None)
+    monkeypatch.setattr(client, 'iter_fetch_session_page', evicted_page)
+    monkeypatch.setattr(client, 'open_fetch_session', counted_open_fetch_session)
+    try:
+        with pytest.raises(grpc.RpcError) as exc_info:
+            list(client.iter_fetch_session_data('', digests, max_retries=3))
+        assert exc_info.value.code() == grpc.StatusCode.FAILED_PRECONDITION
+        assert len(opened) == 4
+    finally:
+        client.close()
+
+
+def test_fetch_data_pages_through_session(paged_server_repo, managed_tmpdir):
+    from hangar import Repository
+
+    server, repo = paged_server_repo
+    new_tmpdir = pjoin(managed_tmpdir, 'new')
+    mkdir(new_tmpdir)
+    newRepo = Repository(path=new_tmpdir, exists=False)
+    newRepo.clone('Test User', 'tester@foo.com', server, remove_old=True)
+    newRepo.remote.fetch_data('origin', branch='master')
+
+    co = repo.checkout()
+    nco = newRepo.checkout()
+    assert nco.columns['writtenaset'].contains_remote_references is False
+    for key, arr in co.columns['writtenaset'].items():
+        assert np.allclose(nco.columns['writtenaset'][key], arr)
+    co.close()
+    nco.close()
+    newRepo._env._close_environments()
+
+
+@pytest.fixture()
+def two_schema_server_repo(server_instance, two_commit_filled_samples_repo):
+    repo = two_commit_filled_samples_repo
+    co = repo.checkout(write=True)
+    col = co.add_ndarray_column('second', shape=(20,), dtype=np.int64, backend='10')
+    for idx in range(12):
+        col[idx] = np.arange(idx, idx + 20, dtype=np.int64)
+    co.commit('add second column')
+    co.close()
+    time.sleep(0.1)  # wait for ready
+    repo.remote.add('origin', server_instance)
+    assert repo.remote.push('origin', 'master') == 'master'
+    yield (server_instance, repo)
+
+
+@pytest.mark.parametrize('num_streams', [1, 3, 8])
+def test_fetch_data_concurrent_streams(two_schema_server_repo, managed_tmpdir, num_streams):
+    from hangar import Repository
+
+    server, repo = two_schema_server_repo
+    new_tmpdir = pjoin(managed_tmpdir, 'new')
+    mkdir(new_tmpdir)
+    newRepo = Repository(path=new_tmpdir, exists=False)
+    newRepo.clone('Test User', 'tester@foo.com', server, remove_old=True)
+    newRepo.remote.fetch_data('origin', branch='master', num_streams=num_streams)
+
+    co = repo.checkout()
+    nco = newRepo.checkout()
+    for name in ('writtenaset', 'second'):
+        assert nco.columns[name].contains_remote_references is False
+        for key, arr in co.columns[name].items():
+            assert np.allclose(nco.columns[name][key], arr)
+    co.close()
+    nco.close()
+    newRepo._env._close_environments()
+
+
+@pytest.mark.parametrize('max_num_bytes', [1, 1000, 2500])
+def test_fetch_data_concurrent_streams_max_num_bytes(
+        two_schema_server_repo, managed_tmpdir, max_num_bytes):
+    from hangar import Repository
+
+    server, repo = two_schema_server_repo
+    new_tmpdir = pjoin(managed_tmpdir, 'new')
+    mkdir(new_tmpdir)
+    newRepo = Repository(path=new_tmpdir, exists=False)
+    newRepo.clone('Test User', 'tester@foo.com', server, remove_old=True)
+    newRepo.remote.fetch_data(
+        'origin', branch='master', max_num_bytes=max_num_bytes, num_streams=4)
+
+    nco = newRepo.checkout()
+    nbytes = 0
+    for name in ('writtenaset', 'second'):
+        col = nco.columns[name]
+        for key in col.remote_reference_keys:
+            assert key in col
+        for key in set(col.keys()).difference(col.remote_reference_keys):
+            nbytes += col[key].nbytes
+    # every sample is written until the next one would reach the limit.
+    assert nbytes < max_num_bytes
+    assert nbytes >= max_num_bytes - 160
+    nco.close()
+    newRepo._env._close_environments()
+
+
+@pytest.mark.parametrize('num_streams', [0, -1, 1.5])
+def test_fetch_data_concurrent_invalid_num_streams(written_two_cmt_server_repo, num_streams):
+    from hangar.remote.client import HangarClient
+
+    server, repo = written_two_cmt_server_repo
+    client = HangarClient(envs=repo._env, address=server)
+    try:
+        with pytest.raises(ValueError):
+            list(client.iter_fetch_data_concurrent({'': ['a']}, num_streams=num_streams))
+    finally:
+        client.close()
+
+
+@pytest.fixture()
+def small_pack_server_instance(monkeypatch, managed_tmpdir, worker_id):
+    from secrets import choice
+    from hangar.remote import server
+    from conftest import mock_server_config
+
+    def small_pack_server_config(*args, **kwargs):
+        CFG = mock_server_config(*args, **kwargs)
+        CFG['CLIENT_GRPC']['push_max_nbytes'] = '500'
+        return CFG
+
+    monkeypatch.setattr(server, 'server_config', small_pack_server_config)
+    address = f'localhost:{choice(range(50000, 59999))}'
+    base_tmpdir = pjoin(managed_tmpdir, f'{worker_id[-1]}')
+    mkdir(base_tmpdir)
+    grpc_server, hangserver, _ = server.serve(base_tmpdir, overwrite=True, channel_address=address)
+    grpc_server.start()
+    time.sleep(0.1)  # wait for ready
+    yield address
+
+    hangserver.close()
+    grpc_server.stop(0.1)
+    grpc_server.wait_for_termination(timeout=2)
+
+
+def test_push_data_pipelined_packs(small_pack_server_instance, two_commit_filled_samples_repo, managed_tmpdir):
+    from hangar import Repository
+    from hangar.records.hashs import HashQuery
+    from hangar.remote.client import HangarClient
+
+    server, repo = small_pack_server_instance, two_commit_filled_samples_repo
+    repo.remote.add('origin', server)
+    assert repo.remote.push('origin', 'master') == 'master'
+
+    new_tmpdir = pjoin(managed_tmpdir, 'new')
+    mkdir(new_tmpdir)
+    newRepo = Repository(path=new_tmpdir, exists=False)
+    newRepo.clone('Test User', 'tester@foo.com', server, remove_old=True)
+    newRepo.remote.fetch_data('origin', branch='master')
+    co = repo.checkout()
+    nco = newRepo.checkout()
+    for key, arr in co.columns['writtenaset'].items():
+        assert np.allclose(nco.columns['writtenaset'][key], arr)
+    co.close()
+    nco.close()
+    newRepo._env._close_environments()
+
+    class Progress(object):
+        n = 0
+
+        def update(self, n):
+            self.n += n
+
+    co = repo.checkout()
+    schema_hash = co.columns['writtenaset']._schema.schema_hash_digest()
+    co.close()
+    digests = HashQuery(repo._env.hashenv).list_all_hash_keys_raw()
+    client = HangarClient(envs=repo._env, address=server)
+    try:
+        pbar = Progress()
+        res = client.push_data(schema_hash, digests, pbar=pbar, num_readers=3, num_senders=2)
+        assert res.error.code == 0
+        assert pbar.n == len(digests)
+        with pytest.raises(KeyError):
+            client.push_data(schema_hash, ['0=doesnotexist'], pbar=pbar)
+    finally:
+        client.close()
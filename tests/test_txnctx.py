@@ -0,0 +1,102 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+
+@pytest.fixture()
+def lmdbenv(managed_tmpdir):
+    import lmdb
+    from hangar.constants import LMDB_SETTINGS
+
+    env = lmdb.open(str(managed_tmpdir.joinpath('test.lmdb')), **LMDB_SETTINGS)
+    with env.begin(write=True) as txn:
+        for idx in range(100):
+            txn.put(str(idx).encode(), str(idx * 2).encode())
+    yield env
+    env.close()
+
+
+def test_reader_txns_are_shared_within_a_thread(lmdbenv):
+    from hangar.txnctx import TxnRegister
+
+    txn1 = TxnRegister().begin_reader_txn(lmdbenv)
+    txn2 = TxnRegister().begin_reader_txn(lmdbenv)
+    assert txn1 is txn2
+    assert TxnRegister().abort_reader_txn(lmdbenv) is False
+    assert TxnRegister().abort_reader_txn(lmdbenv) is True
+    with pytest.raises(RuntimeError):
+        TxnRegister().abort_reader_txn(lmdbenv)
+
+
+def test_reader_txns_are_per_thread(lmdbenv):
+    from hangar.txnctx import TxnRegister
+
+    barrier = threading.Barrier(4)
+
+    def _read(idx):
+        txn = TxnRegister().begin_reader_txn(lmdbenv)
+        try:
+            barrier.wait(timeout=5)
+            return id(txn), txn.get(str(idx).encode())
+        finally:
+            barrier.wait(timeout=5)
+            TxnRegister().abort_reader_txn(lmdbenv)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(_read, range(4)))
+    assert len({txnId for txnId, _ in results}) == 4
+    assert [val for _, val in results] == [str(idx * 2).encode() for idx in range(4)]
+    assert TxnRegister().ReaderAncestors[lmdbenv] == 0
+
+
+def test_writer_txn_blocks_other_threads_until_committed(lmdbenv):
+    from hangar.txnctx import TxnRegister
+
+    txn = TxnRegister().begin_writer_txn(lmdbenv)
+    assert TxnRegister().begin_writer_txn(lmdbenv) is txn
+    txn.put(b'foo', b'bar')
+
+    started, acquired = threading.Event(), threading.Event()
+
+    def _write():
+        started.set()
+        other = TxnRegister().begin_writer_txn(lmdbenv)
+        acquired.set()
+        try:
+            assert other.get(b'foo') == b'bar'
+            other.put(b'foo', b'baz')
+        finally:
+            TxnRegister().commit_writer_txn(lmdbenv)
+
+    thread = threading.Thread(target=_write)
+    thread.start()
+    started.wait(timeout=5)
+    assert not acquired.wait(timeout=0.2)
+    assert TxnRegister().commit_writer_txn(lmdbenv) is False
+    assert not acquired.wait(timeout=0.2)
+    assert TxnRegister().commit_writer_txn(lmdbenv) is True
+    thread.join(timeout=5)
+    assert acquired.is_set()
+
+    with lmdbenv.begin() as txn:
+        assert txn.get(b'foo') == b'baz'
+
+
+def test_writer_txn_abort_discards_changes(lmdbenv):
+    from hangar.txnctx import TxnRegister
+
+    txn = TxnRegister().begin_writer_txn(lmdbenv)
+    assert TxnRegister().begin_writer_txn(lmdbenv) is txn
+    txn.put(b'0', b'changed')
+    txn.delete(b'1')
+    assert TxnRegister().abort_writer_txn(lmdbenv) is False
+    assert TxnRegister().abort_writer_txn(lmdbenv) is True
+    with pytest.raises(RuntimeError):
+        TxnRegister().abort_writer_txn(lmdbenv)
+
+    with lmdbenv.begin() as txn:
+        assert txn.get(b'0') == b'0'
+        assert txn.get(b'1') == b'2'
+    assert TxnRegister().begin_writer_txn(lmdbenv).get(b'0') == b'0'
+    assert TxnRegister().commit_writer_txn(lmdbenv) is True
@@ -14,6 +14,20 @@ def test_unique_everseen(arg, key, expected):
     assert res == expected
 
 
+@pytest.mark.parametrize('arg,expected', [
+    [[], []],
+    [[(0, 'a')], [(0, ['a'])]],
+    [[(0, 'a'), (1, 'b'), (2, 'c')], [(0, ['a', 'b', 'c'])]],
+    [[(0, 'a'), (2, 'b'), (3, 'c')], [(0, ['a']), (2, ['b', 'c'])]],
+    [[(4, 'a'), (4, 'b'), (5, 'c')], [(4, ['a']), (4, ['b', 'c'])]],
+])
+def test_consecutive_runs(arg, expected):
+    from hangar.utils import consecutive_runs
+
+    res = list(consecutive_runs(arg))
+    assert res == expected
+
+
 @pytest.mark.parametrize('pth', [pytest.File, None, 123])
 def test_valid_directory_path_errors_on_invalid_path_arg(pth):
     from hangar.utils import is_valid_directory_path